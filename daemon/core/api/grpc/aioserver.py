@@ -0,0 +1,315 @@
+"""
+Asyncio based grpc server, running streams as coroutines woken by session
+events and running blocking servicer methods within a bounded executor.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+import grpc
+from google.protobuf import descriptor_pb2
+from grpc import aio
+
+from core.api.grpc import core_pb2, core_pb2_grpc, grpcutils
+from core.api.grpc.events import EVENT_QUEUE_SIZE, EventFilter, EventStreamer
+from core.api.grpc.linkstats import LINK_STATS_INTERVAL, LinkStatsSampler
+from core.api.grpc.server import CoreGrpcServer
+from core.api.grpc.throughputs import THROUGHPUT_INTERVAL
+from core.emulator.coreemu import CoreEmu
+from core.errors import CoreCommandError
+
+logger = logging.getLogger(__name__)
+AIO_WORKERS: int = 64
+# seconds between checks for a stopping server, while streams are idle
+_STREAM_POLL: float = 1.0
+
+
+class AbortError(Exception):
+    """
+    Raised by a servicer method aborting a call, to abort the call on the
+    asyncio context once back on the event loop.
+    """
+
+    def __init__(self, code: grpc.StatusCode, details: str) -> None:
+        super().__init__(details)
+        self.code: grpc.StatusCode = code
+        self.details: str = details
+
+
+class SyncContext:
+    """
+    Servicer context provided to servicer methods running within the executor,
+    on behalf of the asyncio context of a call.
+    """
+
+    def __init__(self, context: aio.ServicerContext) -> None:
+        """
+        Create a SyncContext instance.
+
+        :param context: asyncio context of the call
+        """
+        self.context: aio.ServicerContext = context
+
+    def abort(self, code: grpc.StatusCode, details: str) -> None:
+        raise AbortError(code, details)
+
+    def is_active(self) -> bool:
+        return not self.context.done()
+
+
+async def _anext(iterator: AsyncIterator[Any]) -> Any:
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+def _iterate(
+    iterator: AsyncIterator[Any], loop: asyncio.AbstractEventLoop
+) -> Iterator[Any]:
+    """
+    Iterate an asyncio request iterator from a thread other than the event loop.
+
+    :param iterator: request iterator to iterate
+    :param loop: event loop of the call
+    :return: requests
+    """
+    while True:
+        request = asyncio.run_coroutine_threadsafe(_anext(iterator), loop).result()
+        if request is None:
+            break
+        yield request
+
+
+class CoreAioServicer:
+    """
+    Asyncio servicer for the core api. Streams are coroutines, all other methods
+    run the servicer methods of the threaded server within a bounded executor.
+    """
+
+    def __init__(self, server: CoreGrpcServer, executor: ThreadPoolExecutor) -> None:
+        """
+        Create a CoreAioServicer instance.
+
+        :param server: threaded server providing servicer methods
+        :param executor: executor to run blocking servicer methods within
+        """
+        self.server: CoreGrpcServer = server
+        self.executor: ThreadPoolExecutor = executor
+        # method descriptors lack streaming flags on older protobuf versions
+        service = descriptor_pb2.ServiceDescriptorProto()
+        core_pb2.DESCRIPTOR.services_by_name["CoreApi"].CopyToProto(service)
+        for method in service.method:
+            if hasattr(type(self), method.name):
+                continue
+            func = getattr(server, method.name)
+            if method.client_streaming:
+                handler = self._stream_unary(func)
+            else:
+                handler = self._unary_unary(func)
+            setattr(self, method.name, handler)
+
+    async def run(
+        self, context: aio.ServicerContext, func: Callable[..., Any], *args: Any
+    ) -> Any:
+        """
+        Run a blocking servicer function within the executor, aborting the call
+        when the function aborts.
+
+        :param context: asyncio context of the call
+        :param func: function to run, taking a servicer context as last argument
+        :param args: arguments to run function with
+        :return: function result
+        """
+        loop = asyncio.get_event_loop()
+        func = partial(func, *args, SyncContext(context))
+        try:
+            return await loop.run_in_executor(self.executor, func)
+        except AbortError as e:
+            await context.abort(e.code, e.details)
+
+    def _unary_unary(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        async def handler(request: Any, context: aio.ServicerContext) -> Any:
+            return await self.run(context, func, request)
+
+        return handler
+
+    def _stream_unary(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        async def handler(
+            request_iterator: AsyncIterator[Any], context: aio.ServicerContext
+        ) -> Any:
+            requests = _iterate(request_iterator, asyncio.get_event_loop())
+            return await self.run(context, func, requests)
+
+        return handler
+
+    def _is_running(self, context: aio.ServicerContext) -> bool:
+        return self.server.running and not context.done()
+
+    async def _wait(self, ready: asyncio.Event) -> None:
+        try:
+            await asyncio.wait_for(ready.wait(), _STREAM_POLL)
+        except asyncio.TimeoutError:
+            pass
+        ready.clear()
+
+    async def Events(
+        self, request: core_pb2.EventsRequest, context: aio.ServicerContext
+    ) -> AsyncIterator[core_pb2.Event]:
+        session = await self.run(context, self.server.get_session, request.session_id)
+        event_types = set(request.events)
+        if not event_types:
+            event_types = set(core_pb2.EventType.Enum.values())
+        queue_size = request.queue_size if request.queue_size > 0 else EVENT_QUEUE_SIZE
+        region = request.region if request.HasField("region") else None
+        event_filter = EventFilter(
+            session, request.node_ids, request.network_ids, region
+        )
+        loop = asyncio.get_event_loop()
+        ready = asyncio.Event()
+        streamer = EventStreamer(
+            session,
+            event_types,
+            queue_size,
+            request.overflow,
+            request.batch_size,
+            event_filter,
+        )
+        streamer.queue.notify = partial(loop.call_soon_threadsafe, ready.set)
+        try:
+            while self._is_running(context):
+                await self._wait(ready)
+                while True:
+                    event = streamer.process(0)
+                    if event:
+                        yield event
+                    elif not streamer.queue.entries:
+                        break
+                if streamer.overflowed:
+                    await context.abort(
+                        grpc.StatusCode.RESOURCE_EXHAUSTED, "event queue overflowed"
+                    )
+        finally:
+            streamer.queue.notify = None
+            streamer.remove_handlers()
+        if not context.done():
+            await context.abort(grpc.StatusCode.CANCELLED, "server stopping")
+
+    async def Throughputs(
+        self, request: core_pb2.ThroughputsRequest, context: aio.ServicerContext
+    ) -> AsyncIterator[core_pb2.ThroughputsEvent]:
+        session = await self.run(context, self.server.get_session, request.session_id)
+        interval = request.interval
+        if interval <= 0:
+            interval = THROUGHPUT_INTERVAL
+        loop = asyncio.get_event_loop()
+        ready = asyncio.Event()
+        sampler = self.server.throughput_sampler
+        subscriber = sampler.subscribe(session, interval)
+        subscriber.notify = partial(loop.call_soon_threadsafe, ready.set)
+        try:
+            while self._is_running(context):
+                await self._wait(ready)
+                throughputs_event = subscriber.get(0)
+                if throughputs_event:
+                    yield throughputs_event
+        finally:
+            subscriber.notify = None
+            sampler.unsubscribe(subscriber)
+
+    async def LinkStats(
+        self, request: core_pb2.LinkStatsRequest, context: aio.ServicerContext
+    ) -> AsyncIterator[core_pb2.LinkStatsEvent]:
+        session = await self.run(context, self.server.get_session, request.session_id)
+        interval = request.interval
+        if interval <= 0:
+            interval = LINK_STATS_INTERVAL
+        loop = asyncio.get_event_loop()
+        sampler = LinkStatsSampler(session)
+        while self._is_running(context):
+            start = loop.time()
+            try:
+                event = await loop.run_in_executor(self.executor, sampler.sample)
+            except (CoreCommandError, ValueError):
+                logger.exception("error sampling link stats")
+                event = None
+            if event:
+                yield event
+            await asyncio.sleep(max(interval - (loop.time() - start), 0))
+
+    async def CpuUsage(
+        self, request: core_pb2.CpuUsageRequest, context: aio.ServicerContext
+    ) -> AsyncIterator[core_pb2.CpuUsageEvent]:
+        cpu_usage = grpcutils.CpuUsage()
+        while self._is_running(context):
+            usage = cpu_usage.run()
+            yield core_pb2.CpuUsageEvent(usage=usage)
+            await asyncio.sleep(request.delay)
+
+
+class CoreAioGrpcServer(CoreGrpcServer):
+    """
+    Core grpc server running on an asyncio event loop, where stream count is not
+    bound by the number of worker threads.
+    """
+
+    def __init__(self, coreemu: CoreEmu, workers: int = AIO_WORKERS) -> None:
+        """
+        Create a CoreAioGrpcServer instance.
+
+        :param coreemu: coreemu object
+        :param workers: maximum number of threads running blocking methods
+        """
+        super().__init__(coreemu)
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=workers)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.aio_server: Optional[aio.Server] = None
+        self.stopping: Optional[asyncio.Event] = None
+        self.stopped: threading.Event = threading.Event()
+
+    def listen(self, address: str) -> None:
+        logger.info("CORE gRPC asyncio API listening on: %s", address)
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self.serve(address))
+        except KeyboardInterrupt:
+            self.loop.run_until_complete(self.aio_server.stop(None))
+        finally:
+            self.executor.shutdown(wait=False)
+            self.stopped.set()
+
+    async def serve(self, address: str) -> None:
+        """
+        Serve the core api until the server is stopped.
+
+        :param address: address to listen on
+        :return: nothing
+        """
+        self.stopping = asyncio.Event()
+        self.aio_server = aio.server()
+        servicer = CoreAioServicer(self, self.executor)
+        core_pb2_grpc.add_CoreApiServicer_to_server(servicer, self.aio_server)
+        self.aio_server.add_insecure_port(address)
+        await self.aio_server.start()
+        # stop from within serve, as the loop ends once serve returns
+        await self.stopping.wait()
+        await self.aio_server.stop(None)
+
+    def stop(self) -> None:
+        """
+        Stop serving, from a thread other than the event loop, waiting for the
+        server to stop.
+
+        :return: nothing
+        """
+        if self.aio_server is None:
+            if self.server:
+                self.server.stop(None)
+            return
+        self.loop.call_soon_threadsafe(self.stopping.set)
+        self.stopped.wait()
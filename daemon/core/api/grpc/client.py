@@ -25,6 +25,7 @@ from core.api.grpc.emane_pb2 import (
 )
 from core.api.grpc.mobility_pb2 import (
     GetMobilityConfigRequest,
+    GetMobilityTimelineRequest,
     MobilityActionRequest,
     MobilityConfig,
     SetMobilityConfigRequest,
@@ -150,12 +151,12 @@ def throughput_listener(
     stream: Any, handler: Callable[[wrappers.ThroughputsEvent], None]
 ) -> None:
     """
-        Listen for throughput events and provide them to the handler.
+    Listen for throughput events and provide them to the handler.
 
-        :param stream: grpc stream that will provide events
-        :param handler: function that handles an event
-        :return: nothing
-        """
+    :param stream: grpc stream that will provide events
+    :param handler: function that handles an event
+    :return: nothing
+    """
     try:
         for event_proto in stream:
             event = wrappers.ThroughputsEvent.from_proto(event_proto)
@@ -188,18 +189,27 @@ def cpu_listener(
             logger.exception("cpu stream error")
 
 
-def event_listener(stream: Any, handler: Callable[[wrappers.Event], None]) -> None:
+def event_listener(
+    stream: Any,
+    handler: Callable[[wrappers.Event], None],
+    stats_handler: Callable[[wrappers.EventStreamStats], None] = None,
+) -> None:
     """
     Listen for session events and provide them to the handler.
 
     :param stream: grpc stream that will provide events
     :param handler: function that handles an event
+    :param stats_handler: function that handles updated event stream stats
     :return: nothing
     """
     try:
         for event_proto in stream:
-            event = wrappers.Event.from_proto(event_proto)
-            handler(event)
+            if event_proto.HasField("stats") and stats_handler:
+                stats_handler(wrappers.EventStreamStats.from_proto(event_proto.stats))
+            event_protos = event_proto.events or [event_proto]
+            for proto in event_protos:
+                event = wrappers.Event.from_proto(proto)
+                handler(event)
     except grpc.RpcError as e:
         if e.code() == grpc.StatusCode.CANCELLED:
             logger.debug("session stream closed")
@@ -207,6 +217,27 @@ def event_listener(stream: Any, handler: Callable[[wrappers.Event], None]) -> No
             logger.exception("session stream error")
 
 
+def link_stats_listener(
+    stream: Any, handler: Callable[[wrappers.LinkStatsEvent], None]
+) -> None:
+    """
+    Listen for link stats events and provide them to the handler.
+
+    :param stream: grpc stream that will provide events
+    :param handler: function that handles an event
+    :return: nothing
+    """
+    try:
+        for event_proto in stream:
+            event = wrappers.LinkStatsEvent.from_proto(event_proto)
+            handler(event)
+    except grpc.RpcError as e:
+        if e.code() == grpc.StatusCode.CANCELLED:
+            logger.debug("link stats stream closed")
+        else:
+            logger.exception("link stats stream error")
+
+
 class CoreGrpcClient:
     """
     Provides convenience methods for interfacing with the CORE grpc server.
@@ -239,6 +270,24 @@ class CoreGrpcClient:
         response = self.stub.StartSession(request)
         return response.result, list(response.exceptions)
 
+    def reconcile_session(
+        self, session: wrappers.Session
+    ) -> Tuple[bool, List[str], wrappers.SessionChanges]:
+        """
+        Apply only the node and link differences between a session and the
+        running session, starting the session normally when it is not running or
+        session options, servers, hooks or location differ.
+
+        :param session: session to reconcile
+        :return: tuple of result, exception strings and changes applied
+        """
+        request = core_pb2.StartSessionRequest(
+            session=session.to_proto(), reconcile=True
+        )
+        response = self.stub.StartSession(request)
+        changes = wrappers.SessionChanges.from_proto(response.changes)
+        return response.result, list(response.exceptions), changes
+
     def stop_session(self, session_id: int) -> bool:
         """
         Stop a running session.
@@ -312,6 +361,19 @@ class CoreGrpcClient:
         response = self.stub.GetSession(request)
         return wrappers.Session.from_proto(response.session)
 
+    def get_session_trace(self, session_id: int) -> str:
+        """
+        Retrieve the startup trace of a session, recorded when the session trace
+        option is enabled.
+
+        :param session_id: id of session
+        :return: chrome trace json
+        :raises grpc.RpcError: when session doesn't exist
+        """
+        request = core_pb2.GetSessionTraceRequest(session_id=session_id)
+        response = self.stub.GetSessionTrace(request)
+        return response.trace
+
     def alert(
         self,
         session_id: int,
@@ -345,36 +407,68 @@ class CoreGrpcClient:
         session_id: int,
         handler: Callable[[wrappers.Event], None],
         events: List[wrappers.EventType] = None,
+        queue_size: int = None,
+        overflow: int = wrappers.EventOverflow.COALESCE,
+        batch_size: int = None,
+        stats_handler: Callable[[wrappers.EventStreamStats], None] = None,
+        node_ids: List[int] = None,
+        network_ids: List[int] = None,
+        region: wrappers.EventRegion = None,
     ) -> grpc.Future:
         """
-        Listen for session events.
+        Listen for session events. When node ids, network ids or a region are
+        provided, node and link events are only streamed when matching any of
+        them.
 
         :param session_id: id of session
         :param handler: handler for received events
         :param events: events to listen to, defaults to all
+        :param queue_size: maximum events queued by the server for this stream,
+            defaults to the server default
+        :param overflow: policy applied by the server when its queue is full
+        :param batch_size: maximum events sent within a single message
+        :param stats_handler: handler for updated dropped and coalesced counts
+        :param node_ids: nodes to stream node and link events for
+        :param network_ids: networks to stream node and link events for, including
+            nodes connected to them
+        :param region: region to stream node and link events for nodes within
         :return: stream processing events, can be used to cancel stream
         :raises grpc.RpcError: when session doesn't exist
         """
-        request = core_pb2.EventsRequest(session_id=session_id, events=events)
+        request = core_pb2.EventsRequest(
+            session_id=session_id,
+            events=events,
+            queue_size=queue_size,
+            overflow=overflow,
+            batch_size=batch_size,
+            node_ids=node_ids,
+            network_ids=network_ids,
+            region=region.to_proto() if region else None,
+        )
         stream = self.stub.Events(request)
         thread = threading.Thread(
-            target=event_listener, args=(stream, handler), daemon=True
+            target=event_listener, args=(stream, handler, stats_handler), daemon=True
         )
         thread.start()
         return stream
 
     def throughputs(
-        self, session_id: int, handler: Callable[[wrappers.ThroughputsEvent], None]
+        self,
+        session_id: int,
+        handler: Callable[[wrappers.ThroughputsEvent], None],
+        interval: float = None,
     ) -> grpc.Future:
         """
         Listen for throughput events with information for interfaces and bridges.
 
         :param session_id: session id
         :param handler: handler for every event
+        :param interval: seconds between throughput events, defaults to the
+            server default
         :return: stream processing events, can be used to cancel stream
         :raises grpc.RpcError: when session doesn't exist
         """
-        request = core_pb2.ThroughputsRequest(session_id=session_id)
+        request = core_pb2.ThroughputsRequest(session_id=session_id, interval=interval)
         stream = self.stub.Throughputs(request)
         thread = threading.Thread(
             target=throughput_listener, args=(stream, handler), daemon=True
@@ -382,6 +476,31 @@ class CoreGrpcClient:
         thread.start()
         return stream
 
+    def link_stats(
+        self,
+        session_id: int,
+        handler: Callable[[wrappers.LinkStatsEvent], None],
+        interval: float = None,
+    ) -> grpc.Future:
+        """
+        Listen for statistics of both directions of session links, along with
+        statistics of session networks.
+
+        :param session_id: session id
+        :param handler: handler for every event
+        :param interval: seconds between link stats events, defaults to the
+            server default
+        :return: stream processing events, can be used to cancel stream
+        :raises grpc.RpcError: when session doesn't exist
+        """
+        request = core_pb2.LinkStatsRequest(session_id=session_id, interval=interval)
+        stream = self.stub.LinkStats(request)
+        thread = threading.Thread(
+            target=link_stats_listener, args=(stream, handler), daemon=True
+        )
+        thread.start()
+        return stream
+
     def cpu_usage(
         self, delay: int, handler: Callable[[wrappers.CpuUsageEvent], None]
     ) -> grpc.Future:
@@ -416,6 +535,24 @@ class CoreGrpcClient:
         response = self.stub.AddNode(request)
         return response.node_id
 
+    def add_nodes(
+        self, session_id: int, nodes: List[wrappers.Node], source: str = None
+    ) -> List[wrappers.AddNodeResult]:
+        """
+        Add several nodes to session in a single request.
+
+        :param session_id: session id
+        :param nodes: nodes to add
+        :param source: source application
+        :return: result for each node, in order
+        :raises grpc.RpcError: when session doesn't exist
+        """
+        request = core_pb2.AddNodesRequest(
+            session_id=session_id, nodes=[x.to_proto() for x in nodes], source=source
+        )
+        response = self.stub.AddNodes(request)
+        return [wrappers.AddNodeResult.from_proto(x) for x in response.results]
+
     def get_node(
         self, session_id: int, node_id: int
     ) -> Tuple[wrappers.Node, List[wrappers.Interface], List[wrappers.Link]]:
@@ -626,6 +763,42 @@ class CoreGrpcClient:
         response = self.stub.EditLink(request)
         return response.result
 
+    def add_links(
+        self, session_id: int, links: List[wrappers.Link], source: str = None
+    ) -> List[wrappers.AddLinkResult]:
+        """
+        Add several links between nodes in a single request.
+
+        :param session_id: session id
+        :param links: links to add
+        :param source: application source
+        :return: result for each link, in order
+        :raises grpc.RpcError: when session doesn't exist
+        """
+        request = core_pb2.AddLinksRequest(
+            session_id=session_id, links=[x.to_proto() for x in links], source=source
+        )
+        response = self.stub.AddLinks(request)
+        return [wrappers.AddLinkResult.from_proto(x) for x in response.results]
+
+    def edit_links(
+        self, session_id: int, links: List[wrappers.Link], source: str = None
+    ) -> List[wrappers.EditLinkResult]:
+        """
+        Edit several links between nodes in a single request.
+
+        :param session_id: session id
+        :param links: links to edit
+        :param source: application source
+        :return: result for each link, in order
+        :raises grpc.RpcError: when session doesn't exist
+        """
+        request = core_pb2.EditLinksRequest(
+            session_id=session_id, links=[x.to_proto() for x in links], source=source
+        )
+        response = self.stub.EditLinks(request)
+        return [wrappers.EditLinkResult.from_proto(x) for x in response.results]
+
     def delete_link(
         self, session_id: int, link: wrappers.Link, source: str = None
     ) -> bool:
@@ -703,6 +876,22 @@ class CoreGrpcClient:
         response = self.stub.MobilityAction(request)
         return response.result
 
+    def get_mobility_timeline(
+        self, session_id: int, node_id: int
+    ) -> List[wrappers.LinkChange]:
+        """
+        Get the link changes recorded by a wlan range model during its last
+        mobility pass run with a stepped clock.
+
+        :param session_id: session id
+        :param node_id: wlan node id
+        :return: link changes ordered by script time
+        :raises grpc.RpcError: when session or node doesn't exist
+        """
+        request = GetMobilityTimelineRequest(session_id=session_id, node_id=node_id)
+        response = self.stub.GetMobilityTimeline(request)
+        return [wrappers.LinkChange.from_proto(x) for x in response.changes]
+
     def get_config(self) -> wrappers.CoreConfig:
         """
         Retrieve the current core configuration values.
@@ -0,0 +1,1135 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: core/api/grpc/core.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from core.api.grpc import configservices_pb2 as core_dot_api_dot_grpc_dot_configservices__pb2
+from core.api.grpc import common_pb2 as core_dot_api_dot_grpc_dot_common__pb2
+from core.api.grpc import emane_pb2 as core_dot_api_dot_grpc_dot_emane__pb2
+from core.api.grpc import mobility_pb2 as core_dot_api_dot_grpc_dot_mobility__pb2
+from core.api.grpc import services_pb2 as core_dot_api_dot_grpc_dot_services__pb2
+from core.api.grpc import wlan_pb2 as core_dot_api_dot_grpc_dot_wlan__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18\x63ore/api/grpc/core.proto\x12\x04\x63ore\x1a\"core/api/grpc/configservices.proto\x1a\x1a\x63ore/api/grpc/common.proto\x1a\x19\x63ore/api/grpc/emane.proto\x1a\x1c\x63ore/api/grpc/mobility.proto\x1a\x1c\x63ore/api/grpc/services.proto\x1a\x18\x63ore/api/grpc/wlan.proto\"\x12\n\x10GetConfigRequest\"\xae\x01\n\x11GetConfigResponse\x12#\n\x08services\x18\x01 \x03(\x0b\x32\x11.services.Service\x12\x36\n\x0f\x63onfig_services\x18\x02 \x03(\x0b\x32\x1d.configservices.ConfigService\x12\x14\n\x0c\x65mane_models\x18\x03 \x03(\t\x12&\n\tnode_pool\x18\x04 \x01(\x0b\x32\x13.core.NodePoolStats\"]\n\rNodePoolStats\x12\x0c\n\x04size\x18\x01 \x01(\x05\x12\r\n\x05ready\x18\x02 \x01(\x05\x12\x0f\n\x07\x63laimed\x18\x03 \x01(\x05\x12\x0e\n\x06missed\x18\x04 \x01(\x05\x12\x0e\n\x06\x66\x61iled\x18\x05 \x01(\x05\"\\\n\x13StartSessionRequest\x12\x1e\n\x07session\x18\x01 \x01(\x0b\x32\r.core.Session\x12\x12\n\ndefinition\x18\x02 \x01(\x08\x12\x11\n\treconcile\x18\x03 \x01(\x08\"a\n\x14StartSessionResponse\x12\x0e\n\x06result\x18\x01 \x01(\x08\x12\x12\n\nexceptions\x18\x02 \x03(\t\x12%\n\x07\x63hanges\x18\x03 \x01(\x0b\x32\x14.core.SessionChanges\"\xe5\x01\n\x0eSessionChanges\x12\x12\n\nreconciled\x18\x01 \x01(\x08\x12\x13\n\x0b\x61\x64\x64\x65\x64_nodes\x18\x02 \x03(\x05\x12\x15\n\rdeleted_nodes\x18\x03 \x03(\x05\x12\x16\n\x0ereplaced_nodes\x18\x04 \x03(\x05\x12\x14\n\x0c\x65\x64ited_nodes\x18\x05 \x03(\x05\x12\x1f\n\x0b\x61\x64\x64\x65\x64_links\x18\x06 \x03(\x0b\x32\n.core.Link\x12!\n\rdeleted_links\x18\x07 \x03(\x0b\x32\n.core.Link\x12!\n\rupdated_links\x18\x08 \x03(\x0b\x32\n.core.Link\"(\n\x12StopSessionRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\"%\n\x13StopSessionResponse\x12\x0e\n\x06result\x18\x01 \x01(\x08\"*\n\x14\x43reateSessionRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\"7\n\x15\x43reateSessionResponse\x12\x1e\n\x07session\x18\x01 \x01(\x0b\x32\r.core.Session\"*\n\x14\x44\x65leteSessionRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\"\'\n\x15\x44\x65leteSessionResponse\x12\x0e\n\x06result\x18\x01 \x01(\x08\"\x14\n\x12GetSessionsRequest\"=\n\x13GetSessionsResponse\x12&\n\x08sessions\x18\x01 \x03(\x0b\x32\x14.core.SessionSummary\")\n\x13\x43heckSessionRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\"&\n\x14\x43heckSessionResponse\x12\x0e\n\x06result\x18\x01 \x01(\x08\"\'\n\x11GetSessionRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\"4\n\x12GetSessionResponse\x12\x1e\n\x07session\x18\x01 \x01(\x0b\x32\r.core.Session\",\n\x16GetSessionTraceRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\"(\n\x17GetSessionTraceResponse\x12\r\n\x05trace\x18\x01 \x01(\t\"\x82\x01\n\x13SessionAlertRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12(\n\x05level\x18\x02 \x01(\x0e\x32\x19.core.ExceptionLevel.Enum\x12\x0e\n\x06source\x18\x03 \x01(\t\x12\x0c\n\x04text\x18\x04 \x01(\t\x12\x0f\n\x07node_id\x18\x05 \x01(\x05\"&\n\x14SessionAlertResponse\x12\x0e\n\x06result\x18\x01 \x01(\x08\"\xe7\x01\n\rEventsRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12$\n\x06\x65vents\x18\x02 \x03(\x0e\x32\x14.core.EventType.Enum\x12\x12\n\nqueue_size\x18\x03 \x01(\x05\x12*\n\x08overflow\x18\x04 \x01(\x0e\x32\x18.core.EventOverflow.Enum\x12\x12\n\nbatch_size\x18\x05 \x01(\x05\x12\x10\n\x08node_ids\x18\x06 \x03(\x05\x12\x13\n\x0bnetwork_ids\x18\x07 \x03(\x05\x12!\n\x06region\x18\x08 \x01(\x0b\x32\x11.core.EventRegion\"V\n\x0b\x45ventRegion\x12\r\n\x05min_x\x18\x01 \x01(\x01\x12\r\n\x05min_y\x18\x02 \x01(\x01\x12\r\n\x05max_x\x18\x03 \x01(\x01\x12\r\n\x05max_y\x18\x04 \x01(\x01\x12\x0b\n\x03geo\x18\x05 \x01(\x08\"6\n\x10\x45ventStreamStats\x12\x0f\n\x07\x64ropped\x18\x01 \x01(\x03\x12\x11\n\tcoalesced\x18\x02 \x01(\x03\":\n\x12ThroughputsRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x10\n\x08interval\x18\x02 \x01(\x02\"\x90\x01\n\x10ThroughputsEvent\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x32\n\x12\x62ridge_throughputs\x18\x02 \x03(\x0b\x32\x16.core.BridgeThroughput\x12\x34\n\x11iface_throughputs\x18\x03 \x03(\x0b\x32\x19.core.InterfaceThroughput\"8\n\x10LinkStatsRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x10\n\x08interval\x18\x02 \x01(\x02\"\xf3\x01\n\tLinkStats\x12\x10\n\x08node1_id\x18\x01 \x01(\x05\x12\x10\n\x08node2_id\x18\x02 \x01(\x05\x12\x11\n\tiface1_id\x18\x03 \x01(\x05\x12\x11\n\tiface2_id\x18\x04 \x01(\x05\x12\x12\n\nnetwork_id\x18\x05 \x01(\x05\x12\x18\n\x10\x62ytes_per_second\x18\x06 \x01(\x01\x12\x1a\n\x12packets_per_second\x18\x07 \x01(\x01\x12\r\n\x05\x64rops\x18\x08 \x01(\x03\x12\x12\n\noverlimits\x18\t \x01(\x03\x12\x10\n\x08requeues\x18\n \x01(\x03\x12\x0f\n\x07\x62\x61\x63klog\x18\x0b \x01(\x03\x12\x0c\n\x04qlen\x18\x0c \x01(\x03\"g\n\x0cNetworkStats\x12\x12\n\nnetwork_id\x18\x01 \x01(\x05\x12\x18\n\x10\x62ytes_per_second\x18\x02 \x01(\x01\x12\x1a\n\x12packets_per_second\x18\x03 \x01(\x01\x12\r\n\x05\x64rops\x18\x04 \x01(\x03\"j\n\x0eLinkStatsEvent\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x1e\n\x05links\x18\x02 \x03(\x0b\x32\x0f.core.LinkStats\x12$\n\x08networks\x18\x03 \x03(\x0b\x32\x12.core.NetworkStats\" \n\x0f\x43puUsageRequest\x12\r\n\x05\x64\x65lay\x18\x01 \x01(\x05\"\x1e\n\rCpuUsageEvent\x12\r\n\x05usage\x18\x01 \x01(\x01\"L\n\x13InterfaceThroughput\x12\x0f\n\x07node_id\x18\x01 \x01(\x05\x12\x10\n\x08iface_id\x18\x02 \x01(\x05\x12\x12\n\nthroughput\x18\x03 \x01(\x01\"7\n\x10\x42ridgeThroughput\x12\x0f\n\x07node_id\x18\x01 \x01(\x05\x12\x12\n\nthroughput\x18\x02 \x01(\x01\"\xfb\x02\n\x05\x45vent\x12+\n\rsession_event\x18\x01 \x01(\x0b\x32\x12.core.SessionEventH\x00\x12%\n\nnode_event\x18\x02 \x01(\x0b\x32\x0f.core.NodeEventH\x00\x12%\n\nlink_event\x18\x03 \x01(\x0b\x32\x0f.core.LinkEventH\x00\x12)\n\x0c\x63onfig_event\x18\x04 \x01(\x0b\x32\x11.core.ConfigEventH\x00\x12/\n\x0f\x65xception_event\x18\x05 \x01(\x0b\x32\x14.core.ExceptionEventH\x00\x12%\n\nfile_event\x18\x06 \x01(\x0b\x32\x0f.core.FileEventH\x00\x12\x12\n\nsession_id\x18\x07 \x01(\x05\x12\x0e\n\x06source\x18\x08 \x01(\t\x12\x1b\n\x06\x65vents\x18\t \x03(\x0b\x32\x0b.core.Event\x12%\n\x05stats\x18\n \x01(\x0b\x32\x16.core.EventStreamStatsB\x0c\n\nevent_type\"S\n\tNodeEvent\x12\x18\n\x04node\x18\x01 \x01(\x0b\x32\n.core.Node\x12,\n\x0cmessage_type\x18\x02 \x01(\x0e\x32\x16.core.MessageType.Enum\"S\n\tLinkEvent\x12,\n\x0cmessage_type\x18\x01 \x01(\x0e\x32\x16.core.MessageType.Enum\x12\x18\n\x04link\x18\x02 \x01(\x0b\x32\n.core.Link\"X\n\x0cSessionEvent\x12\x0f\n\x07node_id\x18\x01 \x01(\x05\x12\r\n\x05\x65vent\x18\x02 \x01(\x05\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\t\x12\x0c\n\x04time\x18\x05 \x01(\x02\"\x94\x02\n\x0b\x43onfigEvent\x12,\n\x0cmessage_type\x18\x01 \x01(\x0e\x32\x16.core.MessageType.Enum\x12\x0f\n\x07node_id\x18\x02 \x01(\x05\x12\x0e\n\x06object\x18\x03 \x01(\t\x12\x0c\n\x04type\x18\x04 \x01(\x05\x12\x12\n\ndata_types\x18\x05 \x03(\x05\x12\x13\n\x0b\x64\x61ta_values\x18\x06 \x01(\t\x12\x10\n\x08\x63\x61ptions\x18\x07 \x01(\t\x12\x0e\n\x06\x62itmap\x18\x08 \x01(\t\x12\x17\n\x0fpossible_values\x18\t \x01(\t\x12\x0e\n\x06groups\x18\n \x01(\t\x12\x10\n\x08iface_id\x18\x0b \x01(\x05\x12\x12\n\nnetwork_id\x18\x0c \x01(\x05\x12\x0e\n\x06opaque\x18\r \x01(\t\"\x87\x01\n\x0e\x45xceptionEvent\x12\x0f\n\x07node_id\x18\x01 \x01(\x05\x12(\n\x05level\x18\x02 \x01(\x0e\x32\x19.core.ExceptionLevel.Enum\x12\x0e\n\x06source\x18\x03 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x04 \x01(\t\x12\x0c\n\x04text\x18\x05 \x01(\t\x12\x0e\n\x06opaque\x18\x06 \x01(\t\"\xbb\x01\n\tFileEvent\x12,\n\x0cmessage_type\x18\x01 \x01(\x0e\x32\x16.core.MessageType.Enum\x12\x0f\n\x07node_id\x18\x02 \x01(\x05\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0c\n\x04mode\x18\x04 \x01(\t\x12\x0e\n\x06number\x18\x05 \x01(\x05\x12\x0c\n\x04type\x18\x06 \x01(\t\x12\x0e\n\x06source\x18\x07 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x08 \x01(\t\x12\x17\n\x0f\x63ompressed_data\x18\t \x01(\t\"N\n\x0e\x41\x64\x64NodeRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x18\n\x04node\x18\x02 \x01(\x0b\x32\n.core.Node\x12\x0e\n\x06source\x18\x03 \x01(\t\"\"\n\x0f\x41\x64\x64NodeResponse\x12\x0f\n\x07node_id\x18\x01 \x01(\x05\"P\n\x0f\x41\x64\x64NodesRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x19\n\x05nodes\x18\x02 \x03(\x0b\x32\n.core.Node\x12\x0e\n\x06source\x18\x03 \x01(\t\"?\n\rAddNodeResult\x12\x0e\n\x06result\x18\x01 \x01(\x08\x12\x0f\n\x07node_id\x18\x02 \x01(\x05\x12\r\n\x05\x65rror\x18\x03 \x01(\t\"8\n\x10\x41\x64\x64NodesResponse\x12$\n\x07results\x18\x01 \x03(\x0b\x32\x13.core.AddNodeResult\"5\n\x0eGetNodeRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x0f\n\x07node_id\x18\x02 \x01(\x05\"g\n\x0fGetNodeResponse\x12\x18\n\x04node\x18\x01 \x01(\x0b\x32\n.core.Node\x12\x1f\n\x06ifaces\x18\x02 \x03(\x0b\x32\x0f.core.Interface\x12\x19\n\x05links\x18\x03 \x03(\x0b\x32\n.core.Link\"T\n\x0f\x45\x64itNodeRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x0f\n\x07node_id\x18\x02 \x01(\x05\x12\x0c\n\x04icon\x18\x03 \x01(\t\x12\x0e\n\x06source\x18\x04 \x01(\t\"\"\n\x10\x45\x64itNodeResponse\x12\x0e\n\x06result\x18\x01 \x01(\x08\"H\n\x11\x44\x65leteNodeRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x0f\n\x07node_id\x18\x02 \x01(\x05\x12\x0e\n\x06source\x18\x03 \x01(\t\"$\n\x12\x44\x65leteNodeResponse\x12\x0e\n\x06result\x18\x01 \x01(\x08\"=\n\x16GetNodeTerminalRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x0f\n\x07node_id\x18\x02 \x01(\x05\"+\n\x17GetNodeTerminalResponse\x12\x10\n\x08terminal\x18\x01 \x01(\t\"\x91\x01\n\x0fMoveNodeRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x0f\n\x07node_id\x18\x02 \x01(\x05\x12\x0e\n\x06source\x18\x03 \x01(\t\x12\"\n\x08position\x18\x04 \x01(\x0b\x32\x0e.core.PositionH\x00\x12\x18\n\x03geo\x18\x05 \x01(\x0b\x32\t.core.GeoH\x00\x42\x0b\n\tmove_type\"\"\n\x10MoveNodeResponse\x12\x0e\n\x06result\x18\x01 \x01(\x08\"\x92\x01\n\x10MoveNodesRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x0f\n\x07node_id\x18\x02 \x01(\x05\x12\x0e\n\x06source\x18\x03 \x01(\t\x12\"\n\x08position\x18\x04 \x01(\x0b\x32\x0e.core.PositionH\x00\x12\x18\n\x03geo\x18\x05 \x01(\x0b\x32\t.core.GeoH\x00\x42\x0b\n\tmove_type\"\x13\n\x11MoveNodesResponse\"g\n\x12NodeCommandRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x0f\n\x07node_id\x18\x02 \x01(\x05\x12\x0f\n\x07\x63ommand\x18\x03 \x01(\t\x12\x0c\n\x04wait\x18\x04 \x01(\x08\x12\r\n\x05shell\x18\x05 \x01(\x08\":\n\x13NodeCommandResponse\x12\x0e\n\x06output\x18\x01 \x01(\t\x12\x13\n\x0breturn_code\x18\x02 \x01(\x05\"N\n\x0e\x41\x64\x64LinkRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x18\n\x04link\x18\x02 \x01(\x0b\x32\n.core.Link\x12\x0e\n\x06source\x18\x03 \x01(\t\"c\n\x0f\x41\x64\x64LinkResponse\x12\x0e\n\x06result\x18\x01 \x01(\x08\x12\x1f\n\x06iface1\x18\x02 \x01(\x0b\x32\x0f.core.Interface\x12\x1f\n\x06iface2\x18\x03 \x01(\x0b\x32\x0f.core.Interface\"\xa3\x01\n\x0f\x45\x64itLinkRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x10\n\x08node1_id\x18\x02 \x01(\x05\x12\x10\n\x08node2_id\x18\x03 \x01(\x05\x12\x11\n\tiface1_id\x18\x04 \x01(\x05\x12\x11\n\tiface2_id\x18\x05 \x01(\x05\x12\"\n\x07options\x18\x06 \x01(\x0b\x32\x11.core.LinkOptions\x12\x0e\n\x06source\x18\x07 \x01(\t\"\"\n\x10\x45\x64itLinkResponse\x12\x0e\n\x06result\x18\x01 \x01(\x08\"P\n\x0f\x41\x64\x64LinksRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x19\n\x05links\x18\x02 \x03(\x0b\x32\n.core.Link\x12\x0e\n\x06source\x18\x03 \x01(\t\"p\n\rAddLinkResult\x12\x0e\n\x06result\x18\x01 \x01(\x08\x12\x1f\n\x06iface1\x18\x02 \x01(\x0b\x32\x0f.core.Interface\x12\x1f\n\x06iface2\x18\x03 \x01(\x0b\x32\x0f.core.Interface\x12\r\n\x05\x65rror\x18\x04 \x01(\t\"8\n\x10\x41\x64\x64LinksResponse\x12$\n\x07results\x18\x01 \x03(\x0b\x32\x13.core.AddLinkResult\"Q\n\x10\x45\x64itLinksRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x19\n\x05links\x18\x02 \x03(\x0b\x32\n.core.Link\x12\x0e\n\x06source\x18\x03 \x01(\t\"/\n\x0e\x45\x64itLinkResult\x12\x0e\n\x06result\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\t\":\n\x11\x45\x64itLinksResponse\x12%\n\x07results\x18\x01 \x03(\x0b\x32\x14.core.EditLinkResult\"\x81\x01\n\x11\x44\x65leteLinkRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x10\n\x08node1_id\x18\x02 \x01(\x05\x12\x10\n\x08node2_id\x18\x03 \x01(\x05\x12\x11\n\tiface1_id\x18\x04 \x01(\x05\x12\x11\n\tiface2_id\x18\x05 \x01(\x05\x12\x0e\n\x06source\x18\x06 \x01(\t\"$\n\x12\x44\x65leteLinkResponse\x12\x0e\n\x06result\x18\x01 \x01(\x08\"$\n\x0eSaveXmlRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\"\x1f\n\x0fSaveXmlResponse\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\t\";\n\x0eOpenXmlRequest\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\t\x12\r\n\x05start\x18\x02 \x01(\x08\x12\x0c\n\x04\x66ile\x18\x03 \x01(\t\"5\n\x0fOpenXmlResponse\x12\x0e\n\x06result\x18\x01 \x01(\x08\x12\x12\n\nsession_id\x18\x02 \x01(\x05\"\x16\n\x14GetInterfacesRequest\"\'\n\x15GetInterfacesResponse\x12\x0e\n\x06ifaces\x18\x01 \x03(\t\"4\n\x14\x45xecuteScriptRequest\x12\x0e\n\x06script\x18\x01 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x02 \x01(\t\"+\n\x15\x45xecuteScriptResponse\x12\x12\n\nsession_id\x18\x01 \x01(\x05\"Y\n\tEventType\"L\n\x04\x45num\x12\x0b\n\x07SESSION\x10\x00\x12\x08\n\x04NODE\x10\x01\x12\x08\n\x04LINK\x10\x02\x12\n\n\x06\x43ONFIG\x10\x03\x12\r\n\tEXCEPTION\x10\x04\x12\x08\n\x04\x46ILE\x10\x05\"F\n\rEventOverflow\"5\n\x04\x45num\x12\x0c\n\x08\x43OALESCE\x10\x00\x12\x0f\n\x0b\x44ROP_OLDEST\x10\x01\x12\x0e\n\nDISCONNECT\x10\x02\"g\n\x0bMessageType\"X\n\x04\x45num\x12\x08\n\x04NONE\x10\x00\x12\x07\n\x03\x41\x44\x44\x10\x01\x12\n\n\x06\x44\x45LETE\x10\x02\x12\x07\n\x03\x43RI\x10\x04\x12\t\n\x05LOCAL\x10\x08\x12\n\n\x06STRING\x10\x10\x12\x08\n\x04TEXT\x10 \x12\x07\n\x03TTY\x10@\"+\n\x08LinkType\"\x1f\n\x04\x45num\x12\x0c\n\x08WIRELESS\x10\x00\x12\t\n\x05WIRED\x10\x01\"\x82\x01\n\x0cSessionState\"r\n\x04\x45num\x12\x08\n\x04NONE\x10\x00\x12\x0e\n\nDEFINITION\x10\x01\x12\x11\n\rCONFIGURATION\x10\x02\x12\x11\n\rINSTANTIATION\x10\x03\x12\x0b\n\x07RUNTIME\x10\x04\x12\x0f\n\x0b\x44\x41TACOLLECT\x10\x05\x12\x0c\n\x08SHUTDOWN\x10\x06\"\xbe\x01\n\x08NodeType\"\xb1\x01\n\x04\x45num\x12\x0b\n\x07\x44\x45\x46\x41ULT\x10\x00\x12\x0c\n\x08PHYSICAL\x10\x01\x12\n\n\x06SWITCH\x10\x04\x12\x07\n\x03HUB\x10\x05\x12\x10\n\x0cWIRELESS_LAN\x10\x06\x12\x08\n\x04RJ45\x10\x07\x12\n\n\x06TUNNEL\x10\x08\x12\t\n\x05\x45MANE\x10\n\x12\x0e\n\nTAP_BRIDGE\x10\x0b\x12\x10\n\x0cPEER_TO_PEER\x10\x0c\x12\x0f\n\x0b\x43ONTROL_NET\x10\r\x12\n\n\x06\x44OCKER\x10\x0f\x12\x07\n\x03LXC\x10\x10\"\xa0\x01\n\x10\x43onfigOptionType\"\x8b\x01\n\x04\x45num\x12\x08\n\x04NONE\x10\x00\x12\t\n\x05UINT8\x10\x01\x12\n\n\x06UINT16\x10\x02\x12\n\n\x06UINT32\x10\x03\x12\n\n\x06UINT64\x10\x04\x12\x08\n\x04INT8\x10\x05\x12\t\n\x05INT16\x10\x06\x12\t\n\x05INT32\x10\x07\x12\t\n\x05INT64\x10\x08\x12\t\n\x05\x46LOAT\x10\t\x12\n\n\x06STRING\x10\n\x12\x08\n\x04\x42OOL\x10\x0b\"T\n\x0e\x45xceptionLevel\"B\n\x04\x45num\x12\x0b\n\x07\x44\x45\x46\x41ULT\x10\x00\x12\t\n\x05\x46\x41TAL\x10\x01\x12\t\n\x05\x45RROR\x10\x02\x12\x0b\n\x07WARNING\x10\x03\x12\n\n\x06NOTICE\x10\x04\"J\n\x04Hook\x12&\n\x05state\x18\x01 \x01(\x0e\x32\x17.core.SessionState.Enum\x12\x0c\n\x04\x66ile\x18\x02 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\t\"\x87\x04\n\x07Session\x12\n\n\x02id\x18\x01 \x01(\x05\x12&\n\x05state\x18\x02 \x01(\x0e\x32\x17.core.SessionState.Enum\x12\x19\n\x05nodes\x18\x03 \x03(\x0b\x32\n.core.Node\x12\x19\n\x05links\x18\x04 \x03(\x0b\x32\n.core.Link\x12\x0b\n\x03\x64ir\x18\x05 \x01(\t\x12\x0c\n\x04user\x18\x06 \x01(\t\x12\x33\n\x10\x64\x65\x66\x61ult_services\x18\x07 \x03(\x0b\x32\x19.services.ServiceDefaults\x12\'\n\x08location\x18\x08 \x01(\x0b\x32\x15.core.SessionLocation\x12\x19\n\x05hooks\x18\t \x03(\x0b\x32\n.core.Hook\x12-\n\x08metadata\x18\n \x03(\x0b\x32\x1b.core.Session.MetadataEntry\x12\x0c\n\x04\x66ile\x18\x0b \x01(\t\x12+\n\x07options\x18\x0c \x03(\x0b\x32\x1a.core.Session.OptionsEntry\x12\x1d\n\x07servers\x18\r \x03(\x0b\x32\x0c.core.Server\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x44\n\x0cOptionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.common.ConfigOption:\x02\x38\x01\"n\n\x0eSessionSummary\x12\n\n\x02id\x18\x01 \x01(\x05\x12&\n\x05state\x18\x02 \x01(\x0e\x32\x17.core.SessionState.Enum\x12\r\n\x05nodes\x18\x03 \x01(\x05\x12\x0c\n\x04\x66ile\x18\x04 \x01(\t\x12\x0b\n\x03\x64ir\x18\x05 \x01(\t\"\x85\x07\n\x04Node\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12!\n\x04type\x18\x03 \x01(\x0e\x32\x13.core.NodeType.Enum\x12\r\n\x05model\x18\x04 \x01(\t\x12 \n\x08position\x18\x05 \x01(\x0b\x32\x0e.core.Position\x12\x10\n\x08services\x18\x06 \x03(\t\x12\r\n\x05\x65mane\x18\x07 \x01(\t\x12\x0c\n\x04icon\x18\x08 \x01(\t\x12\r\n\x05image\x18\t \x01(\t\x12\x0e\n\x06server\x18\n \x01(\t\x12\x17\n\x0f\x63onfig_services\x18\x0b \x03(\t\x12\x16\n\x03geo\x18\x0c \x01(\x0b\x32\t.core.Geo\x12\x0b\n\x03\x64ir\x18\r \x01(\t\x12\x0f\n\x07\x63hannel\x18\x0e \x01(\t\x12\x0e\n\x06\x63\x61nvas\x18\x0f \x01(\x05\x12/\n\x0bwlan_config\x18\x10 \x03(\x0b\x32\x1a.core.Node.WlanConfigEntry\x12\x37\n\x0fmobility_config\x18\x11 \x03(\x0b\x32\x1e.core.Node.MobilityConfigEntry\x12\x37\n\x0fservice_configs\x18\x12 \x03(\x0b\x32\x1e.core.Node.ServiceConfigsEntry\x12\x44\n\x16\x63onfig_service_configs\x18\x13 \x03(\x0b\x32$.core.Node.ConfigServiceConfigsEntry\x12-\n\remane_configs\x18\x14 \x03(\x0b\x32\x16.emane.NodeEmaneConfig\x1aG\n\x0fWlanConfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.common.ConfigOption:\x02\x38\x01\x1aK\n\x13MobilityConfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.common.ConfigOption:\x02\x38\x01\x1aR\n\x13ServiceConfigsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12*\n\x05value\x18\x02 \x01(\x0b\x32\x1b.services.NodeServiceConfig:\x02\x38\x01\x1a`\n\x19\x43onfigServiceConfigsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x32\n\x05value\x18\x02 \x01(\x0b\x32#.configservices.ConfigServiceConfig:\x02\x38\x01\"\xe5\x01\n\x04Link\x12\x10\n\x08node1_id\x18\x01 \x01(\x05\x12\x10\n\x08node2_id\x18\x02 \x01(\x05\x12!\n\x04type\x18\x03 \x01(\x0e\x32\x13.core.LinkType.Enum\x12\x1f\n\x06iface1\x18\x04 \x01(\x0b\x32\x0f.core.Interface\x12\x1f\n\x06iface2\x18\x05 \x01(\x0b\x32\x0f.core.Interface\x12\"\n\x07options\x18\x06 \x01(\x0b\x32\x11.core.LinkOptions\x12\x12\n\nnetwork_id\x18\x07 \x01(\x05\x12\r\n\x05label\x18\x08 \x01(\t\x12\r\n\x05\x63olor\x18\t \x01(\t\"\xbb\x01\n\x0bLinkOptions\x12\x0e\n\x06jitter\x18\x01 \x01(\x03\x12\x0b\n\x03key\x18\x02 \x01(\x05\x12\x0e\n\x06mburst\x18\x03 \x01(\x05\x12\x0b\n\x03mer\x18\x04 \x01(\x05\x12\x0c\n\x04loss\x18\x05 \x01(\x02\x12\x11\n\tbandwidth\x18\x06 \x01(\x03\x12\r\n\x05\x62urst\x18\x07 \x01(\x05\x12\r\n\x05\x64\x65lay\x18\x08 \x01(\x03\x12\x0b\n\x03\x64up\x18\t \x01(\x05\x12\x16\n\x0eunidirectional\x18\n \x01(\x08\x12\x0e\n\x06\x62uffer\x18\x0b \x01(\x05\"\xc0\x01\n\tInterface\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0b\n\x03mac\x18\x03 \x01(\t\x12\x0b\n\x03ip4\x18\x04 \x01(\t\x12\x10\n\x08ip4_mask\x18\x05 \x01(\x05\x12\x0b\n\x03ip6\x18\x06 \x01(\t\x12\x10\n\x08ip6_mask\x18\x07 \x01(\x05\x12\x0e\n\x06net_id\x18\x08 \x01(\x05\x12\x0f\n\x07\x66low_id\x18\t \x01(\x05\x12\x0b\n\x03mtu\x18\n \x01(\x05\x12\x0f\n\x07node_id\x18\x0b \x01(\x05\x12\x0f\n\x07net2_id\x18\x0c \x01(\x05\"h\n\x0fSessionLocation\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02\x12\t\n\x01z\x18\x03 \x01(\x02\x12\x0b\n\x03lat\x18\x04 \x01(\x02\x12\x0b\n\x03lon\x18\x05 \x01(\x02\x12\x0b\n\x03\x61lt\x18\x06 \x01(\x02\x12\r\n\x05scale\x18\x07 \x01(\x02\"+\n\x08Position\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02\x12\t\n\x01z\x18\x03 \x01(\x02\",\n\x03Geo\x12\x0b\n\x03lat\x18\x01 \x01(\x02\x12\x0b\n\x03lon\x18\x02 \x01(\x02\x12\x0b\n\x03\x61lt\x18\x03 \x01(\x02\"$\n\x06Server\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04host\x18\x02 \x01(\t2\x89\x1f\n\x07\x43oreApi\x12G\n\x0cStartSession\x12\x19.core.StartSessionRequest\x1a\x1a.core.StartSessionResponse\"\x00\x12\x44\n\x0bStopSession\x12\x18.core.StopSessionRequest\x1a\x19.core.StopSessionResponse\"\x00\x12J\n\rCreateSession\x12\x1a.core.CreateSessionRequest\x1a\x1b.core.CreateSessionResponse\"\x00\x12J\n\rDeleteSession\x12\x1a.core.DeleteSessionRequest\x1a\x1b.core.DeleteSessionResponse\"\x00\x12\x44\n\x0bGetSessions\x12\x18.core.GetSessionsRequest\x1a\x19.core.GetSessionsResponse\"\x00\x12\x41\n\nGetSession\x12\x17.core.GetSessionRequest\x1a\x18.core.GetSessionResponse\"\x00\x12P\n\x0fGetSessionTrace\x12\x1c.core.GetSessionTraceRequest\x1a\x1d.core.GetSessionTraceResponse\"\x00\x12G\n\x0c\x43heckSession\x12\x19.core.CheckSessionRequest\x1a\x1a.core.CheckSessionResponse\"\x00\x12G\n\x0cSessionAlert\x12\x19.core.SessionAlertRequest\x1a\x1a.core.SessionAlertResponse\"\x00\x12.\n\x06\x45vents\x12\x13.core.EventsRequest\x1a\x0b.core.Event\"\x00\x30\x01\x12\x43\n\x0bThroughputs\x12\x18.core.ThroughputsRequest\x1a\x16.core.ThroughputsEvent\"\x00\x30\x01\x12:\n\x08\x43puUsage\x12\x15.core.CpuUsageRequest\x1a\x13.core.CpuUsageEvent\"\x00\x30\x01\x12=\n\tLinkStats\x12\x16.core.LinkStatsRequest\x1a\x14.core.LinkStatsEvent\"\x00\x30\x01\x12\x38\n\x07\x41\x64\x64Node\x12\x14.core.AddNodeRequest\x1a\x15.core.AddNodeResponse\"\x00\x12;\n\x08\x41\x64\x64Nodes\x12\x15.core.AddNodesRequest\x1a\x16.core.AddNodesResponse\"\x00\x12\x38\n\x07GetNode\x12\x14.core.GetNodeRequest\x1a\x15.core.GetNodeResponse\"\x00\x12;\n\x08\x45\x64itNode\x12\x15.core.EditNodeRequest\x1a\x16.core.EditNodeResponse\"\x00\x12\x41\n\nDeleteNode\x12\x17.core.DeleteNodeRequest\x1a\x18.core.DeleteNodeResponse\"\x00\x12\x44\n\x0bNodeCommand\x12\x18.core.NodeCommandRequest\x1a\x19.core.NodeCommandResponse\"\x00\x12P\n\x0fGetNodeTerminal\x12\x1c.core.GetNodeTerminalRequest\x1a\x1d.core.GetNodeTerminalResponse\"\x00\x12;\n\x08MoveNode\x12\x15.core.MoveNodeRequest\x1a\x16.core.MoveNodeResponse\"\x00\x12@\n\tMoveNodes\x12\x16.core.MoveNodesRequest\x1a\x17.core.MoveNodesResponse\"\x00(\x01\x12\x38\n\x07\x41\x64\x64Link\x12\x14.core.AddLinkRequest\x1a\x15.core.AddLinkResponse\"\x00\x12;\n\x08\x45\x64itLink\x12\x15.core.EditLinkRequest\x1a\x16.core.EditLinkResponse\"\x00\x12;\n\x08\x41\x64\x64Links\x12\x15.core.AddLinksRequest\x1a\x16.core.AddLinksResponse\"\x00\x12>\n\tEditLinks\x12\x16.core.EditLinksRequest\x1a\x17.core.EditLinksResponse\"\x00\x12\x41\n\nDeleteLink\x12\x17.core.DeleteLinkRequest\x1a\x18.core.DeleteLinkResponse\"\x00\x12^\n\x11GetMobilityConfig\x12\".mobility.GetMobilityConfigRequest\x1a#.mobility.GetMobilityConfigResponse\"\x00\x12^\n\x11SetMobilityConfig\x12\".mobility.SetMobilityConfigRequest\x1a#.mobility.SetMobilityConfigResponse\"\x00\x12U\n\x0eMobilityAction\x12\x1f.mobility.MobilityActionRequest\x1a .mobility.MobilityActionResponse\"\x00\x12\x64\n\x13GetMobilityTimeline\x12$.mobility.GetMobilityTimelineRequest\x1a%.mobility.GetMobilityTimelineResponse\"\x00\x12\x61\n\x12GetServiceDefaults\x12#.services.GetServiceDefaultsRequest\x1a$.services.GetServiceDefaultsResponse\"\x00\x12\x61\n\x12SetServiceDefaults\x12#.services.SetServiceDefaultsRequest\x1a$.services.SetServiceDefaultsResponse\"\x00\x12U\n\x0eGetNodeService\x12\x1f.services.GetNodeServiceRequest\x1a .services.GetNodeServiceResponse\"\x00\x12\x61\n\x12GetNodeServiceFile\x12#.services.GetNodeServiceFileRequest\x1a$.services.GetNodeServiceFileResponse\"\x00\x12R\n\rServiceAction\x12\x1e.services.ServiceActionRequest\x1a\x1f.services.ServiceActionResponse\"\x00\x12\x7f\n\x18GetConfigServiceDefaults\x12/.configservices.GetConfigServiceDefaultsRequest\x1a\x30.configservices.GetConfigServiceDefaultsResponse\"\x00\x12s\n\x14GetNodeConfigService\x12+.configservices.GetNodeConfigServiceRequest\x1a,.configservices.GetNodeConfigServiceResponse\"\x00\x12X\n\x13\x43onfigServiceAction\x12\x1e.services.ServiceActionRequest\x1a\x1f.services.ServiceActionResponse\"\x00\x12J\n\rGetWlanConfig\x12\x1a.wlan.GetWlanConfigRequest\x1a\x1b.wlan.GetWlanConfigResponse\"\x00\x12J\n\rSetWlanConfig\x12\x1a.wlan.SetWlanConfigRequest\x1a\x1b.wlan.SetWlanConfigResponse\"\x00\x12;\n\x08WlanLink\x12\x15.wlan.WlanLinkRequest\x1a\x16.wlan.WlanLinkResponse\"\x00\x12^\n\x13GetEmaneModelConfig\x12!.emane.GetEmaneModelConfigRequest\x1a\".emane.GetEmaneModelConfigResponse\"\x00\x12^\n\x13SetEmaneModelConfig\x12!.emane.SetEmaneModelConfigRequest\x1a\".emane.SetEmaneModelConfigResponse\"\x00\x12\x61\n\x14GetEmaneEventChannel\x12\".emane.GetEmaneEventChannelRequest\x1a#.emane.GetEmaneEventChannelResponse\"\x00\x12T\n\x0f\x45manePathlosses\x12\x1d.emane.EmanePathlossesRequest\x1a\x1e.emane.EmanePathlossesResponse\"\x00(\x01\x12@\n\tEmaneLink\x12\x17.emane.EmaneLinkRequest\x1a\x18.emane.EmaneLinkResponse\"\x00\x12\x38\n\x07SaveXml\x12\x14.core.SaveXmlRequest\x1a\x15.core.SaveXmlResponse\"\x00\x12\x38\n\x07OpenXml\x12\x14.core.OpenXmlRequest\x1a\x15.core.OpenXmlResponse\"\x00\x12J\n\rGetInterfaces\x12\x1a.core.GetInterfacesRequest\x1a\x1b.core.GetInterfacesResponse\"\x00\x12J\n\rExecuteScript\x12\x1a.core.ExecuteScriptRequest\x1a\x1b.core.ExecuteScriptResponse\"\x00\x12>\n\tGetConfig\x12\x16.core.GetConfigRequest\x1a\x17.core.GetConfigResponse\"\x00\x62\x06proto3')
+
+
+
+_GETCONFIGREQUEST = DESCRIPTOR.message_types_by_name['GetConfigRequest']
+_GETCONFIGRESPONSE = DESCRIPTOR.message_types_by_name['GetConfigResponse']
+_NODEPOOLSTATS = DESCRIPTOR.message_types_by_name['NodePoolStats']
+_STARTSESSIONREQUEST = DESCRIPTOR.message_types_by_name['StartSessionRequest']
+_STARTSESSIONRESPONSE = DESCRIPTOR.message_types_by_name['StartSessionResponse']
+_SESSIONCHANGES = DESCRIPTOR.message_types_by_name['SessionChanges']
+_STOPSESSIONREQUEST = DESCRIPTOR.message_types_by_name['StopSessionRequest']
+_STOPSESSIONRESPONSE = DESCRIPTOR.message_types_by_name['StopSessionResponse']
+_CREATESESSIONREQUEST = DESCRIPTOR.message_types_by_name['CreateSessionRequest']
+_CREATESESSIONRESPONSE = DESCRIPTOR.message_types_by_name['CreateSessionResponse']
+_DELETESESSIONREQUEST = DESCRIPTOR.message_types_by_name['DeleteSessionRequest']
+_DELETESESSIONRESPONSE = DESCRIPTOR.message_types_by_name['DeleteSessionResponse']
+_GETSESSIONSREQUEST = DESCRIPTOR.message_types_by_name['GetSessionsRequest']
+_GETSESSIONSRESPONSE = DESCRIPTOR.message_types_by_name['GetSessionsResponse']
+_CHECKSESSIONREQUEST = DESCRIPTOR.message_types_by_name['CheckSessionRequest']
+_CHECKSESSIONRESPONSE = DESCRIPTOR.message_types_by_name['CheckSessionResponse']
+_GETSESSIONREQUEST = DESCRIPTOR.message_types_by_name['GetSessionRequest']
+_GETSESSIONRESPONSE = DESCRIPTOR.message_types_by_name['GetSessionResponse']
+_GETSESSIONTRACEREQUEST = DESCRIPTOR.message_types_by_name['GetSessionTraceRequest']
+_GETSESSIONTRACERESPONSE = DESCRIPTOR.message_types_by_name['GetSessionTraceResponse']
+_SESSIONALERTREQUEST = DESCRIPTOR.message_types_by_name['SessionAlertRequest']
+_SESSIONALERTRESPONSE = DESCRIPTOR.message_types_by_name['SessionAlertResponse']
+_EVENTSREQUEST = DESCRIPTOR.message_types_by_name['EventsRequest']
+_EVENTREGION = DESCRIPTOR.message_types_by_name['EventRegion']
+_EVENTSTREAMSTATS = DESCRIPTOR.message_types_by_name['EventStreamStats']
+_THROUGHPUTSREQUEST = DESCRIPTOR.message_types_by_name['ThroughputsRequest']
+_THROUGHPUTSEVENT = DESCRIPTOR.message_types_by_name['ThroughputsEvent']
+_LINKSTATSREQUEST = DESCRIPTOR.message_types_by_name['LinkStatsRequest']
+_LINKSTATS = DESCRIPTOR.message_types_by_name['LinkStats']
+_NETWORKSTATS = DESCRIPTOR.message_types_by_name['NetworkStats']
+_LINKSTATSEVENT = DESCRIPTOR.message_types_by_name['LinkStatsEvent']
+_CPUUSAGEREQUEST = DESCRIPTOR.message_types_by_name['CpuUsageRequest']
+_CPUUSAGEEVENT = DESCRIPTOR.message_types_by_name['CpuUsageEvent']
+_INTERFACETHROUGHPUT = DESCRIPTOR.message_types_by_name['InterfaceThroughput']
+_BRIDGETHROUGHPUT = DESCRIPTOR.message_types_by_name['BridgeThroughput']
+_EVENT = DESCRIPTOR.message_types_by_name['Event']
+_NODEEVENT = DESCRIPTOR.message_types_by_name['NodeEvent']
+_LINKEVENT = DESCRIPTOR.message_types_by_name['LinkEvent']
+_SESSIONEVENT = DESCRIPTOR.message_types_by_name['SessionEvent']
+_CONFIGEVENT = DESCRIPTOR.message_types_by_name['ConfigEvent']
+_EXCEPTIONEVENT = DESCRIPTOR.message_types_by_name['ExceptionEvent']
+_FILEEVENT = DESCRIPTOR.message_types_by_name['FileEvent']
+_ADDNODEREQUEST = DESCRIPTOR.message_types_by_name['AddNodeRequest']
+_ADDNODERESPONSE = DESCRIPTOR.message_types_by_name['AddNodeResponse']
+_ADDNODESREQUEST = DESCRIPTOR.message_types_by_name['AddNodesRequest']
+_ADDNODERESULT = DESCRIPTOR.message_types_by_name['AddNodeResult']
+_ADDNODESRESPONSE = DESCRIPTOR.message_types_by_name['AddNodesResponse']
+_GETNODEREQUEST = DESCRIPTOR.message_types_by_name['GetNodeRequest']
+_GETNODERESPONSE = DESCRIPTOR.message_types_by_name['GetNodeResponse']
+_EDITNODEREQUEST = DESCRIPTOR.message_types_by_name['EditNodeRequest']
+_EDITNODERESPONSE = DESCRIPTOR.message_types_by_name['EditNodeResponse']
+_DELETENODEREQUEST = DESCRIPTOR.message_types_by_name['DeleteNodeRequest']
+_DELETENODERESPONSE = DESCRIPTOR.message_types_by_name['DeleteNodeResponse']
+_GETNODETERMINALREQUEST = DESCRIPTOR.message_types_by_name['GetNodeTerminalRequest']
+_GETNODETERMINALRESPONSE = DESCRIPTOR.message_types_by_name['GetNodeTerminalResponse']
+_MOVENODEREQUEST = DESCRIPTOR.message_types_by_name['MoveNodeRequest']
+_MOVENODERESPONSE = DESCRIPTOR.message_types_by_name['MoveNodeResponse']
+_MOVENODESREQUEST = DESCRIPTOR.message_types_by_name['MoveNodesRequest']
+_MOVENODESRESPONSE = DESCRIPTOR.message_types_by_name['MoveNodesResponse']
+_NODECOMMANDREQUEST = DESCRIPTOR.message_types_by_name['NodeCommandRequest']
+_NODECOMMANDRESPONSE = DESCRIPTOR.message_types_by_name['NodeCommandResponse']
+_ADDLINKREQUEST = DESCRIPTOR.message_types_by_name['AddLinkRequest']
+_ADDLINKRESPONSE = DESCRIPTOR.message_types_by_name['AddLinkResponse']
+_EDITLINKREQUEST = DESCRIPTOR.message_types_by_name['EditLinkRequest']
+_EDITLINKRESPONSE = DESCRIPTOR.message_types_by_name['EditLinkResponse']
+_ADDLINKSREQUEST = DESCRIPTOR.message_types_by_name['AddLinksRequest']
+_ADDLINKRESULT = DESCRIPTOR.message_types_by_name['AddLinkResult']
+_ADDLINKSRESPONSE = DESCRIPTOR.message_types_by_name['AddLinksResponse']
+_EDITLINKSREQUEST = DESCRIPTOR.message_types_by_name['EditLinksRequest']
+_EDITLINKRESULT = DESCRIPTOR.message_types_by_name['EditLinkResult']
+_EDITLINKSRESPONSE = DESCRIPTOR.message_types_by_name['EditLinksResponse']
+_DELETELINKREQUEST = DESCRIPTOR.message_types_by_name['DeleteLinkRequest']
+_DELETELINKRESPONSE = DESCRIPTOR.message_types_by_name['DeleteLinkResponse']
+_SAVEXMLREQUEST = DESCRIPTOR.message_types_by_name['SaveXmlRequest']
+_SAVEXMLRESPONSE = DESCRIPTOR.message_types_by_name['SaveXmlResponse']
+_OPENXMLREQUEST = DESCRIPTOR.message_types_by_name['OpenXmlRequest']
+_OPENXMLRESPONSE = DESCRIPTOR.message_types_by_name['OpenXmlResponse']
+_GETINTERFACESREQUEST = DESCRIPTOR.message_types_by_name['GetInterfacesRequest']
+_GETINTERFACESRESPONSE = DESCRIPTOR.message_types_by_name['GetInterfacesResponse']
+_EXECUTESCRIPTREQUEST = DESCRIPTOR.message_types_by_name['ExecuteScriptRequest']
+_EXECUTESCRIPTRESPONSE = DESCRIPTOR.message_types_by_name['ExecuteScriptResponse']
+_EVENTTYPE = DESCRIPTOR.message_types_by_name['EventType']
+_EVENTOVERFLOW = DESCRIPTOR.message_types_by_name['EventOverflow']
+_MESSAGETYPE = DESCRIPTOR.message_types_by_name['MessageType']
+_LINKTYPE = DESCRIPTOR.message_types_by_name['LinkType']
+_SESSIONSTATE = DESCRIPTOR.message_types_by_name['SessionState']
+_NODETYPE = DESCRIPTOR.message_types_by_name['NodeType']
+_CONFIGOPTIONTYPE = DESCRIPTOR.message_types_by_name['ConfigOptionType']
+_EXCEPTIONLEVEL = DESCRIPTOR.message_types_by_name['ExceptionLevel']
+_HOOK = DESCRIPTOR.message_types_by_name['Hook']
+_SESSION = DESCRIPTOR.message_types_by_name['Session']
+_SESSION_METADATAENTRY = _SESSION.nested_types_by_name['MetadataEntry']
+_SESSION_OPTIONSENTRY = _SESSION.nested_types_by_name['OptionsEntry']
+_SESSIONSUMMARY = DESCRIPTOR.message_types_by_name['SessionSummary']
+_NODE = DESCRIPTOR.message_types_by_name['Node']
+_NODE_WLANCONFIGENTRY = _NODE.nested_types_by_name['WlanConfigEntry']
+_NODE_MOBILITYCONFIGENTRY = _NODE.nested_types_by_name['MobilityConfigEntry']
+_NODE_SERVICECONFIGSENTRY = _NODE.nested_types_by_name['ServiceConfigsEntry']
+_NODE_CONFIGSERVICECONFIGSENTRY = _NODE.nested_types_by_name['ConfigServiceConfigsEntry']
+_LINK = DESCRIPTOR.message_types_by_name['Link']
+_LINKOPTIONS = DESCRIPTOR.message_types_by_name['LinkOptions']
+_INTERFACE = DESCRIPTOR.message_types_by_name['Interface']
+_SESSIONLOCATION = DESCRIPTOR.message_types_by_name['SessionLocation']
+_POSITION = DESCRIPTOR.message_types_by_name['Position']
+_GEO = DESCRIPTOR.message_types_by_name['Geo']
+_SERVER = DESCRIPTOR.message_types_by_name['Server']
+_EVENTTYPE_ENUM = _EVENTTYPE.enum_types_by_name['Enum']
+_EVENTOVERFLOW_ENUM = _EVENTOVERFLOW.enum_types_by_name['Enum']
+_MESSAGETYPE_ENUM = _MESSAGETYPE.enum_types_by_name['Enum']
+_LINKTYPE_ENUM = _LINKTYPE.enum_types_by_name['Enum']
+_SESSIONSTATE_ENUM = _SESSIONSTATE.enum_types_by_name['Enum']
+_NODETYPE_ENUM = _NODETYPE.enum_types_by_name['Enum']
+_CONFIGOPTIONTYPE_ENUM = _CONFIGOPTIONTYPE.enum_types_by_name['Enum']
+_EXCEPTIONLEVEL_ENUM = _EXCEPTIONLEVEL.enum_types_by_name['Enum']
+GetConfigRequest = _reflection.GeneratedProtocolMessageType('GetConfigRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETCONFIGREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.GetConfigRequest)
+  })
+_sym_db.RegisterMessage(GetConfigRequest)
+
+GetConfigResponse = _reflection.GeneratedProtocolMessageType('GetConfigResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETCONFIGRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.GetConfigResponse)
+  })
+_sym_db.RegisterMessage(GetConfigResponse)
+
+NodePoolStats = _reflection.GeneratedProtocolMessageType('NodePoolStats', (_message.Message,), {
+  'DESCRIPTOR' : _NODEPOOLSTATS,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.NodePoolStats)
+  })
+_sym_db.RegisterMessage(NodePoolStats)
+
+StartSessionRequest = _reflection.GeneratedProtocolMessageType('StartSessionRequest', (_message.Message,), {
+  'DESCRIPTOR' : _STARTSESSIONREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.StartSessionRequest)
+  })
+_sym_db.RegisterMessage(StartSessionRequest)
+
+StartSessionResponse = _reflection.GeneratedProtocolMessageType('StartSessionResponse', (_message.Message,), {
+  'DESCRIPTOR' : _STARTSESSIONRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.StartSessionResponse)
+  })
+_sym_db.RegisterMessage(StartSessionResponse)
+
+SessionChanges = _reflection.GeneratedProtocolMessageType('SessionChanges', (_message.Message,), {
+  'DESCRIPTOR' : _SESSIONCHANGES,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.SessionChanges)
+  })
+_sym_db.RegisterMessage(SessionChanges)
+
+StopSessionRequest = _reflection.GeneratedProtocolMessageType('StopSessionRequest', (_message.Message,), {
+  'DESCRIPTOR' : _STOPSESSIONREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.StopSessionRequest)
+  })
+_sym_db.RegisterMessage(StopSessionRequest)
+
+StopSessionResponse = _reflection.GeneratedProtocolMessageType('StopSessionResponse', (_message.Message,), {
+  'DESCRIPTOR' : _STOPSESSIONRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.StopSessionResponse)
+  })
+_sym_db.RegisterMessage(StopSessionResponse)
+
+CreateSessionRequest = _reflection.GeneratedProtocolMessageType('CreateSessionRequest', (_message.Message,), {
+  'DESCRIPTOR' : _CREATESESSIONREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.CreateSessionRequest)
+  })
+_sym_db.RegisterMessage(CreateSessionRequest)
+
+CreateSessionResponse = _reflection.GeneratedProtocolMessageType('CreateSessionResponse', (_message.Message,), {
+  'DESCRIPTOR' : _CREATESESSIONRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.CreateSessionResponse)
+  })
+_sym_db.RegisterMessage(CreateSessionResponse)
+
+DeleteSessionRequest = _reflection.GeneratedProtocolMessageType('DeleteSessionRequest', (_message.Message,), {
+  'DESCRIPTOR' : _DELETESESSIONREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.DeleteSessionRequest)
+  })
+_sym_db.RegisterMessage(DeleteSessionRequest)
+
+DeleteSessionResponse = _reflection.GeneratedProtocolMessageType('DeleteSessionResponse', (_message.Message,), {
+  'DESCRIPTOR' : _DELETESESSIONRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.DeleteSessionResponse)
+  })
+_sym_db.RegisterMessage(DeleteSessionResponse)
+
+GetSessionsRequest = _reflection.GeneratedProtocolMessageType('GetSessionsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETSESSIONSREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.GetSessionsRequest)
+  })
+_sym_db.RegisterMessage(GetSessionsRequest)
+
+GetSessionsResponse = _reflection.GeneratedProtocolMessageType('GetSessionsResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETSESSIONSRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.GetSessionsResponse)
+  })
+_sym_db.RegisterMessage(GetSessionsResponse)
+
+CheckSessionRequest = _reflection.GeneratedProtocolMessageType('CheckSessionRequest', (_message.Message,), {
+  'DESCRIPTOR' : _CHECKSESSIONREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.CheckSessionRequest)
+  })
+_sym_db.RegisterMessage(CheckSessionRequest)
+
+CheckSessionResponse = _reflection.GeneratedProtocolMessageType('CheckSessionResponse', (_message.Message,), {
+  'DESCRIPTOR' : _CHECKSESSIONRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.CheckSessionResponse)
+  })
+_sym_db.RegisterMessage(CheckSessionResponse)
+
+GetSessionRequest = _reflection.GeneratedProtocolMessageType('GetSessionRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETSESSIONREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.GetSessionRequest)
+  })
+_sym_db.RegisterMessage(GetSessionRequest)
+
+GetSessionResponse = _reflection.GeneratedProtocolMessageType('GetSessionResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETSESSIONRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.GetSessionResponse)
+  })
+_sym_db.RegisterMessage(GetSessionResponse)
+
+GetSessionTraceRequest = _reflection.GeneratedProtocolMessageType('GetSessionTraceRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETSESSIONTRACEREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.GetSessionTraceRequest)
+  })
+_sym_db.RegisterMessage(GetSessionTraceRequest)
+
+GetSessionTraceResponse = _reflection.GeneratedProtocolMessageType('GetSessionTraceResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETSESSIONTRACERESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.GetSessionTraceResponse)
+  })
+_sym_db.RegisterMessage(GetSessionTraceResponse)
+
+SessionAlertRequest = _reflection.GeneratedProtocolMessageType('SessionAlertRequest', (_message.Message,), {
+  'DESCRIPTOR' : _SESSIONALERTREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.SessionAlertRequest)
+  })
+_sym_db.RegisterMessage(SessionAlertRequest)
+
+SessionAlertResponse = _reflection.GeneratedProtocolMessageType('SessionAlertResponse', (_message.Message,), {
+  'DESCRIPTOR' : _SESSIONALERTRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.SessionAlertResponse)
+  })
+_sym_db.RegisterMessage(SessionAlertResponse)
+
+EventsRequest = _reflection.GeneratedProtocolMessageType('EventsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _EVENTSREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.EventsRequest)
+  })
+_sym_db.RegisterMessage(EventsRequest)
+
+EventRegion = _reflection.GeneratedProtocolMessageType('EventRegion', (_message.Message,), {
+  'DESCRIPTOR' : _EVENTREGION,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.EventRegion)
+  })
+_sym_db.RegisterMessage(EventRegion)
+
+EventStreamStats = _reflection.GeneratedProtocolMessageType('EventStreamStats', (_message.Message,), {
+  'DESCRIPTOR' : _EVENTSTREAMSTATS,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.EventStreamStats)
+  })
+_sym_db.RegisterMessage(EventStreamStats)
+
+ThroughputsRequest = _reflection.GeneratedProtocolMessageType('ThroughputsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _THROUGHPUTSREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.ThroughputsRequest)
+  })
+_sym_db.RegisterMessage(ThroughputsRequest)
+
+ThroughputsEvent = _reflection.GeneratedProtocolMessageType('ThroughputsEvent', (_message.Message,), {
+  'DESCRIPTOR' : _THROUGHPUTSEVENT,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.ThroughputsEvent)
+  })
+_sym_db.RegisterMessage(ThroughputsEvent)
+
+LinkStatsRequest = _reflection.GeneratedProtocolMessageType('LinkStatsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _LINKSTATSREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.LinkStatsRequest)
+  })
+_sym_db.RegisterMessage(LinkStatsRequest)
+
+LinkStats = _reflection.GeneratedProtocolMessageType('LinkStats', (_message.Message,), {
+  'DESCRIPTOR' : _LINKSTATS,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.LinkStats)
+  })
+_sym_db.RegisterMessage(LinkStats)
+
+NetworkStats = _reflection.GeneratedProtocolMessageType('NetworkStats', (_message.Message,), {
+  'DESCRIPTOR' : _NETWORKSTATS,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.NetworkStats)
+  })
+_sym_db.RegisterMessage(NetworkStats)
+
+LinkStatsEvent = _reflection.GeneratedProtocolMessageType('LinkStatsEvent', (_message.Message,), {
+  'DESCRIPTOR' : _LINKSTATSEVENT,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.LinkStatsEvent)
+  })
+_sym_db.RegisterMessage(LinkStatsEvent)
+
+CpuUsageRequest = _reflection.GeneratedProtocolMessageType('CpuUsageRequest', (_message.Message,), {
+  'DESCRIPTOR' : _CPUUSAGEREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.CpuUsageRequest)
+  })
+_sym_db.RegisterMessage(CpuUsageRequest)
+
+CpuUsageEvent = _reflection.GeneratedProtocolMessageType('CpuUsageEvent', (_message.Message,), {
+  'DESCRIPTOR' : _CPUUSAGEEVENT,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.CpuUsageEvent)
+  })
+_sym_db.RegisterMessage(CpuUsageEvent)
+
+InterfaceThroughput = _reflection.GeneratedProtocolMessageType('InterfaceThroughput', (_message.Message,), {
+  'DESCRIPTOR' : _INTERFACETHROUGHPUT,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.InterfaceThroughput)
+  })
+_sym_db.RegisterMessage(InterfaceThroughput)
+
+BridgeThroughput = _reflection.GeneratedProtocolMessageType('BridgeThroughput', (_message.Message,), {
+  'DESCRIPTOR' : _BRIDGETHROUGHPUT,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.BridgeThroughput)
+  })
+_sym_db.RegisterMessage(BridgeThroughput)
+
+Event = _reflection.GeneratedProtocolMessageType('Event', (_message.Message,), {
+  'DESCRIPTOR' : _EVENT,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.Event)
+  })
+_sym_db.RegisterMessage(Event)
+
+NodeEvent = _reflection.GeneratedProtocolMessageType('NodeEvent', (_message.Message,), {
+  'DESCRIPTOR' : _NODEEVENT,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.NodeEvent)
+  })
+_sym_db.RegisterMessage(NodeEvent)
+
+LinkEvent = _reflection.GeneratedProtocolMessageType('LinkEvent', (_message.Message,), {
+  'DESCRIPTOR' : _LINKEVENT,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.LinkEvent)
+  })
+_sym_db.RegisterMessage(LinkEvent)
+
+SessionEvent = _reflection.GeneratedProtocolMessageType('SessionEvent', (_message.Message,), {
+  'DESCRIPTOR' : _SESSIONEVENT,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.SessionEvent)
+  })
+_sym_db.RegisterMessage(SessionEvent)
+
+ConfigEvent = _reflection.GeneratedProtocolMessageType('ConfigEvent', (_message.Message,), {
+  'DESCRIPTOR' : _CONFIGEVENT,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.ConfigEvent)
+  })
+_sym_db.RegisterMessage(ConfigEvent)
+
+ExceptionEvent = _reflection.GeneratedProtocolMessageType('ExceptionEvent', (_message.Message,), {
+  'DESCRIPTOR' : _EXCEPTIONEVENT,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.ExceptionEvent)
+  })
+_sym_db.RegisterMessage(ExceptionEvent)
+
+FileEvent = _reflection.GeneratedProtocolMessageType('FileEvent', (_message.Message,), {
+  'DESCRIPTOR' : _FILEEVENT,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.FileEvent)
+  })
+_sym_db.RegisterMessage(FileEvent)
+
+AddNodeRequest = _reflection.GeneratedProtocolMessageType('AddNodeRequest', (_message.Message,), {
+  'DESCRIPTOR' : _ADDNODEREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.AddNodeRequest)
+  })
+_sym_db.RegisterMessage(AddNodeRequest)
+
+AddNodeResponse = _reflection.GeneratedProtocolMessageType('AddNodeResponse', (_message.Message,), {
+  'DESCRIPTOR' : _ADDNODERESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.AddNodeResponse)
+  })
+_sym_db.RegisterMessage(AddNodeResponse)
+
+AddNodesRequest = _reflection.GeneratedProtocolMessageType('AddNodesRequest', (_message.Message,), {
+  'DESCRIPTOR' : _ADDNODESREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.AddNodesRequest)
+  })
+_sym_db.RegisterMessage(AddNodesRequest)
+
+AddNodeResult = _reflection.GeneratedProtocolMessageType('AddNodeResult', (_message.Message,), {
+  'DESCRIPTOR' : _ADDNODERESULT,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.AddNodeResult)
+  })
+_sym_db.RegisterMessage(AddNodeResult)
+
+AddNodesResponse = _reflection.GeneratedProtocolMessageType('AddNodesResponse', (_message.Message,), {
+  'DESCRIPTOR' : _ADDNODESRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.AddNodesResponse)
+  })
+_sym_db.RegisterMessage(AddNodesResponse)
+
+GetNodeRequest = _reflection.GeneratedProtocolMessageType('GetNodeRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETNODEREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.GetNodeRequest)
+  })
+_sym_db.RegisterMessage(GetNodeRequest)
+
+GetNodeResponse = _reflection.GeneratedProtocolMessageType('GetNodeResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETNODERESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.GetNodeResponse)
+  })
+_sym_db.RegisterMessage(GetNodeResponse)
+
+EditNodeRequest = _reflection.GeneratedProtocolMessageType('EditNodeRequest', (_message.Message,), {
+  'DESCRIPTOR' : _EDITNODEREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.EditNodeRequest)
+  })
+_sym_db.RegisterMessage(EditNodeRequest)
+
+EditNodeResponse = _reflection.GeneratedProtocolMessageType('EditNodeResponse', (_message.Message,), {
+  'DESCRIPTOR' : _EDITNODERESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.EditNodeResponse)
+  })
+_sym_db.RegisterMessage(EditNodeResponse)
+
+DeleteNodeRequest = _reflection.GeneratedProtocolMessageType('DeleteNodeRequest', (_message.Message,), {
+  'DESCRIPTOR' : _DELETENODEREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.DeleteNodeRequest)
+  })
+_sym_db.RegisterMessage(DeleteNodeRequest)
+
+DeleteNodeResponse = _reflection.GeneratedProtocolMessageType('DeleteNodeResponse', (_message.Message,), {
+  'DESCRIPTOR' : _DELETENODERESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.DeleteNodeResponse)
+  })
+_sym_db.RegisterMessage(DeleteNodeResponse)
+
+GetNodeTerminalRequest = _reflection.GeneratedProtocolMessageType('GetNodeTerminalRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETNODETERMINALREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.GetNodeTerminalRequest)
+  })
+_sym_db.RegisterMessage(GetNodeTerminalRequest)
+
+GetNodeTerminalResponse = _reflection.GeneratedProtocolMessageType('GetNodeTerminalResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETNODETERMINALRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.GetNodeTerminalResponse)
+  })
+_sym_db.RegisterMessage(GetNodeTerminalResponse)
+
+MoveNodeRequest = _reflection.GeneratedProtocolMessageType('MoveNodeRequest', (_message.Message,), {
+  'DESCRIPTOR' : _MOVENODEREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.MoveNodeRequest)
+  })
+_sym_db.RegisterMessage(MoveNodeRequest)
+
+MoveNodeResponse = _reflection.GeneratedProtocolMessageType('MoveNodeResponse', (_message.Message,), {
+  'DESCRIPTOR' : _MOVENODERESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.MoveNodeResponse)
+  })
+_sym_db.RegisterMessage(MoveNodeResponse)
+
+MoveNodesRequest = _reflection.GeneratedProtocolMessageType('MoveNodesRequest', (_message.Message,), {
+  'DESCRIPTOR' : _MOVENODESREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.MoveNodesRequest)
+  })
+_sym_db.RegisterMessage(MoveNodesRequest)
+
+MoveNodesResponse = _reflection.GeneratedProtocolMessageType('MoveNodesResponse', (_message.Message,), {
+  'DESCRIPTOR' : _MOVENODESRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.MoveNodesResponse)
+  })
+_sym_db.RegisterMessage(MoveNodesResponse)
+
+NodeCommandRequest = _reflection.GeneratedProtocolMessageType('NodeCommandRequest', (_message.Message,), {
+  'DESCRIPTOR' : _NODECOMMANDREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.NodeCommandRequest)
+  })
+_sym_db.RegisterMessage(NodeCommandRequest)
+
+NodeCommandResponse = _reflection.GeneratedProtocolMessageType('NodeCommandResponse', (_message.Message,), {
+  'DESCRIPTOR' : _NODECOMMANDRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.NodeCommandResponse)
+  })
+_sym_db.RegisterMessage(NodeCommandResponse)
+
+AddLinkRequest = _reflection.GeneratedProtocolMessageType('AddLinkRequest', (_message.Message,), {
+  'DESCRIPTOR' : _ADDLINKREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.AddLinkRequest)
+  })
+_sym_db.RegisterMessage(AddLinkRequest)
+
+AddLinkResponse = _reflection.GeneratedProtocolMessageType('AddLinkResponse', (_message.Message,), {
+  'DESCRIPTOR' : _ADDLINKRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.AddLinkResponse)
+  })
+_sym_db.RegisterMessage(AddLinkResponse)
+
+EditLinkRequest = _reflection.GeneratedProtocolMessageType('EditLinkRequest', (_message.Message,), {
+  'DESCRIPTOR' : _EDITLINKREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.EditLinkRequest)
+  })
+_sym_db.RegisterMessage(EditLinkRequest)
+
+EditLinkResponse = _reflection.GeneratedProtocolMessageType('EditLinkResponse', (_message.Message,), {
+  'DESCRIPTOR' : _EDITLINKRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.EditLinkResponse)
+  })
+_sym_db.RegisterMessage(EditLinkResponse)
+
+AddLinksRequest = _reflection.GeneratedProtocolMessageType('AddLinksRequest', (_message.Message,), {
+  'DESCRIPTOR' : _ADDLINKSREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.AddLinksRequest)
+  })
+_sym_db.RegisterMessage(AddLinksRequest)
+
+AddLinkResult = _reflection.GeneratedProtocolMessageType('AddLinkResult', (_message.Message,), {
+  'DESCRIPTOR' : _ADDLINKRESULT,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.AddLinkResult)
+  })
+_sym_db.RegisterMessage(AddLinkResult)
+
+AddLinksResponse = _reflection.GeneratedProtocolMessageType('AddLinksResponse', (_message.Message,), {
+  'DESCRIPTOR' : _ADDLINKSRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.AddLinksResponse)
+  })
+_sym_db.RegisterMessage(AddLinksResponse)
+
+EditLinksRequest = _reflection.GeneratedProtocolMessageType('EditLinksRequest', (_message.Message,), {
+  'DESCRIPTOR' : _EDITLINKSREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.EditLinksRequest)
+  })
+_sym_db.RegisterMessage(EditLinksRequest)
+
+EditLinkResult = _reflection.GeneratedProtocolMessageType('EditLinkResult', (_message.Message,), {
+  'DESCRIPTOR' : _EDITLINKRESULT,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.EditLinkResult)
+  })
+_sym_db.RegisterMessage(EditLinkResult)
+
+EditLinksResponse = _reflection.GeneratedProtocolMessageType('EditLinksResponse', (_message.Message,), {
+  'DESCRIPTOR' : _EDITLINKSRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.EditLinksResponse)
+  })
+_sym_db.RegisterMessage(EditLinksResponse)
+
+DeleteLinkRequest = _reflection.GeneratedProtocolMessageType('DeleteLinkRequest', (_message.Message,), {
+  'DESCRIPTOR' : _DELETELINKREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.DeleteLinkRequest)
+  })
+_sym_db.RegisterMessage(DeleteLinkRequest)
+
+DeleteLinkResponse = _reflection.GeneratedProtocolMessageType('DeleteLinkResponse', (_message.Message,), {
+  'DESCRIPTOR' : _DELETELINKRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.DeleteLinkResponse)
+  })
+_sym_db.RegisterMessage(DeleteLinkResponse)
+
+SaveXmlRequest = _reflection.GeneratedProtocolMessageType('SaveXmlRequest', (_message.Message,), {
+  'DESCRIPTOR' : _SAVEXMLREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.SaveXmlRequest)
+  })
+_sym_db.RegisterMessage(SaveXmlRequest)
+
+SaveXmlResponse = _reflection.GeneratedProtocolMessageType('SaveXmlResponse', (_message.Message,), {
+  'DESCRIPTOR' : _SAVEXMLRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.SaveXmlResponse)
+  })
+_sym_db.RegisterMessage(SaveXmlResponse)
+
+OpenXmlRequest = _reflection.GeneratedProtocolMessageType('OpenXmlRequest', (_message.Message,), {
+  'DESCRIPTOR' : _OPENXMLREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.OpenXmlRequest)
+  })
+_sym_db.RegisterMessage(OpenXmlRequest)
+
+OpenXmlResponse = _reflection.GeneratedProtocolMessageType('OpenXmlResponse', (_message.Message,), {
+  'DESCRIPTOR' : _OPENXMLRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.OpenXmlResponse)
+  })
+_sym_db.RegisterMessage(OpenXmlResponse)
+
+GetInterfacesRequest = _reflection.GeneratedProtocolMessageType('GetInterfacesRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETINTERFACESREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.GetInterfacesRequest)
+  })
+_sym_db.RegisterMessage(GetInterfacesRequest)
+
+GetInterfacesResponse = _reflection.GeneratedProtocolMessageType('GetInterfacesResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETINTERFACESRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.GetInterfacesResponse)
+  })
+_sym_db.RegisterMessage(GetInterfacesResponse)
+
+ExecuteScriptRequest = _reflection.GeneratedProtocolMessageType('ExecuteScriptRequest', (_message.Message,), {
+  'DESCRIPTOR' : _EXECUTESCRIPTREQUEST,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.ExecuteScriptRequest)
+  })
+_sym_db.RegisterMessage(ExecuteScriptRequest)
+
+ExecuteScriptResponse = _reflection.GeneratedProtocolMessageType('ExecuteScriptResponse', (_message.Message,), {
+  'DESCRIPTOR' : _EXECUTESCRIPTRESPONSE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.ExecuteScriptResponse)
+  })
+_sym_db.RegisterMessage(ExecuteScriptResponse)
+
+EventType = _reflection.GeneratedProtocolMessageType('EventType', (_message.Message,), {
+  'DESCRIPTOR' : _EVENTTYPE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.EventType)
+  })
+_sym_db.RegisterMessage(EventType)
+
+EventOverflow = _reflection.GeneratedProtocolMessageType('EventOverflow', (_message.Message,), {
+  'DESCRIPTOR' : _EVENTOVERFLOW,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.EventOverflow)
+  })
+_sym_db.RegisterMessage(EventOverflow)
+
+MessageType = _reflection.GeneratedProtocolMessageType('MessageType', (_message.Message,), {
+  'DESCRIPTOR' : _MESSAGETYPE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.MessageType)
+  })
+_sym_db.RegisterMessage(MessageType)
+
+LinkType = _reflection.GeneratedProtocolMessageType('LinkType', (_message.Message,), {
+  'DESCRIPTOR' : _LINKTYPE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.LinkType)
+  })
+_sym_db.RegisterMessage(LinkType)
+
+SessionState = _reflection.GeneratedProtocolMessageType('SessionState', (_message.Message,), {
+  'DESCRIPTOR' : _SESSIONSTATE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.SessionState)
+  })
+_sym_db.RegisterMessage(SessionState)
+
+NodeType = _reflection.GeneratedProtocolMessageType('NodeType', (_message.Message,), {
+  'DESCRIPTOR' : _NODETYPE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.NodeType)
+  })
+_sym_db.RegisterMessage(NodeType)
+
+ConfigOptionType = _reflection.GeneratedProtocolMessageType('ConfigOptionType', (_message.Message,), {
+  'DESCRIPTOR' : _CONFIGOPTIONTYPE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.ConfigOptionType)
+  })
+_sym_db.RegisterMessage(ConfigOptionType)
+
+ExceptionLevel = _reflection.GeneratedProtocolMessageType('ExceptionLevel', (_message.Message,), {
+  'DESCRIPTOR' : _EXCEPTIONLEVEL,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.ExceptionLevel)
+  })
+_sym_db.RegisterMessage(ExceptionLevel)
+
+Hook = _reflection.GeneratedProtocolMessageType('Hook', (_message.Message,), {
+  'DESCRIPTOR' : _HOOK,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.Hook)
+  })
+_sym_db.RegisterMessage(Hook)
+
+Session = _reflection.GeneratedProtocolMessageType('Session', (_message.Message,), {
+
+  'MetadataEntry' : _reflection.GeneratedProtocolMessageType('MetadataEntry', (_message.Message,), {
+    'DESCRIPTOR' : _SESSION_METADATAENTRY,
+    '__module__' : 'core.api.grpc.core_pb2'
+    # @@protoc_insertion_point(class_scope:core.Session.MetadataEntry)
+    })
+  ,
+
+  'OptionsEntry' : _reflection.GeneratedProtocolMessageType('OptionsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _SESSION_OPTIONSENTRY,
+    '__module__' : 'core.api.grpc.core_pb2'
+    # @@protoc_insertion_point(class_scope:core.Session.OptionsEntry)
+    })
+  ,
+  'DESCRIPTOR' : _SESSION,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.Session)
+  })
+_sym_db.RegisterMessage(Session)
+_sym_db.RegisterMessage(Session.MetadataEntry)
+_sym_db.RegisterMessage(Session.OptionsEntry)
+
+SessionSummary = _reflection.GeneratedProtocolMessageType('SessionSummary', (_message.Message,), {
+  'DESCRIPTOR' : _SESSIONSUMMARY,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.SessionSummary)
+  })
+_sym_db.RegisterMessage(SessionSummary)
+
+Node = _reflection.GeneratedProtocolMessageType('Node', (_message.Message,), {
+
+  'WlanConfigEntry' : _reflection.GeneratedProtocolMessageType('WlanConfigEntry', (_message.Message,), {
+    'DESCRIPTOR' : _NODE_WLANCONFIGENTRY,
+    '__module__' : 'core.api.grpc.core_pb2'
+    # @@protoc_insertion_point(class_scope:core.Node.WlanConfigEntry)
+    })
+  ,
+
+  'MobilityConfigEntry' : _reflection.GeneratedProtocolMessageType('MobilityConfigEntry', (_message.Message,), {
+    'DESCRIPTOR' : _NODE_MOBILITYCONFIGENTRY,
+    '__module__' : 'core.api.grpc.core_pb2'
+    # @@protoc_insertion_point(class_scope:core.Node.MobilityConfigEntry)
+    })
+  ,
+
+  'ServiceConfigsEntry' : _reflection.GeneratedProtocolMessageType('ServiceConfigsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _NODE_SERVICECONFIGSENTRY,
+    '__module__' : 'core.api.grpc.core_pb2'
+    # @@protoc_insertion_point(class_scope:core.Node.ServiceConfigsEntry)
+    })
+  ,
+
+  'ConfigServiceConfigsEntry' : _reflection.GeneratedProtocolMessageType('ConfigServiceConfigsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _NODE_CONFIGSERVICECONFIGSENTRY,
+    '__module__' : 'core.api.grpc.core_pb2'
+    # @@protoc_insertion_point(class_scope:core.Node.ConfigServiceConfigsEntry)
+    })
+  ,
+  'DESCRIPTOR' : _NODE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.Node)
+  })
+_sym_db.RegisterMessage(Node)
+_sym_db.RegisterMessage(Node.WlanConfigEntry)
+_sym_db.RegisterMessage(Node.MobilityConfigEntry)
+_sym_db.RegisterMessage(Node.ServiceConfigsEntry)
+_sym_db.RegisterMessage(Node.ConfigServiceConfigsEntry)
+
+Link = _reflection.GeneratedProtocolMessageType('Link', (_message.Message,), {
+  'DESCRIPTOR' : _LINK,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.Link)
+  })
+_sym_db.RegisterMessage(Link)
+
+LinkOptions = _reflection.GeneratedProtocolMessageType('LinkOptions', (_message.Message,), {
+  'DESCRIPTOR' : _LINKOPTIONS,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.LinkOptions)
+  })
+_sym_db.RegisterMessage(LinkOptions)
+
+Interface = _reflection.GeneratedProtocolMessageType('Interface', (_message.Message,), {
+  'DESCRIPTOR' : _INTERFACE,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.Interface)
+  })
+_sym_db.RegisterMessage(Interface)
+
+SessionLocation = _reflection.GeneratedProtocolMessageType('SessionLocation', (_message.Message,), {
+  'DESCRIPTOR' : _SESSIONLOCATION,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.SessionLocation)
+  })
+_sym_db.RegisterMessage(SessionLocation)
+
+Position = _reflection.GeneratedProtocolMessageType('Position', (_message.Message,), {
+  'DESCRIPTOR' : _POSITION,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.Position)
+  })
+_sym_db.RegisterMessage(Position)
+
+Geo = _reflection.GeneratedProtocolMessageType('Geo', (_message.Message,), {
+  'DESCRIPTOR' : _GEO,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.Geo)
+  })
+_sym_db.RegisterMessage(Geo)
+
+Server = _reflection.GeneratedProtocolMessageType('Server', (_message.Message,), {
+  'DESCRIPTOR' : _SERVER,
+  '__module__' : 'core.api.grpc.core_pb2'
+  # @@protoc_insertion_point(class_scope:core.Server)
+  })
+_sym_db.RegisterMessage(Server)
+
+_COREAPI = DESCRIPTOR.services_by_name['CoreApi']
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _SESSION_METADATAENTRY._options = None
+  _SESSION_METADATAENTRY._serialized_options = b'8\001'
+  _SESSION_OPTIONSENTRY._options = None
+  _SESSION_OPTIONSENTRY._serialized_options = b'8\001'
+  _NODE_WLANCONFIGENTRY._options = None
+  _NODE_WLANCONFIGENTRY._serialized_options = b'8\001'
+  _NODE_MOBILITYCONFIGENTRY._options = None
+  _NODE_MOBILITYCONFIGENTRY._serialized_options = b'8\001'
+  _NODE_SERVICECONFIGSENTRY._options = None
+  _NODE_SERVICECONFIGSENTRY._serialized_options = b'8\001'
+  _NODE_CONFIGSERVICECONFIGSENTRY._options = None
+  _NODE_CONFIGSERVICECONFIGSENTRY._serialized_options = b'8\001'
+  _GETCONFIGREQUEST._serialized_start=211
+  _GETCONFIGREQUEST._serialized_end=229
+  _GETCONFIGRESPONSE._serialized_start=232
+  _GETCONFIGRESPONSE._serialized_end=406
+  _NODEPOOLSTATS._serialized_start=408
+  _NODEPOOLSTATS._serialized_end=501
+  _STARTSESSIONREQUEST._serialized_start=503
+  _STARTSESSIONREQUEST._serialized_end=595
+  _STARTSESSIONRESPONSE._serialized_start=597
+  _STARTSESSIONRESPONSE._serialized_end=694
+  _SESSIONCHANGES._serialized_start=697
+  _SESSIONCHANGES._serialized_end=926
+  _STOPSESSIONREQUEST._serialized_start=928
+  _STOPSESSIONREQUEST._serialized_end=968
+  _STOPSESSIONRESPONSE._serialized_start=970
+  _STOPSESSIONRESPONSE._serialized_end=1007
+  _CREATESESSIONREQUEST._serialized_start=1009
+  _CREATESESSIONREQUEST._serialized_end=1051
+  _CREATESESSIONRESPONSE._serialized_start=1053
+  _CREATESESSIONRESPONSE._serialized_end=1108
+  _DELETESESSIONREQUEST._serialized_start=1110
+  _DELETESESSIONREQUEST._serialized_end=1152
+  _DELETESESSIONRESPONSE._serialized_start=1154
+  _DELETESESSIONRESPONSE._serialized_end=1193
+  _GETSESSIONSREQUEST._serialized_start=1195
+  _GETSESSIONSREQUEST._serialized_end=1215
+  _GETSESSIONSRESPONSE._serialized_start=1217
+  _GETSESSIONSRESPONSE._serialized_end=1278
+  _CHECKSESSIONREQUEST._serialized_start=1280
+  _CHECKSESSIONREQUEST._serialized_end=1321
+  _CHECKSESSIONRESPONSE._serialized_start=1323
+  _CHECKSESSIONRESPONSE._serialized_end=1361
+  _GETSESSIONREQUEST._serialized_start=1363
+  _GETSESSIONREQUEST._serialized_end=1402
+  _GETSESSIONRESPONSE._serialized_start=1404
+  _GETSESSIONRESPONSE._serialized_end=1456
+  _GETSESSIONTRACEREQUEST._serialized_start=1458
+  _GETSESSIONTRACEREQUEST._serialized_end=1502
+  _GETSESSIONTRACERESPONSE._serialized_start=1504
+  _GETSESSIONTRACERESPONSE._serialized_end=1544
+  _SESSIONALERTREQUEST._serialized_start=1547
+  _SESSIONALERTREQUEST._serialized_end=1677
+  _SESSIONALERTRESPONSE._serialized_start=1679
+  _SESSIONALERTRESPONSE._serialized_end=1717
+  _EVENTSREQUEST._serialized_start=1720
+  _EVENTSREQUEST._serialized_end=1951
+  _EVENTREGION._serialized_start=1953
+  _EVENTREGION._serialized_end=2039
+  _EVENTSTREAMSTATS._serialized_start=2041
+  _EVENTSTREAMSTATS._serialized_end=2095
+  _THROUGHPUTSREQUEST._serialized_start=2097
+  _THROUGHPUTSREQUEST._serialized_end=2155
+  _THROUGHPUTSEVENT._serialized_start=2158
+  _THROUGHPUTSEVENT._serialized_end=2302
+  _LINKSTATSREQUEST._serialized_start=2304
+  _LINKSTATSREQUEST._serialized_end=2360
+  _LINKSTATS._serialized_start=2363
+  _LINKSTATS._serialized_end=2606
+  _NETWORKSTATS._serialized_start=2608
+  _NETWORKSTATS._serialized_end=2711
+  _LINKSTATSEVENT._serialized_start=2713
+  _LINKSTATSEVENT._serialized_end=2819
+  _CPUUSAGEREQUEST._serialized_start=2821
+  _CPUUSAGEREQUEST._serialized_end=2853
+  _CPUUSAGEEVENT._serialized_start=2855
+  _CPUUSAGEEVENT._serialized_end=2885
+  _INTERFACETHROUGHPUT._serialized_start=2887
+  _INTERFACETHROUGHPUT._serialized_end=2963
+  _BRIDGETHROUGHPUT._serialized_start=2965
+  _BRIDGETHROUGHPUT._serialized_end=3020
+  _EVENT._serialized_start=3023
+  _EVENT._serialized_end=3402
+  _NODEEVENT._serialized_start=3404
+  _NODEEVENT._serialized_end=3487
+  _LINKEVENT._serialized_start=3489
+  _LINKEVENT._serialized_end=3572
+  _SESSIONEVENT._serialized_start=3574
+  _SESSIONEVENT._serialized_end=3662
+  _CONFIGEVENT._serialized_start=3665
+  _CONFIGEVENT._serialized_end=3941
+  _EXCEPTIONEVENT._serialized_start=3944
+  _EXCEPTIONEVENT._serialized_end=4079
+  _FILEEVENT._serialized_start=4082
+  _FILEEVENT._serialized_end=4269
+  _ADDNODEREQUEST._serialized_start=4271
+  _ADDNODEREQUEST._serialized_end=4349
+  _ADDNODERESPONSE._serialized_start=4351
+  _ADDNODERESPONSE._serialized_end=4385
+  _ADDNODESREQUEST._serialized_start=4387
+  _ADDNODESREQUEST._serialized_end=4467
+  _ADDNODERESULT._serialized_start=4469
+  _ADDNODERESULT._serialized_end=4532
+  _ADDNODESRESPONSE._serialized_start=4534
+  _ADDNODESRESPONSE._serialized_end=4590
+  _GETNODEREQUEST._serialized_start=4592
+  _GETNODEREQUEST._serialized_end=4645
+  _GETNODERESPONSE._serialized_start=4647
+  _GETNODERESPONSE._serialized_end=4750
+  _EDITNODEREQUEST._serialized_start=4752
+  _EDITNODEREQUEST._serialized_end=4836
+  _EDITNODERESPONSE._serialized_start=4838
+  _EDITNODERESPONSE._serialized_end=4872
+  _DELETENODEREQUEST._serialized_start=4874
+  _DELETENODEREQUEST._serialized_end=4946
+  _DELETENODERESPONSE._serialized_start=4948
+  _DELETENODERESPONSE._serialized_end=4984
+  _GETNODETERMINALREQUEST._serialized_start=4986
+  _GETNODETERMINALREQUEST._serialized_end=5047
+  _GETNODETERMINALRESPONSE._serialized_start=5049
+  _GETNODETERMINALRESPONSE._serialized_end=5092
+  _MOVENODEREQUEST._serialized_start=5095
+  _MOVENODEREQUEST._serialized_end=5240
+  _MOVENODERESPONSE._serialized_start=5242
+  _MOVENODERESPONSE._serialized_end=5276
+  _MOVENODESREQUEST._serialized_start=5279
+  _MOVENODESREQUEST._serialized_end=5425
+  _MOVENODESRESPONSE._serialized_start=5427
+  _MOVENODESRESPONSE._serialized_end=5446
+  _NODECOMMANDREQUEST._serialized_start=5448
+  _NODECOMMANDREQUEST._serialized_end=5551
+  _NODECOMMANDRESPONSE._serialized_start=5553
+  _NODECOMMANDRESPONSE._serialized_end=5611
+  _ADDLINKREQUEST._serialized_start=5613
+  _ADDLINKREQUEST._serialized_end=5691
+  _ADDLINKRESPONSE._serialized_start=5693
+  _ADDLINKRESPONSE._serialized_end=5792
+  _EDITLINKREQUEST._serialized_start=5795
+  _EDITLINKREQUEST._serialized_end=5958
+  _EDITLINKRESPONSE._serialized_start=5960
+  _EDITLINKRESPONSE._serialized_end=5994
+  _ADDLINKSREQUEST._serialized_start=5996
+  _ADDLINKSREQUEST._serialized_end=6076
+  _ADDLINKRESULT._serialized_start=6078
+  _ADDLINKRESULT._serialized_end=6190
+  _ADDLINKSRESPONSE._serialized_start=6192
+  _ADDLINKSRESPONSE._serialized_end=6248
+  _EDITLINKSREQUEST._serialized_start=6250
+  _EDITLINKSREQUEST._serialized_end=6331
+  _EDITLINKRESULT._serialized_start=6333
+  _EDITLINKRESULT._serialized_end=6380
+  _EDITLINKSRESPONSE._serialized_start=6382
+  _EDITLINKSRESPONSE._serialized_end=6440
+  _DELETELINKREQUEST._serialized_start=6443
+  _DELETELINKREQUEST._serialized_end=6572
+  _DELETELINKRESPONSE._serialized_start=6574
+  _DELETELINKRESPONSE._serialized_end=6610
+  _SAVEXMLREQUEST._serialized_start=6612
+  _SAVEXMLREQUEST._serialized_end=6648
+  _SAVEXMLRESPONSE._serialized_start=6650
+  _SAVEXMLRESPONSE._serialized_end=6681
+  _OPENXMLREQUEST._serialized_start=6683
+  _OPENXMLREQUEST._serialized_end=6742
+  _OPENXMLRESPONSE._serialized_start=6744
+  _OPENXMLRESPONSE._serialized_end=6797
+  _GETINTERFACESREQUEST._serialized_start=6799
+  _GETINTERFACESREQUEST._serialized_end=6821
+  _GETINTERFACESRESPONSE._serialized_start=6823
+  _GETINTERFACESRESPONSE._serialized_end=6862
+  _EXECUTESCRIPTREQUEST._serialized_start=6864
+  _EXECUTESCRIPTREQUEST._serialized_end=6916
+  _EXECUTESCRIPTRESPONSE._serialized_start=6918
+  _EXECUTESCRIPTRESPONSE._serialized_end=6961
+  _EVENTTYPE._serialized_start=6963
+  _EVENTTYPE._serialized_end=7052
+  _EVENTTYPE_ENUM._serialized_start=6976
+  _EVENTTYPE_ENUM._serialized_end=7052
+  _EVENTOVERFLOW._serialized_start=7054
+  _EVENTOVERFLOW._serialized_end=7124
+  _EVENTOVERFLOW_ENUM._serialized_start=7071
+  _EVENTOVERFLOW_ENUM._serialized_end=7124
+  _MESSAGETYPE._serialized_start=7126
+  _MESSAGETYPE._serialized_end=7229
+  _MESSAGETYPE_ENUM._serialized_start=7141
+  _MESSAGETYPE_ENUM._serialized_end=7229
+  _LINKTYPE._serialized_start=7231
+  _LINKTYPE._serialized_end=7274
+  _LINKTYPE_ENUM._serialized_start=7243
+  _LINKTYPE_ENUM._serialized_end=7274
+  _SESSIONSTATE._serialized_start=7277
+  _SESSIONSTATE._serialized_end=7407
+  _SESSIONSTATE_ENUM._serialized_start=7293
+  _SESSIONSTATE_ENUM._serialized_end=7407
+  _NODETYPE._serialized_start=7410
+  _NODETYPE._serialized_end=7600
+  _NODETYPE_ENUM._serialized_start=7423
+  _NODETYPE_ENUM._serialized_end=7600
+  _CONFIGOPTIONTYPE._serialized_start=7603
+  _CONFIGOPTIONTYPE._serialized_end=7763
+  _CONFIGOPTIONTYPE_ENUM._serialized_start=7624
+  _CONFIGOPTIONTYPE_ENUM._serialized_end=7763
+  _EXCEPTIONLEVEL._serialized_start=7765
+  _EXCEPTIONLEVEL._serialized_end=7849
+  _EXCEPTIONLEVEL_ENUM._serialized_start=7783
+  _EXCEPTIONLEVEL_ENUM._serialized_end=7849
+  _HOOK._serialized_start=7851
+  _HOOK._serialized_end=7925
+  _SESSION._serialized_start=7928
+  _SESSION._serialized_end=8447
+  _SESSION_METADATAENTRY._serialized_start=8330
+  _SESSION_METADATAENTRY._serialized_end=8377
+  _SESSION_OPTIONSENTRY._serialized_start=8379
+  _SESSION_OPTIONSENTRY._serialized_end=8447
+  _SESSIONSUMMARY._serialized_start=8449
+  _SESSIONSUMMARY._serialized_end=8559
+  _NODE._serialized_start=8562
+  _NODE._serialized_end=9463
+  _NODE_WLANCONFIGENTRY._serialized_start=9133
+  _NODE_WLANCONFIGENTRY._serialized_end=9204
+  _NODE_MOBILITYCONFIGENTRY._serialized_start=9206
+  _NODE_MOBILITYCONFIGENTRY._serialized_end=9281
+  _NODE_SERVICECONFIGSENTRY._serialized_start=9283
+  _NODE_SERVICECONFIGSENTRY._serialized_end=9365
+  _NODE_CONFIGSERVICECONFIGSENTRY._serialized_start=9367
+  _NODE_CONFIGSERVICECONFIGSENTRY._serialized_end=9463
+  _LINK._serialized_start=9466
+  _LINK._serialized_end=9695
+  _LINKOPTIONS._serialized_start=9698
+  _LINKOPTIONS._serialized_end=9885
+  _INTERFACE._serialized_start=9888
+  _INTERFACE._serialized_end=10080
+  _SESSIONLOCATION._serialized_start=10082
+  _SESSIONLOCATION._serialized_end=10186
+  _POSITION._serialized_start=10188
+  _POSITION._serialized_end=10231
+  _GEO._serialized_start=10233
+  _GEO._serialized_end=10277
+  _SERVER._serialized_start=10279
+  _SERVER._serialized_end=10315
+  _COREAPI._serialized_start=10318
+  _COREAPI._serialized_end=14295
+# @@protoc_insertion_point(module_scope)
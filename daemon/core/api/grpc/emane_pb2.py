@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: core/api/grpc/emane.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from core.api.grpc import common_pb2 as core_dot_api_dot_grpc_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x19\x63ore/api/grpc/emane.proto\x12\x05\x65mane\x1a\x1a\x63ore/api/grpc/common.proto\"b\n\x1aGetEmaneModelConfigRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x0f\n\x07node_id\x18\x02 \x01(\x05\x12\x10\n\x08iface_id\x18\x03 \x01(\x05\x12\r\n\x05model\x18\x04 \x01(\t\"\xa2\x01\n\x1bGetEmaneModelConfigResponse\x12>\n\x06\x63onfig\x18\x01 \x03(\x0b\x32..emane.GetEmaneModelConfigResponse.ConfigEntry\x1a\x43\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.common.ConfigOption:\x02\x38\x01\"e\n\x1aSetEmaneModelConfigRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x33\n\x12\x65mane_model_config\x18\x02 \x01(\x0b\x32\x17.emane.EmaneModelConfig\"-\n\x1bSetEmaneModelConfigResponse\x12\x0e\n\x06result\x18\x01 \x01(\x08\"\xc4\x01\n\x13GetEmaneModelConfig\x12\x0f\n\x07node_id\x18\x01 \x01(\x05\x12\r\n\x05model\x18\x02 \x01(\t\x12\x10\n\x08iface_id\x18\x03 \x01(\x05\x12\x36\n\x06\x63onfig\x18\x04 \x03(\x0b\x32&.emane.GetEmaneModelConfig.ConfigEntry\x1a\x43\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.common.ConfigOption:\x02\x38\x01\"\xab\x01\n\x0fNodeEmaneConfig\x12\x10\n\x08iface_id\x18\x01 \x01(\x05\x12\r\n\x05model\x18\x02 \x01(\t\x12\x32\n\x06\x63onfig\x18\x03 \x03(\x0b\x32\".emane.NodeEmaneConfig.ConfigEntry\x1a\x43\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.common.ConfigOption:\x02\x38\x01\"A\n\x1bGetEmaneEventChannelRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x0e\n\x06nem_id\x18\x02 \x01(\x05\"K\n\x1cGetEmaneEventChannelResponse\x12\r\n\x05group\x18\x01 \x01(\t\x12\x0c\n\x04port\x18\x02 \x01(\x05\x12\x0e\n\x06\x64\x65vice\x18\x03 \x01(\t\"R\n\x10\x45maneLinkRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x0c\n\x04nem1\x18\x02 \x01(\x05\x12\x0c\n\x04nem2\x18\x03 \x01(\x05\x12\x0e\n\x06linked\x18\x04 \x01(\x08\"#\n\x11\x45maneLinkResponse\x12\x0e\n\x06result\x18\x01 \x01(\x08\"\xa8\x01\n\x10\x45maneModelConfig\x12\x0f\n\x07node_id\x18\x01 \x01(\x05\x12\x10\n\x08iface_id\x18\x02 \x01(\x05\x12\r\n\x05model\x18\x03 \x01(\t\x12\x33\n\x06\x63onfig\x18\x04 \x03(\x0b\x32#.emane.EmaneModelConfig.ConfigEntry\x1a-\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x90\x01\n\x16\x45manePathlossesRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x10\n\x08node1_id\x18\x02 \x01(\x05\x12\x0b\n\x03rx1\x18\x03 \x01(\x02\x12\x11\n\tiface1_id\x18\x04 \x01(\x05\x12\x10\n\x08node2_id\x18\x05 \x01(\x05\x12\x0b\n\x03rx2\x18\x06 \x01(\x02\x12\x11\n\tiface2_id\x18\x07 \x01(\x05\"\x19\n\x17\x45manePathlossesResponseb\x06proto3')
+
+
+
+_GETEMANEMODELCONFIGREQUEST = DESCRIPTOR.message_types_by_name['GetEmaneModelConfigRequest']
+_GETEMANEMODELCONFIGRESPONSE = DESCRIPTOR.message_types_by_name['GetEmaneModelConfigResponse']
+_GETEMANEMODELCONFIGRESPONSE_CONFIGENTRY = _GETEMANEMODELCONFIGRESPONSE.nested_types_by_name['ConfigEntry']
+_SETEMANEMODELCONFIGREQUEST = DESCRIPTOR.message_types_by_name['SetEmaneModelConfigRequest']
+_SETEMANEMODELCONFIGRESPONSE = DESCRIPTOR.message_types_by_name['SetEmaneModelConfigResponse']
+_GETEMANEMODELCONFIG = DESCRIPTOR.message_types_by_name['GetEmaneModelConfig']
+_GETEMANEMODELCONFIG_CONFIGENTRY = _GETEMANEMODELCONFIG.nested_types_by_name['ConfigEntry']
+_NODEEMANECONFIG = DESCRIPTOR.message_types_by_name['NodeEmaneConfig']
+_NODEEMANECONFIG_CONFIGENTRY = _NODEEMANECONFIG.nested_types_by_name['ConfigEntry']
+_GETEMANEEVENTCHANNELREQUEST = DESCRIPTOR.message_types_by_name['GetEmaneEventChannelRequest']
+_GETEMANEEVENTCHANNELRESPONSE = DESCRIPTOR.message_types_by_name['GetEmaneEventChannelResponse']
+_EMANELINKREQUEST = DESCRIPTOR.message_types_by_name['EmaneLinkRequest']
+_EMANELINKRESPONSE = DESCRIPTOR.message_types_by_name['EmaneLinkResponse']
+_EMANEMODELCONFIG = DESCRIPTOR.message_types_by_name['EmaneModelConfig']
+_EMANEMODELCONFIG_CONFIGENTRY = _EMANEMODELCONFIG.nested_types_by_name['ConfigEntry']
+_EMANEPATHLOSSESREQUEST = DESCRIPTOR.message_types_by_name['EmanePathlossesRequest']
+_EMANEPATHLOSSESRESPONSE = DESCRIPTOR.message_types_by_name['EmanePathlossesResponse']
+GetEmaneModelConfigRequest = _reflection.GeneratedProtocolMessageType('GetEmaneModelConfigRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETEMANEMODELCONFIGREQUEST,
+  '__module__' : 'core.api.grpc.emane_pb2'
+  # @@protoc_insertion_point(class_scope:emane.GetEmaneModelConfigRequest)
+  })
+_sym_db.RegisterMessage(GetEmaneModelConfigRequest)
+
+GetEmaneModelConfigResponse = _reflection.GeneratedProtocolMessageType('GetEmaneModelConfigResponse', (_message.Message,), {
+
+  'ConfigEntry' : _reflection.GeneratedProtocolMessageType('ConfigEntry', (_message.Message,), {
+    'DESCRIPTOR' : _GETEMANEMODELCONFIGRESPONSE_CONFIGENTRY,
+    '__module__' : 'core.api.grpc.emane_pb2'
+    # @@protoc_insertion_point(class_scope:emane.GetEmaneModelConfigResponse.ConfigEntry)
+    })
+  ,
+  'DESCRIPTOR' : _GETEMANEMODELCONFIGRESPONSE,
+  '__module__' : 'core.api.grpc.emane_pb2'
+  # @@protoc_insertion_point(class_scope:emane.GetEmaneModelConfigResponse)
+  })
+_sym_db.RegisterMessage(GetEmaneModelConfigResponse)
+_sym_db.RegisterMessage(GetEmaneModelConfigResponse.ConfigEntry)
+
+SetEmaneModelConfigRequest = _reflection.GeneratedProtocolMessageType('SetEmaneModelConfigRequest', (_message.Message,), {
+  'DESCRIPTOR' : _SETEMANEMODELCONFIGREQUEST,
+  '__module__' : 'core.api.grpc.emane_pb2'
+  # @@protoc_insertion_point(class_scope:emane.SetEmaneModelConfigRequest)
+  })
+_sym_db.RegisterMessage(SetEmaneModelConfigRequest)
+
+SetEmaneModelConfigResponse = _reflection.GeneratedProtocolMessageType('SetEmaneModelConfigResponse', (_message.Message,), {
+  'DESCRIPTOR' : _SETEMANEMODELCONFIGRESPONSE,
+  '__module__' : 'core.api.grpc.emane_pb2'
+  # @@protoc_insertion_point(class_scope:emane.SetEmaneModelConfigResponse)
+  })
+_sym_db.RegisterMessage(SetEmaneModelConfigResponse)
+
+GetEmaneModelConfig = _reflection.GeneratedProtocolMessageType('GetEmaneModelConfig', (_message.Message,), {
+
+  'ConfigEntry' : _reflection.GeneratedProtocolMessageType('ConfigEntry', (_message.Message,), {
+    'DESCRIPTOR' : _GETEMANEMODELCONFIG_CONFIGENTRY,
+    '__module__' : 'core.api.grpc.emane_pb2'
+    # @@protoc_insertion_point(class_scope:emane.GetEmaneModelConfig.ConfigEntry)
+    })
+  ,
+  'DESCRIPTOR' : _GETEMANEMODELCONFIG,
+  '__module__' : 'core.api.grpc.emane_pb2'
+  # @@protoc_insertion_point(class_scope:emane.GetEmaneModelConfig)
+  })
+_sym_db.RegisterMessage(GetEmaneModelConfig)
+_sym_db.RegisterMessage(GetEmaneModelConfig.ConfigEntry)
+
+NodeEmaneConfig = _reflection.GeneratedProtocolMessageType('NodeEmaneConfig', (_message.Message,), {
+
+  'ConfigEntry' : _reflection.GeneratedProtocolMessageType('ConfigEntry', (_message.Message,), {
+    'DESCRIPTOR' : _NODEEMANECONFIG_CONFIGENTRY,
+    '__module__' : 'core.api.grpc.emane_pb2'
+    # @@protoc_insertion_point(class_scope:emane.NodeEmaneConfig.ConfigEntry)
+    })
+  ,
+  'DESCRIPTOR' : _NODEEMANECONFIG,
+  '__module__' : 'core.api.grpc.emane_pb2'
+  # @@protoc_insertion_point(class_scope:emane.NodeEmaneConfig)
+  })
+_sym_db.RegisterMessage(NodeEmaneConfig)
+_sym_db.RegisterMessage(NodeEmaneConfig.ConfigEntry)
+
+GetEmaneEventChannelRequest = _reflection.GeneratedProtocolMessageType('GetEmaneEventChannelRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETEMANEEVENTCHANNELREQUEST,
+  '__module__' : 'core.api.grpc.emane_pb2'
+  # @@protoc_insertion_point(class_scope:emane.GetEmaneEventChannelRequest)
+  })
+_sym_db.RegisterMessage(GetEmaneEventChannelRequest)
+
+GetEmaneEventChannelResponse = _reflection.GeneratedProtocolMessageType('GetEmaneEventChannelResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETEMANEEVENTCHANNELRESPONSE,
+  '__module__' : 'core.api.grpc.emane_pb2'
+  # @@protoc_insertion_point(class_scope:emane.GetEmaneEventChannelResponse)
+  })
+_sym_db.RegisterMessage(GetEmaneEventChannelResponse)
+
+EmaneLinkRequest = _reflection.GeneratedProtocolMessageType('EmaneLinkRequest', (_message.Message,), {
+  'DESCRIPTOR' : _EMANELINKREQUEST,
+  '__module__' : 'core.api.grpc.emane_pb2'
+  # @@protoc_insertion_point(class_scope:emane.EmaneLinkRequest)
+  })
+_sym_db.RegisterMessage(EmaneLinkRequest)
+
+EmaneLinkResponse = _reflection.GeneratedProtocolMessageType('EmaneLinkResponse', (_message.Message,), {
+  'DESCRIPTOR' : _EMANELINKRESPONSE,
+  '__module__' : 'core.api.grpc.emane_pb2'
+  # @@protoc_insertion_point(class_scope:emane.EmaneLinkResponse)
+  })
+_sym_db.RegisterMessage(EmaneLinkResponse)
+
+EmaneModelConfig = _reflection.GeneratedProtocolMessageType('EmaneModelConfig', (_message.Message,), {
+
+  'ConfigEntry' : _reflection.GeneratedProtocolMessageType('ConfigEntry', (_message.Message,), {
+    'DESCRIPTOR' : _EMANEMODELCONFIG_CONFIGENTRY,
+    '__module__' : 'core.api.grpc.emane_pb2'
+    # @@protoc_insertion_point(class_scope:emane.EmaneModelConfig.ConfigEntry)
+    })
+  ,
+  'DESCRIPTOR' : _EMANEMODELCONFIG,
+  '__module__' : 'core.api.grpc.emane_pb2'
+  # @@protoc_insertion_point(class_scope:emane.EmaneModelConfig)
+  })
+_sym_db.RegisterMessage(EmaneModelConfig)
+_sym_db.RegisterMessage(EmaneModelConfig.ConfigEntry)
+
+EmanePathlossesRequest = _reflection.GeneratedProtocolMessageType('EmanePathlossesRequest', (_message.Message,), {
+  'DESCRIPTOR' : _EMANEPATHLOSSESREQUEST,
+  '__module__' : 'core.api.grpc.emane_pb2'
+  # @@protoc_insertion_point(class_scope:emane.EmanePathlossesRequest)
+  })
+_sym_db.RegisterMessage(EmanePathlossesRequest)
+
+EmanePathlossesResponse = _reflection.GeneratedProtocolMessageType('EmanePathlossesResponse', (_message.Message,), {
+  'DESCRIPTOR' : _EMANEPATHLOSSESRESPONSE,
+  '__module__' : 'core.api.grpc.emane_pb2'
+  # @@protoc_insertion_point(class_scope:emane.EmanePathlossesResponse)
+  })
+_sym_db.RegisterMessage(EmanePathlossesResponse)
+
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _GETEMANEMODELCONFIGRESPONSE_CONFIGENTRY._options = None
+  _GETEMANEMODELCONFIGRESPONSE_CONFIGENTRY._serialized_options = b'8\001'
+  _GETEMANEMODELCONFIG_CONFIGENTRY._options = None
+  _GETEMANEMODELCONFIG_CONFIGENTRY._serialized_options = b'8\001'
+  _NODEEMANECONFIG_CONFIGENTRY._options = None
+  _NODEEMANECONFIG_CONFIGENTRY._serialized_options = b'8\001'
+  _EMANEMODELCONFIG_CONFIGENTRY._options = None
+  _EMANEMODELCONFIG_CONFIGENTRY._serialized_options = b'8\001'
+  _GETEMANEMODELCONFIGREQUEST._serialized_start=64
+  _GETEMANEMODELCONFIGREQUEST._serialized_end=162
+  _GETEMANEMODELCONFIGRESPONSE._serialized_start=165
+  _GETEMANEMODELCONFIGRESPONSE._serialized_end=327
+  _GETEMANEMODELCONFIGRESPONSE_CONFIGENTRY._serialized_start=260
+  _GETEMANEMODELCONFIGRESPONSE_CONFIGENTRY._serialized_end=327
+  _SETEMANEMODELCONFIGREQUEST._serialized_start=329
+  _SETEMANEMODELCONFIGREQUEST._serialized_end=430
+  _SETEMANEMODELCONFIGRESPONSE._serialized_start=432
+  _SETEMANEMODELCONFIGRESPONSE._serialized_end=477
+  _GETEMANEMODELCONFIG._serialized_start=480
+  _GETEMANEMODELCONFIG._serialized_end=676
+  _GETEMANEMODELCONFIG_CONFIGENTRY._serialized_start=260
+  _GETEMANEMODELCONFIG_CONFIGENTRY._serialized_end=327
+  _NODEEMANECONFIG._serialized_start=679
+  _NODEEMANECONFIG._serialized_end=850
+  _NODEEMANECONFIG_CONFIGENTRY._serialized_start=260
+  _NODEEMANECONFIG_CONFIGENTRY._serialized_end=327
+  _GETEMANEEVENTCHANNELREQUEST._serialized_start=852
+  _GETEMANEEVENTCHANNELREQUEST._serialized_end=917
+  _GETEMANEEVENTCHANNELRESPONSE._serialized_start=919
+  _GETEMANEEVENTCHANNELRESPONSE._serialized_end=994
+  _EMANELINKREQUEST._serialized_start=996
+  _EMANELINKREQUEST._serialized_end=1078
+  _EMANELINKRESPONSE._serialized_start=1080
+  _EMANELINKRESPONSE._serialized_end=1115
+  _EMANEMODELCONFIG._serialized_start=1118
+  _EMANEMODELCONFIG._serialized_end=1286
+  _EMANEMODELCONFIG_CONFIGENTRY._serialized_start=1241
+  _EMANEMODELCONFIG_CONFIGENTRY._serialized_end=1286
+  _EMANEPATHLOSSESREQUEST._serialized_start=1289
+  _EMANEPATHLOSSESREQUEST._serialized_end=1433
+  _EMANEPATHLOSSESRESPONSE._serialized_start=1435
+  _EMANEPATHLOSSESRESPONSE._serialized_end=1460
+# @@protoc_insertion_point(module_scope)
@@ -1,6 +1,7 @@
 import logging
-from queue import Empty, Queue
-from typing import Iterable, Optional
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
 from core.api.grpc import core_pb2
 from core.api.grpc.grpcutils import convert_link
@@ -12,9 +13,12 @@ from core.emulator.data import (
     LinkData,
     NodeData,
 )
+from core.emulator.enumerations import LinkTypes, MessageFlags
 from core.emulator.session import Session
+from core.nodes.base import NodeBase
 
 logger = logging.getLogger(__name__)
+EVENT_QUEUE_SIZE: int = 10000
 
 
 def handle_node_event(node_data: NodeData) -> core_pb2.Event:
@@ -141,25 +145,267 @@ def handle_file_event(file_data: FileData) -> core_pb2.Event:
     return core_pb2.Event(file_event=file_event)
 
 
+class EventFilter:
+    """
+    Matches node and link event data against watched nodes, networks and a
+    region, allowing events to be discarded before being converted. Event data
+    matching any of the provided criteria is accepted, all event data is
+    accepted when no criteria are provided.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        node_ids: Iterable[int] = None,
+        network_ids: Iterable[int] = None,
+        region: core_pb2.EventRegion = None,
+    ) -> None:
+        """
+        Create an EventFilter instance.
+
+        :param session: session to look up link nodes within
+        :param node_ids: ids of nodes to watch
+        :param network_ids: ids of networks to watch, including nodes connected
+            to them
+        :param region: canvas or geo region to watch nodes within
+        """
+        self.session: Session = session
+        self.node_ids: Set[int] = set(node_ids or [])
+        self.network_ids: Set[int] = set(network_ids or [])
+        self.region: Optional[core_pb2.EventRegion] = region
+
+    @property
+    def active(self) -> bool:
+        return bool(self.node_ids or self.network_ids or self.region)
+
+    def in_region(self, node: NodeBase) -> bool:
+        """
+        Check if a node is within the watched region.
+
+        :param node: node to check
+        :return: True if within region, False otherwise
+        """
+        if self.region is None:
+            return False
+        if self.region.geo:
+            x, y, _ = node.position.get_geo()
+        else:
+            x, y, _ = node.position.get()
+        if x is None or y is None:
+            return False
+        return (
+            self.region.min_x <= x <= self.region.max_x
+            and self.region.min_y <= y <= self.region.max_y
+        )
+
+    def node_matches(self, node: NodeBase) -> bool:
+        """
+        Check if a node is watched.
+
+        :param node: node to check
+        :return: True if watched, False otherwise
+        """
+        if node.id in self.node_ids or node.id in self.network_ids:
+            return True
+        if self.network_ids:
+            for iface in node.get_ifaces():
+                if iface.net and iface.net.id in self.network_ids:
+                    return True
+        return self.in_region(node)
+
+    def link_matches(self, link_data: LinkData) -> bool:
+        """
+        Check if a link is connected to a watched node or network.
+
+        :param link_data: link data to check
+        :return: True if watched, False otherwise
+        """
+        node_ids = {link_data.node1_id, link_data.node2_id}
+        if node_ids & self.node_ids:
+            return True
+        if (node_ids | {link_data.network_id}) & self.network_ids:
+            return True
+        if self.region is not None:
+            for node_id in node_ids:
+                node = self.session.nodes.get(node_id)
+                if node and self.in_region(node):
+                    return True
+        return False
+
+    def matches(self, data: Any) -> bool:
+        """
+        Check if event data should be streamed.
+
+        :param data: event data to check
+        :return: True if event data matches, False otherwise
+        """
+        if not self.active:
+            return True
+        if isinstance(data, NodeData):
+            return self.node_matches(data.node)
+        elif isinstance(data, LinkData):
+            return self.link_matches(data)
+        return True
+
+
+class EventQueue:
+    """
+    Bounded queue of session event data, applying an overflow policy when full
+    and coalescing node position and wireless link updates by key.
+    """
+
+    def __init__(self, size: int, overflow: int) -> None:
+        """
+        Create an EventQueue instance.
+
+        :param size: maximum number of queued events
+        :param overflow: overflow policy, applied when the queue is full
+        """
+        self.size: int = size
+        self.overflow: int = overflow
+        self.condition: threading.Condition = threading.Condition()
+        self.entries: Deque[List[Any]] = deque()
+        self.keys: Dict[Tuple, List[Any]] = {}
+        self.dropped: int = 0
+        self.coalesced: int = 0
+        self.overflowed: bool = False
+        # called after queueing data, to wake consumers not waiting on the queue
+        self.notify: Optional[Callable[[], None]] = None
+
+    @classmethod
+    def coalesce_key(cls, data: Any) -> Tuple[Optional[Tuple], Optional[Tuple]]:
+        """
+        Determine the key to coalesce event data by, and the key of pending
+        updates that must no longer be coalesced with later updates.
+
+        :param data: event data
+        :return: coalesce key and key to reset, None otherwise
+        """
+        if isinstance(data, NodeData):
+            key = ("node", data.node.id)
+            if data.message_type == MessageFlags.NONE:
+                return key, None
+            return None, key
+        elif isinstance(data, LinkData):
+            node1_id, node2_id = sorted([data.node1_id or 0, data.node2_id or 0])
+            key = ("link", node1_id, node2_id, data.network_id)
+            if data.type == LinkTypes.WIRELESS:
+                return key, None
+            return None, key
+        return None, None
+
+    def put(self, data: Any) -> None:
+        """
+        Queue event data.
+
+        :param data: event data to queue
+        :return: nothing
+        """
+        self.put_all([data])
+
+    def put_all(self, data: Iterable[Any]) -> None:
+        """
+        Queue several event data.
+
+        :param data: event data to queue
+        :return: nothing
+        """
+        with self.condition:
+            for item in data:
+                self._put(item)
+            self.condition.notify()
+        if self.notify:
+            self.notify()
+
+    def _put(self, data: Any) -> None:
+        if self.overflowed:
+            return
+        key, reset_key = self.coalesce_key(data)
+        if self.overflow == core_pb2.EventOverflow.COALESCE:
+            if reset_key is not None:
+                self.keys.pop(reset_key, None)
+            entry = self.keys.get(key) if key is not None else None
+            if entry is not None:
+                entry[1] = data
+                self.coalesced += 1
+                return
+        if len(self.entries) >= self.size:
+            if self.overflow == core_pb2.EventOverflow.DISCONNECT:
+                logger.warning("event queue overflowed, disconnecting")
+                self.overflowed = True
+                self.entries.clear()
+                self.keys.clear()
+                self.condition.notify()
+                return
+            oldest = self.entries.popleft()
+            if oldest[0] is not None and self.keys.get(oldest[0]) is oldest:
+                del self.keys[oldest[0]]
+            self.dropped += 1
+        entry = [key, data]
+        self.entries.append(entry)
+        if key is not None and self.overflow == core_pb2.EventOverflow.COALESCE:
+            self.keys[key] = entry
+
+    def get(self, count: int, timeout: float) -> List[Any]:
+        """
+        Retrieve queued event data, waiting for data to be available.
+
+        :param count: maximum number of event data to retrieve
+        :param timeout: maximum time to wait in seconds
+        :return: queued event data, empty when timed out or overflowed
+        """
+        with self.condition:
+            if not self.entries and not self.overflowed:
+                self.condition.wait(timeout)
+            data = []
+            while self.entries and len(data) < count:
+                entry = self.entries.popleft()
+                key, item = entry
+                if key is not None and self.keys.get(key) is entry:
+                    del self.keys[key]
+                data.append(item)
+            return data
+
+
 class EventStreamer:
     """
     Processes session events to generate grpc events.
     """
 
     def __init__(
-        self, session: Session, event_types: Iterable[core_pb2.EventType]
+        self,
+        session: Session,
+        event_types: Iterable[core_pb2.EventType],
+        queue_size: int = EVENT_QUEUE_SIZE,
+        overflow: int = core_pb2.EventOverflow.COALESCE,
+        batch_size: int = 1,
+        event_filter: EventFilter = None,
     ) -> None:
         """
         Create a EventStreamer instance.
 
         :param session: session to process events for
         :param event_types: types of events to process
+        :param queue_size: maximum number of queued events
+        :param overflow: overflow policy, applied when the queue is full
+        :param batch_size: maximum number of events to send within one event
+        :param event_filter: filter for node and link events, all are streamed
+            otherwise
         """
         self.session: Session = session
         self.event_types: Iterable[core_pb2.EventType] = event_types
-        self.queue: Queue = Queue()
+        self.queue: EventQueue = EventQueue(queue_size, overflow)
+        self.batch_size: int = max(batch_size, 1)
+        self.stats: Tuple[int, int] = (0, 0)
+        self.event_filter: Optional[EventFilter] = None
+        if event_filter and event_filter.active:
+            self.event_filter = event_filter
         self.add_handlers()
 
+    @property
+    def overflowed(self) -> bool:
+        return self.queue.overflowed
+
     def add_handlers(self) -> None:
         """
         Add a session event handler for desired event types.
@@ -167,9 +413,9 @@ class EventStreamer:
         :return: nothing
         """
         if core_pb2.EventType.NODE in self.event_types:
-            self.session.node_handlers.append(self.queue.put)
+            self.session.node_batch_handlers.append(self.put_node_data)
         if core_pb2.EventType.LINK in self.event_types:
-            self.session.link_handlers.append(self.queue.put)
+            self.session.link_handlers.append(self.put_link_data)
         if core_pb2.EventType.CONFIG in self.event_types:
             self.session.config_handlers.append(self.queue.put)
         if core_pb2.EventType.FILE in self.event_types:
@@ -179,35 +425,82 @@ class EventStreamer:
         if core_pb2.EventType.SESSION in self.event_types:
             self.session.event_handlers.append(self.queue.put)
 
-    def process(self) -> Optional[core_pb2.Event]:
+    def put_node_data(self, node_data: List[NodeData]) -> None:
         """
-        Process the next event in the queue.
+        Queue node data matching the event filter.
 
-        :return: grpc event, or None when invalid event or queue timeout
+        :param node_data: node data to queue
+        :return: nothing
+        """
+        if self.event_filter:
+            node_data = [x for x in node_data if self.event_filter.matches(x)]
+        if node_data:
+            self.queue.put_all(node_data)
+
+    def put_link_data(self, link_data: LinkData) -> None:
+        """
+        Queue link data matching the event filter.
+
+        :param link_data: link data to queue
+        :return: nothing
+        """
+        if not self.event_filter or self.event_filter.matches(link_data):
+            self.queue.put(link_data)
+
+    def convert(self, data: Any) -> Optional[core_pb2.Event]:
+        """
+        Convert event data to a grpc event.
+
+        :param data: event data to convert
+        :return: grpc event, or None when invalid event
         """
         event = None
-        try:
-            data = self.queue.get(timeout=1)
-            if isinstance(data, NodeData):
-                event = handle_node_event(data)
-            elif isinstance(data, LinkData):
-                event = handle_link_event(data)
-            elif isinstance(data, EventData):
-                event = handle_session_event(data)
-            elif isinstance(data, ConfigData):
-                event = handle_config_event(data)
-            elif isinstance(data, ExceptionData):
-                event = handle_exception_event(data)
-            elif isinstance(data, FileData):
-                event = handle_file_event(data)
-            else:
-                logger.error("unknown event: %s", data)
-        except Empty:
-            pass
+        if isinstance(data, NodeData):
+            event = handle_node_event(data)
+        elif isinstance(data, LinkData):
+            event = handle_link_event(data)
+        elif isinstance(data, EventData):
+            event = handle_session_event(data)
+        elif isinstance(data, ConfigData):
+            event = handle_config_event(data)
+        elif isinstance(data, ExceptionData):
+            event = handle_exception_event(data)
+        elif isinstance(data, FileData):
+            event = handle_file_event(data)
+        else:
+            logger.error("unknown event: %s", data)
         if event:
             event.session_id = self.session.id
         return event
 
+    def process(self, timeout: float = 1) -> Optional[core_pb2.Event]:
+        """
+        Process the next events in the queue, up to the batch size. Several
+        events are sent within the events of a single event, along with stream
+        stats when dropped or coalesced counts changed.
+
+        :param timeout: maximum time to wait for events in seconds
+        :return: grpc event, or None when invalid event or queue timeout
+        """
+        events = []
+        for data in self.queue.get(self.batch_size, timeout):
+            event = self.convert(data)
+            if event:
+                events.append(event)
+        if not events:
+            return None
+        if len(events) == 1:
+            event = events[0]
+        else:
+            event = core_pb2.Event(session_id=self.session.id, events=events)
+        stats = (self.queue.dropped, self.queue.coalesced)
+        if stats != self.stats:
+            self.stats = stats
+            dropped, coalesced = stats
+            event.stats.dropped = dropped
+            event.stats.coalesced = coalesced
+        return event
+
     def remove_handlers(self) -> None:
         """
         Remove session event handlers for events being watched.
@@ -215,9 +508,9 @@ class EventStreamer:
         :return: nothing
         """
         if core_pb2.EventType.NODE in self.event_types:
-            self.session.node_handlers.remove(self.queue.put)
+            self.session.node_batch_handlers.remove(self.put_node_data)
         if core_pb2.EventType.LINK in self.event_types:
-            self.session.link_handlers.remove(self.queue.put)
+            self.session.link_handlers.remove(self.put_link_data)
         if core_pb2.EventType.CONFIG in self.event_types:
             self.session.config_handlers.remove(self.queue.put)
         if core_pb2.EventType.FILE in self.event_types:
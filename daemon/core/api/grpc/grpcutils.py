@@ -1,7 +1,7 @@
 import logging
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Type, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 import grpc
 from grpc import ServicerContext
@@ -21,7 +21,8 @@ from core.emane.nodes import EmaneNet
 from core.emulator.data import InterfaceData, LinkData, LinkOptions, NodeOptions
 from core.emulator.enumerations import LinkTypes, NodeTypes
 from core.emulator.session import Session
-from core.errors import CoreError
+from core.emulator.taskgraph import TaskGraph
+from core.errors import CoreCommandError, CoreError
 from core.location.mobility import BasicRangeModel, Ns2ScriptedMobility
 from core.nodes.base import CoreNode, CoreNodeBase, NodeBase
 from core.nodes.docker import DockerNode
@@ -109,7 +110,7 @@ def link_iface(iface_proto: core_pb2.Interface) -> InterfaceData:
 
 
 def add_link_data(
-    link_proto: core_pb2.Link
+    link_proto: core_pb2.Link,
 ) -> Tuple[InterfaceData, InterfaceData, LinkOptions, LinkTypes]:
     """
     Convert link proto to link interfaces and options data.
@@ -137,75 +138,236 @@ def add_link_data(
     return iface1_data, iface2_data, options, link_type
 
 
-def create_nodes(
-    session: Session, node_protos: List[core_pb2.Node]
-) -> Tuple[List[NodeBase], List[Exception]]:
+def create_topology(
+    session: Session,
+    node_protos: List[core_pb2.Node],
+    link_protos: List[core_pb2.Link],
+    context: ServicerContext,
+) -> List[Exception]:
     """
-    Create nodes using a thread pool and wait for completion.
+    Create nodes and links using a task graph and wait for completion. Each node
+    is configured as soon as it was created, and each link is created as soon as
+    both of its nodes were configured, without waiting on other nodes. Links
+    provided more than once are created once and then edited.
 
-    :param session: session to create nodes in
+    :param session: session to create topology in
     :param node_protos: node proto messages
-    :return: results and exceptions for created nodes
+    :param link_protos: link proto messages
+    :param context: grpc context
+    :return: exceptions for nodes and links that failed
     """
-    funcs = []
-    for node_proto in node_protos:
+    graph = TaskGraph(WORKERS)
+
+    def configure(node_proto: core_pb2.Node, node_key: Tuple) -> None:
+        configure_node(session, node_proto, graph.results[node_key], context)
+
+    node_keys = {}
+    for index, node_proto in enumerate(node_protos):
         _type, _id, options = add_node_data(node_proto)
         _class = session.get_node_class(_type)
-        args = (_class, _id, options)
-        funcs.append((session.add_node, args, {}))
+        node_key = ("node", index)
+        configure_key = ("configure", index)
+        graph.add(node_key, session.add_node, _class, _id, options)
+        graph.add(configure_key, configure, node_proto, node_key, deps=[node_key])
+        node_keys[node_proto.id] = configure_key
+    link_keys = set()
+    for index, link_proto in enumerate(link_protos):
+        node1_id = link_proto.node1_id
+        node2_id = link_proto.node2_id
+        iface1, iface2, options, link_type = add_link_data(link_proto)
+        iface1_id = iface1.id if iface1 else None
+        iface2_id = iface2.id if iface2 else None
+        if node1_id < node2_id:
+            link_key = ("link", node1_id, iface1_id, node2_id, iface2_id)
+        else:
+            link_key = ("link", node2_id, iface2_id, node1_id, iface1_id)
+        if link_key in link_keys:
+            args = (node1_id, node2_id, iface1_id, iface2_id, options, link_type)
+            graph.add(("edit", index), session.update_link, *args, deps=[link_key])
+        else:
+            link_keys.add(link_key)
+            deps = [node_keys[x] for x in (node1_id, node2_id) if x in node_keys]
+            args = (node1_id, node2_id, iface1, iface2, options, link_type)
+            graph.add(link_key, session.add_link, *args, deps=deps)
+    start = time.monotonic()
+    exceptions = graph.run()
+    total = time.monotonic() - start
+    logger.debug("grpc created topology time: %s", total)
+    # configuration aborts the call, as when configuring nodes directly
+    for key, exception in graph.errors.items():
+        if key[0] == "configure":
+            raise exception
+    return exceptions
+
+
+def batch_results(
+    session: Session, funcs: List[Tuple[Callable, Iterable[Any], Dict[Any, Any]]]
+) -> List[Tuple[Any, Optional[Exception]]]:
+    """
+    Run provided functions within a thread pool, batching their network commands.
+    Batched commands failing when flushed are reported for the function that
+    issued them, along with its result.
+
+    :param session: session to batch network commands for
+    :param funcs: iterable that provides a func, args, kwargs
+    :return: result and exception, None when successful, for each function
+    """
+
+    def run(owner: object, func: Callable, args: Iterable[Any], kwargs: Dict) -> Any:
+        with command_batch.owner(owner):
+            return func(*args, **kwargs)
+
+    owners = [object() for _ in funcs]
+    results = [(None, None) for _ in funcs]
+    try:
+        with session.batch() as command_batch:
+            owned = [(run, (x,) + tuple(y), {}) for x, y in zip(owners, funcs)]
+            results = utils.threadpool_results(owned)
+    except CoreCommandError:
+        logger.exception("error flushing batched commands")
+    failed = command_batch.failed
+    return [(x, e or failed.get(y)) for (x, e), y in zip(results, owners)]
+
+
+def add_node(session: Session, node_proto: core_pb2.Node) -> NodeBase:
+    """
+    Add a node to a session from its proto.
+
+    :param session: session to add node to
+    :param node_proto: node proto message
+    :return: created node
+    :raises ValueError: when the node type is not known
+    :raises CoreError: when node creation fails
+    """
+    _type, _id, options = add_node_data(node_proto)
+    _class = session.get_node_class(_type)
+    return session.add_node(_class, _id, options)
+
+
+def add_nodes(
+    session: Session, node_protos: List[core_pb2.Node]
+) -> List[Tuple[Optional[NodeBase], Optional[Exception]]]:
+    """
+    Add nodes to a session using a thread pool, assigning ids to nodes without
+    one beforehand. Nodes whose network commands failed are deleted.
+
+    :param session: session to add nodes to
+    :param node_protos: node proto messages, ids are updated for assigned ids
+    :return: created node or exception for each node proto, in order
+    """
+    used_ids = set(session.nodes)
+    used_ids.update(x.id for x in node_protos if x.id)
+    next_id = 0
+    funcs = []
+    for node_proto in node_protos:
+        if not node_proto.id:
+            next_id += 1
+            while next_id in used_ids:
+                next_id += 1
+            node_proto.id = next_id
+        funcs.append((add_node, (session, node_proto), {}))
     start = time.monotonic()
-    results, exceptions = utils.threadpool(funcs)
+    results = batch_results(session, funcs)
     total = time.monotonic() - start
-    logger.debug("grpc created nodes time: %s", total)
-    return results, exceptions
+    logger.debug("grpc add nodes time: %s", total)
+    for index, (node, exception) in enumerate(results):
+        if node is not None and exception is not None:
+            try:
+                session.delete_node(node.id)
+            except (CoreError, CoreCommandError):
+                logger.exception("error deleting failed node: %s", node.name)
+            results[index] = (None, exception)
+    return results
+
+
+def add_link(
+    session: Session, link_proto: core_pb2.Link
+) -> Tuple[CoreInterface, CoreInterface]:
+    """
+    Add a link to a session from its proto.
+
+    :param session: session to add link to
+    :param link_proto: link proto message
+    :return: created interfaces
+    :raises ValueError: when the link type is not known
+    :raises CoreError: when link creation fails
+    """
+    iface1, iface2, options, link_type = add_link_data(link_proto)
+    node1_id = link_proto.node1_id
+    node2_id = link_proto.node2_id
+    return session.add_link(node1_id, node2_id, iface1, iface2, options, link_type)
 
 
-def create_links(
+def add_links(
     session: Session, link_protos: List[core_pb2.Link]
-) -> Tuple[List[NodeBase], List[Exception]]:
+) -> List[Tuple[Optional[Tuple[CoreInterface, CoreInterface]], Optional[Exception]]]:
     """
-    Create links using a thread pool and wait for completion.
+    Add links to a session using a thread pool. Links whose network commands
+    failed are deleted.
 
-    :param session: session to create nodes in
+    :param session: session to add links to
     :param link_protos: link proto messages
-    :return: results and exceptions for created links
+    :return: created interfaces or exception for each link proto, in order
     """
-    funcs = []
-    for link_proto in link_protos:
-        node1_id = link_proto.node1_id
-        node2_id = link_proto.node2_id
-        iface1, iface2, options, link_type = add_link_data(link_proto)
-        args = (node1_id, node2_id, iface1, iface2, options, link_type)
-        funcs.append((session.add_link, args, {}))
+    funcs = [(add_link, (session, x), {}) for x in link_protos]
     start = time.monotonic()
-    results, exceptions = utils.threadpool(funcs)
+    results = batch_results(session, funcs)
     total = time.monotonic() - start
-    logger.debug("grpc created links time: %s", total)
-    return results, exceptions
+    logger.debug("grpc add links time: %s", total)
+    for index, (ifaces, exception) in enumerate(results):
+        if ifaces is not None and exception is not None:
+            link_proto = link_protos[index]
+            iface1, iface2 = ifaces
+            iface1_id = iface1.id if iface1 else None
+            iface2_id = iface2.id if iface2 else None
+            try:
+                session.delete_link(
+                    link_proto.node1_id,
+                    link_proto.node2_id,
+                    iface1_id,
+                    iface2_id,
+                    LinkTypes(link_proto.type),
+                )
+            except (CoreError, CoreCommandError):
+                logger.exception("error deleting failed link: %s", link_proto)
+            results[index] = (None, exception)
+    return results
+
 
+def update_link(session: Session, link_proto: core_pb2.Link) -> None:
+    """
+    Update a link within a session from its proto.
 
-def edit_links(
+    :param session: session to update link for
+    :param link_proto: link proto message
+    :return: nothing
+    :raises ValueError: when the link type is not known
+    :raises CoreError: when link update fails
+    """
+    _, _, options, link_type = add_link_data(link_proto)
+    iface1_id = link_proto.iface1.id if link_proto.HasField("iface1") else None
+    iface2_id = link_proto.iface2.id if link_proto.HasField("iface2") else None
+    node1_id = link_proto.node1_id
+    node2_id = link_proto.node2_id
+    session.update_link(node1_id, node2_id, iface1_id, iface2_id, options, link_type)
+
+
+def update_links(
     session: Session, link_protos: List[core_pb2.Link]
-) -> Tuple[List[None], List[Exception]]:
+) -> List[Tuple[None, Optional[Exception]]]:
     """
-    Edit links using a thread pool and wait for completion.
+    Update links within a session using a thread pool.
 
-    :param session: session to create nodes in
+    :param session: session to update links for
     :param link_protos: link proto messages
-    :return: results and exceptions for created links
+    :return: exception, None when successful, for each link proto, in order
     """
-    funcs = []
-    for link_proto in link_protos:
-        node1_id = link_proto.node1_id
-        node2_id = link_proto.node2_id
-        iface1, iface2, options, link_type = add_link_data(link_proto)
-        args = (node1_id, node2_id, iface1.id, iface2.id, options, link_type)
-        funcs.append((session.update_link, args, {}))
+    funcs = [(update_link, (session, x), {}) for x in link_protos]
     start = time.monotonic()
-    results, exceptions = utils.threadpool(funcs)
+    results = batch_results(session, funcs)
     total = time.monotonic() - start
-    logger.debug("grpc edit links time: %s", total)
-    return results, exceptions
+    logger.debug("grpc update links time: %s", total)
+    return results
 
 
 def convert_value(value: Any) -> str:
@@ -413,27 +575,6 @@ def convert_link(link_data: LinkData) -> core_pb2.Link:
     )
 
 
-def get_net_stats() -> Dict[str, Dict]:
-    """
-    Retrieve status about the current interfaces in the system
-
-    :return: send and receive status of the interfaces in the system
-    """
-    with open("/proc/net/dev", "r") as f:
-        data = f.readlines()[2:]
-
-    stats = {}
-    for line in data:
-        line = line.strip()
-        if not line:
-            continue
-        line = line.split()
-        line[0] = line[0].strip(":")
-        stats[line[0]] = {"rx": float(line[1]), "tx": float(line[9])}
-
-    return stats
-
-
 def session_location(session: Session, location: core_pb2.SessionLocation) -> None:
     """
     Set session location based on location proto.
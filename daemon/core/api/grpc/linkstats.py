@@ -0,0 +1,253 @@
+"""
+Sampling of link statistics for session links, combining device counters and
+root qdisc statistics read in bulk for all host devices.
+"""
+
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+from core import utils
+from core.api.grpc import core_pb2
+from core.emulator.session import Session
+from core.executables import IP, TC
+from core.nodes.network import CoreNetwork, PtpNet
+
+logger = logging.getLogger(__name__)
+LINK_STATS_INTERVAL: float = 1.0
+
+
+@dataclass
+class DeviceStats:
+    """
+    Counters for a host device, along with its root qdisc statistics.
+    """
+
+    rx_bytes: int = 0
+    rx_packets: int = 0
+    rx_dropped: int = 0
+    tx_bytes: int = 0
+    tx_packets: int = 0
+    tx_dropped: int = 0
+    drops: int = 0
+    overlimits: int = 0
+    requeues: int = 0
+    backlog: int = 0
+    qlen: int = 0
+
+
+@dataclass
+class LinkDirection:
+    """
+    Direction of traffic for a link, from node one to node two, carried by a
+    host device either transmitting towards node two or receiving from node one.
+    """
+
+    node1_id: int
+    node2_id: int
+    network_id: int
+    device: str
+    transmit: bool
+    iface1_id: int = 0
+    iface2_id: int = 0
+
+
+def parse_devices(output: str, names: Set[str]) -> Dict[str, DeviceStats]:
+    """
+    Parse device counters from the json output of ip link statistics.
+
+    :param output: ip link json output
+    :param names: names of devices to parse
+    :return: device names mapped to their counters
+    """
+    stats = {}
+    for link in json.loads(output or "[]"):
+        name = link.get("ifname")
+        if name not in names:
+            continue
+        counters = link.get("stats64") or link.get("stats") or {}
+        rx = counters.get("rx", {})
+        tx = counters.get("tx", {})
+        stats[name] = DeviceStats(
+            rx_bytes=rx.get("bytes", 0),
+            rx_packets=rx.get("packets", 0),
+            rx_dropped=rx.get("dropped", 0),
+            tx_bytes=tx.get("bytes", 0),
+            tx_packets=tx.get("packets", 0),
+            tx_dropped=tx.get("dropped", 0),
+        )
+    return stats
+
+
+def parse_qdiscs(output: str, stats: Dict[str, DeviceStats]) -> None:
+    """
+    Parse root qdisc statistics from the json output of tc qdisc statistics,
+    into the statistics of known devices.
+
+    :param output: tc qdisc json output
+    :param stats: device names mapped to their counters, to update
+    :return: nothing
+    """
+    for qdisc in json.loads(output or "[]"):
+        device_stats = stats.get(qdisc.get("dev"))
+        if device_stats is None or not qdisc.get("root"):
+            continue
+        device_stats.drops = qdisc.get("drops", 0)
+        device_stats.overlimits = qdisc.get("overlimits", 0)
+        device_stats.requeues = qdisc.get("requeues", 0)
+        device_stats.backlog = qdisc.get("backlog", 0)
+        device_stats.qlen = qdisc.get("qlen", 0)
+
+
+def read_devices(names: Set[str]) -> Dict[str, DeviceStats]:
+    """
+    Read counters and root qdisc statistics for host devices, using a single
+    command for each for all devices.
+
+    :param names: names of devices to read
+    :return: device names mapped to their counters
+    :raises CoreCommandError: when failing to read statistics
+    """
+    stats = parse_devices(utils.cmd(f"{IP} -s -j link show"), names)
+    parse_qdiscs(utils.cmd(f"{TC} -s -j qdisc show"), stats)
+    return stats
+
+
+def get_link_directions(session: Session) -> List[LinkDirection]:
+    """
+    Retrieve both directions of all links within a session, carried by local host
+    devices. For point to point links, each direction is carried by the device of
+    the receiving node, otherwise by the node device connected to the network.
+
+    :param session: session to get link directions for
+    :return: link directions
+    """
+    directions = []
+    for net in list(session.nodes.values()):
+        if not isinstance(net, CoreNetwork):
+            continue
+        ifaces = [x for x in net.get_ifaces() if x.node and x.node.server is None]
+        if isinstance(net, PtpNet):
+            if len(ifaces) != 2:
+                continue
+            for iface1, iface2 in [ifaces, ifaces[::-1]]:
+                direction = LinkDirection(
+                    node1_id=iface1.node.id,
+                    node2_id=iface2.node.id,
+                    network_id=net.id,
+                    device=iface2.localname,
+                    transmit=True,
+                    iface1_id=iface1.node_id,
+                    iface2_id=iface2.node_id,
+                )
+                directions.append(direction)
+            continue
+        for iface in ifaces:
+            to_node = LinkDirection(
+                node1_id=net.id,
+                node2_id=iface.node.id,
+                network_id=net.id,
+                device=iface.localname,
+                transmit=True,
+                iface2_id=iface.node_id,
+            )
+            from_node = LinkDirection(
+                node1_id=iface.node.id,
+                node2_id=net.id,
+                network_id=net.id,
+                device=iface.localname,
+                transmit=False,
+                iface1_id=iface.node_id,
+            )
+            directions.extend([to_node, from_node])
+    return directions
+
+
+def _delta(current: int, previous: int) -> int:
+    # counters reset when a qdisc is replaced
+    return max(current - previous, 0)
+
+
+class LinkStatsSampler:
+    """
+    Samples link statistics for a session, providing rates and counter deltas
+    since the previous sample.
+    """
+
+    def __init__(self, session: Session) -> None:
+        """
+        Create a LinkStatsSampler instance.
+
+        :param session: session to sample link statistics for
+        """
+        self.session: Session = session
+        self.last_time: Optional[float] = None
+        self.last_stats: Dict[str, DeviceStats] = {}
+
+    def sample(self) -> Optional[core_pb2.LinkStatsEvent]:
+        """
+        Sample link statistics.
+
+        :return: link statistics since the previous sample, None for the first
+        :raises CoreCommandError: when failing to read statistics
+        """
+        directions = get_link_directions(self.session)
+        bridges = {}
+        for node in list(self.session.nodes.values()):
+            if isinstance(node, CoreNetwork) and node.up:
+                bridges[node.brname] = node.id
+        names = {x.device for x in directions}
+        names.update(bridges)
+        now = time.monotonic()
+        stats = read_devices(names)
+        last_time, last_stats = self.last_time, self.last_stats
+        self.last_time, self.last_stats = now, stats
+        if last_time is None:
+            return None
+        interval = now - last_time
+        event = core_pb2.LinkStatsEvent(session_id=self.session.id)
+        for direction in directions:
+            current = stats.get(direction.device)
+            previous = last_stats.get(direction.device)
+            if current is None or previous is None:
+                continue
+            link_stats = event.links.add()
+            link_stats.node1_id = direction.node1_id
+            link_stats.node2_id = direction.node2_id
+            link_stats.iface1_id = direction.iface1_id
+            link_stats.iface2_id = direction.iface2_id
+            link_stats.network_id = direction.network_id
+            if direction.transmit:
+                sent = _delta(current.tx_bytes, previous.tx_bytes)
+                packets = _delta(current.tx_packets, previous.tx_packets)
+                drops = _delta(current.tx_dropped, previous.tx_dropped)
+                link_stats.drops = drops + _delta(current.drops, previous.drops)
+                link_stats.overlimits = _delta(current.overlimits, previous.overlimits)
+                link_stats.requeues = _delta(current.requeues, previous.requeues)
+                link_stats.backlog = current.backlog
+                link_stats.qlen = current.qlen
+            else:
+                sent = _delta(current.rx_bytes, previous.rx_bytes)
+                packets = _delta(current.rx_packets, previous.rx_packets)
+                link_stats.drops = _delta(current.rx_dropped, previous.rx_dropped)
+            link_stats.bytes_per_second = sent / interval
+            link_stats.packets_per_second = packets / interval
+        for name, network_id in bridges.items():
+            current = stats.get(name)
+            previous = last_stats.get(name)
+            if current is None or previous is None:
+                continue
+            network_stats = event.networks.add()
+            network_stats.network_id = network_id
+            rx_bytes = _delta(current.rx_bytes, previous.rx_bytes)
+            tx_bytes = _delta(current.tx_bytes, previous.tx_bytes)
+            rx_packets = _delta(current.rx_packets, previous.rx_packets)
+            tx_packets = _delta(current.tx_packets, previous.tx_packets)
+            rx_dropped = _delta(current.rx_dropped, previous.rx_dropped)
+            tx_dropped = _delta(current.tx_dropped, previous.tx_dropped)
+            network_stats.bytes_per_second = (rx_bytes + tx_bytes) / interval
+            network_stats.packets_per_second = (rx_packets + tx_packets) / interval
+            network_stats.drops = rx_dropped + tx_dropped
+        return event
@@ -0,0 +1,397 @@
+"""
+Reconciles a running session with a requested session definition, applying only
+the node and link differences instead of clearing and recreating the session.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.message import Message
+from grpc import ServicerContext
+
+from core.api.grpc import core_pb2, grpcutils
+from core.emulator.enumerations import EventTypes, LinkTypes, MessageFlags
+from core.emulator.session import Session
+from core.nodes.base import CoreNode, NodeBase
+
+logger = logging.getLogger(__name__)
+# node fields requiring a node to be recreated when changed
+NODE_FIELDS: List[str] = [
+    "name",
+    "model",
+    "image",
+    "emane",
+    "services",
+    "config_services",
+    "wlan_config",
+    "mobility_config",
+    "service_configs",
+    "config_service_configs",
+    "emane_configs",
+]
+# node fields only used by some node types, ignored when unused by a live node
+NODE_TYPE_FIELDS: List[str] = ["model", "image", "emane"]
+LinkKey = Tuple[int, int, int, int, int]
+
+
+@dataclass
+class TopologyDiff:
+    """
+    Node and link changes needed to reconcile a session with a requested session.
+    """
+
+    add_nodes: List[core_pb2.Node] = field(default_factory=list)
+    delete_nodes: List[int] = field(default_factory=list)
+    replace_nodes: List[core_pb2.Node] = field(default_factory=list)
+    edit_nodes: List[core_pb2.Node] = field(default_factory=list)
+    add_links: List[core_pb2.Link] = field(default_factory=list)
+    delete_links: List[core_pb2.Link] = field(default_factory=list)
+    update_links: List[core_pb2.Link] = field(default_factory=list)
+
+    def to_proto(self) -> core_pb2.SessionChanges:
+        """
+        Convert to the session changes reported for a reconciled session.
+
+        :return: session changes proto
+        """
+        return core_pb2.SessionChanges(
+            reconciled=True,
+            added_nodes=[x.id for x in self.add_nodes],
+            deleted_nodes=self.delete_nodes,
+            replaced_nodes=[x.id for x in self.replace_nodes],
+            edited_nodes=[x.id for x in self.edit_nodes],
+            added_links=self.add_links,
+            deleted_links=self.delete_links,
+            updated_links=self.update_links,
+        )
+
+
+def matches(requested: Any, live: Any) -> bool:
+    """
+    Check if the fields set within a requested proto match a live proto. Fields
+    left unset within the request are not compared, as these take defaults.
+
+    :param requested: requested proto or value
+    :param live: live proto or value
+    :return: True if requested fields match, False otherwise
+    """
+    if not isinstance(requested, Message):
+        return requested == live
+    for descriptor, value in requested.ListFields():
+        if not field_matches(descriptor, value, getattr(live, descriptor.name)):
+            return False
+    return True
+
+
+def field_matches(descriptor: FieldDescriptor, value: Any, live_value: Any) -> bool:
+    """
+    Check if a requested proto field matches a live proto field, comparing
+    maps by requested keys and repeated scalars regardless of order.
+
+    :param descriptor: descriptor of field being compared
+    :param value: requested field value
+    :param live_value: live field value
+    :return: True if requested field matches, False otherwise
+    """
+    message_type = descriptor.message_type
+    if message_type and message_type.GetOptions().map_entry:
+        for key, item in value.items():
+            if key not in live_value or not matches(item, live_value[key]):
+                return False
+        return True
+    elif descriptor.label == FieldDescriptor.LABEL_REPEATED:
+        if message_type:
+            if len(value) != len(live_value):
+                return False
+            return all(matches(x, y) for x, y in zip(value, live_value))
+        return sorted(value) == sorted(live_value)
+    else:
+        return matches(value, live_value)
+
+
+def link_key(link_proto: core_pb2.Link) -> LinkKey:
+    """
+    Create a key identifying a link, regardless of the order of its nodes.
+
+    :param link_proto: link to create key for
+    :return: link key
+    """
+    node1 = (link_proto.node1_id, link_proto.iface1.id)
+    node2 = (link_proto.node2_id, link_proto.iface2.id)
+    if node1 > node2:
+        node1, node2 = node2, node1
+    return (link_proto.type,) + node1 + node2
+
+
+def ifaces_match(requested: core_pb2.Link, live: core_pb2.Link) -> bool:
+    """
+    Check if the interfaces of a requested link match a live link, for each node.
+
+    :param requested: requested link proto
+    :param live: live link proto
+    :return: True if interfaces match, False otherwise
+    """
+    live_ifaces = {live.node1_id: live.iface1, live.node2_id: live.iface2}
+    return matches(requested.iface1, live_ifaces[requested.node1_id]) and matches(
+        requested.iface2, live_ifaces[requested.node2_id]
+    )
+
+
+def link_ids(
+    link_proto: core_pb2.Link,
+) -> Tuple[int, int, Optional[int], Optional[int], LinkTypes]:
+    """
+    Retrieve the node and interface ids of a link.
+
+    :param link_proto: link to get ids for
+    :return: node ids, interface ids and link type
+    """
+    iface1_id = link_proto.iface1.id if link_proto.HasField("iface1") else None
+    iface2_id = link_proto.iface2.id if link_proto.HasField("iface2") else None
+    link_type = LinkTypes(link_proto.type)
+    return link_proto.node1_id, link_proto.node2_id, iface1_id, iface2_id, link_type
+
+
+def can_reconcile(
+    session: Session, live: core_pb2.Session, requested: core_pb2.Session
+) -> bool:
+    """
+    Check if a session can be reconciled, requiring a running session with the
+    same options, servers, hooks and location as requested.
+
+    :param session: session to reconcile
+    :param live: current session proto
+    :param requested: requested session proto
+    :return: True if session can be reconciled, False otherwise
+    """
+    if session.state != EventTypes.RUNTIME_STATE:
+        return False
+    for name, option in requested.options.items():
+        value = session.options.get_config(name) or ""
+        if value != option.value:
+            return False
+    servers = {(x.name, x.host) for x in requested.servers}
+    if servers != {(x.name, x.host) for x in live.servers}:
+        return False
+    hooks = {(x.state, x.file, x.data) for x in requested.hooks}
+    if hooks != {(x.state, x.file, x.data) for x in live.hooks}:
+        return False
+    if requested.HasField("location"):
+        return matches(requested.location, live.location)
+    return True
+
+
+def node_changed(
+    session: Session, live: core_pb2.Node, requested: core_pb2.Node
+) -> bool:
+    """
+    Check if a requested node differs from a live node, in a way requiring the
+    node to be recreated.
+
+    :param session: session node belongs to
+    :param live: live node proto
+    :param requested: requested node proto
+    :return: True if node needs to be recreated, False otherwise
+    """
+    if live.type != requested.type:
+        return True
+    node = session.get_node(live.id, NodeBase)
+    server = node.server.name if node.server else ""
+    if server != requested.server:
+        return True
+    for descriptor, value in requested.ListFields():
+        if descriptor.name not in NODE_FIELDS:
+            continue
+        live_value = getattr(live, descriptor.name)
+        if descriptor.name in NODE_TYPE_FIELDS and not live_value:
+            continue
+        if not field_matches(descriptor, value, live_value):
+            return True
+    return False
+
+
+def node_edited(live: core_pb2.Node, requested: core_pb2.Node) -> bool:
+    """
+    Check if a requested node differs from a live node by position, icon or
+    canvas, which are edited in place.
+
+    :param live: live node proto
+    :param requested: requested node proto
+    :return: True if node needs to be edited, False otherwise
+    """
+    if requested.HasField("position"):
+        if requested.position.x != live.position.x:
+            return True
+        if requested.position.y != live.position.y:
+            return True
+    elif requested.HasField("geo") and not matches(requested.geo, live.geo):
+        return True
+    if requested.icon and requested.icon != live.icon:
+        return True
+    return requested.canvas != live.canvas
+
+
+def diff_topology(
+    session: Session, live: core_pb2.Session, requested: core_pb2.Session
+) -> TopologyDiff:
+    """
+    Determine the node and link changes to reconcile a session with a requested
+    session. Links of deleted and recreated nodes are deleted and recreated as
+    well. Wireless links are only added, as mobility also changes these.
+
+    :param session: session to reconcile
+    :param live: current session proto
+    :param requested: requested session proto
+    :return: changes to apply
+    """
+    diff = TopologyDiff()
+    live_nodes = {x.id: x for x in live.nodes}
+    requested_ids = set()
+    for node_proto in requested.nodes:
+        requested_ids.add(node_proto.id)
+        live_node = live_nodes.get(node_proto.id)
+        if live_node is None:
+            diff.add_nodes.append(node_proto)
+        elif node_changed(session, live_node, node_proto):
+            diff.replace_nodes.append(node_proto)
+        elif node_edited(live_node, node_proto):
+            diff.edit_nodes.append(node_proto)
+    diff.delete_nodes = sorted(x for x in live_nodes if x not in requested_ids)
+    removed = set(diff.delete_nodes)
+    removed.update(x.id for x in diff.replace_nodes)
+    live_links = {link_key(x): x for x in live.links}
+    wireless = LinkTypes.WIRELESS.value
+    for link_proto in requested.links:
+        key = link_key(link_proto)
+        live_link = live_links.pop(key, None)
+        if live_link is None:
+            diff.add_links.append(link_proto)
+        elif {live_link.node1_id, live_link.node2_id} & removed:
+            if live_link.type != wireless:
+                diff.delete_links.append(live_link)
+            diff.add_links.append(link_proto)
+        elif not ifaces_match(link_proto, live_link):
+            diff.delete_links.append(live_link)
+            diff.add_links.append(link_proto)
+        elif link_proto.type == wireless:
+            continue
+        else:
+            options = grpcutils.add_link_data(link_proto)[2]
+            live_options = grpcutils.add_link_data(live_link)[2]
+            if options != live_options:
+                diff.update_links.append(link_proto)
+    for live_link in live_links.values():
+        if live_link.type != wireless:
+            diff.delete_links.append(live_link)
+    return diff
+
+
+def restart_services(session: Session, node: CoreNode) -> None:
+    """
+    Restart the services of a node booted before its services were configured.
+
+    :param session: session node belongs to
+    :param node: node to restart services for
+    :return: nothing
+    """
+    session.services.stop_services(node)
+    for service in node.config_services.values():
+        service.stop()
+    session.boot_node(node)
+
+
+def apply_diff(
+    session: Session, diff: TopologyDiff, context: ServicerContext
+) -> List[Exception]:
+    """
+    Apply topology changes to a running session.
+
+    :param session: session to apply changes to
+    :param diff: changes to apply
+    :param context: grpc context
+    :return: exceptions that occurred
+    """
+    exceptions = []
+    for link_proto in diff.delete_links:
+        try:
+            session.delete_link(*link_ids(link_proto))
+        except Exception as e:
+            logger.exception("error deleting link during reconcile")
+            exceptions.append(e)
+    for node_id in diff.delete_nodes:
+        node = session.get_node(node_id, NodeBase)
+        session.delete_node(node_id)
+        session.broadcast_node(node, MessageFlags.DELETE)
+    for node_proto in diff.replace_nodes:
+        session.delete_node(node_proto.id)
+    for node_proto in diff.edit_nodes:
+        node = session.get_node(node_proto.id, NodeBase)
+        node.icon = node_proto.icon or node.icon
+        node.canvas = node_proto.canvas
+        if node_proto.HasField("position"):
+            position = node_proto.position
+            session.set_node_pos(node, position.x, position.y)
+        elif node_proto.HasField("geo"):
+            geo = node_proto.geo
+            session.set_node_geo(node, geo.lon, geo.lat, geo.alt)
+        session.broadcast_node(node)
+    node_protos = diff.add_nodes + diff.replace_nodes
+    exceptions.extend(
+        grpcutils.create_topology(session, node_protos, diff.add_links, context)
+    )
+    for link_proto in diff.update_links:
+        node1_id, node2_id, iface1_id, iface2_id, link_type = link_ids(link_proto)
+        options = grpcutils.add_link_data(link_proto)[2]
+        args = (node1_id, node2_id, iface1_id, iface2_id, options, link_type)
+        try:
+            session.update_link(*args)
+        except Exception as e:
+            logger.exception("error updating link during reconcile")
+            exceptions.append(e)
+    # nodes are booted when added, before their services were configured
+    for node_proto in node_protos:
+        if not node_proto.service_configs and not node_proto.config_service_configs:
+            continue
+        node = session.nodes.get(node_proto.id)
+        if isinstance(node, CoreNode):
+            try:
+                restart_services(session, node)
+            except Exception as e:
+                logger.exception("error restarting services during reconcile")
+                exceptions.append(e)
+    return exceptions
+
+
+def reconcile_session(
+    session: Session, requested: core_pb2.Session, context: ServicerContext
+) -> Tuple[Optional[TopologyDiff], List[Exception]]:
+    """
+    Reconcile a running session with a requested session, when possible.
+
+    :param session: session to reconcile
+    :param requested: requested session proto
+    :param context: grpc context
+    :return: applied changes, None when the session could not be reconciled, and
+        exceptions that occurred
+    """
+    live = grpcutils.convert_session(session)
+    if not can_reconcile(session, live, requested):
+        return None, []
+    diff = diff_topology(session, live, requested)
+    logger.info(
+        "reconciling session(%s) nodes add(%s) delete(%s) replace(%s) "
+        "links add(%s) delete(%s) update(%s)",
+        session.id,
+        len(diff.add_nodes),
+        len(diff.delete_nodes),
+        len(diff.replace_nodes),
+        len(diff.add_links),
+        len(diff.delete_links),
+        len(diff.update_links),
+    )
+    session.user = requested.user
+    session.metadata = dict(requested.metadata)
+    exceptions = apply_diff(session, diff, context)
+    return diff, exceptions
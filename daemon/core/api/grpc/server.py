@@ -1,12 +1,14 @@
 import atexit
+import json
 import logging
 import os
-import re
+import queue
 import tempfile
+import threading
 import time
 from concurrent import futures
 from pathlib import Path
-from typing import Iterable, Optional, Pattern, Type
+from typing import Dict, Iterable, List, Optional, Tuple, Type
 
 import grpc
 from grpc import ServicerContext
@@ -18,6 +20,7 @@ from core.api.grpc import (
     core_pb2,
     core_pb2_grpc,
     grpcutils,
+    reconcile,
 )
 from core.api.grpc.configservices_pb2 import (
     ConfigService,
@@ -39,11 +42,15 @@ from core.api.grpc.emane_pb2 import (
     SetEmaneModelConfigRequest,
     SetEmaneModelConfigResponse,
 )
-from core.api.grpc.events import EventStreamer
-from core.api.grpc.grpcutils import get_config_options, get_links, get_net_stats
+from core.api.grpc.events import EVENT_QUEUE_SIZE, EventFilter, EventStreamer
+from core.api.grpc.grpcutils import get_config_options, get_links
+from core.api.grpc.linkstats import LINK_STATS_INTERVAL, LinkStatsSampler
 from core.api.grpc.mobility_pb2 import (
     GetMobilityConfigRequest,
     GetMobilityConfigResponse,
+    GetMobilityTimelineRequest,
+    GetMobilityTimelineResponse,
+    LinkChange,
     MobilityAction,
     MobilityActionRequest,
     MobilityActionResponse,
@@ -64,6 +71,7 @@ from core.api.grpc.services_pb2 import (
     SetServiceDefaultsRequest,
     SetServiceDefaultsResponse,
 )
+from core.api.grpc.throughputs import THROUGHPUT_INTERVAL, ThroughputSampler
 from core.api.grpc.wlan_pb2 import (
     GetWlanConfigRequest,
     GetWlanConfigResponse,
@@ -86,13 +94,14 @@ from core.emulator.session import NT, Session
 from core.errors import CoreCommandError, CoreError
 from core.location.mobility import BasicRangeModel, Ns2ScriptedMobility
 from core.nodes.base import CoreNode, NodeBase
+from core.nodes.interface import CoreInterface
 from core.nodes.network import WlanNode
 from core.services.coreservices import ServiceManager
 
 logger = logging.getLogger(__name__)
 _ONE_DAY_IN_SECONDS: int = 60 * 60 * 24
-_INTERFACE_REGEX: Pattern = re.compile(r"veth(?P<node>[0-9a-fA-F]+)")
 _MAX_WORKERS = 1000
+_MOVE_NODES_BATCH: int = 1000
 
 
 class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
@@ -107,6 +116,7 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         self.coreemu: CoreEmu = coreemu
         self.running: bool = True
         self.server: Optional[grpc.Server] = None
+        self.throughput_sampler: ThroughputSampler = ThroughputSampler()
         atexit.register(self._exit_handler)
 
     def _exit_handler(self) -> None:
@@ -185,6 +195,54 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         source = source if source else None
         session.broadcast_node(node, source=source)
 
+    def move_nodes(
+        self, context: ServicerContext, requests: List[core_pb2.MoveNodesRequest]
+    ) -> None:
+        """
+        Move a batch of nodes, converting geo positions in a single batch per
+        session. Only the latest request for a node within the batch is applied.
+        Moves prior to an invalid request are applied before failing, as when
+        moving each node in order.
+
+        :param context: grpc context
+        :param requests: move node requests to apply
+        :return: nothing
+        """
+        moves = {}
+        try:
+            for request in requests:
+                geo = request.geo if request.HasField("geo") else None
+                position = request.position if request.HasField("position") else None
+                if not geo and not position:
+                    raise CoreError("move node must provide a geo or position to move")
+                session = self.get_session(request.session_id, context)
+                node = self.get_node(session, request.node_id, context, NodeBase)
+                moves[(session.id, node.id)] = (session, node, geo, position, request)
+        finally:
+            self.apply_moves(list(moves.values()))
+
+    def apply_moves(self, moves: List[Tuple]) -> None:
+        """
+        Apply validated node moves, converting geo positions in a single batch
+        per session.
+
+        :param moves: session, node, geo, position and request of each move
+        :return: nothing
+        """
+        sessions: Dict[Session, List[Tuple]] = {}
+        for session, *move in moves:
+            sessions.setdefault(session, []).append(move)
+        for session, session_moves in sessions.items():
+            geos = [(x, g.lon, g.lat, g.alt) for x, g, _, _ in session_moves if g]
+            session.set_node_geos(geos)
+            sources = {}
+            for node, geo, position, request in session_moves:
+                if not geo:
+                    session.set_node_pos(node, position.x, position.y)
+                sources.setdefault(request.source or None, []).append(node)
+            for source, nodes in sources.items():
+                session.broadcast_nodes(nodes, source=source)
+
     def validate_service(
         self, name: str, context: ServicerContext
     ) -> Type[ConfigService]:
@@ -227,17 +285,23 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
             )
             config_services.append(service_proto)
         emane_models = [x.name for x in EmaneModelManager.models.values()]
+        node_pool = None
+        node_pool_stats = self.coreemu.node_pool_stats()
+        if node_pool_stats is not None:
+            node_pool = core_pb2.NodePoolStats(**node_pool_stats)
         return core_pb2.GetConfigResponse(
             services=services,
             config_services=config_services,
             emane_models=emane_models,
+            node_pool=node_pool,
         )
 
     def StartSession(
         self, request: core_pb2.StartSessionRequest, context: ServicerContext
     ) -> core_pb2.StartSessionResponse:
         """
-        Start a session.
+        Start a session. When reconciling a running session, only the node and
+        link differences from the requested session are applied.
 
         :param request: start session request
         :param context: grpc context
@@ -246,6 +310,18 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         logger.debug("start session: %s", request)
         session = self.get_session(request.session.id, context)
 
+        # apply only changes to a running session, when requested and possible
+        if request.reconcile and not request.definition:
+            diff, exceptions = reconcile.reconcile_session(
+                session, request.session, context
+            )
+            if diff is not None:
+                changes = diff.to_proto()
+                exceptions = [str(x) for x in exceptions]
+                return core_pb2.StartSessionResponse(
+                    result=not exceptions, exceptions=exceptions, changes=changes
+                )
+
         # clear previous state and setup for creation
         session.clear()
         if request.definition:
@@ -275,38 +351,12 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
             state = EventTypes(hook.state)
             session.add_hook(state, hook.file, hook.data)
 
-        # create nodes
-        _, exceptions = grpcutils.create_nodes(session, request.session.nodes)
-        if exceptions:
-            exceptions = [str(x) for x in exceptions]
-            return core_pb2.StartSessionResponse(result=False, exceptions=exceptions)
-
-        # check for configurations
-        for node in request.session.nodes:
-            core_node = self.get_node(session, node.id, context, NodeBase)
-            grpcutils.configure_node(session, node, core_node, context)
-
-        # create links
-        links = []
-        edit_links = []
-        known_links = set()
-        for link in request.session.links:
-            iface1 = link.iface1.id if link.iface1 else None
-            iface2 = link.iface2.id if link.iface2 else None
-            if link.node1_id < link.node2_id:
-                link_id = (link.node1_id, iface1, link.node2_id, iface2)
-            else:
-                link_id = (link.node2_id, iface2, link.node1_id, iface1)
-            if link_id in known_links:
-                edit_links.append(link)
-            else:
-                known_links.add(link_id)
-                links.append(link)
-        _, exceptions = grpcutils.create_links(session, links)
-        if exceptions:
-            exceptions = [str(x) for x in exceptions]
-            return core_pb2.StartSessionResponse(result=False, exceptions=exceptions)
-        _, exceptions = grpcutils.edit_links(session, edit_links)
+        # create nodes and links, batching their network commands
+        try:
+            with session.batch():
+                exceptions = self.create_topology(session, request, context)
+        except CoreCommandError as e:
+            exceptions = [e]
         if exceptions:
             exceptions = [str(x) for x in exceptions]
             return core_pb2.StartSessionResponse(result=False, exceptions=exceptions)
@@ -326,6 +376,24 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
                 )
         return core_pb2.StartSessionResponse(result=True)
 
+    def create_topology(
+        self,
+        session: Session,
+        request: core_pb2.StartSessionRequest,
+        context: ServicerContext,
+    ) -> List[Exception]:
+        """
+        Create and configure the nodes and links for a start session request.
+
+        :param session: session to create topology for
+        :param request: start session request
+        :param context: grpc context
+        :return: exceptions that occurred
+        """
+        return grpcutils.create_topology(
+            session, request.session.nodes, request.session.links, context
+        )
+
     def StopSession(
         self, request: core_pb2.StopSessionRequest, context: ServicerContext
     ) -> core_pb2.StopSessionResponse:
@@ -427,6 +495,21 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         session_proto = grpcutils.convert_session(session)
         return core_pb2.GetSessionResponse(session=session_proto)
 
+    def GetSessionTrace(
+        self, request: core_pb2.GetSessionTraceRequest, context: ServicerContext
+    ) -> core_pb2.GetSessionTraceResponse:
+        """
+        Retrieve the startup trace of a session, as chrome trace json
+
+        :param request: get session trace request
+        :param context: context object
+        :return: get session trace response
+        """
+        logger.debug("get session trace: %s", request)
+        session = self.get_session(request.session_id, context)
+        data = session.tracer.to_chrome(session.id, f"session {session.id}")
+        return core_pb2.GetSessionTraceResponse(trace=json.dumps(data, default=str))
+
     def SessionAlert(
         self, request: core_pb2.SessionAlertRequest, context: ServicerContext
     ) -> core_pb2.SessionAlertResponse:
@@ -442,82 +525,82 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         if not event_types:
             event_types = set(core_pb2.EventType.Enum.values())
 
-        streamer = EventStreamer(session, event_types)
-        while self._is_running(context):
-            event = streamer.process()
-            if event:
-                yield event
-
-        streamer.remove_handlers()
+        queue_size = request.queue_size if request.queue_size > 0 else EVENT_QUEUE_SIZE
+        region = request.region if request.HasField("region") else None
+        event_filter = EventFilter(
+            session, request.node_ids, request.network_ids, region
+        )
+        streamer = EventStreamer(
+            session,
+            event_types,
+            queue_size,
+            request.overflow,
+            request.batch_size,
+            event_filter,
+        )
+        try:
+            while self._is_running(context):
+                event = streamer.process()
+                if event:
+                    yield event
+                if streamer.overflowed:
+                    context.abort(
+                        grpc.StatusCode.RESOURCE_EXHAUSTED, "event queue overflowed"
+                    )
+        finally:
+            streamer.remove_handlers()
         self._cancel_stream(context)
 
     def Throughputs(
         self, request: core_pb2.ThroughputsRequest, context: ServicerContext
     ) -> None:
         """
-        Calculate average throughput after every certain amount of delay time
+        Calculate average throughput every requested interval, using throughputs
+        sampled by the sampler shared by all streams
 
         :param request: throughputs request
         :param context: context object
         :return: nothing
         """
         session = self.get_session(request.session_id, context)
-        delay = 3
-        last_check = None
-        last_stats = None
-
-        while self._is_running(context):
-            now = time.monotonic()
-            stats = get_net_stats()
-
-            # calculate average
-            if last_check is not None:
-                interval = now - last_check
-                throughputs_event = core_pb2.ThroughputsEvent(session_id=session.id)
-                for key in stats:
-                    current_rxtx = stats[key]
-                    previous_rxtx = last_stats.get(key)
-                    if not previous_rxtx:
-                        continue
-                    rx_kbps = (
-                        (current_rxtx["rx"] - previous_rxtx["rx"]) * 8.0 / interval
-                    )
-                    tx_kbps = (
-                        (current_rxtx["tx"] - previous_rxtx["tx"]) * 8.0 / interval
-                    )
-                    throughput = rx_kbps + tx_kbps
-                    if key.startswith("veth"):
-                        key = key.split(".")
-                        node_id = _INTERFACE_REGEX.search(key[0]).group("node")
-                        node_id = int(node_id, base=16)
-                        iface_id = int(key[1])
-                        session_id = key[2]
-                        if session.short_session_id() != session_id:
-                            continue
-                        iface_throughput = throughputs_event.iface_throughputs.add()
-                        iface_throughput.node_id = node_id
-                        iface_throughput.iface_id = iface_id
-                        iface_throughput.throughput = throughput
-                    elif key.startswith("b."):
-                        try:
-                            key = key.split(".")
-                            node_id = int(key[1], base=16)
-                            session_id = key[2]
-                            if session.short_session_id() != session_id:
-                                continue
-                            bridge_throughput = (
-                                throughputs_event.bridge_throughputs.add()
-                            )
-                            bridge_throughput.node_id = node_id
-                            bridge_throughput.throughput = throughput
-                        except ValueError:
-                            pass
+        interval = request.interval
+        if interval <= 0:
+            interval = THROUGHPUT_INTERVAL
+        subscriber = self.throughput_sampler.subscribe(session, interval)
+        try:
+            while self._is_running(context):
+                throughputs_event = subscriber.get(1)
+                if throughputs_event:
+                    yield throughputs_event
+        finally:
+            self.throughput_sampler.unsubscribe(subscriber)
 
-                yield throughputs_event
+    def LinkStats(
+        self, request: core_pb2.LinkStatsRequest, context: ServicerContext
+    ) -> None:
+        """
+        Stream statistics for both directions of session links every requested
+        interval, along with statistics for session networks.
 
-            last_check = now
-            last_stats = stats
-            time.sleep(delay)
+        :param request: link stats request
+        :param context: context object
+        :return: nothing
+        """
+        session = self.get_session(request.session_id, context)
+        interval = request.interval
+        if interval <= 0:
+            interval = LINK_STATS_INTERVAL
+        sampler = LinkStatsSampler(session)
+        while self._is_running(context):
+            start = time.monotonic()
+            try:
+                event = sampler.sample()
+            except (CoreCommandError, ValueError):
+                logger.exception("error sampling link stats")
+                event = None
+            if event:
+                yield event
+            time.sleep(max(interval - (time.monotonic() - start), 0))
 
     def CpuUsage(
         self, request: core_pb2.CpuUsageRequest, context: ServicerContext
@@ -548,6 +631,37 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         session.broadcast_node(node, MessageFlags.ADD, source)
         return core_pb2.AddNodeResponse(node_id=node.id)
 
+    def AddNodes(
+        self, request: core_pb2.AddNodesRequest, context: ServicerContext
+    ) -> core_pb2.AddNodesResponse:
+        """
+        Add several nodes to requested session, creating them within a thread pool
+        and batching their network commands.
+
+        :param request: add-nodes request
+        :param context: context object
+        :return: add-nodes response, with a result for each requested node
+        """
+        logger.debug("add nodes: %s", request)
+        session = self.get_session(request.session_id, context)
+        nodes = list(request.nodes)
+        results = grpcutils.add_nodes(session, nodes)
+        node_results = []
+        added = []
+        for node_proto, (node, exception) in zip(nodes, results):
+            if exception:
+                node_result = core_pb2.AddNodeResult(
+                    result=False, node_id=node_proto.id, error=str(exception)
+                )
+            else:
+                grpcutils.configure_node(session, node_proto, node, context)
+                added.append(node)
+                node_result = core_pb2.AddNodeResult(result=True, node_id=node.id)
+            node_results.append(node_result)
+        source = request.source if request.source else None
+        session.broadcast_nodes(added, MessageFlags.ADD, source)
+        return core_pb2.AddNodesResponse(results=node_results)
+
     def GetNode(
         self, request: core_pb2.GetNodeRequest, context: ServicerContext
     ) -> core_pb2.GetNodeResponse:
@@ -601,17 +715,48 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         :param context: context object
         :return: move nodes response
         """
-        for request in request_iterator:
-            geo = request.geo if request.HasField("geo") else None
-            position = request.position if request.HasField("position") else None
-            self.move_node(
-                context,
-                request.session_id,
-                request.node_id,
-                geo,
-                position,
-                request.source,
-            )
+        # read requests on a separate thread, to move all requests received while
+        # processing a batch together
+        requests = queue.Queue(_MOVE_NODES_BATCH)
+        done = threading.Event()
+
+        def read() -> None:
+            try:
+                for request in request_iterator:
+                    while not done.is_set():
+                        try:
+                            requests.put(request, timeout=1)
+                            break
+                        except queue.Full:
+                            pass
+            except Exception:
+                logger.exception("error reading move nodes requests")
+            finally:
+                while not done.is_set():
+                    try:
+                        requests.put(None, timeout=1)
+                        break
+                    except queue.Full:
+                        pass
+
+        thread = threading.Thread(target=read, daemon=True)
+        thread.start()
+        try:
+            finished = False
+            while not finished:
+                batch = [requests.get()]
+                while batch[-1] is not None and len(batch) < _MOVE_NODES_BATCH:
+                    try:
+                        batch.append(requests.get_nowait())
+                    except queue.Empty:
+                        break
+                if batch[-1] is None:
+                    finished = True
+                    batch.pop()
+                if batch:
+                    self.move_nodes(context, batch)
+        finally:
+            done.set()
         return core_pb2.MoveNodesResponse()
 
     def EditNode(
@@ -711,17 +856,44 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         node1_iface, node2_iface = session.add_link(
             node1_id, node2_id, iface1_data, iface2_data, options, link_type
         )
+        source = request.source if request.source else None
+        iface1_proto, iface2_proto = self.broadcast_add_link(
+            session, request.link, node1_iface, node2_iface, options, source
+        )
+        return core_pb2.AddLinkResponse(
+            result=True, iface1=iface1_proto, iface2=iface2_proto
+        )
+
+    def broadcast_add_link(
+        self,
+        session: Session,
+        link: core_pb2.Link,
+        node1_iface: Optional[CoreInterface],
+        node2_iface: Optional[CoreInterface],
+        options: LinkOptions,
+        source: Optional[str],
+    ) -> Tuple[Optional[core_pb2.Interface], Optional[core_pb2.Interface]]:
+        """
+        Broadcast an added link, creating interface protos for the link.
+
+        :param session: session link was added to
+        :param link: link proto that was added
+        :param node1_iface: created node one interface, None otherwise
+        :param node2_iface: created node two interface, None otherwise
+        :param options: link options
+        :param source: source of link, None otherwise
+        :return: node one and node two interface protos, None otherwise
+        """
         iface1_data = None
         if node1_iface:
             iface1_data = grpcutils.iface_to_data(node1_iface)
         iface2_data = None
         if node2_iface:
             iface2_data = grpcutils.iface_to_data(node2_iface)
-        source = request.source if request.source else None
         link_data = LinkData(
             message_type=MessageFlags.ADD,
-            node1_id=node1_id,
-            node2_id=node2_id,
+            node1_id=link.node1_id,
+            node2_id=link.node2_id,
             iface1=iface1_data,
             iface2=iface2_data,
             options=options,
@@ -731,12 +903,42 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         iface1_proto = None
         iface2_proto = None
         if node1_iface:
-            iface1_proto = grpcutils.iface_to_proto(node1_id, node1_iface)
+            iface1_proto = grpcutils.iface_to_proto(link.node1_id, node1_iface)
         if node2_iface:
-            iface2_proto = grpcutils.iface_to_proto(node2_id, node2_iface)
-        return core_pb2.AddLinkResponse(
-            result=True, iface1=iface1_proto, iface2=iface2_proto
-        )
+            iface2_proto = grpcutils.iface_to_proto(link.node2_id, node2_iface)
+        return iface1_proto, iface2_proto
+
+    def AddLinks(
+        self, request: core_pb2.AddLinksRequest, context: ServicerContext
+    ) -> core_pb2.AddLinksResponse:
+        """
+        Add several links to a session, creating them within a thread pool and
+        batching their network commands.
+
+        :param request: add-links request
+        :param context: context object
+        :return: add-links response, with a result for each requested link
+        """
+        logger.debug("add links: %s", request)
+        session = self.get_session(request.session_id, context)
+        links = list(request.links)
+        results = grpcutils.add_links(session, links)
+        source = request.source if request.source else None
+        link_results = []
+        for link, (ifaces, exception) in zip(links, results):
+            if exception:
+                error = str(exception)
+                link_results.append(core_pb2.AddLinkResult(result=False, error=error))
+                continue
+            _, _, options, _ = grpcutils.add_link_data(link)
+            iface1_proto, iface2_proto = self.broadcast_add_link(
+                session, link, *ifaces, options, source
+            )
+            link_result = core_pb2.AddLinkResult(
+                result=True, iface1=iface1_proto, iface2=iface2_proto
+            )
+            link_results.append(link_result)
+        return core_pb2.AddLinksResponse(results=link_results)
 
     def EditLink(
         self, request: core_pb2.EditLinkRequest, context: ServicerContext
@@ -769,20 +971,81 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
             buffer=options_proto.buffer,
         )
         session.update_link(node1_id, node2_id, iface1_id, iface2_id, options)
-        iface1 = InterfaceData(id=iface1_id)
-        iface2 = InterfaceData(id=iface2_id)
         source = request.source if request.source else None
+        self.broadcast_edit_link(
+            session, node1_id, node2_id, iface1_id, iface2_id, options, source
+        )
+        return core_pb2.EditLinkResponse(result=True)
+
+    def broadcast_edit_link(
+        self,
+        session: Session,
+        node1_id: int,
+        node2_id: int,
+        iface1_id: Optional[int],
+        iface2_id: Optional[int],
+        options: LinkOptions,
+        source: Optional[str],
+    ) -> None:
+        """
+        Broadcast an edited link.
+
+        :param session: session link was edited in
+        :param node1_id: node one id
+        :param node2_id: node two id
+        :param iface1_id: node one interface id
+        :param iface2_id: node two interface id
+        :param options: updated link options
+        :param source: source of edit, None otherwise
+        :return: nothing
+        """
         link_data = LinkData(
             message_type=MessageFlags.NONE,
             node1_id=node1_id,
             node2_id=node2_id,
-            iface1=iface1,
-            iface2=iface2,
+            iface1=InterfaceData(id=iface1_id),
+            iface2=InterfaceData(id=iface2_id),
             options=options,
             source=source,
         )
         session.broadcast_link(link_data)
-        return core_pb2.EditLinkResponse(result=True)
+
+    def EditLinks(
+        self, request: core_pb2.EditLinksRequest, context: ServicerContext
+    ) -> core_pb2.EditLinksResponse:
+        """
+        Edit several links, updating them within a thread pool and batching their
+        network commands.
+
+        :param request: edit-links request
+        :param context: context object
+        :return: edit-links response, with a result for each requested link
+        """
+        logger.debug("edit links: %s", request)
+        session = self.get_session(request.session_id, context)
+        links = list(request.links)
+        results = grpcutils.update_links(session, links)
+        source = request.source if request.source else None
+        link_results = []
+        for link, (_, exception) in zip(links, results):
+            if exception:
+                error = str(exception)
+                link_results.append(core_pb2.EditLinkResult(result=False, error=error))
+                continue
+            _, _, options, _ = grpcutils.add_link_data(link)
+            iface1_id = link.iface1.id if link.HasField("iface1") else None
+            iface2_id = link.iface2.id if link.HasField("iface2") else None
+            self.broadcast_edit_link(
+                session,
+                link.node1_id,
+                link.node2_id,
+                iface1_id,
+                iface2_id,
+                options,
+                source,
+            )
+            link_results.append(core_pb2.EditLinkResult(result=True))
+        return core_pb2.EditLinksResponse(results=link_results)
 
     def DeleteLink(
         self, request: core_pb2.DeleteLinkRequest, context: ServicerContext
@@ -882,6 +1145,36 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
             result = False
         return MobilityActionResponse(result=result)
 
+    def GetMobilityTimeline(
+        self, request: GetMobilityTimelineRequest, context: ServicerContext
+    ) -> GetMobilityTimelineResponse:
+        """
+        Retrieve the link changes a wlan range model recorded during its last
+        mobility pass run with a stepped clock
+
+        :param request: get-mobility-timeline request
+        :param context: context object
+        :return: get-mobility-timeline response
+        """
+        logger.debug("get mobility timeline: %s", request)
+        session = self.get_session(request.session_id, context)
+        wlan = self.get_node(session, request.node_id, context, WlanNode)
+        if not isinstance(wlan.model, BasicRangeModel):
+            context.abort(
+                grpc.StatusCode.NOT_FOUND,
+                f"wlan node {request.node_id} is not using BasicRangeModel",
+            )
+        changes = [
+            LinkChange(
+                time=x.time,
+                node1_id=x.node1_id,
+                node2_id=x.node2_id,
+                linked=x.linked,
+            )
+            for x in wlan.model.get_timeline()
+        ]
+        return GetMobilityTimelineResponse(changes=changes)
+
     def GetServiceDefaults(
         self, request: GetServiceDefaultsRequest, context: ServicerContext
     ) -> GetServiceDefaultsResponse:
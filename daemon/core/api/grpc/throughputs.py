@@ -0,0 +1,218 @@
+"""
+Shared sampling of session interface throughputs, taking a single snapshot of
+interface counters for all subscribers due at the same time.
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from queue import Empty, Full, Queue
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from core.api.grpc import core_pb2
+from core.emulator.session import Session
+
+logger = logging.getLogger(__name__)
+NET_DEV_PATH: Path = Path("/proc/net/dev")
+THROUGHPUT_INTERVAL: float = 3.0
+
+# received and transmitted bytes for an interface
+Counters = Tuple[float, float]
+
+
+def read_net_dev(names: Set[str], path: Path = NET_DEV_PATH) -> Dict[str, Counters]:
+    """
+    Read received and transmitted bytes for the provided interfaces, skipping
+    the parsing of all other interfaces.
+
+    :param names: names of interfaces to read
+    :param path: path of net dev file to read
+    :return: interface names mapped to received and transmitted bytes
+    """
+    stats = {}
+    with path.open("r") as f:
+        for line in f:
+            name, sep, data = line.partition(":")
+            if not sep:
+                continue
+            name = name.strip()
+            if name not in names:
+                continue
+            values = data.split()
+            stats[name] = (float(values[0]), float(values[8]))
+    return stats
+
+
+class ThroughputSubscriber:
+    """
+    Subscriber receiving throughputs for a session at its own interval.
+    """
+
+    def __init__(self, session: Session, interval: float) -> None:
+        """
+        Create a ThroughputSubscriber instance.
+
+        :param session: session to receive throughputs for
+        :param interval: seconds between throughputs
+        """
+        self.session: Session = session
+        self.interval: float = interval
+        self.next_time: float = time.monotonic()
+        self.last_time: Optional[float] = None
+        self.last_stats: Dict[str, Counters] = {}
+        self.queue: Queue = Queue(maxsize=1)
+        # called after new throughputs are available
+        self.notify: Optional[Callable[[], None]] = None
+
+    def update(
+        self,
+        now: float,
+        stats: Dict[str, Counters],
+        ifaces: Dict[str, Tuple[int, Optional[int]]],
+    ) -> None:
+        """
+        Calculate throughputs since the last snapshot, replacing any throughputs
+        not yet retrieved.
+
+        :param now: time of snapshot
+        :param stats: snapshot of interface counters
+        :param ifaces: session host interfaces mapped to node and interface ids
+        :return: nothing
+        """
+        last_time, last_stats = self.last_time, self.last_stats
+        self.last_time = now
+        self.last_stats = {x: stats[x] for x in ifaces if x in stats}
+        if last_time is None:
+            return
+        interval = now - last_time
+        event = core_pb2.ThroughputsEvent(session_id=self.session.id)
+        for name, (node_id, iface_id) in ifaces.items():
+            current = stats.get(name)
+            previous = last_stats.get(name)
+            if not current or not previous:
+                continue
+            rx = (current[0] - previous[0]) * 8.0 / interval
+            tx = (current[1] - previous[1]) * 8.0 / interval
+            if iface_id is None:
+                throughput = event.bridge_throughputs.add()
+            else:
+                throughput = event.iface_throughputs.add()
+                throughput.iface_id = iface_id
+            throughput.node_id = node_id
+            throughput.throughput = rx + tx
+        try:
+            self.queue.get_nowait()
+        except Empty:
+            pass
+        try:
+            self.queue.put_nowait(event)
+        except Full:
+            pass
+        if self.notify:
+            self.notify()
+
+    def get(self, timeout: float) -> Optional[core_pb2.ThroughputsEvent]:
+        """
+        Retrieve the next throughputs.
+
+        :param timeout: maximum time to wait in seconds
+        :return: throughputs event, None when timed out
+        """
+        try:
+            return self.queue.get(timeout=timeout)
+        except Empty:
+            return None
+
+
+class ThroughputSampler:
+    """
+    Samples interface counters for all subscribers from a single thread, reading
+    only interfaces of subscribed sessions once for all subscribers due.
+    """
+
+    def __init__(self, path: Path = NET_DEV_PATH) -> None:
+        """
+        Create a ThroughputSampler instance.
+
+        :param path: path of net dev file to sample
+        """
+        self.path: Path = path
+        self.condition: threading.Condition = threading.Condition()
+        self.subscribers: List[ThroughputSubscriber] = []
+        self.thread: Optional[threading.Thread] = None
+
+    def subscribe(self, session: Session, interval: float) -> ThroughputSubscriber:
+        """
+        Subscribe to throughputs for a session.
+
+        :param session: session to receive throughputs for
+        :param interval: seconds between throughputs
+        :return: subscriber to retrieve throughputs from
+        """
+        subscriber = ThroughputSubscriber(session, interval)
+        with self.condition:
+            self.subscribers.append(subscriber)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+            self.condition.notify()
+        return subscriber
+
+    def unsubscribe(self, subscriber: ThroughputSubscriber) -> None:
+        """
+        Stop providing throughputs to a subscriber.
+
+        :param subscriber: subscriber to remove
+        :return: nothing
+        """
+        with self.condition:
+            if subscriber in self.subscribers:
+                self.subscribers.remove(subscriber)
+            self.condition.notify()
+
+    def _next_due(self) -> Optional[List[ThroughputSubscriber]]:
+        with self.condition:
+            while True:
+                if not self.subscribers:
+                    self.thread = None
+                    return None
+                now = time.monotonic()
+                due = [x for x in self.subscribers if x.next_time <= now]
+                if due:
+                    return due
+                delay = min(x.next_time for x in self.subscribers) - now
+                self.condition.wait(delay)
+
+    def run(self) -> None:
+        """
+        Sample interface counters as subscribers become due, until there are no
+        subscribers left.
+
+        :return: nothing
+        """
+        while True:
+            due = self._next_due()
+            if due is None:
+                break
+            session_ifaces = {}
+            for subscriber in due:
+                session = subscriber.session
+                if session.id not in session_ifaces:
+                    session_ifaces[session.id] = session.get_host_ifaces()
+            names = set()
+            for ifaces in session_ifaces.values():
+                names.update(ifaces)
+            now = time.monotonic()
+            try:
+                stats = read_net_dev(names, self.path)
+            except (IOError, ValueError, IndexError):
+                logger.exception("error reading interface counters")
+                stats = {}
+            for subscriber in due:
+                ifaces = session_ifaces[subscriber.session.id]
+                subscriber.update(now, stats, ifaces)
+                # keep a fixed rate, unless running behind by a whole interval
+                subscriber.next_time += subscriber.interval
+                if subscriber.next_time < now:
+                    subscriber.next_time = now + subscriber.interval
@@ -8,6 +8,7 @@ from core.api.grpc import (
     configservices_pb2,
     core_pb2,
     emane_pb2,
+    mobility_pb2,
     services_pb2,
 )
 
@@ -109,6 +110,12 @@ class EventType:
     FILE = 5
 
 
+class EventOverflow:
+    COALESCE = 0
+    DROP_OLDEST = 1
+    DISCONNECT = 2
+
+
 @dataclass
 class ConfigService:
     group: str
@@ -352,6 +359,71 @@ class ThroughputsEvent:
         )
 
 
+@dataclass
+class LinkStats:
+    node1_id: int
+    node2_id: int
+    iface1_id: int
+    iface2_id: int
+    network_id: int
+    bytes_per_second: float
+    packets_per_second: float
+    drops: int
+    overlimits: int
+    requeues: int
+    backlog: int
+    qlen: int
+
+    @classmethod
+    def from_proto(cls, proto: core_pb2.LinkStats) -> "LinkStats":
+        return LinkStats(
+            node1_id=proto.node1_id,
+            node2_id=proto.node2_id,
+            iface1_id=proto.iface1_id,
+            iface2_id=proto.iface2_id,
+            network_id=proto.network_id,
+            bytes_per_second=proto.bytes_per_second,
+            packets_per_second=proto.packets_per_second,
+            drops=proto.drops,
+            overlimits=proto.overlimits,
+            requeues=proto.requeues,
+            backlog=proto.backlog,
+            qlen=proto.qlen,
+        )
+
+
+@dataclass
+class NetworkStats:
+    network_id: int
+    bytes_per_second: float
+    packets_per_second: float
+    drops: int
+
+    @classmethod
+    def from_proto(cls, proto: core_pb2.NetworkStats) -> "NetworkStats":
+        return NetworkStats(
+            network_id=proto.network_id,
+            bytes_per_second=proto.bytes_per_second,
+            packets_per_second=proto.packets_per_second,
+            drops=proto.drops,
+        )
+
+
+@dataclass
+class LinkStatsEvent:
+    session_id: int
+    links: List[LinkStats]
+    networks: List[NetworkStats]
+
+    @classmethod
+    def from_proto(cls, proto: core_pb2.LinkStatsEvent) -> "LinkStatsEvent":
+        return LinkStatsEvent(
+            session_id=proto.session_id,
+            links=[LinkStats.from_proto(x) for x in proto.links],
+            networks=[NetworkStats.from_proto(x) for x in proto.networks],
+        )
+
+
 @dataclass
 class CpuUsageEvent:
     usage: float
@@ -987,23 +1059,107 @@ class Session:
             self.options[key] = option
 
 
+@dataclass
+class LinkChange:
+    time: float
+    node1_id: int
+    node2_id: int
+    linked: bool
+
+    @classmethod
+    def from_proto(cls, proto: mobility_pb2.LinkChange) -> "LinkChange":
+        return LinkChange(
+            time=proto.time,
+            node1_id=proto.node1_id,
+            node2_id=proto.node2_id,
+            linked=proto.linked,
+        )
+
+
+@dataclass
+class NodePoolStats:
+    size: int
+    ready: int
+    claimed: int
+    missed: int
+    failed: int
+
+    @classmethod
+    def from_proto(cls, proto: core_pb2.NodePoolStats) -> "NodePoolStats":
+        return NodePoolStats(
+            size=proto.size,
+            ready=proto.ready,
+            claimed=proto.claimed,
+            missed=proto.missed,
+            failed=proto.failed,
+        )
+
+
 @dataclass
 class CoreConfig:
     services: List[Service] = field(default_factory=list)
     config_services: List[ConfigService] = field(default_factory=list)
     emane_models: List[str] = field(default_factory=list)
+    node_pool: Optional[NodePoolStats] = None
 
     @classmethod
     def from_proto(cls, proto: core_pb2.GetConfigResponse) -> "CoreConfig":
         services = [Service.from_proto(x) for x in proto.services]
         config_services = [ConfigService.from_proto(x) for x in proto.config_services]
+        node_pool = None
+        if proto.HasField("node_pool"):
+            node_pool = NodePoolStats.from_proto(proto.node_pool)
         return CoreConfig(
             services=services,
             config_services=config_services,
             emane_models=list(proto.emane_models),
+            node_pool=node_pool,
+        )
+
+
+@dataclass
+class AddNodeResult:
+    result: bool
+    node_id: int
+    error: str
+
+    @classmethod
+    def from_proto(cls, proto: core_pb2.AddNodeResult) -> "AddNodeResult":
+        return AddNodeResult(
+            result=proto.result, node_id=proto.node_id, error=proto.error
+        )
+
+
+@dataclass
+class AddLinkResult:
+    result: bool
+    iface1: Optional[Interface]
+    iface2: Optional[Interface]
+    error: str
+
+    @classmethod
+    def from_proto(cls, proto: core_pb2.AddLinkResult) -> "AddLinkResult":
+        iface1 = None
+        if proto.HasField("iface1"):
+            iface1 = Interface.from_proto(proto.iface1)
+        iface2 = None
+        if proto.HasField("iface2"):
+            iface2 = Interface.from_proto(proto.iface2)
+        return AddLinkResult(
+            result=proto.result, iface1=iface1, iface2=iface2, error=proto.error
         )
 
 
+@dataclass
+class EditLinkResult:
+    result: bool
+    error: str
+
+    @classmethod
+    def from_proto(cls, proto: core_pb2.EditLinkResult) -> "EditLinkResult":
+        return EditLinkResult(result=proto.result, error=proto.error)
+
+
 @dataclass
 class LinkEvent:
     message_type: MessageType
@@ -1111,6 +1267,34 @@ class ConfigEvent:
         )
 
 
+@dataclass
+class EventRegion:
+    min_x: float
+    min_y: float
+    max_x: float
+    max_y: float
+    geo: bool = False
+
+    def to_proto(self) -> core_pb2.EventRegion:
+        return core_pb2.EventRegion(
+            min_x=self.min_x,
+            min_y=self.min_y,
+            max_x=self.max_x,
+            max_y=self.max_y,
+            geo=self.geo,
+        )
+
+
+@dataclass
+class EventStreamStats:
+    dropped: int
+    coalesced: int
+
+    @classmethod
+    def from_proto(cls, proto: core_pb2.EventStreamStats) -> "EventStreamStats":
+        return EventStreamStats(dropped=proto.dropped, coalesced=proto.coalesced)
+
+
 @dataclass
 class Event:
     session_id: int
@@ -1212,3 +1396,28 @@ class MoveNodesRequest:
             position=position,
             geo=geo,
         )
+
+
+@dataclass
+class SessionChanges:
+    reconciled: bool
+    added_nodes: List[int]
+    deleted_nodes: List[int]
+    replaced_nodes: List[int]
+    edited_nodes: List[int]
+    added_links: List[Link]
+    deleted_links: List[Link]
+    updated_links: List[Link]
+
+    @classmethod
+    def from_proto(cls, proto: core_pb2.SessionChanges) -> "SessionChanges":
+        return SessionChanges(
+            reconciled=proto.reconciled,
+            added_nodes=list(proto.added_nodes),
+            deleted_nodes=list(proto.deleted_nodes),
+            replaced_nodes=list(proto.replaced_nodes),
+            edited_nodes=list(proto.edited_nodes),
+            added_links=[Link.from_proto(x) for x in proto.added_links],
+            deleted_links=[Link.from_proto(x) for x in proto.deleted_links],
+            updated_links=[Link.from_proto(x) for x in proto.updated_links],
+        )
@@ -165,16 +165,20 @@ class ConfigService(abc.ABC):
         :raises ConfigServiceBootError: when there is an error starting service
         """
         logger.info("node(%s) service(%s) starting...", self.node.name, self.name)
-        self.create_shadow_dirs()
-        self.create_dirs()
-        self.create_files()
-        wait = self.validation_mode == ConfigServiceMode.BLOCKING
-        self.run_startup(wait)
+        tracer = self.node.session.tracer
+        args = dict(node_id=self.node.id, service=self.name)
+        with tracer.span("config_service_start", "service", **args):
+            self.create_shadow_dirs()
+            self.create_dirs()
+            self.create_files()
+            wait = self.validation_mode == ConfigServiceMode.BLOCKING
+            self.run_startup(wait)
         if not wait:
-            if self.validation_mode == ConfigServiceMode.TIMER:
-                self.wait_validation()
-            else:
-                self.run_validation()
+            with tracer.span("config_service_validate", "service", **args):
+                if self.validation_mode == ConfigServiceMode.TIMER:
+                    self.wait_validation()
+                else:
+                    self.run_validation()
 
     def stop(self) -> None:
         """
@@ -426,19 +426,37 @@ class EmaneManager:
         :param iface: interface to get nem emane position for
         :return: nem position tuple, None otherwise
         """
-        nem_id = self.get_nem_id(iface)
-        if nem_id is None:
-            logger.info("nem for %s is unknown", iface.localname)
-            return
-        node = iface.node
-        x, y, z = node.getposition()
-        lat, lon, alt = self.session.location.getgeo(x, y, z)
-        if node.position.alt is not None:
-            alt = node.position.alt
-        node.position.set_geo(lon, lat, alt)
-        # altitude must be an integer or warning is printed
-        alt = int(round(alt))
-        return nem_id, lon, lat, alt
+        positions = self.get_nem_positions([iface])
+        return positions[0] if positions else None
+
+    def get_nem_positions(
+        self, ifaces: List[CoreInterface]
+    ) -> List[Tuple[int, float, float, int]]:
+        """
+        Retrieves nem positions for the given interfaces, converting all positions
+        to geo in a single batch.
+
+        :param ifaces: interfaces to get nem emane positions for
+        :return: nem position tuples for interfaces with a known nem
+        """
+        nems = []
+        for iface in ifaces:
+            nem_id = self.get_nem_id(iface)
+            if nem_id is None:
+                logger.info("nem for %s is unknown", iface.localname)
+                continue
+            nems.append((nem_id, iface.node))
+        geos = self.session.location.getgeo_many(
+            [node.getposition() for _, node in nems]
+        )
+        positions = []
+        for (nem_id, node), (lat, lon, alt) in zip(nems, geos):
+            if node.position.alt is not None:
+                alt = node.position.alt
+            node.position.set_geo(lon, lat, alt)
+            # altitude must be an integer or warning is printed
+            positions.append((nem_id, lon, lat, int(round(alt))))
+        return positions
 
     def set_nem_position(self, iface: CoreInterface) -> None:
         """
@@ -462,11 +480,7 @@ class EmaneManager:
         if not moved_ifaces:
             return
         services = {}
-        for iface in moved_ifaces:
-            position = self.get_nem_position(iface)
-            if not position:
-                continue
-            nem_id, lon, lat, alt = position
+        for nem_id, lon, lat, alt in self.get_nem_positions(moved_ifaces):
             service = self.nem_service.get(nem_id)
             if not service:
                 continue
@@ -0,0 +1,254 @@
+"""
+Batching of ip and tc commands, flushed through a single ip/tc -batch invocation
+per execution target.
+"""
+
+import itertools
+import logging
+import re
+import threading
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+)
+
+from core import utils
+from core.errors import CoreCommandError
+from core.executables import IP, TC
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from core.emulator.distributed import DistributedServer
+
+BATCH_TOOLS: Tuple[str, ...] = (IP, TC)
+READ_ACTIONS: Tuple[str, ...] = ("show", "list", "lst", "get", "monitor", "help")
+FAILED_REGEX: Pattern = re.compile(r"^Command failed -:(\d+)", re.MULTILINE)
+
+
+@dataclass
+class BatchCommand:
+    seq: int
+    target: Hashable
+    tool: str
+    args: str
+    run: Callable[[str, str], str]
+    owner: Optional[Hashable] = None
+
+    @property
+    def key(self) -> Tuple[Hashable, str]:
+        return self.target, self.tool
+
+
+def parse_errors(commands: List[BatchCommand], output: str) -> Dict[int, str]:
+    """
+    Parse batch output for failed commands.
+
+    :param commands: commands that were part of the batch, in batch order
+    :param output: combined output from the batch command
+    :return: mapping of failed command index to the error reported for it
+    """
+    errors = {}
+    start = 0
+    for match in FAILED_REGEX.finditer(output):
+        index = int(match.group(1)) - 1
+        message = output[start : match.start()].strip()
+        if 0 <= index < len(commands):
+            errors[index] = message
+        start = match.end()
+    return errors
+
+
+class CommandBatch:
+    """
+    Collects ip and tc commands per execution target, to later run them as a
+    single batch for each target.
+
+    Commands keep their issue order for a given target and for a given thread,
+    commands from different threads on different targets are expected to be
+    independent of each other. Commands may be tagged with an owner, so that
+    failures are reported for the owner that issued them.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create a CommandBatch instance.
+        """
+        self.lock: threading.RLock = threading.RLock()
+        self.counter: itertools.count = itertools.count()
+        self.queues: Dict[int, Deque[BatchCommand]] = {}
+        self.errors: List[Tuple[int, Optional[Hashable], CoreCommandError]] = []
+        self.failed: Dict[Hashable, CoreCommandError] = {}
+        self.local: threading.local = threading.local()
+
+    @classmethod
+    def batch_tool(cls, args: str) -> Optional[str]:
+        """
+        Check if a command can be batched.
+
+        :param args: command to check
+        :return: batch tool for the command, None when not batchable
+        """
+        fields = args.split()
+        if len(fields) < 3 or fields[0] not in BATCH_TOOLS:
+            return None
+        if fields[1].startswith("-") or any(x in READ_ACTIONS for x in fields[1:]):
+            return None
+        return fields[0]
+
+    @contextmanager
+    def owner(self, owner: Hashable) -> Iterator[None]:
+        """
+        Context tagging commands submitted by the current thread with an owner.
+        Flushing within this context only raises errors for commands of this
+        owner, errors are recorded within failed for each owner.
+
+        :param owner: owner of submitted commands
+        :return: nothing
+        """
+        previous = getattr(self.local, "owner", None)
+        self.local.owner = owner
+        try:
+            yield
+        finally:
+            self.local.owner = previous
+
+    def submit(
+        self,
+        target: Hashable,
+        args: str,
+        run: Callable[[str, str], str],
+        env: Dict[str, str] = None,
+        cwd: Path = None,
+        wait: bool = True,
+        shell: bool = False,
+    ) -> bool:
+        """
+        Add a command to run later within the batch for its target, when it can be
+        batched. Otherwise pending commands are flushed, so the command can be
+        run directly after them.
+
+        :param target: target the command runs on
+        :param args: command to run
+        :param run: function used to run the batch command on the target, given
+            the command and its standard input
+        :param env: environment the command would run with
+        :param cwd: directory the command would run in
+        :param wait: True if the command would wait for status, False otherwise
+        :param shell: True if the command would use a shell, False otherwise
+        :return: True if the command was batched, False otherwise
+        :raises CoreCommandError: when flushing and a batched command failed
+        """
+        tool = None
+        if wait and not shell and env is None and cwd is None:
+            tool = self.batch_tool(args)
+        if tool is None:
+            self.flush()
+            return False
+        thread_id = threading.get_ident()
+        with self.lock:
+            owner = getattr(self.local, "owner", None)
+            command = BatchCommand(next(self.counter), target, tool, args, run, owner)
+            self.queues.setdefault(thread_id, deque()).append(command)
+        return True
+
+    def _next_round(self) -> Dict[Tuple[Hashable, str], List[BatchCommand]]:
+        runs = {}
+        barriers = {}
+        for thread_id, queue in self.queues.items():
+            key = queue[0].key
+            run = list(itertools.takewhile(lambda x: x.key == key, queue))
+            runs[thread_id] = run
+            for command in itertools.islice(queue, len(run), None):
+                barrier = barriers.get(command.key, command.seq)
+                barriers[command.key] = min(barrier, command.seq)
+        groups = {}
+        for thread_id, run in runs.items():
+            queue = self.queues[thread_id]
+            for command in run:
+                barrier = barriers.get(command.key)
+                if barrier is not None and command.seq > barrier:
+                    break
+                groups.setdefault(command.key, []).append(queue.popleft())
+            if not queue:
+                self.queues.pop(thread_id)
+        for commands in groups.values():
+            commands.sort(key=lambda x: x.seq)
+        return groups
+
+    def _run_group(self, commands: List[BatchCommand]) -> None:
+        tool = commands[0].tool
+        lines = [x.args.split(None, 1)[1] for x in commands]
+        data = "\n".join(lines) + "\n"
+        logger.debug("running %s batch of %s commands", tool, len(commands))
+        try:
+            commands[0].run(f"{tool} -force -batch -", data)
+        except CoreCommandError as e:
+            output = "\n".join(x for x in (e.output, e.stderr) if x)
+            errors = parse_errors(commands, output)
+            if not errors:
+                errors[0] = output
+            for index, message in errors.items():
+                command = commands[index]
+                error = CoreCommandError(e.returncode, command.args, "", message)
+                self.errors.append((command.seq, command.owner, error))
+
+    def flush(self) -> None:
+        """
+        Run all pending commands, a batch per target at a time. When flushing
+        within an owner context, errors of other owners are kept to be raised by
+        a later flush.
+
+        :return: nothing
+        :raises CoreCommandError: for the first batched command that failed
+        """
+        owner = getattr(self.local, "owner", None)
+        with self.lock:
+            while self.queues:
+                groups = self._next_round()
+                funcs = [(self._run_group, (x,), {}) for x in groups.values()]
+                if len(funcs) == 1:
+                    self._run_group(*funcs[0][1])
+                else:
+                    utils.threadpool(funcs)
+            errors = []
+            pending = []
+            for error in self.errors:
+                if owner is None or error[1] == owner:
+                    errors.append(error)
+                else:
+                    pending.append(error)
+            self.errors = pending
+            for _, error_owner, error in errors:
+                if error_owner is not None:
+                    self.failed.setdefault(error_owner, error)
+        if errors:
+            errors.sort(key=lambda x: x[0])
+            for _, _, error in errors[1:]:
+                logger.error("batch command error: %s", error)
+            raise errors[0][2]
+
+
+def host_runner(server: Optional["DistributedServer"]) -> Callable[[str, str], str]:
+    """
+    Retrieve a function to run batch commands on the host or a distributed server.
+
+    :param server: server to run on, None for the host
+    :return: function for running batch commands
+    """
+    if server is None:
+        return lambda args, data: utils.cmd(args, stdin=data)
+    else:
+        return lambda args, data: server.remote_cmd(args, stdin=data)
@@ -0,0 +1,112 @@
+"""
+Coalescing of node updates, delivering only the latest update for each node at
+a fixed rate.
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, List, Optional
+
+from core.emulator.data import NodeData
+
+logger = logging.getLogger(__name__)
+
+
+class NodeUpdateCoalescer:
+    """
+    Keeps the latest update for each node, delivering pending updates as a single
+    batch every interval while running. Delivered batches keep their order
+    relative to each other, allowing other node data to be delivered directly
+    after flushing pending updates.
+    """
+
+    def __init__(self, deliver: Callable[[List[NodeData]], None]) -> None:
+        """
+        Create a NodeUpdateCoalescer instance.
+
+        :param deliver: function to deliver a batch of node data with
+        """
+        self.deliver: Callable[[List[NodeData]], None] = deliver
+        self.lock: threading.Lock = threading.Lock()
+        self.deliver_lock: threading.RLock = threading.RLock()
+        self.pending: Dict[int, NodeData] = {}
+        self.interval: float = 0.0
+        self.stopping: threading.Event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self.thread is not None
+
+    def start(self, interval: float) -> None:
+        """
+        Start delivering coalesced updates every interval.
+
+        :param interval: seconds between deliveries
+        :return: nothing
+        """
+        if self.running:
+            return
+        logger.info("coalescing node updates every %s seconds", interval)
+        self.interval = interval
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop delivering coalesced updates, delivering any that are pending.
+
+        :return: nothing
+        """
+        if not self.running:
+            return
+        self.stopping.set()
+        if self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+        self.flush()
+
+    def run(self) -> None:
+        """
+        Deliver pending updates every interval until stopped.
+
+        :return: nothing
+        """
+        while not self.stopping.wait(self.interval):
+            self.flush()
+
+    def update(self, node_data: List[NodeData]) -> None:
+        """
+        Replace pending updates for nodes with the provided updates.
+
+        :param node_data: node updates to coalesce
+        :return: nothing
+        """
+        with self.lock:
+            for data in node_data:
+                self.pending[data.node.id] = data
+
+    def flush(self) -> None:
+        """
+        Deliver all pending updates.
+
+        :return: nothing
+        """
+        with self.deliver_lock:
+            with self.lock:
+                node_data = list(self.pending.values())
+                self.pending.clear()
+            if node_data:
+                self.deliver(node_data)
+
+    def send(self, node_data: List[NodeData]) -> None:
+        """
+        Deliver node data directly, after delivering all pending updates.
+
+        :param node_data: node data to deliver
+        :return: nothing
+        """
+        with self.deliver_lock:
+            self.flush()
+            self.deliver(node_data)
@@ -4,7 +4,7 @@ import os
 import signal
 import sys
 from pathlib import Path
-from typing import Dict, List, Type
+from typing import Dict, List, Optional, Type
 
 from core import utils
 from core.configservice.manager import ConfigServiceManager
@@ -133,6 +133,27 @@ class CoreEmu:
             custom_path = Path(custom_path)
             EmaneModelManager.load(custom_path, emane_prefix)
 
+    def node_pool_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Retrieve warm pool statistics combined across the pools of running
+        sessions, when a pool size is configured.
+
+        :return: pool size, ready namespaces and claimed, missed and failed
+            counts, None when no pool size is configured
+        """
+        size = int(self.config.get("nodepool") or 0)
+        if size <= 0:
+            return None
+        stats = dict(size=size, ready=0, claimed=0, missed=0, failed=0)
+        for session in list(self.sessions.values()):
+            node_pool = session.node_pool
+            if node_pool is None:
+                continue
+            for key, value in node_pool.stats().items():
+                if key != "size":
+                    stats[key] += value
+        return stats
+
     def shutdown(self) -> None:
         """
         Shutdown all CORE session.
@@ -2,6 +2,7 @@
 Defines distributed server functionality.
 """
 
+import io
 import logging
 import os
 import threading
@@ -47,7 +48,12 @@ class DistributedServer:
         self.lock: threading.Lock = threading.Lock()
 
     def remote_cmd(
-        self, cmd: str, env: Dict[str, str] = None, cwd: str = None, wait: bool = True
+        self,
+        cmd: str,
+        env: Dict[str, str] = None,
+        cwd: str = None,
+        wait: bool = True,
+        stdin: str = None,
     ) -> str:
         """
         Run command remotely using server connection.
@@ -57,6 +63,7 @@ class DistributedServer:
         :param cwd: directory to run command in, defaults to None, which is the
             user's home directory
         :param wait: True to wait for status, False to background process
+        :param stdin: data to write to the command standard input, default is None
         :return: stdout when success
         :raises CoreCommandError: when a non-zero exit status occurs
         """
@@ -67,16 +74,15 @@ class DistributedServer:
         logger.debug(
             "remote cmd server(%s) cwd(%s) wait(%s): %s", self.host, cwd, wait, cmd
         )
+        kwargs = dict(hide=CMD_HIDE, env=env, replace_env=replace_env)
+        if stdin is not None:
+            kwargs["in_stream"] = io.StringIO(stdin)
         try:
             if cwd is None:
-                result = self.conn.run(
-                    cmd, hide=CMD_HIDE, env=env, replace_env=replace_env
-                )
+                result = self.conn.run(cmd, **kwargs)
             else:
                 with self.conn.cd(cwd):
-                    result = self.conn.run(
-                        cmd, hide=CMD_HIDE, env=env, replace_env=replace_env
-                    )
+                    result = self.conn.run(cmd, **kwargs)
             return result.stdout.strip()
         except UnexpectedExit as e:
             stdout, stderr = e.streams_for_display()
@@ -13,13 +13,30 @@ import sys
 import tempfile
 import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from core import constants, utils
 from core.configservice.manager import ConfigServiceManager
 from core.emane.emanemanager import EmaneManager, EmaneState
 from core.emane.nodes import EmaneNet
+from core.emulator import teardown
+from core.emulator.batch import CommandBatch
+from core.emulator.coalescer import NodeUpdateCoalescer
 from core.emulator.data import (
     ConfigData,
     EventData,
@@ -40,6 +57,8 @@ from core.emulator.enumerations import (
     NodeTypes,
 )
 from core.emulator.sessionconfig import SessionConfig
+from core.emulator.taskgraph import TaskGraph
+from core.emulator.tracing import TRACE_FILE, Tracer
 from core.errors import CoreError
 from core.location.event import EventLoop
 from core.location.geo import GeoLocation
@@ -58,6 +77,7 @@ from core.nodes.network import (
     WlanNode,
 )
 from core.nodes.physical import PhysicalNode, Rj45Node
+from core.nodes.warmpool import WarmPool
 from core.plugins.sdt import Sdt
 from core.services.coreservices import CoreServices
 from core.xml import corexml, corexmldeployment
@@ -116,10 +136,15 @@ class Session:
         self.user: Optional[str] = None
         self.event_loop: EventLoop = EventLoop()
         self.link_colors: Dict[int, str] = {}
+        self.tracer: Tracer = Tracer(self.use_trace)
 
         # dict of nodes: all nodes and nets
         self.nodes: Dict[int, NodeBase] = {}
         self.nodes_lock = threading.Lock()
+        # host interface names mapped to their node and interface id, None for
+        # the node's own device, e.g. a bridge
+        self.host_ifaces: Dict[str, Tuple[int, Optional[int]]] = {}
+        self.host_ifaces_lock: threading.Lock = threading.Lock()
 
         # states and hooks handlers
         self.state: EventTypes = EventTypes.DEFINITION_STATE
@@ -134,6 +159,10 @@ class Session:
         self.event_handlers: List[Callable[[EventData], None]] = []
         self.exception_handlers: List[Callable[[ExceptionData], None]] = []
         self.node_handlers: List[Callable[[NodeData], None]] = []
+        self.node_batch_handlers: List[Callable[[List[NodeData]], None]] = []
+        self.node_coalescer: NodeUpdateCoalescer = NodeUpdateCoalescer(
+            self.deliver_node_data
+        )
         self.link_handlers: List[Callable[[LinkData], None]] = []
         self.file_handlers: List[Callable[[FileData], None]] = []
         self.config_handlers: List[Callable[[ConfigData], None]] = []
@@ -160,6 +189,12 @@ class Session:
         # config services
         self.service_manager: Optional[ConfigServiceManager] = None
 
+        # warm pool of idle namespaces for runtime nodes
+        self.node_pool: Optional[WarmPool] = None
+
+        # batching of host and node network commands
+        self.command_batch: Optional[CommandBatch] = None
+
     @classmethod
     def get_node_class(cls, _type: NodeTypes) -> Type[NodeBase]:
         """
@@ -224,6 +259,34 @@ class Session:
     def use_ovs(self) -> bool:
         return self.options.get_config("ovs") == "1"
 
+    def use_netlink(self) -> bool:
+        return self.options.get_config("netlink") == "1"
+
+    def use_trace(self) -> bool:
+        return self.options.get_config("trace") == "1"
+
+    @contextmanager
+    def batch(self) -> Iterator[CommandBatch]:
+        """
+        Context for batching ip and tc commands issued for nodes, interfaces and
+        networks, which are flushed as a single batch per host, node namespace
+        and distributed server, when leaving the context or when another
+        command needs to run.
+
+        :return: command batch in use
+        :raises CoreCommandError: when a batched command failed
+        """
+        if self.command_batch is not None:
+            yield self.command_batch
+            return
+        self.command_batch = CommandBatch()
+        try:
+            yield self.command_batch
+        finally:
+            command_batch, self.command_batch = self.command_batch, None
+            with self.tracer.span("batch_flush", "session"):
+                command_batch.flush()
+
     def add_link(
         self,
         node1_id: int,
@@ -247,6 +310,21 @@ class Session:
         :param link_type: type of link to add
         :return: tuple of created core interfaces, depending on link
         """
+        args = (node1_id, node2_id, iface1_data, iface2_data, options, link_type)
+        with self.tracer.span(
+            "add_link", "session", node1_id=node1_id, node2_id=node2_id
+        ):
+            return self._add_link(*args)
+
+    def _add_link(
+        self,
+        node1_id: int,
+        node2_id: int,
+        iface1_data: Optional[InterfaceData],
+        iface2_data: Optional[InterfaceData],
+        options: Optional[LinkOptions],
+        link_type: LinkTypes,
+    ) -> Tuple[CoreInterface, CoreInterface]:
         if not options:
             options = LinkOptions()
         node1 = self.get_node(node1_id, NodeBase)
@@ -513,16 +591,21 @@ class Session:
         :return: created node
         :raises core.CoreError: when an invalid node type is given
         """
+        # determine node id
+        if not _id:
+            _id = self.next_node_id()
+        with self.tracer.span("add_node", "session", node_id=_id):
+            return self._add_node(_class, _id, options)
+
+    def _add_node(
+        self, _class: Type[NT], _id: int, options: Optional[NodeOptions]
+    ) -> NT:
         # set node start based on current session state, override and check when rj45
         start = self.state.should_start()
         enable_rj45 = self.options.get_config("enablerj45") == "1"
         if _class == Rj45Node and not enable_rj45:
             start = False
 
-        # determine node id
-        if not _id:
-            _id = self.next_node_id()
-
         # generate name if not provided
         if not options:
             options = NodeOptions()
@@ -618,6 +701,28 @@ class Session:
         node.position.set_geo(lon, lat, alt)
         self.sdt.edit_node(node, lon, lat, alt)
 
+    def set_node_geos(self, geos: List[Tuple[NodeBase, float, float, float]]) -> None:
+        """
+        Set the geo positions of several nodes, converting all geo positions in
+        a single batch. No node is moved when any geo position is invalid.
+
+        :param geos: nodes with the lon,lat,alt to move them to
+        :return: nothing
+        :raises CoreError: when a geo position is invalid
+        """
+        positions = self.location.getxyz_many(
+            [(lat, lon, alt) for _, lon, lat, alt in geos]
+        )
+        for (_, lon, lat, alt), (x, y, _) in zip(geos, positions):
+            if math.isinf(x) or math.isinf(y):
+                raise CoreError(
+                    f"invalid geo for current reference/scale: {lon},{lat},{alt}"
+                )
+        for (node, lon, lat, alt), (x, y, _) in zip(geos, positions):
+            node.setposition(x, y, None)
+            node.position.set_geo(lon, lat, alt)
+            self.sdt.edit_node(node, lon, lat, alt)
+
     def start_mobility(self, node_ids: List[int] = None) -> None:
         """
         Start mobility for the provided node ids.
@@ -722,6 +827,7 @@ class Session:
         :return: nothing
         """
         self.emane.shutdown()
+        self.stop_node_pool()
         self.delete_nodes()
         self.distributed.shutdown()
         self.hooks.clear()
@@ -731,6 +837,7 @@ class Session:
         self.services.reset()
         self.mobility.config_reset()
         self.link_colors.clear()
+        self.tracer.clear()
 
     def start_events(self) -> None:
         """
@@ -771,6 +878,7 @@ class Session:
         else:
             logger.info("session(%s) state(%s) shutting down", self.id, self.state)
             self.set_state(EventTypes.SHUTDOWN_STATE, send_event=True)
+            self.node_coalescer.stop()
             # clear out current core session
             self.clear()
             # shutdown sdt
@@ -817,8 +925,58 @@ class Session:
         if not node.apitype:
             return
         node_data = NodeData(node=node, message_type=message_type, source=source)
-        for handler in self.node_handlers:
+        self.send_node_data([node_data])
+
+    def broadcast_nodes(
+        self,
+        nodes: Iterable[NodeBase],
+        message_type: MessageFlags = MessageFlags.NONE,
+        source: str = None,
+    ) -> None:
+        """
+        Handle node data for a group of nodes that should be provided to node
+        handlers, creating all node data before providing it at once.
+
+        :param nodes: nodes to broadcast
+        :param message_type: type of message to broadcast, None by default
+        :param source: source of broadcast, None by default
+        :return: nothing
+        """
+        node_data = [
+            NodeData(node=x, message_type=message_type, source=source)
+            for x in nodes
+            if x.apitype
+        ]
+        if not node_data:
+            return
+        self.send_node_data(node_data)
+
+    def send_node_data(self, node_data: List[NodeData]) -> None:
+        """
+        Send node data to node handlers, coalescing updates when enabled.
+
+        :param node_data: node data to send
+        :return: nothing
+        """
+        if not self.node_coalescer.running:
+            self.deliver_node_data(node_data)
+        elif all(x.message_type == MessageFlags.NONE for x in node_data):
+            self.node_coalescer.update(node_data)
+        else:
+            self.node_coalescer.send(node_data)
+
+    def deliver_node_data(self, node_data: List[NodeData]) -> None:
+        """
+        Deliver node data to node handlers, as a single batch to batch handlers.
+
+        :param node_data: node data to deliver
+        :return: nothing
+        """
+        for handler in self.node_batch_handlers:
             handler(node_data)
+        for handler in self.node_handlers:
+            for data in node_data:
+                handler(data)
 
     def broadcast_file(self, file_data: FileData) -> None:
         """
@@ -1078,7 +1236,8 @@ class Session:
                 raise CoreError(f"duplicate node id {node.id} for {node.name}")
             self.nodes[node.id] = node
         if start:
-            node.startup()
+            with self.tracer.span("node_startup", "node", node_id=node.id):
+                node.startup()
         return node
 
     def get_node(self, _id: int, _class: Type[NT]) -> NT:
@@ -1115,21 +1274,68 @@ class Session:
                 logger.info("deleted node(%s)", node.name)
         if node:
             node.shutdown()
+            self.remove_host_ifaces([_id])
             self.sdt.delete_node(_id)
         return node is not None
 
+    def add_host_iface(self, name: str, node_id: int, iface_id: int = None) -> None:
+        """
+        Track a host interface belonging to a node.
+
+        :param name: host interface name
+        :param node_id: id of node the interface belongs to
+        :param iface_id: node interface id, None for the node's own device
+        :return: nothing
+        """
+        with self.host_ifaces_lock:
+            self.host_ifaces[name] = (node_id, iface_id)
+
+    def remove_host_iface(self, name: str) -> None:
+        """
+        Stop tracking a host interface.
+
+        :param name: host interface name
+        :return: nothing
+        """
+        with self.host_ifaces_lock:
+            self.host_ifaces.pop(name, None)
+
+    def remove_host_ifaces(self, node_ids: Iterable[int]) -> None:
+        """
+        Stop tracking all host interfaces belonging to the provided nodes.
+
+        :param node_ids: ids of nodes to stop tracking interfaces for
+        :return: nothing
+        """
+        node_ids = set(node_ids)
+        with self.host_ifaces_lock:
+            for name, (node_id, _) in list(self.host_ifaces.items()):
+                if node_id in node_ids:
+                    del self.host_ifaces[name]
+
+    def get_host_ifaces(self) -> Dict[str, Tuple[int, Optional[int]]]:
+        """
+        Retrieve a copy of the tracked host interfaces.
+
+        :return: host interface names mapped to their node and interface id
+        """
+        with self.host_ifaces_lock:
+            return self.host_ifaces.copy()
+
     def delete_nodes(self) -> None:
         """
-        Clear the nodes dictionary, and call shutdown for each node.
+        Clear the nodes dictionary, and shutdown all nodes, removing local nodes
+        and bridges in bulk.
         """
         nodes_ids = []
         with self.nodes_lock:
-            funcs = []
+            nodes = []
             while self.nodes:
                 _, node = self.nodes.popitem()
                 nodes_ids.append(node.id)
-                funcs.append((node.shutdown, [], {}))
-            utils.threadpool(funcs)
+                nodes.append(node)
+            teardown.shutdown_nodes(self, nodes)
+        self.remove_host_ifaces(nodes_ids)
         for node_id in nodes_ids:
             self.sdt.delete_node(node_id)
 
@@ -1185,24 +1391,73 @@ class Session:
         # create control net interfaces and network tunnels
         # which need to exist for emane to sync on location events
         # in distributed scenarios
-        self.add_remove_control_net(0, remove=False)
+        with self.tracer.span("control_net", "session"):
+            self.add_remove_control_net(0, remove=False)
         # initialize distributed tunnels
-        self.distributed.start()
+        with self.tracer.span("distributed", "session"):
+            self.distributed.start()
         # instantiate will be invoked again upon emane configure
-        if self.emane.startup() == EmaneState.NOT_READY:
+        with self.tracer.span("emane_startup", "session"):
+            emane_state = self.emane.startup()
+        if emane_state == EmaneState.NOT_READY:
             return []
         # boot node services and then start mobility
-        exceptions = self.boot_nodes()
+        with self.tracer.span("boot_nodes", "session"):
+            exceptions = self.boot_nodes()
+        self.write_trace()
         if not exceptions:
+            node_update_ms = self.options.get_config_int("node_update_ms", default=0)
+            if node_update_ms > 0:
+                self.node_coalescer.start(node_update_ms / 1000.0)
             self.mobility.startup()
             # notify listeners that instantiation is complete
             event = EventData(event_type=EventTypes.INSTANTIATION_COMPLETE)
             self.broadcast_event(event)
             # startup event loop
             self.event_loop.run()
+        self.start_node_pool()
         self.set_state(EventTypes.RUNTIME_STATE, send_event=True)
         return exceptions
 
+    def start_node_pool(self) -> None:
+        """
+        Start a warm pool of idle namespaces for nodes added during runtime, when
+        a pool size is configured. Namespaces are created with the session
+        environment.
+
+        :return: nothing
+        """
+        size = self.options.get_config_int("nodepool", default=0)
+        if size <= 0 or self.node_pool is not None:
+            return
+        env = self.get_environment(state=False)
+        self.node_pool = WarmPool(size, self.directory / "pool", env)
+        self.node_pool.start()
+
+    def stop_node_pool(self) -> None:
+        """
+        Stop the session warm pool, removing its idle namespaces.
+
+        :return: nothing
+        """
+        if self.node_pool is not None:
+            self.node_pool.shutdown()
+            self.node_pool = None
+
+    def write_trace(self) -> None:
+        """
+        Write the startup trace to the session directory, when tracing.
+
+        :return: nothing
+        """
+        if not self.use_trace():
+            return
+        path = self.directory / TRACE_FILE
+        try:
+            self.tracer.export(path, self.id, f"session {self.id}")
+        except IOError:
+            logger.exception("error writing trace file")
+
     def get_node_count(self) -> int:
         """
         Returns the number of CoreNodes and CoreNets, except for those
@@ -1239,6 +1494,8 @@ class Session:
 
         # stop event loop
         self.event_loop.stop()
+        self.node_coalescer.stop()
+        self.stop_node_pool()
 
         # stop mobility and node services
         with self.nodes_lock:
@@ -1278,8 +1535,9 @@ class Session:
         :return: nothing
         """
         logger.info("booting node(%s): %s", node.name, [x.name for x in node.services])
-        self.services.boot_services(node)
-        node.start_config_services()
+        with self.tracer.span("boot_node", "node", node_id=node.id):
+            self.services.boot_services(node)
+            node.start_config_services()
 
     def boot_nodes(self) -> List[Exception]:
         """
@@ -1287,18 +1545,26 @@ class Session:
         messages to the GUI for node messages that had the status
         request flag.
 
-        :return: service boot exceptions
+        Each node boots as soon as its own control interface was added, without
+        waiting on other nodes.
+
+        :return: service boot exceptions, ordered by node id
         """
         with self.nodes_lock:
-            funcs = []
-            start = time.monotonic()
-            for node in self.nodes.values():
-                if isinstance(node, (CoreNode, PhysicalNode)):
-                    self.add_remove_control_iface(node, remove=False)
-                    funcs.append((self.boot_node, (node,), {}))
-            results, exceptions = utils.threadpool(funcs)
-            total = time.monotonic() - start
-            logger.debug("boot run time: %s", total)
+            nodes = [
+                x
+                for x in self.nodes.values()
+                if isinstance(x, (CoreNode, PhysicalNode))
+            ]
+        graph = TaskGraph()
+        for node in sorted(nodes, key=lambda x: x.id):
+            iface_key = ("control_iface", node.id)
+            graph.add(iface_key, self.add_remove_control_iface, node)
+            graph.add(("boot", node.id), self.boot_node, node, deps=[iface_key])
+        start = time.monotonic()
+        exceptions = graph.run()
+        total = time.monotonic() - start
+        logger.debug("boot run time: %s", total)
         if not exceptions:
             self.update_control_iface_hosts()
         return exceptions
@@ -1466,6 +1732,12 @@ class Session:
             return
         if not node:
             return
+        with self.tracer.span("control_iface", "node", node_id=node.id):
+            self._add_control_iface(node, control_net, net_index)
+
+    def _add_control_iface(
+        self, node: Union[CoreNode, PhysicalNode], control_net: CtrlNet, net_index: int
+    ) -> None:
         # ctrl# already exists
         if node.ifaces.get(control_net.CTRLIF_IDX_BASE + net_index):
             return
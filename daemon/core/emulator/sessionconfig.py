@@ -2,6 +2,7 @@ from typing import Any, List
 
 from core.config import (
     ConfigBool,
+    ConfigFloat,
     ConfigInt,
     ConfigString,
     ConfigurableManager,
@@ -30,6 +31,10 @@ class SessionConfig(ConfigurableManager, ConfigurableOptions):
         ConfigBool(id="enablesdt", default="0", label="Enable SDT3D output"),
         ConfigString(id="sdturl", default=Sdt.DEFAULT_SDT_URL, label="SDT3D URL"),
         ConfigBool(id="ovs", default="0", label="Enable OVS"),
+        ConfigBool(id="netlink", default="0", label="Enable In-Process Netlink"),
+        ConfigBool(
+            id="nftables_vmap", default="0", label="WLAN Filtering Using Verdict Maps"
+        ),
         ConfigInt(id="platform_id_start", default="1", label="EMANE Platform ID Start"),
         ConfigInt(id="nem_id_start", default="1", label="EMANE NEM ID Start"),
         ConfigBool(id="link_enabled", default="1", label="EMANE Links?"),
@@ -41,6 +46,15 @@ class SessionConfig(ConfigurableManager, ConfigurableOptions):
         ),
         ConfigInt(id="link_timeout", default="4", label="EMANE Link Timeout (sec)"),
         ConfigInt(id="mtu", default="0", label="MTU for All Devices"),
+        ConfigString(
+            id="mobility_clock",
+            default="realtime",
+            options=["realtime", "scaled", "step"],
+            label="Mobility Clock",
+        ),
+        ConfigFloat(id="mobility_scale", default="1.0", label="Mobility Clock Scale"),
+        ConfigInt(id="node_update_ms", default="0", label="Node Update Interval (ms)"),
+        ConfigBool(id="trace", default="0", label="Trace Session Startup"),
     ]
     config_type: RegisterTlvs = RegisterTlvs.UTILITY
 
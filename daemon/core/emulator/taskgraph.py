@@ -0,0 +1,150 @@
+"""
+Running of dependent tasks within a bounded thread pool, starting each task as
+soon as the tasks it depends on have completed.
+"""
+
+import concurrent.futures
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Set, Tuple
+
+from core.errors import CoreError
+
+logger = logging.getLogger(__name__)
+
+
+class Task:
+    """
+    Function to run once all the tasks it depends on completed successfully.
+    """
+
+    def __init__(
+        self, key: Hashable, func: Callable, args: Tuple, deps: Iterable[Hashable]
+    ) -> None:
+        """
+        Create a Task instance.
+
+        :param key: unique key of the task
+        :param func: function to run
+        :param args: arguments to run function with
+        :param deps: keys of tasks to complete before running
+        """
+        self.key: Hashable = key
+        self.func: Callable = func
+        self.args: Tuple = args
+        self.deps: Set[Hashable] = set(deps)
+
+
+class TaskGraph:
+    """
+    Graph of dependent tasks, run within a single bounded thread pool. Tasks
+    depending on a failed task are skipped, while all other tasks keep running.
+    """
+
+    def __init__(self, workers: int = 10) -> None:
+        """
+        Create a TaskGraph instance.
+
+        :param workers: number of workers for the thread pool
+        """
+        self.workers: int = workers
+        self.tasks: Dict[Hashable, Task] = {}
+        self.results: Dict[Hashable, Any] = {}
+        self.errors: Dict[Hashable, Exception] = {}
+        self.skipped: Set[Hashable] = set()
+
+    def add(
+        self, key: Hashable, func: Callable, *args: Any, deps: Iterable[Hashable] = ()
+    ) -> None:
+        """
+        Add a task to the graph.
+
+        :param key: unique key of the task
+        :param func: function to run
+        :param args: arguments to run function with
+        :param deps: keys of tasks to complete before running
+        :return: nothing
+        :raises CoreError: when a task already exists for key
+        """
+        if key in self.tasks:
+            raise CoreError(f"task already exists: {key}")
+        self.tasks[key] = Task(key, func, args, deps)
+
+    def check(self) -> None:
+        """
+        Check that all dependencies are known tasks and do not form a cycle.
+
+        :return: nothing
+        :raises CoreError: when a dependency is unknown or within a cycle
+        """
+        waiting = {}
+        dependents = defaultdict(list)
+        for task in self.tasks.values():
+            for dep in task.deps:
+                if dep not in self.tasks:
+                    raise CoreError(f"task({task.key}) unknown dependency: {dep}")
+                dependents[dep].append(task.key)
+            waiting[task.key] = len(task.deps)
+        ready = [x for x, count in waiting.items() if not count]
+        while ready:
+            key = ready.pop()
+            for dependent in dependents[key]:
+                waiting[dependent] -= 1
+                if not waiting[dependent]:
+                    ready.append(dependent)
+        cycle = [x for x, count in waiting.items() if count]
+        if cycle:
+            raise CoreError(f"task dependency cycle: {cycle}")
+
+    def _skip(self, key: Hashable, dependents: Dict[Hashable, List[Hashable]]) -> None:
+        pending = list(dependents[key])
+        while pending:
+            dependent = pending.pop()
+            if dependent in self.skipped:
+                continue
+            logger.error("skipping task(%s), dependency failed: %s", dependent, key)
+            self.skipped.add(dependent)
+            pending.extend(dependents[dependent])
+
+    def run(self) -> List[Exception]:
+        """
+        Run all tasks, each as soon as the tasks it depends on completed.
+
+        :return: exceptions of failed tasks, in the order tasks were added
+        :raises CoreError: when a dependency is unknown or within a cycle
+        """
+        self.check()
+        waiting = {}
+        dependents = defaultdict(list)
+        for task in self.tasks.values():
+            waiting[task.key] = set(task.deps)
+            for dep in task.deps:
+                dependents[dep].append(task.key)
+        with concurrent.futures.ThreadPoolExecutor(self.workers) as executor:
+            futures = {}
+
+            def submit(task: Task) -> None:
+                future = executor.submit(task.func, *task.args)
+                futures[future] = task.key
+
+            for task in self.tasks.values():
+                if not task.deps:
+                    submit(task)
+            while futures:
+                done, _ = concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    key = futures.pop(future)
+                    try:
+                        self.results[key] = future.result()
+                    except Exception as e:
+                        logger.exception("task(%s) exception", key)
+                        self.errors[key] = e
+                        self._skip(key, dependents)
+                        continue
+                    for dependent in dependents[key]:
+                        waiting[dependent].discard(key)
+                        if not waiting[dependent] and dependent not in self.skipped:
+                            submit(self.tasks[dependent])
+        return [self.errors[x] for x in self.tasks if x in self.errors]
@@ -0,0 +1,284 @@
+"""
+Bulk teardown of session nodes, finding session devices by their naming
+convention and removing them with a few batched commands, instead of shutting
+down every node, interface and bridge separately. Devices found for a session
+are only removed when known to belong to it, as short session ids may collide.
+"""
+
+import logging
+import os
+import re
+import shutil
+import signal
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, Optional, Pattern, Set
+
+from core import utils
+from core.errors import CoreCommandError
+from core.executables import IP, NFTABLES
+from core.nodes.base import CoreNode, NodeBase
+from core.nodes.network import CoreNetwork, CtrlNet, GreTapBridge, nft_queue
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from core.emulator.session import Session
+
+SYS_NET: Path = Path("/sys/class/net")
+PROC: Path = Path("/proc")
+# prefixes of host devices created for nodes, links, bridges and control networks
+DEVICE_PREFIXES: str = r"(?:veth|tap|gt\.|b\.|ctrl\d+)"
+
+
+def device_regex(session_id: Optional[str] = None) -> Pattern:
+    """
+    Create a regex matching devices created for a session, based on names
+    ending with the short session id, or devices for any session.
+
+    :param session_id: short session id to match, None for any session
+    :return: device name regex
+    """
+    suffix = re.escape(session_id) if session_id else "[0-9a-f]+"
+    return re.compile(rf"^{DEVICE_PREFIXES}\S*\.{suffix}p?$")
+
+
+def find_devices(session_id: Optional[str] = None) -> List[str]:
+    """
+    Find host devices created for a session, or for any session.
+
+    :param session_id: short session id to find devices for, None for any session
+    :return: names of found devices
+    """
+    regex = device_regex(session_id)
+    try:
+        names = os.listdir(SYS_NET)
+    except OSError:
+        logger.exception("error listing host devices")
+        return []
+    return sorted(x for x in names if regex.match(x))
+
+
+def delete_devices(names: Iterable[str]) -> None:
+    """
+    Delete host devices within a single batch, continuing past devices that
+    have already been removed.
+
+    :param names: names of devices to delete
+    :return: nothing
+    """
+    cmds = [f"link delete dev {x}" for x in names]
+    if not cmds:
+        return
+    data = "\n".join(cmds) + "\n"
+    try:
+        utils.cmd(f"{IP} -force -batch -", stdin=data)
+    except CoreCommandError as e:
+        logger.debug("error during batch device delete: %s", e)
+
+
+def find_nft_tables(session_id: Optional[str] = None) -> List[str]:
+    """
+    Find nftables bridge tables created for a session, or for any session.
+
+    :param session_id: short session id to find tables for, None for any session
+    :return: names of found tables
+    """
+    regex = device_regex(session_id)
+    try:
+        output = utils.cmd(f"{NFTABLES} list tables bridge")
+    except CoreCommandError:
+        logger.exception("error listing nftables tables")
+        return []
+    names = []
+    for line in output.splitlines():
+        name = line.split()[-1] if line.strip() else ""
+        if name.startswith("b.") and regex.match(name):
+            names.append(name)
+    return names
+
+
+def find_processes(names: Set[str]) -> List[int]:
+    """
+    Find host processes by name.
+
+    :param names: process names to find
+    :return: ids of found processes
+    """
+    pids = []
+    for path in PROC.iterdir():
+        if not path.name.isdigit():
+            continue
+        try:
+            name = (path / "comm").read_text().strip()
+        except OSError:
+            continue
+        if name in names:
+            pids.append(int(path.name))
+    return pids
+
+
+def kill_processes(pids: Iterable[int], sig: int = signal.SIGKILL) -> None:
+    """
+    Signal processes, ignoring processes that no longer exist.
+
+    :param pids: ids of processes to signal
+    :param sig: signal to send
+    :return: nothing
+    """
+    for pid in pids:
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            pass
+        except OSError:
+            logger.exception("error killing process: %s", pid)
+
+
+def remove_paths(paths: Iterable[Path]) -> None:
+    """
+    Remove files and directories, ignoring paths that do not exist.
+
+    :param paths: paths to remove
+    :return: nothing
+    """
+    for path in paths:
+        try:
+            if path.is_dir() and not path.is_symlink():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logger.exception("error removing path: %s", path)
+
+
+def owned_devices(session: "Session", nodes: Iterable[NodeBase]) -> Set[str]:
+    """
+    Retrieve names of host devices known to belong to the provided session nodes,
+    being their tracked host interfaces, bridges and interfaces.
+
+    :param session: session nodes belong to
+    :param nodes: nodes to retrieve devices for
+    :return: device names
+    """
+    nodes = list(nodes)
+    node_ids = {x.id for x in nodes}
+    names = set()
+    for name, (node_id, _) in session.get_host_ifaces().items():
+        if node_id in node_ids:
+            names.add(name)
+    for node in nodes:
+        brname = getattr(node, "brname", None)
+        if brname:
+            names.add(brname)
+        for iface in node.get_ifaces():
+            names.add(iface.localname)
+    return names
+
+
+def is_bulk(session: "Session", node: NodeBase) -> bool:
+    """
+    Check if a node can be removed by bulk teardown. These are local nodes and
+    linux bridge networks, without additional shutdown behavior.
+
+    :param session: session node belongs to
+    :param node: node to check
+    :return: True if node can be removed in bulk, False otherwise
+    """
+    if node.server is not None:
+        return False
+    if type(node) is CoreNode:
+        return True
+    if isinstance(node, CoreNetwork):
+        if isinstance(node, (CtrlNet, GreTapBridge)):
+            return False
+        return not session.use_ovs() and not session.distributed.servers
+    return False
+
+
+def shutdown_nodes(session: "Session", nodes: List[NodeBase]) -> None:
+    """
+    Shutdown session nodes, removing local nodes and bridges in bulk and
+    shutting down all other nodes separately.
+
+    Node processes are killed first, removing their namespaces along with the
+    devices within them. Remaining session devices are then found by name and
+    deleted within a single batch, limited to devices owned by the removed
+    nodes, along with nftables tables within a single transaction.
+
+    :param session: session nodes belong to
+    :param nodes: nodes to shutdown
+    :return: nothing
+    """
+    preserve = session.options.get_config("preservedir") == "1"
+    bulk_nodes = []
+    bulk_nets = []
+    others = []
+    for node in nodes:
+        if not node.up:
+            continue
+        elif not is_bulk(session, node):
+            others.append(node)
+        elif isinstance(node, CoreNode):
+            bulk_nodes.append(node)
+        else:
+            bulk_nets.append(node)
+    # devices belonging to nodes shutdown separately are left to them
+    exclude = set()
+    for node in others:
+        for iface in node.get_ifaces():
+            if iface.node is None or iface.node is node:
+                exclude.add(iface.localname)
+        brname = getattr(node, "brname", None)
+        if brname:
+            exclude.add(brname)
+    owned = owned_devices(session, bulk_nodes + bulk_nets)
+    # kill node processes and remove node directories
+    kill_processes(x.pid for x in bulk_nodes if x.pid is not None)
+    paths = []
+    for node in bulk_nodes:
+        paths.append(node.ctrlchnlname)
+        if node.tmpnodedir and not preserve:
+            paths.append(node.directory)
+    remove_paths(paths)
+    # delete remaining devices and nftables tables
+    names = []
+    if bulk_nodes or bulk_nets:
+        names = find_devices(session.short_session_id())
+        names = [x for x in names if x in owned and x not in exclude]
+        delete_devices(names)
+    tables = [x.brname for x in bulk_nets if x.has_nftables_chain]
+    if tables:
+        nft_queue.stop()
+        nft_queue.delete_tables(tables)
+    # update node state to reflect removal
+    for node in bulk_nodes:
+        with node.lock:
+            for iface in node.get_ifaces():
+                iface.up = False
+            if node.client_pool is not None:
+                node.client_pool.close()
+                node.client_pool = None
+            node._mounts = []
+            node.ifaces.clear()
+            node.node_net_client.close()
+            node.up = False
+    for net in bulk_nets:
+        for iface in net.get_ifaces():
+            if iface.node is None:
+                iface.up = False
+        net.ifaces.clear()
+        net.linked.clear()
+        net.up = False
+    logger.info(
+        "bulk teardown nodes(%s) networks(%s) devices(%s) tables(%s)",
+        len(bulk_nodes),
+        len(bulk_nets),
+        len(names),
+        len(tables),
+    )
+    # shutdown remaining nodes separately
+    funcs = [(x.shutdown, [], {}) for x in others]
+    if funcs:
+        utils.threadpool(funcs)
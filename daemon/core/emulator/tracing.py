@@ -0,0 +1,156 @@
+"""
+Opt-in tracing of session startup, recording spans of time spent within session
+phases, node commands and services, exported in the chrome trace event format
+supported by chrome://tracing and perfetto.
+"""
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+logger = logging.getLogger(__name__)
+TRACE_FILE: str = "trace.json"
+# maximum spans kept, later spans are counted as dropped
+TRACE_MAX_SPANS: int = 500000
+
+
+@dataclass
+class Span:
+    """
+    Time spent within a named operation, on a given thread.
+    """
+
+    name: str
+    category: str
+    start: float
+    duration: float
+    thread_id: int
+    thread_name: str
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+class Tracer:
+    """
+    Records spans while tracing is enabled, doing nothing otherwise.
+    """
+
+    def __init__(self, enabled: Callable[[], bool]) -> None:
+        """
+        Create a Tracer instance.
+
+        :param enabled: function determining if tracing is currently enabled
+        """
+        self.enabled: Callable[[], bool] = enabled
+        self.lock: threading.Lock = threading.Lock()
+        self.spans: List[Span] = []
+        self.dropped: int = 0
+        self.start: float = time.perf_counter()
+
+    def clear(self) -> None:
+        """
+        Remove all recorded spans and restart trace time.
+
+        :return: nothing
+        """
+        with self.lock:
+            self.spans = []
+            self.dropped = 0
+            self.start = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[None]:
+        """
+        Context recording a span for the time spent within it, when enabled.
+        Errors raised within the context are recorded with the span.
+
+        :param name: name of span
+        :param category: category of span, i.e. session, node or service
+        :param args: additional span details, such as node id or command
+        :return: nothing
+        """
+        if not self.enabled():
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            args["error"] = str(e)
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            thread = threading.current_thread()
+            span = Span(
+                name, category, start, duration, thread.ident, thread.name, args
+            )
+            with self.lock:
+                if len(self.spans) < TRACE_MAX_SPANS:
+                    self.spans.append(span)
+                else:
+                    self.dropped += 1
+
+    def to_chrome(self, pid: int = 0, process_name: str = None) -> Dict[str, Any]:
+        """
+        Convert recorded spans to chrome trace events, with times in microseconds
+        since the trace started.
+
+        :param pid: process id to record spans under
+        :param process_name: name of process to display, if provided
+        :return: chrome trace data
+        """
+        with self.lock:
+            spans = list(self.spans)
+            dropped = self.dropped
+            trace_start = self.start
+        events = []
+        if process_name:
+            events.append(
+                dict(ph="M", name="process_name", pid=pid, args=dict(name=process_name))
+            )
+        threads = {}
+        for span in spans:
+            threads[span.thread_id] = span.thread_name
+            event = dict(
+                ph="X",
+                name=span.name,
+                cat=span.category,
+                ts=(span.start - trace_start) * 1e6,
+                dur=span.duration * 1e6,
+                pid=pid,
+                tid=span.thread_id,
+                args=span.args,
+            )
+            events.append(event)
+        for thread_id, thread_name in threads.items():
+            event = dict(
+                ph="M",
+                name="thread_name",
+                pid=pid,
+                tid=thread_id,
+                args=dict(name=thread_name),
+            )
+            events.append(event)
+        return dict(
+            traceEvents=events,
+            displayTimeUnit="ms",
+            otherData=dict(dropped=dropped),
+        )
+
+    def export(self, path: Path, pid: int = 0, process_name: str = None) -> None:
+        """
+        Write recorded spans as a chrome trace file.
+
+        :param path: file to write trace to
+        :param pid: process id to record spans under
+        :param process_name: name of process to display, if provided
+        :return: nothing
+        """
+        data = self.to_chrome(pid, process_name)
+        with path.open("w") as f:
+            json.dump(data, f, default=str)
+        logger.info("wrote trace with %s events: %s", len(data["traceEvents"]), path)
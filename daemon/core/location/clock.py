@@ -0,0 +1,114 @@
+"""
+clock.py: clocks driving mobility script time, in real time, scaled time or
+discrete steps.
+"""
+
+import time
+from typing import TYPE_CHECKING
+
+from core.errors import CoreError
+
+if TYPE_CHECKING:
+    from core.emulator.sessionconfig import SessionConfig
+
+CLOCK_REALTIME: str = "realtime"
+CLOCK_SCALED: str = "scaled"
+CLOCK_STEP: str = "step"
+# minimum clock seconds a stepped clock advances by
+STEP_RESOLUTION: float = 0.001
+
+
+class MobilityClock:
+    """
+    Real time mobility clock, the base for other clocks.
+    """
+
+    # True when script time only advances when scheduling the next step
+    stepped: bool = False
+
+    def now(self) -> float:
+        """
+        Retrieve the current clock time.
+
+        :return: clock time in seconds
+        """
+        return time.monotonic()
+
+    def delay(self, seconds: float) -> float:
+        """
+        Convert a delay in clock time to the real delay to schedule it with.
+
+        :param seconds: clock time delay
+        :return: real time delay
+        """
+        return seconds
+
+
+class ScaledClock(MobilityClock):
+    """
+    Mobility clock running faster or slower than real time.
+    """
+
+    def __init__(self, scale: float) -> None:
+        """
+        Create a ScaledClock instance.
+
+        :param scale: clock seconds per real second
+        :raises CoreError: when scale is not positive
+        """
+        if scale <= 0:
+            raise CoreError(f"invalid mobility clock scale: {scale}")
+        self.scale: float = scale
+        self.start: float = time.monotonic()
+
+    def now(self) -> float:
+        return self.start + (time.monotonic() - self.start) * self.scale
+
+    def delay(self, seconds: float) -> float:
+        return seconds / self.scale
+
+
+class StepClock(MobilityClock):
+    """
+    Mobility clock advancing by each scheduled delay without waiting, running
+    script time as fast as possible.
+    """
+
+    stepped: bool = True
+
+    def __init__(self) -> None:
+        """
+        Create a StepClock instance.
+        """
+        self.time: float = 0.0
+
+    def now(self) -> float:
+        return self.time
+
+    def delay(self, seconds: float) -> float:
+        # always advance, to avoid rounding errors stalling script time
+        self.time += max(seconds, STEP_RESOLUTION)
+        return 0.0
+
+
+def create_clock(options: "SessionConfig") -> MobilityClock:
+    """
+    Create the mobility clock configured for a session.
+
+    :param options: session options
+    :return: mobility clock
+    :raises CoreError: when the configured clock is not valid
+    """
+    name = options.get_config("mobility_clock", default=CLOCK_REALTIME)
+    if name == CLOCK_REALTIME:
+        return MobilityClock()
+    elif name == CLOCK_SCALED:
+        scale = options.get_config("mobility_scale", default="1.0")
+        try:
+            return ScaledClock(float(scale))
+        except ValueError:
+            raise CoreError(f"invalid mobility clock scale: {scale}")
+    elif name == CLOCK_STEP:
+        return StepClock()
+    else:
+        raise CoreError(f"unknown mobility clock: {name}")
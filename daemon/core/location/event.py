@@ -1,73 +1,31 @@
 """
-event.py: event loop implementation using a heap queue and threads.
+event.py: event loop implementation using a heap queue and a dispatcher thread.
 """
 
+import dataclasses
 import heapq
+import logging
 import threading
 import time
+from dataclasses import dataclass
 from functools import total_ordering
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+logger = logging.getLogger(__name__)
 
-class Timer(threading.Thread):
+
+@dataclass
+class EventLoopStats:
     """
-    Based on threading.Timer but cancel() returns if the timer was
-    already running.
+    Metrics for events run by an event loop, lag being the delay between the
+    scheduled and actual run time of an event.
     """
 
-    def __init__(
-        self,
-        interval: float,
-        func: Callable[..., None],
-        args: Tuple[Any] = None,
-        kwargs: Dict[Any, Any] = None,
-    ) -> None:
-        """
-        Create a Timer instance.
-
-        :param interval: time interval
-        :param func: function to call when timer finishes
-        :param args: function arguments
-        :param kwargs: function keyword arguments
-        """
-        super().__init__()
-        self.interval: float = interval
-        self.func: Callable[..., None] = func
-        self.finished: threading.Event = threading.Event()
-        self._running: threading.Lock = threading.Lock()
-        # validate arguments were provided
-        if args is None:
-            args = ()
-        self.args: Tuple[Any] = args
-        # validate keyword arguments were provided
-        if kwargs is None:
-            kwargs = {}
-        self.kwargs: Dict[Any, Any] = kwargs
-
-    def cancel(self) -> bool:
-        """
-        Stop the timer if it hasn't finished yet.  Return False if
-        the timer was already running.
-
-        :return: True if canceled, False otherwise
-        """
-        locked = self._running.acquire(False)
-        if locked:
-            self.finished.set()
-            self._running.release()
-        return locked
-
-    def run(self) -> None:
-        """
-        Run the timer.
-
-        :return: nothing
-        """
-        self.finished.wait(self.interval)
-        with self._running:
-            if not self.finished.is_set():
-                self.func(*self.args, **self.kwargs)
-            self.finished.set()
+    events: int = 0
+    errors: int = 0
+    last_lag: float = 0.0
+    max_lag: float = 0.0
+    total_lag: float = 0.0
 
 
 @total_ordering
@@ -99,12 +57,10 @@ class Event:
         self.args: Tuple[Any] = args
         self.kwds: Dict[Any, Any] = kwds
         self.canceled: bool = False
+        self.period: Optional[float] = None
 
     def __lt__(self, other: "Event") -> bool:
-        result = self.time < other.time
-        if result:
-            result = self.eventnum < other.eventnum
-        return result
+        return (self.time, self.eventnum) < (other.time, other.eventnum)
 
     def run(self) -> None:
         """
@@ -118,7 +74,8 @@ class Event:
 
     def cancel(self) -> None:
         """
-        Cancel event.
+        Cancel event, canceled events are discarded when reaching the head of
+        the queue.
 
         :return: nothing
         """
@@ -127,7 +84,8 @@ class Event:
 
 class EventLoop:
     """
-    Provides an event loop for running events.
+    Provides an event loop for running events, using a single dispatcher thread
+    waiting for the next event deadline.
     """
 
     def __init__(self) -> None:
@@ -135,54 +93,71 @@ class EventLoop:
         Creates a EventLoop instance.
         """
         self.lock: threading.RLock = threading.RLock()
+        self.condition: threading.Condition = threading.Condition(self.lock)
         self.queue: List[Event] = []
         self.eventnum: int = 0
-        self.timer: Optional[Timer] = None
+        self.thread: Optional[threading.Thread] = None
         self.running: bool = False
         self.start: Optional[float] = None
+        self.stats: EventLoopStats = EventLoopStats()
+
+    def _next_event(self, thread: threading.Thread) -> Optional[Event]:
+        """
+        Wait for the next event that is due to run.
+
+        :param thread: dispatcher thread waiting, used to detect a restarted loop
+        :return: event to run, None when the loop was stopped
+        """
+        with self.condition:
+            while True:
+                if not self.running or self.thread is not thread:
+                    return None
+                if self.queue and self.queue[0].canceled:
+                    heapq.heappop(self.queue)
+                    continue
+                if not self.queue:
+                    self.condition.wait()
+                    continue
+                delay = self.queue[0].time - time.monotonic()
+                if delay > 0:
+                    self.condition.wait(delay)
+                    continue
+                return heapq.heappop(self.queue)
 
     def _run_events(self) -> None:
         """
-        Run events.
+        Run events as they become due, until the loop is stopped.
 
         :return: nothing
         """
-        schedule = False
+        thread = threading.current_thread()
         while True:
-            with self.lock:
-                if not self.running or not self.queue:
-                    break
+            event = self._next_event(thread)
+            if event is None:
+                break
+            lag = time.monotonic() - event.time
+            try:
+                event.run()
+                error = False
+            except Exception:
+                logger.exception("error running event: %s", event.func)
+                error = True
+            with self.condition:
+                self.stats.events += 1
+                self.stats.errors += int(error)
+                self.stats.last_lag = lag
+                self.stats.max_lag = max(self.stats.max_lag, lag)
+                self.stats.total_lag += lag
+                if event.period is None or event.canceled:
+                    continue
+                if not self.running or self.thread is not thread:
+                    continue
+                # keep a fixed rate, unless running behind by a whole period
+                event.time += event.period
                 now = time.monotonic()
-                if self.queue[0].time > now:
-                    schedule = True
-                    break
-                event = heapq.heappop(self.queue)
-            if event.time > now:
-                raise ValueError("invalid event time: %s > %s", event.time, now)
-            event.run()
-
-        with self.lock:
-            self.timer = None
-            if schedule:
-                self._schedule_event()
-
-    def _schedule_event(self) -> None:
-        """
-        Schedule event.
-
-        :return: nothing
-        """
-        with self.lock:
-            if not self.running:
-                raise ValueError("scheduling event while not running")
-            if not self.queue:
-                return
-            delay = self.queue[0].time - time.monotonic()
-            if self.timer:
-                raise ValueError("timer was already set")
-            self.timer = Timer(delay, self._run_events)
-            self.timer.daemon = True
-            self.timer.start()
+                if event.time < now:
+                    event.time = now
+                heapq.heappush(self.queue, event)
 
     def run(self) -> None:
         """
@@ -190,14 +165,17 @@ class EventLoop:
 
         :return: nothing
         """
-        with self.lock:
+        with self.condition:
             if self.running:
                 return
             self.running = True
             self.start = time.monotonic()
+            self.stats = EventLoopStats()
             for event in self.queue:
                 event.time += self.start
-            self._schedule_event()
+            heapq.heapify(self.queue)
+            self.thread = threading.Thread(target=self._run_events, daemon=True)
+            self.thread.start()
 
     def stop(self) -> None:
         """
@@ -205,16 +183,42 @@ class EventLoop:
 
         :return: nothing
         """
-        with self.lock:
+        with self.condition:
             if not self.running:
                 return
             self.queue = []
             self.eventnum = 0
-            if self.timer is not None:
-                self.timer.cancel()
-                self.timer = None
+            self.thread = None
             self.running = False
             self.start = None
+            self.condition.notify_all()
+
+    def get_stats(self) -> EventLoopStats:
+        """
+        Retrieve a copy of the current event metrics.
+
+        :return: event loop metrics
+        """
+        with self.condition:
+            return dataclasses.replace(self.stats)
+
+    def _add(self, event: Event) -> Event:
+        with self.condition:
+            heapq.heappush(self.queue, event)
+            if self.running and self.queue[0] is event:
+                self.condition.notify()
+        return event
+
+    def _create_event(
+        self, delaysec: float, func: Callable, args: Tuple[Any], kwds: Dict[Any, Any]
+    ) -> Event:
+        with self.condition:
+            eventnum = self.eventnum
+            self.eventnum += 1
+            evtime = float(delaysec)
+            if self.running:
+                evtime += time.monotonic()
+            return Event(eventnum, evtime, func, *args, **kwds)
 
     def add_event(self, delaysec: float, func: Callable, *args: Any, **kwds: Any):
         """
@@ -226,24 +230,25 @@ class EventLoop:
         :param kwds: event keyword arguments
         :return: created event
         """
-        with self.lock:
-            eventnum = self.eventnum
-            self.eventnum += 1
-            evtime = float(delaysec)
-            if self.running:
-                evtime += time.monotonic()
-            event = Event(eventnum, evtime, func, *args, **kwds)
+        with self.condition:
+            event = self._create_event(delaysec, func, args, kwds)
+            return self._add(event)
 
-            if self.queue:
-                prevhead = self.queue[0]
-            else:
-                prevhead = None
+    def add_periodic_event(
+        self, interval: float, func: Callable, *args: Any, **kwds: Any
+    ) -> Event:
+        """
+        Add an event to the event loop, that runs every interval until canceled.
 
-            heapq.heappush(self.queue, event)
-            head = self.queue[0]
-            if prevhead is not None and prevhead != head:
-                if self.timer is not None and self.timer.cancel():
-                    self.timer = None
-            if self.running and self.timer is None:
-                self._schedule_event()
-        return event
+        :param interval: interval in seconds between runs, first run included
+        :param func: event function
+        :param args: event arguments
+        :param kwds: event keyword arguments
+        :return: created event, to cancel the periodic event with
+        """
+        if interval <= 0:
+            raise ValueError(f"invalid periodic event interval: {interval}")
+        with self.condition:
+            event = self._create_event(interval, func, args, kwds)
+            event.period = float(interval)
+            return self._add(event)
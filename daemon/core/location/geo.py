@@ -3,7 +3,7 @@ Provides conversions from x,y,z to lon,lat,alt.
 """
 
 import logging
-from typing import Tuple
+from typing import List, Optional, Sequence, Tuple
 
 import pyproj
 from pyproj import Transformer
@@ -126,3 +126,56 @@ class GeoLocation:
         alt = self.refgeo[2] + self.pixels2meters(z)
         logger.debug("result lon,lat,alt(%s, %s, %s)", lon, lat, alt)
         return lat, lon, alt
+
+    def getxyz_many(
+        self, positions: Sequence[Tuple[float, float, float]]
+    ) -> List[Tuple[float, float, float]]:
+        """
+        Convert provided lat,lon,alt positions to x,y,z, using a single
+        transformation for all positions.
+
+        :param positions: lat,lon,alt positions to convert
+        :return: x,y,z representation of provided positions, in order
+        """
+        if not positions:
+            return []
+        lats, lons, alts = zip(*positions)
+        pxs, pys = self.to_pixels.transform(list(lons), list(lats))
+        results = []
+        for px, py, alt in zip(pxs, pys, alts):
+            px -= self.refproj[0]
+            py -= self.refproj[1]
+            pz = alt - self.refproj[2]
+            x = self.meters2pixels(px) + self.refxyz[0]
+            y = -(self.meters2pixels(py) + self.refxyz[1])
+            z = self.meters2pixels(pz) + self.refxyz[2]
+            results.append((x, y, z))
+        return results
+
+    def getgeo_many(
+        self, positions: Sequence[Tuple[float, float, Optional[float]]]
+    ) -> List[Tuple[float, float, float]]:
+        """
+        Convert provided x,y,z positions to lat,lon,alt, using a single
+        transformation for all positions.
+
+        :param positions: x,y,z positions to convert
+        :return: lat,lon,alt representation of provided positions, in order
+        """
+        if not positions:
+            return []
+        pxs = []
+        pys = []
+        alts = []
+        for x, y, z in positions:
+            x -= self.refxyz[0]
+            y = -(y - self.refxyz[1])
+            if z is None:
+                z = self.refxyz[2]
+            else:
+                z -= self.refxyz[2]
+            pxs.append(self.refproj[0] + self.pixels2meters(x))
+            pys.append(self.refproj[1] + self.pixels2meters(y))
+            alts.append(self.refgeo[2] + self.pixels2meters(z))
+        lons, lats = self.to_geo.transform(pxs, pys)
+        return list(zip(lats, lons, alts))
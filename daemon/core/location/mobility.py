@@ -7,9 +7,20 @@ import logging
 import math
 import threading
 import time
+from dataclasses import dataclass
 from functools import total_ordering
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from core import utils
 from core.config import (
@@ -27,17 +38,26 @@ from core.emulator.data import EventData, LinkData, LinkOptions
 from core.emulator.enumerations import EventTypes, LinkTypes, MessageFlags, RegisterTlvs
 from core.errors import CoreError
 from core.executables import BASH
+from core.location.clock import MobilityClock, create_clock
+from core.location.trace import TraceReader, is_binary_trace, open_trace
 from core.nodes.base import CoreNode
 from core.nodes.interface import CoreInterface
-from core.nodes.network import WlanNode
+from core.nodes.network import NetworkPolicy, WlanNode
 
 logger = logging.getLogger(__name__)
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+    logger.debug("numpy not installed, using scalar range calculations")
+
 if TYPE_CHECKING:
     from core.emulator.session import Session
 
 LEARNING_DISABLED: int = 0
 LEARNING_ENABLED: int = 30000
+RANGE_TOLERANCE: float = 1e-9
 
 
 def get_mobility_node(session: "Session", node_id: int) -> Union[WlanNode, EmaneNet]:
@@ -257,6 +277,18 @@ class WirelessModel(ConfigurableOptions):
         """
         raise NotImplementedError
 
+    def links_updated(
+        self, changed: List[Tuple[CoreInterface, CoreInterface, bool]]
+    ) -> None:
+        """
+        Notification of interface pairs linked or unlinked within the related
+        network, regardless of what caused the change.
+
+        :param changed: interface pairs and their new linked state
+        :return: nothing
+        """
+        pass
+
     def update_config(self, config: Dict[str, str]) -> None:
         """
         For run-time updates of model config. Returns True when position callback and
@@ -268,6 +300,170 @@ class WirelessModel(ConfigurableOptions):
         pass
 
 
+class SpatialGrid:
+    """
+    Uniform grid index of interface positions, used to find interfaces within
+    range of a position without checking every interface.
+    """
+
+    def __init__(self, size: float) -> None:
+        """
+        Create a SpatialGrid instance.
+
+        :param size: size of each grid cell, should be at least the search range
+        """
+        self.size: float = size
+        self.cells: Dict[Tuple[int, int], Set[CoreInterface]] = {}
+        self.iface_to_cell: Dict[CoreInterface, Tuple[int, int]] = {}
+
+    def cell(self, x: float, y: float) -> Tuple[int, int]:
+        """
+        Retrieve the cell a position falls within.
+
+        :param x: x position
+        :param y: y position
+        :return: cell coordinates
+        """
+        return math.floor(x / self.size), math.floor(y / self.size)
+
+    def update(self, iface: CoreInterface, x: float, y: float) -> None:
+        """
+        Set the position of an interface, moving it between cells as needed.
+
+        :param iface: interface to update
+        :param x: x position
+        :param y: y position
+        :return: nothing
+        """
+        cell = self.cell(x, y)
+        current = self.iface_to_cell.get(iface)
+        if current == cell:
+            return
+        if current is not None:
+            self.remove(iface)
+        self.cells.setdefault(cell, set()).add(iface)
+        self.iface_to_cell[iface] = cell
+
+    def remove(self, iface: CoreInterface) -> None:
+        """
+        Remove an interface from the grid.
+
+        :param iface: interface to remove
+        :return: nothing
+        """
+        cell = self.iface_to_cell.pop(iface, None)
+        if cell is None:
+            return
+        ifaces = self.cells[cell]
+        ifaces.discard(iface)
+        if not ifaces:
+            self.cells.pop(cell)
+
+    def neighbors(self, x: float, y: float) -> Iterable[CoreInterface]:
+        """
+        Retrieve interfaces within the cell of a position and its adjacent
+        cells, a superset of the interfaces within cell size of the position.
+
+        :param x: x position
+        :param y: y position
+        :return: interfaces near the position
+        """
+        cell_x, cell_y = self.cell(x, y)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                yield from self.cells.get((cell_x + dx, cell_y + dy), ())
+
+
+@dataclass
+class LinkChange:
+    """
+    Link state change calculated by a range model at a given script time.
+    """
+
+    time: float
+    node1_id: int
+    node2_id: int
+    linked: bool
+
+
+class RangeEngine:
+    """
+    Vectorized range calculations, over interface positions held within a
+    contiguous array.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create a RangeEngine instance.
+        """
+        self.ifaces: List[CoreInterface] = []
+        self.index: Dict[CoreInterface, int] = {}
+        self.positions: "np.ndarray" = np.full((16, 3), np.nan)
+
+    def set_position(
+        self, iface: CoreInterface, x: float, y: float, z: Optional[float]
+    ) -> None:
+        """
+        Set the position of an interface, unknown values are stored as NaN.
+
+        :param iface: interface to set position for
+        :param x: x position
+        :param y: y position
+        :param z: z position
+        :return: nothing
+        """
+        index = self.index.get(iface)
+        if index is None:
+            index = len(self.ifaces)
+            if index == len(self.positions):
+                positions = np.full((index * 2, 3), np.nan)
+                positions[:index] = self.positions
+                self.positions = positions
+            self.ifaces.append(iface)
+            self.index[iface] = index
+        self.positions[index] = [np.nan if v is None else v for v in (x, y, z)]
+
+    def get_position(self, index: int) -> Tuple[float, float, Optional[float]]:
+        x, y, z = self.positions[index].tolist()
+        return x, y, None if math.isnan(z) else z
+
+    def calc(
+        self, ifaces: List[CoreInterface], distance: float
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Calculate which interfaces are within range of the provided interfaces,
+        matching the results of BasicRangeModel.calcdistance().
+
+        :param ifaces: interfaces to calculate range from, with known positions
+        :param distance: range to check within
+        :return: matrix of interfaces with a known position and matrix of
+            interfaces within range, a row per provided interface
+        """
+        count = len(self.ifaces)
+        positions = self.positions[:count]
+        rows = np.array([self.index[x] for x in ifaces], dtype=int)
+        moved = positions[rows]
+        valid = ~np.isnan(positions[:, 0]) & ~np.isnan(positions[:, 1])
+        valid = np.broadcast_to(valid, (len(rows), count)).copy()
+        valid[np.arange(len(rows)), rows] = False
+        with np.errstate(invalid="ignore"):
+            a = moved[:, 0, None] - positions[None, :, 0]
+            b = moved[:, 1, None] - positions[None, :, 1]
+            c = moved[:, 2, None] - positions[None, :, 2]
+            c[np.isnan(c)] = 0
+            d = np.hypot(np.hypot(a, b), c)
+        # recalculate distances close to the range using the scalar path, to
+        # avoid floating point differences deciding the result
+        tolerance = RANGE_TOLERANCE * max(distance, 1)
+        close = valid & (np.abs(d - distance) <= tolerance)
+        for row, column in zip(*np.nonzero(close)):
+            p1 = self.get_position(rows[row])
+            p2 = self.get_position(column)
+            d[row, column] = BasicRangeModel.calcdistance(p1, p2)
+        in_range = valid & (d <= distance)
+        return valid, in_range
+
+
 class BasicRangeModel(WirelessModel):
     """
     Basic Range wireless model, calculates range between nodes and links
@@ -300,13 +496,21 @@ class BasicRangeModel(WirelessModel):
         self.session: "Session" = session
         self.wlan: WlanNode = session.get_node(_id, WlanNode)
         self.iface_to_pos: Dict[CoreInterface, Tuple[float, float, float]] = {}
-        self.iface_lock: threading.Lock = threading.Lock()
+        self.iface_lock: threading.RLock = threading.RLock()
         self.range: int = 0
+        self.grid: SpatialGrid = SpatialGrid(1)
+        self.iface_links: Dict[CoreInterface, Set[CoreInterface]] = {}
+        self.engine: Optional[RangeEngine] = None
+        self.timeline: List[LinkChange] = []
+        self.timeline_time: Optional[float] = None
+        if np is not None:
+            self.engine = RangeEngine()
         self.bw: Optional[int] = None
         self.delay: Optional[int] = None
         self.loss: Optional[float] = None
         self.jitter: Optional[int] = None
         self.promiscuous: bool = False
+        self.load_links()
 
     def setlinkparams(self) -> None:
         """
@@ -345,9 +549,13 @@ class BasicRangeModel(WirelessModel):
         x, y, z = iface.node.position.get()
         with self.iface_lock:
             self.iface_to_pos[iface] = (x, y, z)
+            if self.engine:
+                self.engine.set_position(iface, x, y, z)
             if x is None or y is None:
+                self.grid.remove(iface)
                 return
-            for iface2 in self.iface_to_pos:
+            self.grid.update(iface, x, y)
+            for iface2 in self.candidates(iface, x, y):
                 self.calclink(iface, iface2)
 
     position_callback = set_position
@@ -362,17 +570,163 @@ class BasicRangeModel(WirelessModel):
         :param moved_ifaces: moved network interfaces
         :return: nothing
         """
+        if self.engine:
+            self.update_vectorized(moved_ifaces)
+            return
         with self.iface_lock:
+            pending = set(moved_ifaces)
             while len(moved_ifaces):
                 iface = moved_ifaces.pop()
+                pending.discard(iface)
                 nx, ny, nz = iface.node.getposition()
                 if iface in self.iface_to_pos:
                     self.iface_to_pos[iface] = (nx, ny, nz)
-                for iface2 in self.iface_to_pos:
-                    if iface2 in moved_ifaces:
+                    if nx is None or ny is None:
+                        self.grid.remove(iface)
+                    else:
+                        self.grid.update(iface, nx, ny)
+                if nx is None or ny is None:
+                    continue
+                for iface2 in self.candidates(iface, nx, ny):
+                    if iface2 in pending:
                         continue
                     self.calclink(iface, iface2)
 
+    def update_vectorized(self, moved_ifaces: List[CoreInterface]) -> None:
+        """
+        Vectorized version of update(), calculating range for all moved
+        interfaces at once and applying the resulting link changes as a batch.
+
+        :param moved_ifaces: moved network interfaces
+        :return: nothing
+        """
+        with self.iface_lock:
+            ifaces = []
+            while len(moved_ifaces):
+                iface = moved_ifaces.pop()
+                if iface not in self.iface_to_pos:
+                    logger.error("moved interface not known: %s", iface.name)
+                    continue
+                x, y, z = iface.node.getposition()
+                self.iface_to_pos[iface] = (x, y, z)
+                self.engine.set_position(iface, x, y, z)
+                if x is None or y is None:
+                    self.grid.remove(iface)
+                    continue
+                self.grid.update(iface, x, y)
+                if iface not in ifaces:
+                    ifaces.append(iface)
+            if not ifaces:
+                return
+            valid, in_range = self.engine.calc(ifaces, self.range)
+            check_all = self.wlan.policy != NetworkPolicy.DROP
+            links = {}
+            for row, iface in enumerate(ifaces):
+                columns = valid[row] if check_all else in_range[row]
+                ifaces2 = {self.engine.ifaces[x] for x in np.flatnonzero(columns)}
+                ifaces2.update(self.iface_links.get(iface, ()))
+                for iface2 in ifaces2:
+                    column = self.engine.index.get(iface2)
+                    if column is None or not valid[row, column]:
+                        continue
+                    a = min(iface, iface2)
+                    b = max(iface, iface2)
+                    links[(a, b)] = bool(in_range[row, column])
+            for (a, b), linked in links.items():
+                self.track_link(a, b, linked)
+            changed = self.wlan.update_links(links)
+        for a, b, linked in changed:
+            self.sendlinkmsg(a, b, unlink=not linked)
+
+    def candidates(
+        self, iface: CoreInterface, x: float, y: float
+    ) -> Iterable[CoreInterface]:
+        """
+        Retrieve the interfaces whose link state with a moved interface may
+        change. These are interfaces within the grid cells around its position,
+        along with those it is currently linked to, so links leaving range are
+        removed. Networks using an accept policy consider interfaces linked by
+        default, so all interfaces are candidates for them.
+
+        :param iface: moved interface
+        :param x: x position of the moved interface
+        :param y: y position of the moved interface
+        :return: candidate interfaces
+        """
+        if self.wlan.policy != NetworkPolicy.DROP:
+            return list(self.iface_to_pos)
+        ifaces = set(self.grid.neighbors(x, y))
+        for iface2 in self.iface_links.get(iface, ()):
+            if iface2 in self.iface_to_pos:
+                ifaces.add(iface2)
+        return ifaces
+
+    def reset_grid(self) -> None:
+        """
+        Rebuild the spatial grid for the current range and known positions.
+
+        :return: nothing
+        """
+        with self.iface_lock:
+            self.grid = SpatialGrid(max(self.range, 1))
+            for iface, (x, y, _) in self.iface_to_pos.items():
+                if x is not None and y is not None:
+                    self.grid.update(iface, x, y)
+            self.load_links()
+
+    def load_links(self) -> None:
+        """
+        Track interfaces currently linked within the network, including those
+        linked before this model was set or linked by other means.
+
+        :return: nothing
+        """
+        with self.wlan.linked_lock:
+            links = [
+                (iface, iface2)
+                for iface, ifaces in self.wlan.linked.items()
+                for iface2, linked in ifaces.items()
+                if linked
+            ]
+        with self.iface_lock:
+            self.iface_links.clear()
+            for iface, iface2 in links:
+                self.track_link(iface, iface2, True)
+
+    def links_updated(
+        self, changed: List[Tuple[CoreInterface, CoreInterface, bool]]
+    ) -> None:
+        """
+        Track link changes made within the network, so interfaces linked
+        outside of this model are unlinked when moving out of range.
+
+        :param changed: interface pairs and their new linked state
+        :return: nothing
+        """
+        with self.iface_lock:
+            for iface, iface2, linked in changed:
+                self.track_link(iface, iface2, linked)
+
+    def track_link(self, a: CoreInterface, b: CoreInterface, linked: bool) -> None:
+        """
+        Track interfaces linked by this model, to revisit them when moving
+        apart beyond grid neighbors.
+
+        :param a: interface one
+        :param b: interface two
+        :param linked: True when now linked, False otherwise
+        :return: nothing
+        """
+        for iface, iface2 in ((a, b), (b, a)):
+            if linked:
+                self.iface_links.setdefault(iface, set()).add(iface2)
+            else:
+                links = self.iface_links.get(iface)
+                if links is not None:
+                    links.discard(iface2)
+                    if not links:
+                        self.iface_links.pop(iface)
+
     def calclink(self, iface: CoreInterface, iface2: CoreInterface) -> None:
         """
         Helper used by set_position() and update() to
@@ -398,11 +752,13 @@ class BasicRangeModel(WirelessModel):
             with self.wlan.linked_lock:
                 linked = self.wlan.is_linked(a, b)
             if d > self.range:
+                self.track_link(a, b, False)
                 if linked:
                     logger.debug("was linked, unlinking")
                     self.wlan.unlink(a, b)
                     self.sendlinkmsg(a, b, unlink=True)
             else:
+                self.track_link(a, b, True)
                 if not linked:
                     logger.debug("was not linked, linking")
                     self.wlan.link(a, b)
@@ -435,9 +791,12 @@ class BasicRangeModel(WirelessModel):
         :param config: values to update configuration
         :return: nothing
         """
+        current_range = self.range
         self.range = get_config_int(self.range, config, "range")
         if self.range is None:
             self.range = 0
+        if self.range != current_range:
+            self.reset_grid()
         logger.debug("wlan %s set range to %s", self.wlan.name, self.range)
         self.bw = get_config_int(self.bw, config, "bandwidth")
         self.delay = get_config_int(self.delay, config, "delay")
@@ -483,10 +842,24 @@ class BasicRangeModel(WirelessModel):
         :param unlink: unlink or not
         :return: nothing
         """
+        if self.timeline_time is not None:
+            change = LinkChange(
+                self.timeline_time, iface.node.id, iface2.node.id, not unlink
+            )
+            self.timeline.append(change)
         message_type = MessageFlags.DELETE if unlink else MessageFlags.ADD
         link_data = self.create_link_data(iface, iface2, message_type)
         self.session.broadcast_link(link_data)
 
+    def get_timeline(self) -> List[LinkChange]:
+        """
+        Retrieve the link changes recorded during the last mobility pass run
+        with a stepped clock.
+
+        :return: link changes ordered by script time
+        """
+        return list(self.timeline)
+
     def links(self, flags: MessageFlags = MessageFlags.NONE) -> List[LinkData]:
         """
         Return a list of wireless link messages for when the GUI reconnects.
@@ -577,6 +950,7 @@ class WayPointMobility(WirelessModel):
         # flag whether to stop scheduling when queue is empty
         #  (ns-3 sets this to False as new waypoints may be added from trace)
         self.empty_queue_stop: bool = True
+        self.clock: MobilityClock = create_clock(self.session.options)
 
     def startup(self):
         raise NotImplementedError
@@ -590,7 +964,7 @@ class WayPointMobility(WirelessModel):
         if self.state != self.STATE_RUNNING:
             return
         t = self.lasttime
-        self.lasttime = time.monotonic()
+        self.lasttime = self.clock.now()
         now = self.lasttime - self.timezero
         dt = self.lasttime - t
 
@@ -603,17 +977,20 @@ class WayPointMobility(WirelessModel):
                 nexttime = self.queue[0].time - now
                 if nexttime > (0.001 * self.refresh_ms):
                     nexttime -= 0.001 * self.refresh_ms
-                self.session.event_loop.add_event(nexttime, self.runround)
+                self.session.event_loop.add_event(
+                    self.clock.delay(nexttime), self.runround
+                )
                 return
             else:
                 # no more waypoints or queued items, loop?
                 if not self.empty_queue_stop:
                     # keep running every refresh_ms, even with empty queue
                     self.session.event_loop.add_event(
-                        0.001 * self.refresh_ms, self.runround
+                        self.clock.delay(0.001 * self.refresh_ms), self.runround
                     )
                     return
-                if not self.loopwaypoints():
+                # stepped clocks restart at zero, a pass is not repeated
+                if self.clock.stepped or not self.loopwaypoints():
                     return self.stop(move_initial=False)
                 if not len(self.queue):
                     # prevent busy loop
@@ -621,16 +998,25 @@ class WayPointMobility(WirelessModel):
                 return self.run()
 
         moved_ifaces = []
-        for iface in self.net.get_ifaces():
-            node = iface.node
-            if self.movenode(node, dt):
-                moved_ifaces.append(iface)
+        if np is not None:
+            ifaces = self.net.get_ifaces()
+            nodes = {x.node.id: x.node for x in ifaces}
+            moved = {x.id for x in self.movenodes(list(nodes.values()), dt)}
+            moved_ifaces = [x for x in ifaces if x.node.id in moved]
+        else:
+            for iface in self.net.get_ifaces():
+                node = iface.node
+                if self.movenode(node, dt):
+                    moved_ifaces.append(iface)
 
         # calculate all ranges after moving nodes; this saves calculations
+        self.settimeline(now)
         self.net.model.update(moved_ifaces)
 
         # TODO: check session state
-        self.session.event_loop.add_event(0.001 * self.refresh_ms, self.runround)
+        self.session.event_loop.add_event(
+            self.clock.delay(0.001 * self.refresh_ms), self.runround
+        )
 
     def run(self) -> None:
         """
@@ -638,12 +1024,29 @@ class WayPointMobility(WirelessModel):
 
         :return: nothing
         """
-        self.timezero = time.monotonic()
+        self.clock = create_clock(self.session.options)
+        self.timezero = self.clock.now()
         self.lasttime = self.timezero - (0.001 * self.refresh_ms)
+        model = self.net.model
+        if isinstance(model, BasicRangeModel):
+            model.timeline.clear()
+        self.settimeline(0.0)
         self.movenodesinitial()
         self.runround()
         self.session.mobility.sendevent(self)
 
+    def settimeline(self, now: float) -> None:
+        """
+        Set the script time link changes are recorded at by a basic range model,
+        for stepped clocks. Link changes are not recorded for other clocks.
+
+        :param now: current script time
+        :return: nothing
+        """
+        model = self.net.model
+        if isinstance(model, BasicRangeModel):
+            model.timeline_time = now if self.clock.stepped else None
+
     def movenode(self, node: CoreNode, dt: float) -> bool:
         """
         Calculate next node location and update its coordinates.
@@ -691,6 +1094,65 @@ class WayPointMobility(WirelessModel):
         self.setnodeposition(node, x1 + dx, y1 + dy, z1)
         return True
 
+    def movenodes(self, nodes: List[CoreNode], dt: float) -> List[CoreNode]:
+        """
+        Vectorized version of movenode(), calculating next locations for all
+        nodes at once, followed by a single broadcast for all moved nodes.
+
+        :param nodes: nodes to move
+        :param dt: move factor
+        :return: nodes that were moved
+        """
+        moved = []
+        vector_nodes = []
+        for node in nodes:
+            if node.id not in self.points:
+                continue
+            x, y, _ = node.position.get()
+            if x is None or y is None:
+                if self.movenode(node, dt):
+                    moved.append(node)
+            else:
+                vector_nodes.append(node)
+        if not vector_nodes:
+            return moved
+        current = [x.position.get() for x in vector_nodes]
+        points = [self.points[x.id] for x in vector_nodes]
+        x1, y1 = np.array([x[:2] for x in current], dtype=float).T
+        x2, y2 = np.array([x.coords[:2] for x in points], dtype=float).T
+        speed = np.array([x.speed for x in points], dtype=float)
+        # linear speed value
+        alpha = np.arctan2(y2 - y1, x2 - x1)
+        dx = speed * np.cos(alpha) * dt
+        dy = speed * np.sin(alpha) * dt
+        # prevent overshoot
+        dx = np.where(np.abs(dx) > np.abs(x2 - x1), x2 - x1, dx)
+        dy = np.where(np.abs(dy) > np.abs(y2 - y1), y2 - y1, dy)
+        arrived = (dx == 0.0) & (dy == 0.0)
+        # prevent moving below zero
+        dx = np.where(x1 + dx < 0.0, 0.0 - x1, dx)
+        dy = np.where(y1 + dy < 0.0, 0.0 - y1, dy)
+        x, y = (x1 + dx).tolist(), (y1 + dy).tolist()
+        broadcast = []
+        for index, node in enumerate(vector_nodes):
+            point = points[index]
+            if point.speed == 0:
+                # instantaneous move
+                node.position.set(*point.coords)
+                del self.points[node.id]
+            elif arrived[index]:
+                # the last node to reach the last waypoint determines this
+                # script's endtime
+                if self.endtime < (self.lasttime - self.timezero):
+                    self.endtime = self.lasttime - self.timezero
+                del self.points[node.id]
+                continue
+            else:
+                node.position.set(x[index], y[index], current[index][2])
+            broadcast.append(node)
+        self.session.broadcast_nodes(broadcast)
+        return moved + broadcast
+
     def movenodesinitial(self) -> None:
         """
         Move nodes to their initial positions. Then calculate the ranges.
@@ -698,13 +1160,16 @@ class WayPointMobility(WirelessModel):
         :return: nothing
         """
         moved_ifaces = []
+        moved_nodes = {}
         for iface in self.net.get_ifaces():
             node = iface.node
             if node.id not in self.initial:
                 continue
             x, y, z = self.initial[node.id].coords
-            self.setnodeposition(node, x, y, z)
+            node.position.set(x, y, z)
+            moved_nodes[node.id] = node
             moved_ifaces.append(iface)
+        self.session.broadcast_nodes(moved_nodes.values())
         self.net.model.update(moved_ifaces)
 
     def addwaypoint(
@@ -817,7 +1282,7 @@ class WayPointMobility(WirelessModel):
             self.lasttime = 0
             self.run()
         elif laststate == self.STATE_PAUSED:
-            now = time.monotonic()
+            now = self.clock.now()
             self.timezero += now - self.lasttime
             self.lasttime = now - (0.001 * self.refresh_ms)
             self.runround()
@@ -845,7 +1310,7 @@ class WayPointMobility(WirelessModel):
         :return: nothing
         """
         self.state = self.STATE_PAUSED
-        self.lasttime = time.monotonic()
+        self.lasttime = self.clock.now()
 
 
 class Ns2ScriptedMobility(WayPointMobility):
@@ -866,6 +1331,11 @@ class Ns2ScriptedMobility(WayPointMobility):
         ConfigString(id="script_stop", label="script file to run upon stop"),
     ]
 
+    # scripts of this size or larger are streamed, instead of loaded up front
+    stream_size: int = 16 * 1024 * 1024
+    # script time of waypoints to keep queued ahead, when streaming
+    lookahead: float = 10.0
+
     @classmethod
     def config_groups(cls) -> List[ConfigGroup]:
         return [
@@ -886,6 +1356,8 @@ class Ns2ScriptedMobility(WayPointMobility):
         self.script_start: Optional[str] = None
         self.script_pause: Optional[str] = None
         self.script_stop: Optional[str] = None
+        self.reader: Optional[TraceReader] = None
+        self.read_time: float = 0.0
 
     def update_config(self, config: Dict[str, str]) -> None:
         self.file = Path(config["file"])
@@ -909,14 +1381,24 @@ class Ns2ScriptedMobility(WayPointMobility):
         """
         Read in mobility script from a file. This adds waypoints to a
         priority queue, sorted by waypoint time. Initial waypoints are
-        stored in a separate dict.
+        stored in a separate dict. Binary traces and large scripts are streamed
+        instead, using readscriptstream().
 
         :return: nothing
         """
         file_path = self.findfile(self.file)
+        if self.reader:
+            self.reader.close()
+            self.reader = None
         try:
+            if (
+                is_binary_trace(file_path)
+                or file_path.stat().st_size >= self.stream_size
+            ):
+                self.readscriptstream(file_path)
+                return
             f = file_path.open("r")
-        except IOError:
+        except (IOError, ValueError):
             logger.exception(
                 "ns-2 scripted mobility failed to load file: %s", self.file
             )
@@ -971,6 +1453,74 @@ class Ns2ScriptedMobility(WayPointMobility):
         if ix is not None and iy is not None:
             self.addinitial(self.map(inodenum), ix, iy, iz)
 
+    def readscriptstream(self, file_path: Path) -> None:
+        """
+        Open a mobility script or binary trace for streaming. Initial waypoints
+        are read up front, while other waypoints are queued as script time
+        advances.
+
+        :param file_path: script file to stream
+        :return: nothing
+        :raises OSError: when failing to open the file
+        :raises ValueError: when a binary trace is not valid
+        """
+        logger.info("streaming mobility script file: %s", file_path)
+        self.reader = open_trace(file_path)
+        for nodenum, (x, y, z) in self.reader.initial.items():
+            self.addinitial(self.map(nodenum), x, y, z)
+        self.seek(0.0)
+
+    def seek(self, script_time: float) -> None:
+        """
+        Move a streamed script to the provided script time, replacing queued
+        waypoints with those following it.
+
+        :param script_time: script time to move to
+        :return: nothing
+        """
+        self.queue = []
+        self.read_time = script_time
+        self.fillwaypoints(script_time + self.lookahead)
+
+    def fillwaypoints(self, until: float) -> None:
+        """
+        Queue waypoints from a streamed script up to the provided script time,
+        reading further when needed to have a next waypoint queued.
+
+        :param until: script time to queue waypoints up to
+        :return: nothing
+        """
+        while self.read_time <= self.reader.end_time and (
+            self.read_time < until or not self.queue
+        ):
+            end = self.read_time + self.lookahead
+            for line_time, nodenum, x, y, z, speed in self.reader.read(
+                self.read_time, end
+            ):
+                self.addwaypoint(line_time, self.map(nodenum), x, y, z, speed)
+            self.read_time = end
+
+    def updatepoints(self, now: float) -> None:
+        if self.reader:
+            self.fillwaypoints(now + self.lookahead)
+        super().updatepoints(now)
+
+    def copywaypoints(self) -> None:
+        if not self.reader:
+            super().copywaypoints()
+
+    def loopwaypoints(self) -> bool:
+        if not self.reader:
+            return super().loopwaypoints()
+        self.seek(0.0)
+        return self.loop
+
+    def setendtime(self) -> None:
+        if not self.reader:
+            super().setendtime()
+        else:
+            self.endtime = self.reader.end_time
+
     def findfile(self, file_path: Path) -> Path:
         """
         Locate a script file. If the specified file doesn't exist, look in the
@@ -0,0 +1,361 @@
+"""
+trace.py: readers for mobility trace files, providing waypoints by script time
+without loading a whole trace into memory.
+"""
+
+import abc
+import array
+import bisect
+import logging
+import math
+import mmap
+import re
+import struct
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Pattern, Tuple
+
+logger = logging.getLogger(__name__)
+
+# script time, node number, x, y, z and speed of a waypoint
+TraceRow = Tuple[float, int, float, float, Optional[float], float]
+TracePosition = Tuple[Optional[float], Optional[float], Optional[float]]
+
+NS2_CHUNK_SIZE: int = 1024 * 1024
+NS2_TIME_REGEX: Pattern = re.compile(rb"^\$ns_ at\s+(\S+)", re.MULTILINE)
+NS2_WAYPOINT_REGEX: Pattern = re.compile(
+    rb'^\$ns_ at\s+(\S+)\s+"?\$node_\((\w+)\)\s+setdest\s+(\S+)\s+(\S+)\s+([^"\s]+)',
+    re.MULTILINE,
+)
+NS2_INITIAL_REGEX: Pattern = re.compile(
+    rb"^\$node_\((\w+)\)\s+set\s+([XYZ])_\s+(\S+)", re.MULTILINE
+)
+
+
+# binary traces contain a header, initial positions, waypoint columns sorted by
+# time and a sparse index of every index step time, all little endian
+BINARY_MAGIC: bytes = b"CORETRC1"
+BINARY_VERSION: int = 1
+BINARY_INDEX_STEP: int = 4096
+BINARY_HEADER: struct.Struct = struct.Struct("<8sIIQQQ")
+BINARY_INITIAL: struct.Struct = struct.Struct("<qddd")
+# column name and array type code, in file order
+BINARY_COLUMNS: List[Tuple[str, str]] = [
+    ("time", "d"),
+    ("node", "q"),
+    ("x", "d"),
+    ("y", "d"),
+    ("z", "d"),
+    ("speed", "d"),
+]
+
+
+@dataclass
+class TraceChunk:
+    """
+    Section of a trace file, along with the range of script times within it.
+    """
+
+    offset: int
+    end: int
+    start_time: float
+    end_time: float
+
+
+class TraceReader(abc.ABC):
+    """
+    Base class for mobility trace readers, providing initial positions and
+    waypoints within a range of script time.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Create a TraceReader instance.
+
+        :param path: trace file to read
+        """
+        self.path: Path = path
+        self.initial: Dict[int, TracePosition] = {}
+        self.end_time: float = 0.0
+
+    @abc.abstractmethod
+    def read(self, start: float, end: float) -> List[TraceRow]:
+        """
+        Read waypoints with a script time within the provided range.
+
+        :param start: start of script time range, inclusive
+        :param end: end of script time range, exclusive
+        :return: waypoints within range
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """
+        Release resources held by the reader.
+
+        :return: nothing
+        """
+        raise NotImplementedError
+
+
+class Ns2TraceReader(TraceReader):
+    """
+    Memory mapped reader for ns-2 mobility scripts, indexing the file into chunks
+    by script time and parsing waypoints of a chunk only when requested.
+    """
+
+    def __init__(self, path: Path, chunk_size: int = NS2_CHUNK_SIZE) -> None:
+        """
+        Create a Ns2TraceReader instance.
+
+        :param path: ns-2 script file to read
+        :param chunk_size: approximate size of indexed chunks
+        :raises OSError: when failing to open the file
+        """
+        super().__init__(path)
+        self.chunks: List[TraceChunk] = []
+        self.cache: Tuple[int, List[TraceRow]] = (-1, [])
+        with path.open("rb") as f:
+            size = path.stat().st_size
+            self.mmap: Optional[mmap.mmap] = None
+            if size:
+                self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._index(chunk_size)
+
+    def _index(self, chunk_size: int) -> None:
+        if self.mmap is None:
+            return
+        size = len(self.mmap)
+        initial = {}
+        offset = 0
+        while offset < size:
+            end = min(offset + chunk_size, size)
+            newline = self.mmap.find(b"\n", end - 1)
+            end = size if newline == -1 else newline + 1
+            data = self.mmap[offset:end]
+            times = []
+            for value in NS2_TIME_REGEX.findall(data):
+                try:
+                    times.append(float(value))
+                except ValueError:
+                    logger.warning("invalid ns-2 waypoint time: %s", value)
+            if times:
+                chunk = TraceChunk(offset, end, min(times), max(times))
+                self.chunks.append(chunk)
+                self.end_time = max(self.end_time, chunk.end_time)
+            for match in NS2_INITIAL_REGEX.finditer(data):
+                node, axis, value = match.groups()
+                try:
+                    position = initial.setdefault(int(node), [None, None, None])
+                    position["XYZ".index(axis.decode())] = float(value)
+                except ValueError:
+                    logger.warning("invalid ns-2 initial position: %s", match.group())
+            offset = end
+        for node, (x, y, z) in initial.items():
+            if x is not None and y is not None:
+                self.initial[node] = (x, y, z)
+
+    def _parse(self, index: int) -> List[TraceRow]:
+        if self.cache[0] == index:
+            return self.cache[1]
+        chunk = self.chunks[index]
+        data = self.mmap[chunk.offset : chunk.end]
+        rows = []
+        for match in NS2_WAYPOINT_REGEX.finditer(data):
+            try:
+                line_time, node, x, y, speed = match.groups()
+                row = (float(line_time), int(node), float(x), float(y), None)
+                rows.append(row + (float(speed),))
+            except ValueError:
+                logger.warning("invalid ns-2 waypoint: %s", match.group())
+        self.cache = (index, rows)
+        return rows
+
+    def read(self, start: float, end: float) -> List[TraceRow]:
+        rows = []
+        for index, chunk in enumerate(self.chunks):
+            if chunk.end_time < start or chunk.start_time >= end:
+                continue
+            rows.extend(x for x in self._parse(index) if start <= x[0] < end)
+        return rows
+
+    def close(self) -> None:
+        self.cache = (-1, [])
+        if self.mmap is not None:
+            self.mmap.close()
+            self.mmap = None
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def is_binary_trace(path: Path) -> bool:
+    """
+    Check if a file is a binary mobility trace.
+
+    :param path: file to check
+    :return: True if a binary trace, False otherwise
+    :raises OSError: when failing to read the file
+    """
+    with path.open("rb") as f:
+        return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+class BinaryTraceReader(TraceReader):
+    """
+    Memory mapped reader for binary mobility traces, seeking to script times
+    using the trace time index.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Create a BinaryTraceReader instance.
+
+        :param path: binary trace file to read
+        :raises OSError: when failing to open the file
+        :raises ValueError: when the file is not a valid binary trace
+        """
+        super().__init__(path)
+        if sys.byteorder != "little":
+            raise ValueError("binary traces are only supported on little endian")
+        with path.open("rb") as f:
+            self.mmap: Optional[mmap.mmap] = mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        self.views: List[memoryview] = []
+        try:
+            self._load()
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+    def _view(self, offset: int, count: int, type_code: str) -> memoryview:
+        size = count * struct.calcsize(type_code)
+        if offset + size > len(self.mmap):
+            raise ValueError(f"truncated binary trace: {self.path}")
+        view = memoryview(self.mmap)[offset : offset + size].cast(type_code)
+        self.views.append(view)
+        return view
+
+    def _load(self) -> None:
+        magic, version, step, rows, initial, index = BINARY_HEADER.unpack_from(
+            self.mmap
+        )
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError(f"invalid binary trace: {self.path}")
+        self.step: int = step
+        self.rows: int = rows
+        offset = BINARY_HEADER.size
+        for _ in range(initial):
+            node, x, y, z = BINARY_INITIAL.unpack_from(self.mmap, offset)
+            self.initial[node] = (x, y, _optional(z))
+            offset += BINARY_INITIAL.size
+        self.columns: Dict[str, memoryview] = {}
+        for name, type_code in BINARY_COLUMNS:
+            self.columns[name] = self._view(offset, rows, type_code)
+            offset += rows * struct.calcsize(type_code)
+        self.index: memoryview = self._view(offset, index, "d")
+        if rows:
+            self.end_time = self.columns["time"][rows - 1]
+
+    def find(self, script_time: float) -> int:
+        """
+        Find the first waypoint row at or after the provided script time.
+
+        :param script_time: script time to find
+        :return: row index, the number of rows when there is none
+        """
+        position = bisect.bisect_left(self.index, script_time)
+        low = max(0, (position - 1) * self.step)
+        high = min(self.rows, position * self.step)
+        return bisect.bisect_left(self.columns["time"], script_time, low, high)
+
+    def read(self, start: float, end: float) -> List[TraceRow]:
+        first = self.find(start)
+        last = self.find(end)
+        columns = [self.columns[x][first:last].tolist() for x, _ in BINARY_COLUMNS]
+        times, nodes, xs, ys, zs, speeds = columns
+        zs = [_optional(x) for x in zs]
+        return list(zip(times, nodes, xs, ys, zs, speeds))
+
+    def close(self) -> None:
+        for view in self.views:
+            view.release()
+        self.views = []
+        if self.mmap is not None:
+            self.mmap.close()
+            self.mmap = None
+
+
+def open_trace(path: Path) -> TraceReader:
+    """
+    Open a mobility trace with the reader for its format.
+
+    :param path: trace file to open
+    :return: trace reader
+    :raises OSError: when failing to open the file
+    :raises ValueError: when a binary trace is not valid
+    """
+    if is_binary_trace(path):
+        return BinaryTraceReader(path)
+    return Ns2TraceReader(path)
+
+
+def write_binary_trace(
+    f: BinaryIO, initial: Dict[int, TracePosition], rows: List[TraceRow]
+) -> None:
+    """
+    Write a binary mobility trace.
+
+    :param f: file to write to
+    :param initial: initial positions by node number
+    :param rows: waypoints to write, sorted by time
+    :return: nothing
+    """
+    index = array.array("d", (x[0] for x in rows[::BINARY_INDEX_STEP]))
+    positions = [(n, x, y, z) for n, (x, y, z) in initial.items() if x is not None]
+    header = BINARY_HEADER.pack(
+        BINARY_MAGIC,
+        BINARY_VERSION,
+        BINARY_INDEX_STEP,
+        len(rows),
+        len(positions),
+        len(index),
+    )
+    f.write(header)
+    for node, x, y, z in positions:
+        f.write(BINARY_INITIAL.pack(node, x, y, math.nan if z is None else z))
+    for column, (_, type_code) in enumerate(BINARY_COLUMNS):
+        values = (row[column] for row in rows)
+        if type_code == "d":
+            values = (math.nan if x is None else x for x in values)
+        data = array.array(type_code, values)
+        if sys.byteorder != "little":
+            data.byteswap()
+        data.tofile(f)
+    if sys.byteorder != "little":
+        index.byteswap()
+    index.tofile(f)
+
+
+def convert_ns2(src: Path, dst: Path) -> int:
+    """
+    Convert an ns-2 mobility script into a binary mobility trace.
+
+    :param src: ns-2 script to convert
+    :param dst: binary trace file to create
+    :return: number of waypoints written
+    :raises OSError: when failing to read or write files
+    """
+    reader = Ns2TraceReader(src)
+    try:
+        rows = reader.read(-math.inf, math.inf)
+    finally:
+        reader.close()
+    rows.sort(key=lambda x: x[0])
+    with dst.open("wb") as f:
+        write_binary_trace(f, reader.initial, rows)
+    return len(rows)
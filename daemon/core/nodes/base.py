@@ -3,6 +3,7 @@ Defines the base logic for nodes used within core.
 """
 import abc
 import logging
+import shlex
 import shutil
 import threading
 from pathlib import Path
@@ -13,12 +14,14 @@ import netaddr
 
 from core import utils
 from core.configservice.dependencies import ConfigServiceDependencies
+from core.emulator.batch import host_runner
 from core.emulator.data import InterfaceData, LinkData
-from core.emulator.enumerations import LinkTypes, MessageFlags, NodeTypes
+from core.emulator.enumerations import EventTypes, LinkTypes, MessageFlags, NodeTypes
 from core.errors import CoreCommandError, CoreError
 from core.executables import BASH, MOUNT, TEST, VCMD, VNODED
 from core.nodes.interface import DEFAULT_MTU, CoreInterface, TunTap, Veth
 from core.nodes.netclient import LinuxNetClient, get_net_client
+from core.nodes.vnodeclient import VnodeClientPool, create_pool
 
 logger = logging.getLogger(__name__)
 
@@ -74,8 +77,9 @@ class NodeBase(abc.ABC):
         self.icon: Optional[str] = None
         self.position: Position = Position()
         self.up: bool = False
+        use_netlink = self.session.use_netlink() and server is None
         self.net_client: LinuxNetClient = get_net_client(
-            self.session.use_ovs(), self.host_cmd
+            self.session.use_ovs(), self.host_cmd, use_netlink
         )
 
     @abc.abstractmethod
@@ -115,10 +119,16 @@ class NodeBase(abc.ABC):
         :return: combined stdout and stderr
         :raises CoreCommandError: when a non-zero exit status occurs
         """
-        if self.server is None:
-            return utils.cmd(args, env, cwd, wait, shell)
-        else:
-            return self.server.remote_cmd(args, env, cwd, wait)
+        command_batch = self.session.command_batch
+        if command_batch is not None:
+            run = host_runner(self.server)
+            if command_batch.submit(self.server, args, run, env, cwd, wait, shell):
+                return ""
+        with self.session.tracer.span("host_cmd", "node", node_id=self.id, cmd=args):
+            if self.server is None:
+                return utils.cmd(args, env, cwd, wait, shell)
+            else:
+                return self.server.remote_cmd(args, env, cwd, wait)
 
     def setposition(self, x: float = None, y: float = None, z: float = None) -> bool:
         """
@@ -405,6 +415,7 @@ class CoreNodeBase(NodeBase):
             raise CoreError(f"interface({iface_id}) already exists")
         self.ifaces[iface_id] = iface
         iface.node_id = iface_id
+        self.session.add_host_iface(iface.localname, self.id, iface_id)
 
     def delete_iface(self, iface_id: int) -> None:
         """
@@ -416,6 +427,7 @@ class CoreNodeBase(NodeBase):
         if iface_id not in self.ifaces:
             raise CoreError(f"node({self.name}) interface({iface_id}) does not exist")
         iface = self.ifaces.pop(iface_id)
+        self.session.remove_host_iface(iface.localname)
         logger.info("node(%s) removing interface(%s)", self.name, iface.name)
         iface.detachnet()
         iface.shutdown()
@@ -506,6 +518,10 @@ class CoreNode(CoreNodeBase):
         self.pid: Optional[int] = None
         self.lock: RLock = RLock()
         self._mounts: List[Tuple[Path, Path]] = []
+        self.client_pool: Optional[VnodeClientPool] = None
+        # node environment exported through commands, when the namespace was not
+        # created with it
+        self.cmd_env: Dict[str, str] = {}
         self.node_net_client: LinuxNetClient = self.create_node_net_client(
             self.session.use_ovs()
         )
@@ -518,7 +534,8 @@ class CoreNode(CoreNodeBase):
         :param use_ovs: True for OVS bridges, False for Linux bridges
         :return: node network client
         """
-        return get_net_client(use_ovs, self.cmd)
+        use_netlink = self.session.use_netlink() and self.server is None
+        return get_net_client(use_ovs, self.cmd, use_netlink, lambda: self.pid)
 
     def alive(self) -> bool:
         """
@@ -541,6 +558,8 @@ class CoreNode(CoreNodeBase):
         :return: nothing
         """
         with self.lock:
+            if self.directory is None and self._start_pooled():
+                return
             self.makenodedir()
             if self.up:
                 raise ValueError("starting a node that is already up")
@@ -552,11 +571,13 @@ class CoreNode(CoreNodeBase):
             if self.directory:
                 vnoded += f" -C {self.directory}"
             env = self.session.get_environment(state=False)
-            env["NODE_NUMBER"] = str(self.id)
-            env["NODE_NAME"] = str(self.name)
+            env.update(self.get_environment())
             output = self.host_cmd(vnoded, env=env)
             self.pid = int(output)
             logger.debug("node(%s) pid: %s", self.name, self.pid)
+            # open persistent control channel connections for local nodes
+            if self.server is None:
+                self.client_pool = create_pool(self.ctrlchnlname)
             # bring up the loopback interface
             logger.debug("bringing up loopback interface")
             self.node_net_client.device_up("lo")
@@ -569,6 +590,45 @@ class CoreNode(CoreNodeBase):
             for dir_path in PRIVATE_DIRS:
                 self.create_dir(dir_path)
 
+    def get_environment(self) -> Dict[str, str]:
+        """
+        Retrieve the node specific environment variables, added to the session
+        environment for commands run within the node.
+
+        :return: node environment variables
+        """
+        return {"NODE_NUMBER": str(self.id), "NODE_NAME": str(self.name)}
+
+    def _start_pooled(self) -> bool:
+        """
+        Start node within an idle namespace claimed from the session warm pool,
+        when available for runtime nodes, only applying node specific setup.
+        The pool namespaces run with the session environment, so node specific
+        variables are exported through the commands run within the node.
+
+        :return: True if started using the warm pool, False otherwise
+        """
+        pool = self.session.node_pool
+        if pool is None or self.server is not None or self.up:
+            return False
+        if self.session.state != EventTypes.RUNTIME_STATE:
+            return False
+        directory = self.session.directory / f"{self.name}.conf"
+        namespace = pool.claim(self.ctrlchnlname, directory)
+        if namespace is None:
+            return False
+        self.directory = directory
+        self.tmpnodedir = True
+        self.pid = namespace.pid
+        self.cmd_env = self.get_environment()
+        logger.debug("node(%s) claimed pooled pid: %s", self.name, self.pid)
+        self.client_pool = create_pool(self.ctrlchnlname)
+        logger.debug("setting hostname: %s", self.name)
+        self.node_net_client.set_hostname(self.name)
+        self.up = True
+        self._mounts = list(namespace.mounts)
+        return True
+
     def shutdown(self) -> None:
         """
         Shutdown logic for simple lxc nodes.
@@ -586,6 +646,10 @@ class CoreNode(CoreNodeBase):
                 # shutdown all interfaces
                 for iface in self.get_ifaces():
                     iface.shutdown()
+                # close persistent control channel connections
+                if self.client_pool is not None:
+                    self.client_pool.close()
+                    self.client_pool = None
                 # kill node process if present
                 try:
                     self.host_cmd(f"kill -9 {self.pid}")
@@ -598,6 +662,8 @@ class CoreNode(CoreNodeBase):
                     logger.exception("error removing node directory")
                 # clear interface data, close client, and mark self and not up
                 self.ifaces.clear()
+                self.cmd_env = {}
+                self.node_net_client.close()
                 self.up = False
             except OSError:
                 logger.exception("error during shutdown")
@@ -616,6 +682,21 @@ class CoreNode(CoreNodeBase):
             args = f'{BASH} -c "{args}"'
         return f"{VCMD} -c {self.ctrlchnlname} -- {args}"
 
+    def _env_args(self, args: str, shell: bool = False) -> str:
+        """
+        Export the node command environment to command arguments, when set.
+
+        :param args: command arguments
+        :param shell: True to run shell like, False otherwise
+        :return: command arguments
+        """
+        if shell:
+            args = f'{BASH} -c "{args}"'
+        if self.cmd_env:
+            env = " ".join(f"{k}={shlex.quote(v)}" for k, v in self.cmd_env.items())
+            args = f"env {env} {args}"
+        return args
+
     def cmd(self, args: str, wait: bool = True, shell: bool = False) -> str:
         """
         Runs a command that is used to configure and setup the network within a
@@ -627,11 +708,37 @@ class CoreNode(CoreNodeBase):
         :return: combined stdout and stderr
         :raises CoreCommandError: when a non-zero exit status occurs
         """
-        args = self._create_cmd(args, shell)
+        command_batch = self.session.command_batch
+        if command_batch is not None:
+            target = (self.server, self.id)
+            run = self._batch_cmd
+            if command_batch.submit(target, args, run, wait=wait, shell=shell):
+                return ""
+        with self.session.tracer.span("cmd", "node", node_id=self.id, cmd=args):
+            if self.cmd_env:
+                args, shell = self._env_args(args, shell), False
+            client_pool = self.client_pool
+            if wait and client_pool is not None:
+                try:
+                    return client_pool.cmd(args, shell)
+                except (OSError, ValueError) as e:
+                    logger.warning(
+                        "node(%s) control channel error, using vcmd: %s", self.name, e
+                    )
+                    client_pool.close()
+                    self.client_pool = None
+            args = self._create_cmd(args, shell)
+            if self.server is None:
+                return utils.cmd(args, wait=wait, shell=shell)
+            else:
+                return self.server.remote_cmd(args, wait=wait)
+
+    def _batch_cmd(self, args: str, data: str) -> str:
+        args = self._create_cmd(self._env_args(args))
         if self.server is None:
-            return utils.cmd(args, wait=wait, shell=shell)
+            return utils.cmd(args, stdin=data)
         else:
-            return self.server.remote_cmd(args, wait=wait)
+            return self.server.remote_cmd(args, stdin=data)
 
     def path_exists(self, path: str) -> bool:
         """
@@ -653,7 +760,7 @@ class CoreNode(CoreNodeBase):
         :param sh: shell to execute command in
         :return: str
         """
-        terminal = self._create_cmd(sh)
+        terminal = self._create_cmd(self._env_args(sh))
         if self.server is None:
             return terminal
         else:
@@ -940,6 +1047,7 @@ class CoreNetworkBase(NodeBase):
         self.brname: Optional[str] = None
         self.linked: Dict[CoreInterface, Dict[CoreInterface, bool]] = {}
         self.linked_lock: threading.Lock = threading.Lock()
+        self.lock: RLock = RLock()
 
     @abc.abstractmethod
     def startup(self) -> None:
@@ -980,6 +1088,15 @@ class CoreNetworkBase(NodeBase):
         """
         raise NotImplementedError
 
+    def next_iface_id(self) -> int:
+        """
+        Retrieve a new interface index.
+
+        :return: new interface index
+        """
+        with self.lock:
+            return super().next_iface_id()
+
     def get_linked_iface(self, net: "CoreNetworkBase") -> Optional[CoreInterface]:
         """
         Return the interface that links this net with another net.
@@ -999,11 +1116,12 @@ class CoreNetworkBase(NodeBase):
         :param iface: network interface to attach
         :return: nothing
         """
-        i = self.next_iface_id()
-        self.ifaces[i] = iface
-        iface.net_id = i
-        with self.linked_lock:
-            self.linked[iface] = {}
+        with self.lock:
+            i = self.next_iface_id()
+            self.ifaces[i] = iface
+            iface.net_id = i
+            with self.linked_lock:
+                self.linked[iface] = {}
 
     def detach(self, iface: CoreInterface) -> None:
         """
@@ -1012,10 +1130,11 @@ class CoreNetworkBase(NodeBase):
         :param iface: network interface to detach
         :return: nothing
         """
-        del self.ifaces[iface.net_id]
-        iface.net_id = None
-        with self.linked_lock:
-            del self.linked[iface]
+        with self.lock:
+            del self.ifaces[iface.net_id]
+            iface.net_id = None
+            with self.linked_lock:
+                del self.linked[iface]
 
     def links(self, flags: MessageFlags = MessageFlags.NONE) -> List[LinkData]:
         """
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 import netaddr
 
 from core import utils
+from core.emulator.batch import host_runner
 from core.emulator.data import InterfaceData, LinkOptions
 from core.emulator.enumerations import TransportType
 from core.errors import CoreCommandError, CoreError
@@ -121,8 +122,9 @@ class CoreInterface:
         # id used to find flow data
         self.flow_id: Optional[int] = None
         self.server: Optional["DistributedServer"] = server
+        use_netlink = self.session.use_netlink() and server is None
         self.net_client: LinuxNetClient = get_net_client(
-            self.session.use_ovs(), self.host_cmd
+            self.session.use_ovs(), self.host_cmd, use_netlink
         )
         self.control: bool = False
         # configuration data
@@ -150,10 +152,16 @@ class CoreInterface:
         :return: combined stdout and stderr
         :raises CoreCommandError: when a non-zero exit status occurs
         """
-        if self.server is None:
-            return utils.cmd(args, env, cwd, wait, shell)
-        else:
-            return self.server.remote_cmd(args, env, cwd, wait)
+        command_batch = self.session.command_batch
+        if command_batch is not None:
+            run = host_runner(self.server)
+            if command_batch.submit(self.server, args, run, env, cwd, wait, shell):
+                return ""
+        with self.session.tracer.span("host_cmd", "iface", iface=self.name, cmd=args):
+            if self.server is None:
+                return utils.cmd(args, env, cwd, wait, shell)
+            else:
+                return self.server.remote_cmd(args, env, cwd, wait)
 
     def startup(self) -> None:
         """
@@ -312,6 +320,11 @@ class CoreInterface:
         :param use_local: True to use localname for device, False for name
         :return: nothing
         """
+        node_id = self.node.id if self.node else None
+        with self.session.tracer.span("iface_config", "iface", node_id=node_id):
+            self._config(options, use_local)
+
+    def _config(self, options: LinkOptions, use_local: bool) -> None:
         # determine name, options, and if anything has changed
         name = self.localname if use_local else self.name
         current_options = self.local_options if use_local else self.options
@@ -1,11 +1,15 @@
 """
 Clients for dealing with bridge/interface commands.
 """
-from typing import Callable
+import socket
+from typing import Callable, Dict, Optional, Tuple
 
 import netaddr
 
+from core.errors import CoreCommandError
 from core.executables import ETHTOOL, IP, OVS_VSCTL, SYSCTL, TC
+from core.nodes import netlink
+from core.nodes.netlink import NetlinkSocket
 
 
 class LinuxNetClient:
@@ -306,6 +310,231 @@ class LinuxNetClient:
         """
         self.run(f"{IP} link set {name} mtu {value}")
 
+    def close(self) -> None:
+        """
+        Release any resources held by the client.
+
+        :return: nothing
+        """
+        pass
+
+
+class NetlinkNetClient(LinuxNetClient):
+    """
+    Client for creating Linux bridges and ip interfaces using in-process
+    rtnetlink requests, falling back to commands for everything else.
+    """
+
+    def __init__(
+        self, run: Callable[..., str], netns: Callable[[], Optional[int]] = None
+    ) -> None:
+        """
+        Create NetlinkNetClient instance.
+
+        :param run: function to run commands with
+        :param netns: function providing the pid of the network namespace to
+            operate within, None to operate on the host
+        """
+        super().__init__(run)
+        self.netns: Optional[Callable[[], Optional[int]]] = netns
+        self._socket: Optional[NetlinkSocket] = None
+
+    def _sock(self, cmd: str) -> NetlinkSocket:
+        if self.netns is None:
+            return netlink.host_socket()
+        pid = self.netns()
+        if pid is None:
+            self.close()
+            raise CoreCommandError(-1, cmd, "", "network namespace is not running")
+        if self._socket is None or self._socket.pid != pid:
+            self.close()
+            try:
+                self._socket = NetlinkSocket(pid)
+            except OSError as e:
+                raise CoreCommandError(-1, f"setns {pid}", "", str(e))
+        return self._socket
+
+    def _get_link(self, device: str) -> Tuple[int, Dict[int, bytes]]:
+        cmd = f"{IP} link show {device}"
+        payload = netlink.pack_ifinfo() + netlink.pack_str(netlink.IFLA_IFNAME, device)
+        responses = self._sock(cmd).request(cmd, netlink.RTM_GETLINK, 0, payload)
+        for msg_type, body in responses:
+            if msg_type == netlink.RTM_NEWLINK:
+                _, _, index, _, _ = netlink.IFINFOMSG.unpack_from(body)
+                attrs = netlink.parse_attrs(body[netlink.IFINFOMSG.size :])
+                return index, attrs
+        raise CoreCommandError(1, cmd, "", f"Device {device} does not exist.")
+
+    def _set_link(self, cmd: str, device: str, attrs: bytes, flags: int = 0) -> None:
+        index = self.get_ifindex(device)
+        payload = netlink.pack_ifinfo(index, flags, flags) + attrs
+        self._sock(cmd).request(cmd, netlink.RTM_NEWLINK, 0, payload)
+
+    def device_up(self, device: str) -> None:
+        """
+        Bring a device up.
+
+        :param device: device to bring up
+        :return: nothing
+        """
+        self._set_link(f"{IP} link set {device} up", device, b"", netlink.IFF_UP)
+
+    def device_name(self, device: str, name: str) -> None:
+        """
+        Set a device name.
+
+        :param device: device to set name for
+        :param name: name to set
+        :return: nothing
+        """
+        cmd = f"{IP} link set {device} name {name}"
+        self._set_link(cmd, device, netlink.pack_str(netlink.IFLA_IFNAME, name))
+
+    def get_mac(self, device: str) -> str:
+        """
+        Retrieve MAC address for a given device.
+
+        :param device: device to get mac for
+        :return: MAC address
+        """
+        _, attrs = self._get_link(device)
+        mac = attrs.get(netlink.IFLA_ADDRESS, b"")
+        return ":".join(f"{x:02x}" for x in mac)
+
+    def get_ifindex(self, device: str) -> int:
+        """
+        Retrieve ifindex for a given device.
+
+        :param device: device to get ifindex for
+        :return: ifindex
+        """
+        index, _ = self._get_link(device)
+        return index
+
+    def device_ns(self, device: str, namespace: str) -> None:
+        """
+        Set netns for a device.
+
+        :param device: device to setns for
+        :param namespace: namespace to set device to
+        :return: nothing
+        """
+        if not namespace.isdigit():
+            super().device_ns(device, namespace)
+            return
+        cmd = f"{IP} link set {device} netns {namespace}"
+        attrs = netlink.pack_u32(netlink.IFLA_NET_NS_PID, int(namespace))
+        self._set_link(cmd, device, attrs)
+
+    def create_address(self, device: str, address: str, broadcast: str = None) -> None:
+        """
+        Create address for a device.
+
+        :param device: device to add address to
+        :param address: address to add
+        :param broadcast: broadcast address to use, default is None
+        :return: nothing
+        """
+        if broadcast is not None:
+            cmd = f"{IP} address add {address} broadcast {broadcast} dev {device}"
+        else:
+            cmd = f"{IP} address add {address} dev {device}"
+        network = netaddr.IPNetwork(address)
+        if network.version == 4:
+            family = socket.AF_INET
+        else:
+            family = socket.AF_INET6
+        index = self.get_ifindex(device)
+        ip = network.ip.packed
+        payload = netlink.IFADDRMSG.pack(family, network.prefixlen, 0, 0, index)
+        payload += netlink.pack_attr(netlink.IFA_LOCAL, ip)
+        payload += netlink.pack_attr(netlink.IFA_ADDRESS, ip)
+        if broadcast == "+":
+            broadcast = network.broadcast
+        if broadcast is not None:
+            broadcast = netaddr.IPAddress(broadcast).packed
+            payload += netlink.pack_attr(netlink.IFA_BROADCAST, broadcast)
+        flags = netlink.NLM_F_CREATE | netlink.NLM_F_EXCL
+        self._sock(cmd).request(cmd, netlink.RTM_NEWADDR, flags, payload)
+        if network.version == 6:
+            # IPv6 addresses are removed by default on interface down.
+            # Make sure that the IPv6 address we add is not removed
+            self.run(f"{SYSCTL} -w net.ipv6.conf.{device}.keep_addr_on_down=1")
+
+    def create_veth(self, name: str, peer: str) -> None:
+        """
+        Create a veth pair.
+
+        :param name: veth name
+        :param peer: peer name
+        :return: nothing
+        """
+        cmd = f"{IP} link add name {name} type veth peer name {peer}"
+        peer_info = netlink.pack_ifinfo() + netlink.pack_str(netlink.IFLA_IFNAME, peer)
+        info_data = netlink.pack_attr(netlink.VETH_INFO_PEER, peer_info)
+        self._create_link(cmd, name, "veth", info_data)
+
+    def create_bridge(self, name: str) -> None:
+        """
+        Create a Linux bridge and bring it up.
+
+        :param name: bridge name
+        :return: nothing
+        """
+        cmd = (
+            f"{IP} link add name {name} type bridge stp_state 0 forward_delay 0 "
+            f"mcast_snooping 0 group_fwd_mask 65528"
+        )
+        info_data = netlink.pack_u32(netlink.IFLA_BR_STP_STATE, 0)
+        info_data += netlink.pack_u32(netlink.IFLA_BR_FORWARD_DELAY, 0)
+        info_data += netlink.pack_u8(netlink.IFLA_BR_MCAST_SNOOPING, 0)
+        info_data += netlink.pack_u16(netlink.IFLA_BR_GROUP_FWD_MASK, 65528)
+        self._create_link(cmd, name, "bridge", info_data)
+        self.device_up(name)
+
+    def _create_link(self, cmd: str, name: str, kind: str, info_data: bytes) -> None:
+        link_info = netlink.pack_str(netlink.IFLA_INFO_KIND, kind)
+        link_info += netlink.pack_attr(netlink.IFLA_INFO_DATA, info_data)
+        payload = netlink.pack_ifinfo()
+        payload += netlink.pack_str(netlink.IFLA_IFNAME, name)
+        payload += netlink.pack_attr(netlink.IFLA_LINKINFO, link_info)
+        flags = netlink.NLM_F_CREATE | netlink.NLM_F_EXCL
+        self._sock(cmd).request(cmd, netlink.RTM_NEWLINK, flags, payload)
+
+    def set_iface_master(self, bridge_name: str, iface_name: str) -> None:
+        """
+        Assign interface master to a Linux bridge.
+
+        :param bridge_name: bridge name
+        :param iface_name: interface name
+        :return: nothing
+        """
+        cmd = f"{IP} link set dev {iface_name} master {bridge_name}"
+        master = self.get_ifindex(bridge_name)
+        attrs = netlink.pack_u32(netlink.IFLA_MASTER, master)
+        self._set_link(cmd, iface_name, attrs, netlink.IFF_UP)
+
+    def set_mtu(self, name: str, value: int) -> None:
+        """
+        Sets the mtu value for a device.
+
+        :param name: name of device to set value for
+        :param value: mtu value to set
+        :return: nothing
+        """
+        cmd = f"{IP} link set {name} mtu {value}"
+        self._set_link(cmd, name, netlink.pack_u32(netlink.IFLA_MTU, value))
+
+    def close(self) -> None:
+        """
+        Close the namespace netlink socket, when one is open.
+
+        :return: nothing
+        """
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
 
 class OvsNetClient(LinuxNetClient):
     """
@@ -382,15 +611,26 @@ class OvsNetClient(LinuxNetClient):
         self.run(f"{OVS_VSCTL} set bridge {name} other_config:mac-aging-time={value}")
 
 
-def get_net_client(use_ovs: bool, run: Callable[..., str]) -> LinuxNetClient:
+def get_net_client(
+    use_ovs: bool,
+    run: Callable[..., str],
+    use_netlink: bool = False,
+    netns: Callable[[], Optional[int]] = None,
+) -> LinuxNetClient:
     """
     Retrieve desired net client for running network commands.
 
     :param use_ovs: True for OVS bridges, False for Linux bridges
     :param run: function used to run net client commands
+    :param use_netlink: True to use in-process netlink for Linux bridges and
+        interfaces, only valid when commands are run locally
+    :param netns: function providing the pid of the network namespace netlink
+        requests operate within, None for the host
     :return: net client class
     """
     if use_ovs:
         return OvsNetClient(run)
+    elif use_netlink:
+        return NetlinkNetClient(run, netns)
     else:
         return LinuxNetClient(run)
@@ -0,0 +1,264 @@
+"""
+Minimal in-process rtnetlink support, used to configure links and addresses
+without forking ip commands.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import socket
+import struct
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from core.errors import CoreCommandError
+
+NETLINK_ROUTE: int = 0
+
+# netlink message types and flags
+NLMSG_ERROR: int = 2
+NLMSG_DONE: int = 3
+NLM_F_REQUEST: int = 0x1
+NLM_F_ACK: int = 0x4
+NLM_F_EXCL: int = 0x200
+NLM_F_CREATE: int = 0x400
+RTM_NEWLINK: int = 16
+RTM_GETLINK: int = 18
+RTM_NEWADDR: int = 20
+
+# link attributes
+IFLA_ADDRESS: int = 1
+IFLA_IFNAME: int = 3
+IFLA_MTU: int = 4
+IFLA_MASTER: int = 10
+IFLA_LINKINFO: int = 18
+IFLA_NET_NS_PID: int = 19
+IFLA_INFO_KIND: int = 1
+IFLA_INFO_DATA: int = 2
+VETH_INFO_PEER: int = 1
+IFLA_BR_FORWARD_DELAY: int = 1
+IFLA_BR_STP_STATE: int = 5
+IFLA_BR_GROUP_FWD_MASK: int = 9
+IFLA_BR_MCAST_SNOOPING: int = 23
+IFF_UP: int = 0x1
+
+# address attributes
+IFA_ADDRESS: int = 1
+IFA_LOCAL: int = 2
+IFA_BROADCAST: int = 4
+
+CLONE_NEWNET: int = 0x40000000
+
+NLMSG_HEADER: struct.Struct = struct.Struct("=LHHLL")
+RTA_HEADER: struct.Struct = struct.Struct("=HH")
+IFINFOMSG: struct.Struct = struct.Struct("=BxHiII")
+IFADDRMSG: struct.Struct = struct.Struct("=BBBBI")
+NLMSG_ERROR_CODE: struct.Struct = struct.Struct("=i")
+RECV_SIZE: int = 65536
+
+
+def _align(length: int) -> int:
+    return (length + 3) & ~3
+
+
+def pack_attr(attr_type: int, data: bytes) -> bytes:
+    """
+    Pack a netlink route attribute, including alignment padding.
+
+    :param attr_type: attribute type
+    :param data: attribute payload
+    :return: packed attribute
+    """
+    length = RTA_HEADER.size + len(data)
+    padding = b"\0" * (_align(length) - length)
+    return RTA_HEADER.pack(length, attr_type) + data + padding
+
+
+def pack_str(attr_type: int, value: str) -> bytes:
+    return pack_attr(attr_type, value.encode() + b"\0")
+
+
+def pack_u8(attr_type: int, value: int) -> bytes:
+    return pack_attr(attr_type, struct.pack("=B", value))
+
+
+def pack_u16(attr_type: int, value: int) -> bytes:
+    return pack_attr(attr_type, struct.pack("=H", value))
+
+
+def pack_u32(attr_type: int, value: int) -> bytes:
+    return pack_attr(attr_type, struct.pack("=I", value))
+
+
+def pack_ifinfo(index: int = 0, flags: int = 0, change: int = 0) -> bytes:
+    """
+    Pack an ifinfomsg header, used for link messages.
+
+    :param index: interface index, 0 for none
+    :param flags: interface flags to set
+    :param change: mask of interface flags being changed
+    :return: packed header
+    """
+    return IFINFOMSG.pack(socket.AF_UNSPEC, 0, index, flags, change)
+
+
+def parse_attrs(data: bytes) -> Dict[int, bytes]:
+    """
+    Parse a buffer of netlink route attributes.
+
+    :param data: buffer containing attributes
+    :return: mapping of attribute type to raw payload
+    """
+    attrs = {}
+    offset = 0
+    while offset + RTA_HEADER.size <= len(data):
+        length, attr_type = RTA_HEADER.unpack_from(data, offset)
+        if length < RTA_HEADER.size:
+            break
+        attrs[attr_type] = data[offset + RTA_HEADER.size : offset + length]
+        offset += _align(length)
+    return attrs
+
+
+def parse_messages(data: bytes) -> List[Tuple[int, int, bytes]]:
+    """
+    Split a netlink datagram into its messages.
+
+    :param data: received datagram
+    :return: list of message type, sequence number and payload
+    """
+    messages = []
+    offset = 0
+    while offset + NLMSG_HEADER.size <= len(data):
+        length, msg_type, _, seq, _ = NLMSG_HEADER.unpack_from(data, offset)
+        if length < NLMSG_HEADER.size:
+            break
+        payload = data[offset + NLMSG_HEADER.size : offset + length]
+        messages.append((msg_type, seq, payload))
+        offset += _align(length)
+    return messages
+
+
+def _setns_socket(pid: int) -> socket.socket:
+    """
+    Create a netlink socket bound within the network namespace of a process.
+
+    The namespace switch happens on a short-lived thread, as setns only
+    affects the calling thread, and the socket stays bound to the namespace
+    it was created in.
+
+    :param pid: process id owning the desired network namespace
+    :return: netlink socket
+    :raises OSError: when unable to enter the namespace
+    """
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    result = {}
+
+    def create() -> None:
+        try:
+            with open(f"/proc/{pid}/ns/net") as f:
+                if libc.setns(f.fileno(), CLONE_NEWNET) != 0:
+                    error = ctypes.get_errno()
+                    raise OSError(error, os.strerror(error))
+            result["socket"] = socket.socket(
+                socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_ROUTE
+            )
+        except OSError as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=create, daemon=True)
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["socket"]
+
+
+class NetlinkSocket:
+    """
+    Thread safe rtnetlink request/acknowledge socket.
+    """
+
+    def __init__(self, pid: int = None) -> None:
+        """
+        Create a NetlinkSocket instance.
+
+        :param pid: process id whose network namespace to operate within,
+            None for the current namespace
+        """
+        self.pid: Optional[int] = pid
+        self.lock: threading.Lock = threading.Lock()
+        self.seq: int = 0
+        if pid is None:
+            self.sock: socket.socket = socket.socket(
+                socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_ROUTE
+            )
+        else:
+            self.sock: socket.socket = _setns_socket(pid)
+        self.sock.bind((0, 0))
+
+    def close(self) -> None:
+        """
+        Close the underlying socket.
+
+        :return: nothing
+        """
+        self.sock.close()
+
+    def request(
+        self, cmd: str, msg_type: int, flags: int, payload: bytes
+    ) -> List[Tuple[int, bytes]]:
+        """
+        Send a request and wait for its acknowledgement.
+
+        :param cmd: equivalent command, used for error reporting
+        :param msg_type: netlink message type
+        :param flags: additional netlink flags
+        :param payload: message payload
+        :return: list of message type and payload responses
+        :raises CoreCommandError: when the kernel rejects the request
+        """
+        with self.lock:
+            self.seq += 1
+            seq = self.seq
+            flags |= NLM_F_REQUEST | NLM_F_ACK
+            length = NLMSG_HEADER.size + len(payload)
+            header = NLMSG_HEADER.pack(length, msg_type, flags, seq, 0)
+            try:
+                self.sock.send(header + payload)
+                responses = []
+                while True:
+                    data = self.sock.recv(RECV_SIZE)
+                    for response_type, response_seq, body in parse_messages(data):
+                        if response_seq != seq:
+                            continue
+                        if response_type == NLMSG_ERROR:
+                            code = -NLMSG_ERROR_CODE.unpack_from(body)[0]
+                            if code:
+                                raise CoreCommandError(code, cmd, "", os.strerror(code))
+                            return responses
+                        elif response_type == NLMSG_DONE:
+                            return responses
+                        responses.append((response_type, body))
+            except OSError as e:
+                raise CoreCommandError(
+                    e.errno or errno.EIO, cmd, "", e.strerror or str(e)
+                )
+
+
+_host_socket: Optional[NetlinkSocket] = None
+_host_socket_lock: threading.Lock = threading.Lock()
+
+
+def host_socket() -> NetlinkSocket:
+    """
+    Retrieve the shared netlink socket for the host network namespace.
+
+    :return: host netlink socket
+    """
+    global _host_socket
+    with _host_socket_lock:
+        if _host_socket is None:
+            _host_socket = NetlinkSocket()
+        return _host_socket
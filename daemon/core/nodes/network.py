@@ -2,16 +2,20 @@
 Defines network nodes used within core.
 """
 
+import dataclasses
 import logging
 import threading
+import time
 from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from queue import Queue
-from typing import TYPE_CHECKING, Dict, List, Optional, Type
+from queue import Empty, Queue
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Type
 
 import netaddr
 
 from core import utils
+from core.emulator.batch import host_runner
 from core.emulator.data import InterfaceData, LinkData
 from core.emulator.enumerations import (
     LinkTypes,
@@ -54,6 +58,22 @@ class SetQueue(Queue):
         return key
 
 
+@dataclass
+class NftablesStats:
+    """
+    Metrics for nftables commits.
+    """
+
+    commits: int = 0
+    networks: int = 0
+    rules: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    last_time: float = 0.0
+    last_networks: int = 0
+    last_rules: int = 0
+
+
 class NftablesQueue:
     """
     Helper class for queuing up nftables commands into rate-limited
@@ -63,8 +83,8 @@ class NftablesQueue:
 
     # update rate is every 300ms
     rate: float = 0.3
-    atomic_file: str = "/tmp/pycore.nftables.atomic"
     chain: str = "forward"
+    vmap: str = "links"
 
     def __init__(self) -> None:
         """
@@ -73,12 +93,16 @@ class NftablesQueue:
         """
         self.running: bool = False
         self.run_thread: Optional[threading.Thread] = None
+        self.stopping: threading.Event = threading.Event()
         # this lock protects cmds and updates lists
         self.lock: threading.Lock = threading.Lock()
         # list of pending nftables commands
         self.cmds: List[str] = []
         # list of WLANs requiring update
         self.updates: SetQueue = SetQueue()
+        # commit metrics
+        self.stats: NftablesStats = NftablesStats()
+        self.last_commit: float = 0.0
 
     def start(self) -> None:
         """
@@ -89,6 +113,7 @@ class NftablesQueue:
         with self.lock:
             if not self.running:
                 self.running = True
+                self.stopping.clear()
                 self.run_thread = threading.Thread(target=self.run, daemon=True)
                 self.run_thread.start()
 
@@ -101,6 +126,7 @@ class NftablesQueue:
         with self.lock:
             if self.running:
                 self.running = False
+                self.stopping.set()
                 self.updates.put(None)
                 self.run_thread.join()
                 self.run_thread = None
@@ -117,26 +143,120 @@ class NftablesQueue:
             net = self.updates.get()
             if net is None:
                 break
+            # wait out the rest of the current tick, coalescing networks updated
+            # in the meantime into the same commit
+            delay = self.last_commit + self.rate - time.monotonic()
+            if delay > 0:
+                self.stopping.wait(delay)
+            nets = [net]
+            while True:
+                try:
+                    net = self.updates.get_nowait()
+                except Empty:
+                    break
+                if net is None:
+                    self.running = False
+                    break
+                nets.append(net)
+            self.commit(nets)
+
+    def commit(self, nets: List["CoreNetwork"]) -> None:
+        """
+        Commit changes to nftables for the provided networks, as a single
+        transaction for the host and each distributed server involved.
+
+        :param nets: networks to commit nftables changes for
+        :return: nothing
+        """
+        start = time.monotonic()
+        net_cmds = []
+        states = {}
+        for net in nets:
+            states[net] = (net.has_nftables_chain, set(net.nftables_elements))
             self.build_cmds(net)
-            self.commit(net)
+            if self.cmds:
+                net_cmds.append((net, self.cmds))
+                self.cmds = []
+        self.last_commit = start
+        if not net_cmds:
+            return
+        rules = 0
+        payloads = {}
+        for net, cmds in net_cmds:
+            rules += len(cmds)
+            servers = [None] + list(net.session.distributed.servers.values())
+            for server in servers:
+                payloads.setdefault(server, []).append((net, cmds))
+        failed = set()
+        for server, server_cmds in payloads.items():
+            try:
+                self.apply(server, [x for _, cmds in server_cmds for x in cmds])
+            except CoreCommandError:
+                self.stats.errors += 1
+                logger.exception("error committing nftables transaction")
+                if len(server_cmds) == 1:
+                    failed.add(server_cmds[0][0])
+                    continue
+                # retry networks separately, isolating the failure
+                for net, cmds in server_cmds:
+                    try:
+                        self.apply(server, cmds)
+                    except CoreCommandError:
+                        logger.exception("error committing nftables changes")
+                        failed.add(net)
+        for net in failed:
+            self.restore(net, *states[net])
+        elapsed = time.monotonic() - start
+        self.stats.commits += 1
+        self.stats.networks += len(net_cmds)
+        self.stats.rules += rules
+        self.stats.total_time += elapsed
+        self.stats.last_time = elapsed
+        self.stats.last_networks = len(net_cmds)
+        self.stats.last_rules = rules
+        logger.debug(
+            "nftables commit networks(%s) rules(%s) time(%.4f)",
+            len(net_cmds),
+            rules,
+            elapsed,
+        )
 
-    def commit(self, net: "CoreNetwork") -> None:
+    def restore(
+        self, net: "CoreNetwork", has_chain: bool, elements: Set[Tuple[str, str]]
+    ) -> None:
         """
-        Commit changes to nftables for the provided network.
+        Restore the nftables state tracked for a network to what it was before
+        changes that failed to apply, resyncing it on its next update.
 
-        :param net: network to commit nftables changes
+        :param net: network to restore state for
+        :param has_chain: True if the network table existed, False otherwise
+        :param elements: verdict map elements that existed
         :return: nothing
         """
-        if not self.cmds:
-            return
-        # write out nft commands to file
-        for cmd in self.cmds:
-            net.host_cmd(f"echo {cmd} >> {self.atomic_file}", shell=True)
-        # read file as atomic change
-        net.host_cmd(f"{NFTABLES} -f {self.atomic_file}")
-        # remove file
-        net.host_cmd(f"rm -f {self.atomic_file}")
-        self.cmds.clear()
+        with net.linked_lock:
+            net.has_nftables_chain = has_chain
+            net.nftables_elements = elements
+            net.nftables_resync = True
+
+    def apply(self, server: Optional["DistributedServer"], cmds: List[str]) -> None:
+        """
+        Apply nftables commands as an atomic transaction, streamed to nft.
+
+        :param server: server to apply commands to, None for the host
+        :param cmds: nftables commands
+        :return: nothing
+        :raises CoreCommandError: when nft rejects the transaction
+        """
+        data = "\n".join(cmds) + "\n"
+        host_runner(server)(f"{NFTABLES} -f -", data)
+
+    def get_stats(self) -> NftablesStats:
+        """
+        Retrieve a copy of the current commit metrics.
+
+        :return: nftables commit metrics
+        """
+        return dataclasses.replace(self.stats)
 
     def update(self, net: "CoreNetwork") -> None:
         """
@@ -157,6 +277,28 @@ class NftablesQueue:
         with self.lock:
             net.host_cmd(f"{NFTABLES} delete table bridge {net.brname}")
 
+    def delete_tables(self, names: List[str]) -> None:
+        """
+        Delete many nftables bridge rule tables on the host, as a single
+        transaction, deleting them separately when the transaction fails.
+
+        :param names: names of bridge tables to delete
+        :return: nothing
+        """
+        if not names:
+            return
+        cmds = [f"delete table bridge {x}" for x in names]
+        with self.lock:
+            try:
+                self.apply(None, cmds)
+            except CoreCommandError:
+                logger.debug("error deleting nftables tables, deleting separately")
+                for cmd in cmds:
+                    try:
+                        self.apply(None, [cmd])
+                    except CoreCommandError:
+                        logger.debug("error during nftables command: %s", cmd)
+
     def build_cmds(self, net: "CoreNetwork") -> None:
         """
         Inspect linked nodes for a network, and rebuild the nftables chain commands.
@@ -164,6 +306,9 @@ class NftablesQueue:
         :param net: network to build commands for
         :return: nothing
         """
+        if net.nftables_vmap:
+            self.build_vmap_cmds(net)
+            return
         with net.linked_lock:
             if net.has_nftables_chain:
                 self.cmds.append(f"flush table bridge {net.brname}")
@@ -173,7 +318,7 @@ class NftablesQueue:
                 self.cmds.append(f"add table bridge {net.brname}")
                 self.cmds.append(
                     f"add chain bridge {net.brname} {self.chain} {{type filter hook "
-                    f"forward priority -1\\; policy {policy}\\;}}"
+                    f"forward priority -1; policy {policy};}}"
                 )
             # add default rule to accept all traffic not for this bridge
             self.cmds.append(
@@ -200,6 +345,87 @@ class NftablesQueue:
                             f"{policy}"
                         )
 
+    def build_vmap_cmds(self, net: "CoreNetwork") -> None:
+        """
+        Build the commands to incrementally update a network verdict map, that
+        provides the filtering for linked interface pairs, creating the table,
+        chain and map when needed.
+
+        :param net: network to build commands for
+        :return: nothing
+        """
+        with net.linked_lock:
+            if not net.has_nftables_chain:
+                net.has_nftables_chain = True
+                net.nftables_elements.clear()
+                net.nftables_resync = True
+                policy = net.policy.value.lower()
+                self.cmds.append(f"add table bridge {net.brname}")
+                self.cmds.append(
+                    f"add chain bridge {net.brname} {self.chain} {{type filter hook "
+                    f"forward priority -1; policy {policy};}}"
+                )
+                self.cmds.append(
+                    f"add map bridge {net.brname} {self.vmap} "
+                    f"{{type ifname . ifname : verdict;}}"
+                )
+                # add default rule to accept all traffic not for this bridge
+                self.cmds.append(
+                    f"add rule bridge {net.brname} {self.chain} "
+                    f"ibriport != {net.brname} accept"
+                )
+                self.cmds.append(
+                    f"add rule bridge {net.brname} {self.chain} "
+                    f"iifname . oifname vmap @{self.vmap}"
+                )
+            if net.nftables_resync:
+                pairs = set()
+                for iface1, v in net.linked.items():
+                    for iface2 in v:
+                        pairs.add((iface1, iface2))
+                wanted = set()
+                for iface1, iface2 in pairs:
+                    if net.nftables_verdict(iface1, iface2):
+                        wanted.add(net.nftables_key(iface1, iface2))
+                added = wanted - net.nftables_elements
+                deleted = net.nftables_elements - wanted
+            else:
+                added = set()
+                deleted = set()
+                for iface1, iface2 in net.nftables_pending:
+                    key = net.nftables_key(iface1, iface2)
+                    if net.nftables_verdict(iface1, iface2):
+                        if key not in net.nftables_elements:
+                            added.add(key)
+                    elif key in net.nftables_elements:
+                        deleted.add(key)
+            net.nftables_resync = False
+            net.nftables_pending.clear()
+            if deleted:
+                elements = []
+                for name1, name2 in sorted(deleted):
+                    elements.append(f"{name1} . {name2}")
+                    elements.append(f"{name2} . {name1}")
+                elements = ", ".join(elements)
+                self.cmds.append(
+                    f"delete element bridge {net.brname} {self.vmap} {{ {elements} }}"
+                )
+                net.nftables_elements -= deleted
+            if added:
+                if net.policy == NetworkPolicy.DROP:
+                    verdict = "accept"
+                else:
+                    verdict = "drop"
+                elements = []
+                for name1, name2 in sorted(added):
+                    elements.append(f"{name1} . {name2} : {verdict}")
+                    elements.append(f"{name2} . {name1} : {verdict}")
+                elements = ", ".join(elements)
+                self.cmds.append(
+                    f"add element bridge {net.brname} {self.vmap} {{ {elements} }}"
+                )
+                net.nftables_elements |= added
+
 
 # a global object because all networks share the same queue
 # cannot have multiple threads invoking the nftables commnd
@@ -240,6 +466,11 @@ class CoreNetwork(CoreNetworkBase):
         sessionid = self.session.short_session_id()
         self.brname: str = f"b.{self.id}.{sessionid}"
         self.has_nftables_chain: bool = False
+        # incremental filtering using a verdict map of linked interface pairs
+        self.nftables_vmap: bool = False
+        self.nftables_elements: Set[Tuple[str, str]] = set()
+        self.nftables_pending: Set[Tuple[CoreInterface, CoreInterface]] = set()
+        self.nftables_resync: bool = False
 
     def host_cmd(
         self,
@@ -262,6 +493,13 @@ class CoreNetwork(CoreNetworkBase):
         :raises CoreCommandError: when a non-zero exit status occurs
         """
         logger.debug("network node(%s) cmd", self.name)
+        command_batch = self.session.command_batch
+        if command_batch is not None:
+            run = host_runner(None)
+            if command_batch.submit(None, args, run, env, cwd, wait, shell):
+                for server in self.session.distributed.servers.values():
+                    command_batch.submit(server, args, host_runner(server))
+                return ""
         output = utils.cmd(args, env, cwd, wait, shell)
         self.session.distributed.execute(lambda x: x.remote_cmd(args, env, cwd, wait))
         return output
@@ -277,7 +515,9 @@ class CoreNetwork(CoreNetworkBase):
         if self.mtu > 0:
             self.net_client.set_mtu(self.brname, self.mtu)
         self.has_nftables_chain = False
+        self.nftables_vmap = self.session.options.get_config("nftables_vmap") == "1"
         self.up = True
+        self.session.add_host_iface(self.brname, self.id)
         nft_queue.start()
 
     def shutdown(self) -> None:
@@ -288,6 +528,7 @@ class CoreNetwork(CoreNetworkBase):
         """
         if not self.up:
             return
+        self.session.remove_host_iface(self.brname)
         nft_queue.stop()
         try:
             self.net_client.delete_bridge(self.brname)
@@ -323,6 +564,41 @@ class CoreNetwork(CoreNetworkBase):
         if self.up:
             iface.net_client.delete_iface(self.brname, iface.localname)
         super().detach(iface)
+        with self.linked_lock:
+            self.nftables_resync = True
+
+    def nftables_key(
+        self, iface1: CoreInterface, iface2: CoreInterface
+    ) -> Tuple[str, str]:
+        """
+        Retrieve the verdict map key used for a pair of interfaces.
+
+        :param iface1: interface one
+        :param iface2: interface two
+        :return: ordered pair of interface names
+        """
+        return tuple(sorted((iface1.localname, iface2.localname)))
+
+    def nftables_verdict(self, iface1: CoreInterface, iface2: CoreInterface) -> bool:
+        """
+        Determine if a pair of interfaces requires a verdict map element, to
+        accept traffic for linked interfaces with a drop policy, or drop traffic
+        for unlinked interfaces with an accept policy. Must be called while
+        holding the linked lock.
+
+        :param iface1: interface one
+        :param iface2: interface two
+        :return: True if an element is needed, False otherwise
+        """
+        for first, second in ((iface1, iface2), (iface2, iface1)):
+            linked = self.linked.get(first, {}).get(second)
+            if linked is None:
+                continue
+            if self.policy == NetworkPolicy.DROP and linked:
+                return True
+            elif self.policy == NetworkPolicy.ACCEPT and not linked:
+                return True
+        return False
 
     def is_linked(self, iface1: CoreInterface, iface2: CoreInterface) -> bool:
         """
@@ -357,11 +633,7 @@ class CoreNetwork(CoreNetworkBase):
         :param iface2: interface two
         :return: nothing
         """
-        with self.linked_lock:
-            if not self.is_linked(iface1, iface2):
-                return
-            self.linked[iface1][iface2] = False
-        nft_queue.update(self)
+        self.update_links({(iface1, iface2): False})
 
     def link(self, iface1: CoreInterface, iface2: CoreInterface) -> None:
         """
@@ -372,11 +644,29 @@ class CoreNetwork(CoreNetworkBase):
         :param iface2: interface two
         :return: nothing
         """
+        self.update_links({(iface1, iface2): True})
+
+    def update_links(
+        self, links: Dict[Tuple[CoreInterface, CoreInterface], bool]
+    ) -> List[Tuple[CoreInterface, CoreInterface, bool]]:
+        """
+        Link and unlink interface pairs together, with a single filtering rules
+        update for all resulting changes.
+
+        :param links: mapping of interface pairs to their desired linked state
+        :return: interface pairs and linked state, for pairs that changed
+        """
+        changed = []
         with self.linked_lock:
-            if self.is_linked(iface1, iface2):
-                return
-            self.linked[iface1][iface2] = True
-        nft_queue.update(self)
+            for (iface1, iface2), linked in links.items():
+                if self.is_linked(iface1, iface2) == linked:
+                    continue
+                self.linked[iface1][iface2] = linked
+                self.nftables_pending.add((iface1, iface2))
+                changed.append((iface1, iface2, linked))
+        if changed:
+            nft_queue.update(self)
+        return changed
 
     def linknet(self, net: CoreNetworkBase) -> CoreInterface:
         """
@@ -403,10 +693,11 @@ class CoreNetwork(CoreNetworkBase):
         self.attach(iface)
         if net.up and net.brname:
             iface.net_client.set_iface_master(net.brname, iface.name)
-        i = net.next_iface_id()
-        net.ifaces[i] = iface
-        with net.linked_lock:
-            net.linked[iface] = {}
+        with net.lock:
+            i = net.next_iface_id()
+            net.ifaces[i] = iface
+            with net.linked_lock:
+                net.linked[iface] = {}
         iface.net = self
         iface.othernet = net
         return iface
@@ -617,7 +908,7 @@ class CtrlNet(CoreNetwork):
         use_ovs = self.session.use_ovs()
         address = self.prefix[index]
         current = f"{address}/{self.prefix.prefixlen}"
-        net_client = get_net_client(use_ovs, utils.cmd)
+        net_client = get_net_client(use_ovs, utils.cmd, self.session.use_netlink())
         net_client.create_address(self.brname, current)
         servers = self.session.distributed.servers
         for name in servers:
@@ -867,6 +1158,23 @@ class WlanNode(CoreNetwork):
             raise CoreError(f"no mobility set to update for node({self.name})")
         self.mobility.update_config(config)
 
+    def update_links(
+        self, links: Dict[Tuple[CoreInterface, CoreInterface], bool]
+    ) -> List[Tuple[CoreInterface, CoreInterface, bool]]:
+        """
+        Link and unlink interface pairs together, notifying the wireless model
+        of resulting changes. Pairs are ordered as wireless models order them,
+        so a pair is tracked by a single entry regardless of how it was linked.
+
+        :param links: mapping of interface pairs to their desired linked state
+        :return: interface pairs and linked state, for pairs that changed
+        """
+        links = {(min(a, b), max(a, b)): linked for (a, b), linked in links.items()}
+        changed = super().update_links(links)
+        if changed and self.model:
+            self.model.links_updated(changed)
+        return changed
+
     def updatemodel(self, config: Dict[str, str]) -> None:
         if not self.model:
             raise CoreError(f"no model set to update for node({self.name})")
@@ -0,0 +1,297 @@
+"""
+Persistent clients for running commands within vnoded namespaces, speaking the
+vnoded control channel protocol directly over its unix socket.
+"""
+
+import array
+import logging
+import os
+import selectors
+import shlex
+import socket
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from core.errors import CoreCommandError
+from core.executables import BASH
+
+logger = logging.getLogger(__name__)
+
+# vnoded control channel messages, using native byte order as vnoded does
+HEADER: struct.Struct = struct.Struct("=II")
+TLV: struct.Struct = struct.Struct("=II")
+INT32: struct.Struct = struct.Struct("=i")
+MSG_CMDREQ: int = 1
+MSG_CMDREQACK: int = 2
+MSG_CMDSTATUS: int = 3
+TLV_CMDID: int = 1
+TLV_CMDARG: int = 5
+TLV_CMDPID: int = 6
+TLV_CMDSTATUS: int = 7
+MSG_SIZE_MAX: int = 65535
+CMDID_MAX: int = 2**31 - 1
+
+
+def _pack_tlv(tlv_type: int, value: bytes) -> bytes:
+    return TLV.pack(tlv_type, len(value)) + value
+
+
+def _unpack_msg(data: bytes) -> Tuple[int, Dict[int, int]]:
+    """
+    Unpack a control channel message carrying int32 values.
+
+    :param data: message data
+    :return: message type and values by tlv type
+    :raises ValueError: when the message is malformed
+    """
+    if len(data) < HEADER.size:
+        raise ValueError(f"control channel message truncated: {len(data)} bytes")
+    msg_type, length = HEADER.unpack_from(data)
+    if HEADER.size + length != len(data):
+        raise ValueError(f"control channel message length mismatch: {length}")
+    values = {}
+    offset = HEADER.size
+    while offset < len(data):
+        tlv_type, tlv_length = TLV.unpack_from(data, offset)
+        offset += TLV.size
+        if tlv_length == INT32.size:
+            values[tlv_type] = INT32.unpack_from(data, offset)[0]
+        offset += tlv_length
+    return msg_type, values
+
+
+class VnodeClient:
+    """
+    Connection to a vnoded control channel, running one command at a time.
+    """
+
+    def __init__(self, ctrlchnlname: Path) -> None:
+        """
+        Create a VnodeClient instance, connecting to the control channel.
+
+        :param ctrlchnlname: vnoded control channel to connect to
+        :raises OSError: when connecting to the control channel fails
+        """
+        self.sock: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        try:
+            self.sock.connect(str(ctrlchnlname))
+        except OSError:
+            self.sock.close()
+            raise
+        self.cmdid: int = 0
+
+    def send(self, args: List[str], in_fd: int, out_fd: int, err_fd: int) -> int:
+        """
+        Request a command to run within the namespace, passing the file
+        descriptors to use as its stdin, stdout and stderr.
+
+        :param args: command arguments
+        :param in_fd: stdin file descriptor
+        :param out_fd: stdout file descriptor
+        :param err_fd: stderr file descriptor
+        :return: id of requested command
+        :raises OSError: when sending the request fails
+        """
+        self.cmdid = self.cmdid % CMDID_MAX + 1
+        data = [_pack_tlv(TLV_CMDID, INT32.pack(self.cmdid))]
+        for arg in args:
+            data.append(_pack_tlv(TLV_CMDARG, arg.encode("utf-8") + b"\0"))
+        data = b"".join(data)
+        msg = HEADER.pack(MSG_CMDREQ, len(data)) + data
+        fds = array.array("i", [in_fd, out_fd, err_fd])
+        self.sock.sendmsg([msg], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, fds)])
+        return self.cmdid
+
+    def wait(self, cmdid: int) -> int:
+        """
+        Wait for a requested command to complete.
+
+        :param cmdid: id of command to wait for
+        :return: command wait status, -1 when the command failed to start
+        :raises OSError: when the control channel closes or fails
+        :raises ValueError: when a malformed message is received
+        """
+        while True:
+            data = self.sock.recv(MSG_SIZE_MAX)
+            if not data:
+                raise ConnectionError("control channel closed")
+            msg_type, values = _unpack_msg(data)
+            if values.get(TLV_CMDID) != cmdid:
+                continue
+            if msg_type == MSG_CMDREQACK and values.get(TLV_CMDPID) == -1:
+                return -1
+            if msg_type == MSG_CMDSTATUS:
+                return values.get(TLV_CMDSTATUS, -1)
+
+    def close(self) -> None:
+        """
+        Close the control channel connection.
+
+        :return: nothing
+        """
+        self.sock.close()
+
+
+def _read_pipes(out_fd: int, err_fd: int) -> List[bytes]:
+    """
+    Read output from stdout and stderr pipes until both are closed.
+
+    :param out_fd: stdout read file descriptor
+    :param err_fd: stderr read file descriptor
+    :return: stdout and stderr output
+    """
+    output = {out_fd: [], err_fd: []}
+    with selectors.DefaultSelector() as selector:
+        selector.register(out_fd, selectors.EVENT_READ)
+        selector.register(err_fd, selectors.EVENT_READ)
+        while selector.get_map():
+            for key, _ in selector.select():
+                data = os.read(key.fd, 65536)
+                if data:
+                    output[key.fd].append(data)
+                else:
+                    selector.unregister(key.fd)
+    return [b"".join(output[out_fd]), b"".join(output[err_fd])]
+
+
+def _exit_status(status: int) -> int:
+    if status < 0:
+        return 1
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+class VnodeClientPool:
+    """
+    Pool of persistent connections to a vnoded control channel, allowing
+    concurrent callers to each run a command over an already open connection.
+    """
+
+    def __init__(self, ctrlchnlname: Path, size: int = 4) -> None:
+        """
+        Create a VnodeClientPool instance.
+
+        :param ctrlchnlname: vnoded control channel to connect to
+        :param size: maximum number of connections to open
+        """
+        self.ctrlchnlname: Path = ctrlchnlname
+        self.size: int = size
+        self.condition: threading.Condition = threading.Condition()
+        self.idle: List[VnodeClient] = []
+        self.count: int = 0
+        self.closed: bool = False
+
+    @classmethod
+    def available(cls) -> bool:
+        """
+        Check if the platform supports the unix sockets pools connect with.
+
+        :return: True if available, False otherwise
+        """
+        return hasattr(socket, "AF_UNIX") and hasattr(socket, "SOCK_SEQPACKET")
+
+    def _acquire(self) -> VnodeClient:
+        with self.condition:
+            while True:
+                if self.closed:
+                    raise ValueError(f"client pool closed: {self.ctrlchnlname}")
+                if self.idle:
+                    return self.idle.pop()
+                if self.count < self.size:
+                    self.count += 1
+                    break
+                self.condition.wait()
+        try:
+            return VnodeClient(self.ctrlchnlname)
+        except Exception:
+            self._discard()
+            raise
+
+    def _release(self, client: VnodeClient) -> None:
+        with self.condition:
+            if self.closed:
+                client.close()
+                self.count -= 1
+            else:
+                self.idle.append(client)
+            self.condition.notify()
+
+    def _discard(self) -> None:
+        with self.condition:
+            self.count -= 1
+            self.condition.notify()
+
+    def cmd(self, args: str, shell: bool = False) -> str:
+        """
+        Run a command within the namespace and wait for it to complete.
+
+        :param args: command to run
+        :param shell: True to use shell, False otherwise
+        :return: stdout output
+        :raises CoreCommandError: when a non-zero exit status occurs
+        :raises OSError: when the control channel connection fails
+        """
+        if shell:
+            cmd_args = [BASH, "-c", args]
+        else:
+            cmd_args = shlex.split(args)
+        client = self._acquire()
+        try:
+            stdout, stderr, status = self._run(client, cmd_args)
+        except (OSError, ValueError):
+            client.close()
+            self._discard()
+            raise
+        self._release(client)
+        status = _exit_status(status)
+        stdout = stdout.decode("utf-8").strip()
+        stderr = stderr.decode("utf-8").strip()
+        if status != 0:
+            raise CoreCommandError(status, args, stdout, stderr)
+        return stdout
+
+    def _run(self, client: VnodeClient, args: List[str]) -> Tuple[bytes, bytes, int]:
+        in_fd = os.open(os.devnull, os.O_RDONLY)
+        out_read, out_write = os.pipe()
+        err_read, err_write = os.pipe()
+        try:
+            try:
+                cmdid = client.send(args, in_fd, out_write, err_write)
+            finally:
+                os.close(in_fd)
+                os.close(out_write)
+                os.close(err_write)
+            stdout, stderr = _read_pipes(out_read, err_read)
+            return stdout, stderr, client.wait(cmdid)
+        finally:
+            os.close(out_read)
+            os.close(err_read)
+
+    def close(self) -> None:
+        """
+        Close all open connections, connections in use are closed when released.
+
+        :return: nothing
+        """
+        with self.condition:
+            self.closed = True
+            while self.idle:
+                client = self.idle.pop()
+                client.close()
+                self.count -= 1
+            self.condition.notify_all()
+
+
+def create_pool(ctrlchnlname: Path) -> Optional[VnodeClientPool]:
+    """
+    Create a client pool for a control channel, when unix sockets are supported.
+
+    :param ctrlchnlname: vnoded control channel
+    :return: client pool, None when unix sockets are not supported
+    """
+    if VnodeClientPool.available():
+        return VnodeClientPool(ctrlchnlname)
+    return None
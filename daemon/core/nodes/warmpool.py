@@ -0,0 +1,266 @@
+"""
+Warm pool of pre-spawned vnoded namespaces, allowing nodes to start by claiming
+an idle namespace, with loopback up and private directories mounted, instead of
+creating one on demand.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple
+
+from core import utils
+from core.emulator import teardown
+from core.errors import CoreCommandError
+from core.executables import MOUNT, VCMD, VNODED
+from core.nodes.base import PRIVATE_DIRS
+from core.nodes.netclient import LinuxNetClient
+
+logger = logging.getLogger(__name__)
+
+POOL_DIR: Path = Path(tempfile.gettempdir()) / "pycore.pool"
+RETRY_DELAY: float = 5.0
+
+
+@dataclass
+class PooledNamespace:
+    """
+    Idle vnoded namespace, along with its control channel and directory.
+    """
+
+    pid: int
+    ctrlchnlname: Path
+    directory: Path
+    mounts: List[Tuple[Path, Path]] = field(default_factory=list)
+
+    def cmd(self, args: str) -> str:
+        """
+        Run a command within the namespace.
+
+        :param args: command to run
+        :return: command output
+        :raises CoreCommandError: when a non-zero exit status occurs
+        """
+        return utils.cmd(f"{VCMD} -c {self.ctrlchnlname} -- {args}")
+
+    def setup(self) -> None:
+        """
+        Apply the setup common to all nodes, bringing up the loopback device and
+        mounting private directories.
+
+        :return: nothing
+        """
+        LinuxNetClient(self.cmd).device_up("lo")
+        for dir_path in PRIVATE_DIRS:
+            host_path = self.directory / str(dir_path).strip("/").replace("/", ".")
+            host_path.mkdir()
+            self.cmd(f"mkdir -p {dir_path}")
+            self.cmd(f"{MOUNT} -n --bind {host_path} {dir_path}")
+            self.mounts.append((host_path, dir_path))
+
+    def move(self, ctrlchnlname: Path, directory: Path) -> None:
+        """
+        Move the namespace control channel and directory to the paths of the
+        node claiming it. Running processes and mounts follow the renamed paths.
+
+        :param ctrlchnlname: control channel path to move to
+        :param directory: directory path to move to
+        :return: nothing
+        :raises OSError: when the control channel or directory can not be moved
+        """
+        os.rename(self.directory, directory)
+        try:
+            os.rename(self.ctrlchnlname, ctrlchnlname)
+        except OSError:
+            os.rename(directory, self.directory)
+            raise
+        for suffix in [".log", ".pid"]:
+            src = self.ctrlchnlname.with_name(self.ctrlchnlname.name + suffix)
+            dst = ctrlchnlname.with_name(ctrlchnlname.name + suffix)
+            try:
+                os.rename(src, dst)
+            except OSError:
+                logger.debug("error moving pooled namespace file: %s", src)
+        self.mounts = [(directory / x.name, y) for x, y in self.mounts]
+        self.ctrlchnlname = ctrlchnlname
+        self.directory = directory
+
+    def kill(self) -> None:
+        """
+        Kill the namespace process and remove its files.
+
+        :return: nothing
+        """
+        try:
+            utils.cmd(f"kill -9 {self.pid}")
+        except CoreCommandError:
+            logger.exception("error killing pooled namespace: %s", self.pid)
+        paths = [self.ctrlchnlname, self.directory]
+        for suffix in [".log", ".pid"]:
+            paths.append(self.ctrlchnlname.with_name(self.ctrlchnlname.name + suffix))
+        teardown.remove_paths(paths)
+
+
+class WarmPool:
+    """
+    Keeps a number of idle namespaces ready to be claimed by starting nodes,
+    refilling them in the background as they are claimed.
+    """
+
+    def __init__(
+        self, size: int, directory: Path = POOL_DIR, env: Dict[str, str] = None
+    ) -> None:
+        """
+        Create a WarmPool instance.
+
+        :param size: number of idle namespaces to keep ready
+        :param directory: directory for pooled namespace files
+        :param env: environment to create namespaces with
+        """
+        self.size: int = size
+        self.directory: Path = directory
+        self.env: Optional[Dict[str, str]] = env
+        self.ready: Deque[PooledNamespace] = deque()
+        self.lock: threading.Lock = threading.Lock()
+        self.wakeup: threading.Event = threading.Event()
+        self.closed: bool = False
+        self.thread: Optional[threading.Thread] = None
+        self.count: int = 0
+        self.claimed: int = 0
+        self.missed: int = 0
+        self.failed: int = 0
+
+    def start(self) -> None:
+        """
+        Create the pool directory and start filling the pool in the background.
+
+        :return: nothing
+        """
+        teardown.remove_paths([self.directory])
+        self.directory.mkdir(parents=True)
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        logger.info("started warm pool of %s namespaces: %s", self.size, self.directory)
+
+    def _run(self) -> None:
+        while not self.closed:
+            self.wakeup.clear()
+            try:
+                self.fill()
+            except (CoreCommandError, OSError, ValueError):
+                logger.exception("error filling warm pool")
+                with self.lock:
+                    self.failed += 1
+                self.wakeup.wait(RETRY_DELAY)
+                continue
+            self.wakeup.wait()
+
+    def fill(self) -> None:
+        """
+        Spawn idle namespaces until the pool is full.
+
+        :return: nothing
+        :raises CoreCommandError: when a namespace fails to be created
+        """
+        while not self.closed and len(self.ready) < self.size:
+            namespace = self.spawn()
+            with self.lock:
+                self.ready.append(namespace)
+
+    def spawn(self) -> PooledNamespace:
+        """
+        Create a new idle namespace, with setup common to all nodes applied.
+
+        :return: created namespace
+        :raises CoreCommandError: when the namespace fails to be created
+        """
+        with self.lock:
+            self.count += 1
+            index = self.count
+        ctrlchnlname = self.directory / f"ns{index}"
+        directory = self.directory / f"ns{index}.conf"
+        directory.mkdir()
+        vnoded = (
+            f"{VNODED} -v -c {ctrlchnlname} -l {ctrlchnlname}.log "
+            f"-p {ctrlchnlname}.pid -C {directory}"
+        )
+        try:
+            output = utils.cmd(vnoded, env=self.env)
+        except CoreCommandError:
+            teardown.remove_paths([directory])
+            raise
+        namespace = PooledNamespace(int(output), ctrlchnlname, directory)
+        try:
+            namespace.setup()
+        except (CoreCommandError, OSError):
+            namespace.kill()
+            raise
+        logger.debug("spawned pooled namespace: %s", namespace.pid)
+        return namespace
+
+    def claim(self, ctrlchnlname: Path, directory: Path) -> Optional[PooledNamespace]:
+        """
+        Claim an idle namespace, moving it to the control channel and directory
+        of the claiming node, and trigger a refill of the pool.
+
+        :param ctrlchnlname: control channel path for the claiming node
+        :param directory: directory path for the claiming node
+        :return: claimed namespace, None when no namespace is available
+        """
+        with self.lock:
+            namespace = self.ready.popleft() if self.ready else None
+            if namespace is None:
+                self.missed += 1
+        self.wakeup.set()
+        if namespace is None:
+            return None
+        try:
+            namespace.move(ctrlchnlname, directory)
+        except OSError:
+            logger.exception("error claiming pooled namespace: %s", namespace.pid)
+            namespace.kill()
+            with self.lock:
+                self.failed += 1
+                self.missed += 1
+            return None
+        with self.lock:
+            self.claimed += 1
+        return namespace
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Retrieve pool statistics.
+
+        :return: pool size, ready namespaces and claimed, missed and failed counts
+        """
+        with self.lock:
+            return dict(
+                size=self.size,
+                ready=len(self.ready),
+                claimed=self.claimed,
+                missed=self.missed,
+                failed=self.failed,
+            )
+
+    def shutdown(self) -> None:
+        """
+        Stop refilling the pool and remove all idle namespaces.
+
+        :return: nothing
+        """
+        self.closed = True
+        self.wakeup.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        with self.lock:
+            namespaces = list(self.ready)
+            self.ready.clear()
+        for namespace in namespaces:
+            namespace.kill()
+        teardown.remove_paths([self.directory])
@@ -73,7 +73,7 @@ class Sdt:
         self.address: Optional[Tuple[Optional[str], Optional[int]]] = None
         self.protocol: Optional[str] = None
         self.network_layers: Set[str] = set()
-        self.session.node_handlers.append(self.handle_node_update)
+        self.session.node_batch_handlers.append(self.handle_node_updates)
         self.session.link_handlers.append(self.handle_link_update)
 
     def is_enabled(self) -> bool:
@@ -307,11 +307,38 @@ class Sdt:
             return
         self.cmd(f"delete node,{node_id}")
 
-    def handle_node_update(self, node_data: NodeData) -> None:
+    def handle_node_updates(self, node_data: List[NodeData]) -> None:
+        """
+        Handler for a batch of node updates, connecting once for all updates.
+
+        :param node_data: node data being updated
+        :return: nothing
+        """
+        if not self.connect():
+            return
+        # convert positions of nodes without a geo position in a single batch
+        convert = []
+        for data in node_data:
+            if data.message_type != MessageFlags.NONE:
+                continue
+            position = data.node.position
+            if None in position.get_geo() and None not in position.get()[:2]:
+                convert.append(data)
+        positions = [(x.node.position.x, x.node.position.y, 0) for x in convert]
+        geos = self.session.location.getgeo_many(positions)
+        converted = {id(data): geo for data, geo in zip(convert, geos)}
+        for data in node_data:
+            self.handle_node_update(data, converted.get(id(data)))
+
+    def handle_node_update(
+        self, node_data: NodeData, geo: Tuple[float, float, float] = None
+    ) -> None:
         """
         Handler for node updates, specifically for updating their location.
 
         :param node_data: node data being updated
+        :param geo: lat,lon,alt already converted from the node position, when
+            the node has no geo position
         :return: nothing
         """
         if not self.connect():
@@ -327,7 +354,9 @@ class Sdt:
                 pos = f"pos {lon:.6f},{lat:.6f},{alt:.6f}"
                 self.cmd(f"node {node.id} {pos}")
             elif node_data.message_type == MessageFlags.NONE:
-                lat, lon, alt = self.session.location.getgeo(x, y, 0)
+                if geo is None:
+                    geo = self.session.location.getgeo(x, y, 0)
+                lat, lon, alt = geo
                 pos = f"pos {lon:.6f},{lat:.6f},{alt:.6f}"
                 self.cmd(f"node {node.id} {pos}")
 
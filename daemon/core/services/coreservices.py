@@ -486,7 +486,10 @@ class CoreServices:
         for service in boot_path:
             service = self.get_service(node.id, service.name, default_service=True)
             try:
-                self.boot_service(node, service)
+                with node.session.tracer.span(
+                    "service_boot", "service", node_id=node.id, service=service.name
+                ):
+                    self.boot_service(node, service)
             except Exception as e:
                 logger.exception("exception booting service: %s", service.name)
                 raise CoreServiceBootError(e)
@@ -542,7 +545,10 @@ class CoreServices:
         elif service.validation_mode == ServiceMode.NON_BLOCKING:
             start = time.monotonic()
             while True:
-                status = self.validate_service(node, service)
+                with node.session.tracer.span(
+                    "service_validate", "service", node_id=node.id, service=service.name
+                ):
+                    status = self.validate_service(node, service)
                 if not status:
                     break
 
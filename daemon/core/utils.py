@@ -212,6 +212,7 @@ def cmd(
     cwd: Path = None,
     wait: bool = True,
     shell: bool = False,
+    stdin: str = None,
 ) -> str:
     """
     Execute a command on the host and return a tuple containing the exit status and
@@ -222,6 +223,7 @@ def cmd(
     :param cwd: directory to run command in
     :param wait: True to wait for status, False otherwise
     :param shell: True to use shell, False otherwise
+    :param stdin: data to write to the command standard input, requires wait
     :return: combined stdout and stderr
     :raises CoreCommandError: when there is a non-zero exit status or the file to
         execute is not found
@@ -232,9 +234,20 @@ def cmd(
         args = shlex.split(args)
     try:
         output = PIPE if wait else DEVNULL
-        p = Popen(args, stdout=output, stderr=output, env=env, cwd=cwd, shell=shell)
+        input_pipe = PIPE if stdin is not None else None
+        p = Popen(
+            args,
+            stdin=input_pipe,
+            stdout=output,
+            stderr=output,
+            env=env,
+            cwd=cwd,
+            shell=shell,
+        )
         if wait:
-            stdout, stderr = p.communicate()
+            if stdin is not None:
+                stdin = stdin.encode("utf-8")
+            stdout, stderr = p.communicate(stdin)
             stdout = stdout.decode("utf-8").strip()
             stderr = stderr.decode("utf-8").strip()
             status = p.wait()
@@ -433,6 +446,32 @@ def threadpool(
     return results, exceptions
 
 
+def threadpool_results(
+    funcs: List[Tuple[Callable, Iterable[Any], Dict[Any, Any]]], workers: int = 10
+) -> List[Tuple[Any, Optional[Exception]]]:
+    """
+    Run provided functions, arguments, and keywords within a threadpool
+    collecting the result or exception of each function, in the order provided.
+
+    :param funcs: iterable that provides a func, args, kwargs
+    :param workers: number of workers for the threadpool
+    :return: result and exception, None when successful, for each function
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for func, args, kwargs in funcs:
+            future = executor.submit(func, *args, **kwargs)
+            futures.append(future)
+        results = []
+        for future in futures:
+            try:
+                results.append((future.result(), None))
+            except Exception as e:
+                logger.exception("thread pool exception")
+                results.append((None, e))
+    return results
+
+
 def random_mac() -> str:
     """
     Create a random mac address using Xen OID 00:16:3E.
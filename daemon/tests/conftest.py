@@ -19,6 +19,7 @@ from core.emulator.enumerations import EventTypes
 from core.emulator.session import Session
 from core.nodes.base import CoreNode
 from core.nodes.netclient import LinuxNetClient
+from core.nodes.vnodeclient import VnodeClientPool
 
 EMANE_SERVICES = "zebra|OSPFv3MDR|IPForward"
 
@@ -56,11 +57,13 @@ def patcher(request):
         patch_manager.patch("os.mkdir")
         patch_manager.patch("core.utils.cmd")
         patch_manager.patch("core.utils.which")
+        patch_manager.patch("core.emulator.teardown.kill_processes")
         patch_manager.patch("core.nodes.netclient.get_net_client")
         patch_manager.patch_obj(
             LinuxNetClient, "get_mac", return_value="00:00:00:00:00:00"
         )
         patch_manager.patch_obj(CoreNode, "create_file")
+        patch_manager.patch_obj(VnodeClientPool, "available", return_value=False)
         patch_manager.patch_obj(Session, "write_state")
         patch_manager.patch_obj(Session, "write_nodes")
     yield patch_manager
@@ -0,0 +1,165 @@
+import threading
+
+import mock
+import pytest
+
+from core.emulator.batch import CommandBatch
+from core.emulator.session import Session
+from core.errors import CoreCommandError
+from core.nodes.base import CoreNode
+
+
+class BatchRecorder:
+    def __init__(self, name, error=None):
+        self.name = name
+        self.error = error
+        self.calls = []
+
+    def __call__(self, args, data):
+        self.calls.append((args, data))
+        if self.error:
+            raise CoreCommandError(1, args, "", self.error)
+        return ""
+
+
+class TestBatch:
+    @pytest.mark.parametrize(
+        "args,expected",
+        [
+            ("ip link set eth0 up", "ip"),
+            ("tc qdisc replace dev eth0 root netem delay 10", "tc"),
+            ("ip link show eth0", None),
+            ("ip -o link show type bridge", None),
+            ("cat /sys/class/net/eth0/ifindex", None),
+            ("ip", None),
+        ],
+    )
+    def test_batch_tool(self, args, expected):
+        assert CommandBatch.batch_tool(args) == expected
+
+    def test_submit_non_batchable(self):
+        # given
+        command_batch = CommandBatch()
+        host = BatchRecorder("host")
+
+        # when
+        batched = command_batch.submit(None, "ip link set eth0 up", host)
+        shell = command_batch.submit(None, "ip link set eth1 up", host, shell=True)
+        read = command_batch.submit(None, "ip link show eth0", host)
+
+        # then
+        assert batched is True
+        assert shell is False
+        assert read is False
+        assert host.calls == [("ip -force -batch -", "link set eth0 up\n")]
+
+    def test_flush_groups_per_target(self):
+        # given
+        command_batch = CommandBatch()
+        host = BatchRecorder("host")
+        node = BatchRecorder("node")
+        barrier = threading.Barrier(3)
+
+        def create(index):
+            command_batch.submit(None, f"ip link add veth{index} type veth", host)
+            command_batch.submit(index, f"ip link set eth{index} up", node)
+            command_batch.submit(None, f"tc qdisc replace dev veth{index} root", host)
+            barrier.wait()
+
+        threads = [threading.Thread(target=create, args=(x,)) for x in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # when
+        command_batch.flush()
+
+        # then
+        assert len(host.calls) == 2
+        ip_args, ip_data = host.calls[0]
+        assert ip_args == "ip -force -batch -"
+        assert len(ip_data.splitlines()) == 3
+        tc_args, tc_data = host.calls[1]
+        assert tc_args == "tc -force -batch -"
+        assert len(tc_data.splitlines()) == 3
+        assert len(node.calls) == 3
+
+    def test_flush_error_maps_command(self):
+        # given
+        command_batch = CommandBatch()
+        error = "RTNETLINK answers: File exists\nCommand failed -:2"
+        host = BatchRecorder("host", error)
+        command_batch.submit(None, "ip link set eth0 up", host)
+        command_batch.submit(None, "ip link add eth0 type veth", host)
+
+        # when
+        with pytest.raises(CoreCommandError) as e:
+            command_batch.flush()
+
+        # then
+        assert e.value.cmd == "ip link add eth0 type veth"
+        assert e.value.stderr == "RTNETLINK answers: File exists"
+
+    def test_node_shell_cmd_not_batched(self, session: Session):
+        # given
+        node = session.add_node(CoreNode)
+        command_batch = CommandBatch()
+
+        # when
+        with mock.patch.object(session, "command_batch", command_batch), mock.patch(
+            "core.utils.cmd", return_value="output"
+        ) as cmd:
+            output = node.cmd("ip link set lo up", shell=True)
+
+        # then
+        assert output == "output"
+        assert not command_batch.queues
+        assert cmd.call_args[1]["shell"] is True
+
+    def test_flush_errors_per_owner(self):
+        # given
+        command_batch = CommandBatch()
+
+        def run(args, data):
+            lines = data.splitlines()
+            if "link set eth1 up" in lines:
+                index = lines.index("link set eth1 up") + 1
+                error = f"Cannot find device\nCommand failed -:{index}"
+                raise CoreCommandError(1, args, "", error)
+            return ""
+
+        def submit(index):
+            with command_batch.owner(index):
+                command_batch.submit(None, f"ip link set eth{index} up", run)
+
+        threads = [threading.Thread(target=submit, args=(x,)) for x in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # when
+        with pytest.raises(CoreCommandError) as e:
+            command_batch.flush()
+
+        # then
+        assert e.value.cmd == "ip link set eth1 up"
+        assert list(command_batch.failed) == [1]
+        assert command_batch.failed[1] is e.value
+
+    def test_owner_flush_keeps_other_errors(self):
+        # given
+        command_batch = CommandBatch()
+        host = BatchRecorder("host", "Cannot find device\nCommand failed -:1")
+        with command_batch.owner(1):
+            command_batch.submit(None, "ip link set eth1 up", host)
+
+        # when
+        with command_batch.owner(2):
+            command_batch.flush()
+        with pytest.raises(CoreCommandError):
+            command_batch.flush()
+
+        # then
+        assert list(command_batch.failed) == [1]
@@ -0,0 +1,43 @@
+from core.emulator.data import NodeOptions
+from core.emulator.enumerations import MessageFlags
+from core.emulator.session import Session
+from core.nodes.base import CoreNode
+
+
+class TestCoalescer:
+    def test_node_updates_coalesced(self, session: Session):
+        # given
+        node1 = session.add_node(CoreNode, options=NodeOptions())
+        node2 = session.add_node(CoreNode, options=NodeOptions())
+        batches = []
+        session.node_batch_handlers.append(batches.append)
+        session.node_coalescer.start(60)
+
+        # when
+        session.broadcast_node(node1)
+        session.broadcast_nodes([node1, node2])
+        session.broadcast_node(node2, MessageFlags.DELETE)
+        session.broadcast_node(node1)
+        session.node_coalescer.stop()
+        session.node_batch_handlers.remove(batches.append)
+
+        # then
+        assert [[(x.node, x.message_type) for x in batch] for batch in batches] == [
+            [(node1, MessageFlags.NONE), (node2, MessageFlags.NONE)],
+            [(node2, MessageFlags.DELETE)],
+            [(node1, MessageFlags.NONE)],
+        ]
+
+    def test_node_updates_direct(self, session: Session):
+        # given
+        node = session.add_node(CoreNode, options=NodeOptions())
+        updates = []
+        session.node_handlers.append(updates.append)
+
+        # when
+        session.broadcast_node(node)
+        session.broadcast_node(node)
+        session.node_handlers.remove(updates.append)
+
+        # then
+        assert len(updates) == 2
@@ -3,10 +3,12 @@ Unit tests for testing basic CORE networks.
 """
 
 import threading
+import time
 from pathlib import Path
 from typing import List, Type
 
 import pytest
+from mock import patch
 
 from core.emulator.data import IpPrefixes, NodeOptions
 from core.emulator.enumerations import MessageFlags
@@ -180,3 +182,30 @@ class TestCore:
 
         # validate we receive a node message for updating its location
         assert event.wait(5)
+
+    def test_boot_nodes_control_ifaces(self, session: Session):
+        # given
+        prefix = session.options.get_config("controlnet")
+        session.options.set_config("controlnet", "172.16.0.0/24")
+        nodes = [session.add_node(CoreNode) for _ in range(10)]
+
+        def slow_next_iface_id(node: NodeBase) -> int:
+            while node.iface_id in node.ifaces:
+                node.iface_id += 1
+            iface_id = node.iface_id
+            time.sleep(0.01)
+            node.iface_id = iface_id + 1
+            return iface_id
+
+        # when
+        try:
+            with patch.object(NodeBase, "next_iface_id", slow_next_iface_id):
+                exceptions = session.boot_nodes()
+        finally:
+            session.options.set_config("controlnet", prefix)
+
+        # then
+        assert not exceptions
+        control_net = session.get_control_net(0)
+        assert len(control_net.ifaces) == len(nodes)
+        assert {x.node for x in control_net.get_ifaces()} == set(nodes)
@@ -0,0 +1,60 @@
+import threading
+import time
+
+from core.location.event import EventLoop
+
+
+class TestEventLoop:
+    def test_events_run_in_order(self):
+        # given
+        event_loop = EventLoop()
+        results = []
+        done = threading.Event()
+        event_loop.add_event(0.02, results.append, 2)
+        event_loop.add_event(0.01, results.append, 1)
+        event_loop.add_event(0.03, done.set)
+        canceled = event_loop.add_event(0.015, results.append, 3)
+        canceled.cancel()
+
+        # when
+        event_loop.run()
+        thread = event_loop.thread
+        assert done.wait(1)
+        event_loop.stop()
+        thread.join(1)
+
+        # then
+        assert results == [1, 2]
+        stats = event_loop.get_stats()
+        assert stats.events == 3
+        assert stats.max_lag >= stats.last_lag >= 0
+
+    def test_periodic_event(self):
+        # given
+        event_loop = EventLoop()
+        event_loop.run()
+        thread = event_loop.thread
+        runs = []
+        count = threading.Semaphore(0)
+
+        def periodic() -> None:
+            runs.append(time.monotonic())
+            count.release()
+
+        # when
+        event = event_loop.add_periodic_event(0.01, periodic)
+        for _ in range(3):
+            assert count.acquire(timeout=1)
+        event.cancel()
+        time.sleep(0.05)
+        fired = len(runs)
+        time.sleep(0.05)
+        event_loop.stop()
+        thread.join(1)
+
+        # then
+        assert len(runs) == fired
+        assert fired >= 3
+        stats = event_loop.get_stats()
+        assert stats.events == fired
+        assert stats.errors == 0
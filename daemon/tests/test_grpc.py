@@ -1,3 +1,4 @@
+import json
 import time
 from pathlib import Path
 from queue import Queue
@@ -8,9 +9,12 @@ import grpc
 import pytest
 from mock import patch
 
-from core.api.grpc import core_pb2, wrappers
+from core.api.grpc import core_pb2, grpcutils, wrappers
 from core.api.grpc.client import CoreGrpcClient, InterfaceHelper, MoveNodesStreamer
+from core.api.grpc.events import EventFilter, EventQueue
+from core.api.grpc.linkstats import LinkStatsSampler
 from core.api.grpc.server import CoreGrpcServer
+from core.api.grpc.throughputs import ThroughputSampler
 from core.api.grpc.wrappers import (
     ConfigOption,
     ConfigOptionType,
@@ -21,6 +25,7 @@ from core.api.grpc.wrappers import (
     Interface,
     Link,
     LinkOptions,
+    LinkType,
     MobilityAction,
     Node,
     NodeServiceData,
@@ -36,9 +41,9 @@ from core.api.tlv.enumerations import ConfigFlags
 from core.emane.models.ieee80211abg import EmaneIeee80211abgModel
 from core.emane.nodes import EmaneNet
 from core.emulator.data import EventData, IpPrefixes, NodeData, NodeOptions
-from core.emulator.enumerations import EventTypes, ExceptionLevels
-from core.errors import CoreError
-from core.location.mobility import BasicRangeModel, Ns2ScriptedMobility
+from core.emulator.enumerations import EventTypes, ExceptionLevels, MessageFlags
+from core.errors import CoreCommandError, CoreError
+from core.location.mobility import BasicRangeModel, LinkChange, Ns2ScriptedMobility
 from core.nodes.base import CoreNode
 from core.nodes.network import SwitchNode, WlanNode
 from core.xml.corexml import CoreXmlWriter
@@ -165,6 +170,74 @@ class TestGrpc:
         assert service_file.data == service_file_data
         assert option_value == real_session.options.get_config(option_key)
 
+    def test_reconcile_session(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        with client.context_connect():
+            session = client.create_session()
+        node1 = session.add_node(1, position=Position(x=50, y=100))
+        node2 = session.add_node(2, position=Position(x=100, y=100))
+        switch = session.add_node(
+            3, _type=NodeType.SWITCH, position=Position(x=200, y=200)
+        )
+        iface_helper = InterfaceHelper(ip4_prefix="10.83.0.0/16")
+        iface1 = iface_helper.create_iface(node1.id, 0)
+        link1 = Link(node1_id=node1.id, node2_id=switch.id, iface1=iface1)
+        iface2 = iface_helper.create_iface(node2.id, 0)
+        link2 = Link(node1_id=node2.id, node2_id=switch.id, iface1=iface2)
+        session.links = [link1, link2]
+        with patch.object(CoreXmlWriter, "write"):
+            with client.context_connect():
+                client.start_session(session)
+                session.nodes.pop(node2.id)
+                node4 = session.add_node(4, position=Position(x=300, y=100))
+                iface4 = iface_helper.create_iface(node4.id, 0)
+                link4 = Link(node1_id=node4.id, node2_id=switch.id, iface1=iface4)
+                link1.options = LinkOptions(loss=10.0)
+                session.links = [link1, link4]
+                node1.position = Position(x=75, y=100)
+
+                # when
+                result, exceptions, changes = client.reconcile_session(session)
+
+        # then
+        assert result is True
+        assert not exceptions
+        assert changes.reconciled is True
+        assert changes.added_nodes == [node4.id]
+        assert changes.deleted_nodes == [node2.id]
+        assert changes.replaced_nodes == []
+        assert changes.edited_nodes == [node1.id]
+        assert [x.node1_id for x in changes.added_links] == [node4.id]
+        assert [x.node1_id for x in changes.updated_links] == [node1.id]
+        assert len(changes.deleted_links) == 1
+        real_session = grpc_server.coreemu.sessions[session.id]
+        assert real_session.state == EventTypes.RUNTIME_STATE
+        assert node2.id not in real_session.nodes
+        real_node1 = real_session.get_node(node1.id, CoreNode)
+        assert real_node1.position.x == 75
+        assert real_node1.get_iface(0).local_options.loss == 10.0
+        assert 0 in real_session.get_node(node4.id, CoreNode).ifaces
+
+    def test_reconcile_session_not_running(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        with client.context_connect():
+            session = client.create_session()
+        session.add_node(1, position=Position(x=50, y=100))
+
+        # when
+        with patch.object(CoreXmlWriter, "write"):
+            with client.context_connect():
+                result, exceptions, changes = client.reconcile_session(session)
+
+        # then
+        assert result is True
+        assert changes.reconciled is False
+        real_session = grpc_server.coreemu.sessions[session.id]
+        assert real_session.state == EventTypes.RUNTIME_STATE
+        assert 1 in real_session.nodes
+
     @pytest.mark.parametrize("session_id", [None, 6013])
     def test_create_session(
         self, grpc_server: CoreGrpcServer, session_id: Optional[int]
@@ -218,6 +291,23 @@ class TestGrpc:
         assert len(session.nodes) == 1
         assert len(session.links) == 0
 
+    def test_get_session_trace(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        session.options.set_config("trace", "1")
+        node = session.add_node(CoreNode)
+
+        # then
+        with client.context_connect():
+            trace = client.get_session_trace(session.id)
+
+        # then
+        events = json.loads(trace)["traceEvents"]
+        spans = [x for x in events if x["ph"] == "X" and x["name"] == "add_node"]
+        assert spans[0]["pid"] == session.id
+        assert spans[0]["args"]["node_id"] == node.id
+
     def test_get_sessions(self, grpc_server: CoreGrpcServer):
         # given
         client = CoreGrpcClient()
@@ -251,6 +341,82 @@ class TestGrpc:
         assert node_id is not None
         assert session.get_node(node_id, CoreNode) is not None
 
+    def test_add_nodes(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        existing = session.add_node(CoreNode)
+        position = Position(x=0, y=0)
+        nodes = [
+            Node(id=0, name="n2", type=NodeType.DEFAULT, position=position),
+            Node(id=0, name="n3", type=NodeType.DEFAULT, position=position),
+            Node(id=existing.id, name="n4", type=NodeType.SWITCH, position=position),
+        ]
+
+        # then
+        with client.context_connect():
+            results = client.add_nodes(session.id, nodes)
+
+        # then
+        assert [x.result for x in results] == [True, True, False]
+        assert results[0].node_id != results[1].node_id
+        assert session.get_node(results[0].node_id, CoreNode).name == "n2"
+        assert session.get_node(results[1].node_id, CoreNode).name == "n3"
+        assert results[2].node_id == existing.id
+        assert results[2].error
+
+    def test_add_nodes_invalid_type(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        nodes = [
+            core_pb2.Node(name="n1", type=NodeType.DEFAULT.value),
+            core_pb2.Node(name="n2", type=99),
+        ]
+        request = core_pb2.AddNodesRequest(session_id=session.id, nodes=nodes)
+
+        # then
+        with client.context_connect():
+            response = client.stub.AddNodes(request)
+
+        # then
+        assert [x.result for x in response.results] == [True, False]
+        assert response.results[1].error
+        assert session.get_node(response.results[0].node_id, CoreNode).name == "n1"
+
+    def test_add_nodes_command_failure(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        position = Position(x=0, y=0)
+        nodes = [
+            Node(id=0, name="n1", type=NodeType.DEFAULT, position=position),
+            Node(id=0, name="n2", type=NodeType.DEFAULT, position=position),
+        ]
+        error = "Cannot find device\nCommand failed -:1"
+        create_node = grpcutils.add_node
+
+        def run(args, data):
+            raise CoreCommandError(1, args, "", error)
+
+        def add_node(session, node_proto):
+            node = create_node(session, node_proto)
+            if node.name == "n2":
+                session.command_batch.submit(None, "ip link set eth0 up", run)
+            return node
+
+        # then
+        with client.context_connect(), patch(
+            "core.api.grpc.grpcutils.add_node", side_effect=add_node
+        ):
+            results = client.add_nodes(session.id, nodes)
+
+        # then
+        assert [x.result for x in results] == [True, False]
+        assert "ip link set eth0 up" in results[1].error
+        assert session.get_node(results[0].node_id, CoreNode).name == "n1"
+        assert results[1].node_id not in session.nodes
+
     def test_get_node(self, grpc_server: CoreGrpcServer):
         # given
         client = CoreGrpcClient()
@@ -441,6 +607,80 @@ class TestGrpc:
             with client.context_connect():
                 client.add_link(session.id, link)
 
+    def test_add_links(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        switch = session.add_node(SwitchNode)
+        node1 = session.add_node(CoreNode)
+        node2 = session.add_node(CoreNode)
+        iface_helper = InterfaceHelper("10.0.0.0/24")
+        iface1 = iface_helper.create_iface(node1.id, 0)
+        iface2 = iface_helper.create_iface(node2.id, 0)
+        links = [
+            Link(node1.id, switch.id, iface1=iface1),
+            Link(node2.id, 100),
+            Link(node2.id, switch.id, iface1=iface2),
+        ]
+
+        # then
+        with client.context_connect():
+            results = client.add_links(session.id, links)
+
+        # then
+        assert [x.result for x in results] == [True, False, True]
+        assert results[1].error
+        assert results[0].iface1.ip4 == iface1.ip4
+        assert results[2].iface1.ip4 == iface2.ip4
+        assert len(switch.links()) == 2
+
+    def test_add_links_invalid_type(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        switch = session.add_node(SwitchNode)
+        node = session.add_node(CoreNode)
+        links = [
+            core_pb2.Link(node1_id=node.id, node2_id=switch.id, type=99),
+            core_pb2.Link(
+                node1_id=node.id, node2_id=switch.id, type=LinkType.WIRED.value
+            ),
+        ]
+        request = core_pb2.AddLinksRequest(session_id=session.id, links=links)
+
+        # then
+        with client.context_connect():
+            response = client.stub.AddLinks(request)
+
+        # then
+        assert [x.result for x in response.results] == [False, True]
+        assert response.results[0].error
+        assert len(switch.links()) == 1
+
+    def test_edit_links(self, grpc_server: CoreGrpcServer, ip_prefixes: IpPrefixes):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        switch = session.add_node(SwitchNode)
+        node = session.add_node(CoreNode)
+        iface = ip_prefixes.create_iface(node)
+        session.add_link(node.id, switch.id, iface)
+        options = LinkOptions(bandwidth=30000)
+        links = [
+            Link(node.id, switch.id, iface1=Interface(id=iface.id), options=options),
+            Link(node.id, 100, options=options),
+        ]
+
+        # then
+        with client.context_connect():
+            results = client.edit_links(session.id, links)
+
+        # then
+        assert [x.result for x in results] == [True, False]
+        assert results[1].error
+        link = switch.links()[0]
+        assert options.bandwidth == link.options.bandwidth
+
     def test_edit_link(self, grpc_server: CoreGrpcServer, ip_prefixes: IpPrefixes):
         # given
         client = CoreGrpcClient()
@@ -635,6 +875,21 @@ class TestGrpc:
         # then
         assert result is True
 
+    def test_get_mobility_timeline(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        wlan = session.add_node(WlanNode)
+        session.mobility.set_model(wlan, BasicRangeModel)
+        wlan.model.timeline.append(LinkChange(1.5, 1, 2, True))
+
+        # then
+        with client.context_connect():
+            timeline = client.get_mobility_timeline(session.id, wlan.id)
+
+        # then
+        assert timeline == [wrappers.LinkChange(1.5, 1, 2, True)]
+
     def test_get_service_defaults(self, grpc_server: CoreGrpcServer):
         # given
         client = CoreGrpcClient()
@@ -751,6 +1006,113 @@ class TestGrpc:
             # then
             queue.get(timeout=5)
 
+    def test_node_events_batch(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        nodes = [session.add_node(CoreNode) for _ in range(3)]
+        queue = Queue()
+
+        # then
+        with client.context_connect():
+            client.events(session.id, queue.put, batch_size=10)
+            time.sleep(0.1)
+            session.broadcast_nodes(nodes)
+
+            # then
+            node_ids = {queue.get(timeout=5).node_event.node.id for _ in nodes}
+            assert node_ids == {x.id for x in nodes}
+
+    def test_node_events_filter(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        node1 = session.add_node(CoreNode)
+        node2 = session.add_node(CoreNode)
+        queue = Queue()
+
+        # then
+        with client.context_connect():
+            client.events(session.id, queue.put, node_ids=[node2.id])
+            time.sleep(0.1)
+            session.broadcast_node(node1)
+            session.broadcast_node(node2)
+
+            # then
+            event = queue.get(timeout=5)
+            assert event.node_event.node.id == node2.id
+            assert queue.empty()
+
+    @pytest.mark.parametrize(
+        "node_ids,network_ids,region,expected",
+        [
+            ([], [], None, [True, True, True]),
+            ([1], [], None, [True, False, True]),
+            ([], [3], None, [True, False, True]),
+            ([], [], core_pb2.EventRegion(max_x=20, max_y=20), [True, False, True]),
+        ],
+    )
+    def test_event_filter(
+        self,
+        grpc_server: CoreGrpcServer,
+        ip_prefixes: IpPrefixes,
+        node_ids,
+        network_ids,
+        region,
+        expected,
+    ):
+        # given
+        session = grpc_server.coreemu.create_session()
+        options = NodeOptions(x=10, y=10)
+        node1 = session.add_node(CoreNode, 1, options)
+        options = NodeOptions(x=100, y=100)
+        node2 = session.add_node(CoreNode, 2, options)
+        switch = session.add_node(SwitchNode, 3, options)
+        session.add_link(node1.id, switch.id, ip_prefixes.create_iface(node1))
+        link_data = switch.links()[0]
+        event_filter = EventFilter(session, node_ids, network_ids, region)
+
+        # when
+        node1_match = event_filter.matches(NodeData(node1, MessageFlags.NONE))
+        node2_match = event_filter.matches(NodeData(node2, MessageFlags.NONE))
+        link_match = event_filter.matches(link_data)
+
+        # then
+        assert [node1_match, node2_match, link_match] == expected
+
+    @pytest.mark.parametrize(
+        "overflow,expected,dropped,coalesced",
+        [
+            (core_pb2.EventOverflow.COALESCE, 2, 1, 2),
+            (core_pb2.EventOverflow.DROP_OLDEST, 2, 3, 0),
+            (core_pb2.EventOverflow.DISCONNECT, 0, 0, 0),
+        ],
+    )
+    def test_event_queue_overflow(
+        self, grpc_server: CoreGrpcServer, overflow, expected, dropped, coalesced
+    ):
+        # given
+        session = grpc_server.coreemu.create_session()
+        node1 = session.add_node(CoreNode)
+        node2 = session.add_node(CoreNode)
+        event_queue = EventQueue(2, overflow)
+
+        # when
+        updates = [node1, node2, node1, node2]
+        event_queue.put_all(NodeData(x, MessageFlags.NONE) for x in updates)
+        event_queue.put(NodeData(node=node1, message_type=MessageFlags.DELETE))
+
+        # then
+        data = event_queue.get(10, 0)
+        assert len(data) == expected
+        if data:
+            assert data[0].node == node2
+            assert data[1].message_type == MessageFlags.DELETE
+        assert event_queue.dropped == dropped
+        assert event_queue.coalesced == coalesced
+        is_disconnect = overflow == core_pb2.EventOverflow.DISCONNECT
+        assert event_queue.overflowed == is_disconnect
+
     def test_link_events(self, grpc_server: CoreGrpcServer, ip_prefixes: IpPrefixes):
         # given
         client = CoreGrpcClient()
@@ -797,6 +1159,78 @@ class TestGrpc:
             # then
             queue.get(timeout=5)
 
+    def test_throughput_sampler(self, grpc_server: CoreGrpcServer, tmp_path: Path):
+        # given
+        session = grpc_server.coreemu.create_session()
+        session.add_host_iface("veth1.0.1", 1, 0)
+        session.add_host_iface("b.2.1", 2)
+        net_dev = tmp_path / "dev"
+        header = "Inter-|   Receive\n face |bytes\n"
+        line = "{}: {} 0 0 0 0 0 0 0 {} 0 0 0 0 0 0 0\n"
+        net_dev.write_text(header + line.format("veth1.0.1", 0, 0))
+        sampler = ThroughputSampler(net_dev)
+
+        # when
+        subscriber = sampler.subscribe(session, 0.2)
+        time.sleep(0.1)
+        lines = [line.format("veth1.0.1", 100, 100), line.format("b.2.1", 5, 5)]
+        net_dev.write_text(header + "".join(lines))
+        event = subscriber.get(5)
+        sampler.unsubscribe(subscriber)
+
+        # then
+        assert event.session_id == session.id
+        assert len(event.iface_throughputs) == 1
+        iface_throughput = event.iface_throughputs[0]
+        assert iface_throughput.node_id == 1
+        assert iface_throughput.iface_id == 0
+        assert iface_throughput.throughput > 0
+        assert len(event.bridge_throughputs) == 0
+
+    def test_link_stats_sampler(
+        self, grpc_server: CoreGrpcServer, ip_prefixes: IpPrefixes
+    ):
+        # given
+        session = grpc_server.coreemu.create_session()
+        node1 = session.add_node(CoreNode)
+        node2 = session.add_node(CoreNode)
+        iface1, iface2 = session.add_link(
+            node1.id,
+            node2.id,
+            ip_prefixes.create_iface(node1),
+            ip_prefixes.create_iface(node2),
+        )
+        sampler = LinkStatsSampler(session)
+
+        def output(tx_bytes: int, drops: int):
+            links = []
+            for iface in [iface1, iface2]:
+                stats64 = {
+                    "rx": {"bytes": 0, "packets": 0, "dropped": 0},
+                    "tx": {"bytes": tx_bytes, "packets": tx_bytes, "dropped": 0},
+                }
+                links.append(dict(ifname=iface.localname, stats64=stats64))
+            qdisc = dict(dev=iface2.localname, root=True, drops=drops, backlog=7)
+            return [json.dumps(links), json.dumps([qdisc])]
+
+        # when
+        with patch("core.api.grpc.linkstats.utils.cmd") as cmd:
+            cmd.side_effect = output(0, 0)
+            first = sampler.sample()
+            cmd.side_effect = output(1000, 5)
+            event = sampler.sample()
+
+        # then
+        assert first is None
+        assert len(event.links) == 2
+        node1_to_node2 = event.links[0]
+        if node1_to_node2.node1_id != node1.id:
+            node1_to_node2 = event.links[1]
+        assert node1_to_node2.node2_id == node2.id
+        assert node1_to_node2.bytes_per_second > 0
+        assert node1_to_node2.drops == 5
+        assert node1_to_node2.backlog == 7
+
     def test_session_events(self, grpc_server: CoreGrpcServer):
         # given
         client = CoreGrpcClient()
@@ -945,6 +1379,62 @@ class TestGrpc:
         assert node.position.lat == lat
         assert node.position.alt == alt
 
+    def test_move_nodes_batch(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        node1 = session.add_node(CoreNode)
+        node2 = session.add_node(CoreNode)
+        lon, lat, alt = 10.0, 15.0, 5.0
+        streamer = MoveNodesStreamer(session.id)
+        streamer.send_position(node1.id, 5.0, 5.0)
+        streamer.send_geo(node2.id, lon, lat, alt)
+        streamer.send_position(node1.id, 10.0, 20.0)
+        streamer.stop()
+
+        # then
+        with client.context_connect():
+            client.move_nodes(streamer)
+
+        # assert
+        assert node1.position.x == 10.0
+        assert node1.position.y == 20.0
+        assert node2.position.lon == lon
+        assert node2.position.lat == lat
+        assert node2.position.alt == alt
+
+    @pytest.mark.parametrize("node_id", [None, 1000])
+    def test_move_nodes_applies_prior_moves(
+        self, grpc_server: CoreGrpcServer, node_id: Optional[int]
+    ):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        node1 = session.add_node(CoreNode)
+        node2 = session.add_node(CoreNode)
+        lon, lat, alt = 10.0, 15.0, 5.0
+        streamer = MoveNodesStreamer(session.id)
+        streamer.send_position(node1.id, 10.0, 20.0)
+        streamer.send_geo(node2.id, lon, lat, alt)
+        if node_id is None:
+            streamer.send(wrappers.MoveNodesRequest(session.id, node2.id))
+        else:
+            streamer.send_position(node_id, 5.0, 5.0)
+        streamer.send_position(node1.id, 30.0, 40.0)
+        streamer.stop()
+
+        # then
+        with pytest.raises(grpc.RpcError):
+            with client.context_connect():
+                client.move_nodes(streamer)
+
+        # assert
+        assert node1.position.x == 10.0
+        assert node1.position.y == 20.0
+        assert node2.position.lon == lon
+        assert node2.position.lat == lat
+        assert node2.position.alt == alt
+
     def test_move_nodes_exception(self, grpc_server: CoreGrpcServer):
         # given
         client = CoreGrpcClient()
@@ -0,0 +1,94 @@
+import threading
+import time
+from queue import Queue
+
+import grpc
+import pytest
+
+from core.api.grpc.aioserver import CoreAioGrpcServer
+from core.api.grpc.client import CoreGrpcClient, MoveNodesStreamer
+from core.api.grpc.wrappers import Event
+from core.emulator.enumerations import EventTypes
+from core.nodes.base import CoreNode
+
+AIO_ADDRESS = "localhost:50052"
+AIO_WORKERS = 4
+
+
+@pytest.fixture(scope="module")
+def module_aio_grpc(global_coreemu):
+    grpc_server = CoreAioGrpcServer(global_coreemu, workers=AIO_WORKERS)
+    thread = threading.Thread(target=grpc_server.listen, args=(AIO_ADDRESS,))
+    thread.daemon = True
+    thread.start()
+    time.sleep(0.5)
+    yield grpc_server
+    grpc_server.stop()
+
+
+@pytest.fixture
+def aio_grpc_server(module_aio_grpc):
+    yield module_aio_grpc
+    for session in module_aio_grpc.coreemu.sessions.values():
+        session.set_state(EventTypes.CONFIGURATION_STATE)
+    module_aio_grpc.coreemu.shutdown()
+
+
+class TestAioGrpc:
+    def test_get_session(self, aio_grpc_server: CoreAioGrpcServer):
+        # given
+        client = CoreGrpcClient(AIO_ADDRESS)
+        session = aio_grpc_server.coreemu.create_session()
+        session.add_node(CoreNode)
+
+        # then
+        with client.context_connect():
+            result = client.get_session(session.id)
+            with pytest.raises(grpc.RpcError) as e:
+                client.get_session(session.id + 1)
+
+        # then
+        assert result.id == session.id
+        assert len(result.nodes) == 1
+        assert e.value.code() == grpc.StatusCode.NOT_FOUND
+
+    def test_events_exceed_workers(self, aio_grpc_server: CoreAioGrpcServer):
+        # given
+        client = CoreGrpcClient(AIO_ADDRESS)
+        session = aio_grpc_server.coreemu.create_session()
+        node = session.add_node(CoreNode)
+        queue = Queue()
+
+        def handle_event(event: Event) -> None:
+            assert event.node_event.node.id == node.id
+            queue.put(event)
+
+        # then
+        streams = AIO_WORKERS * 2
+        with client.context_connect():
+            for _ in range(streams):
+                client.events(session.id, handle_event)
+            time.sleep(0.5)
+            session.broadcast_node(node)
+
+            # then
+            for _ in range(streams):
+                queue.get(timeout=5)
+            assert client.get_session(session.id).id == session.id
+
+    def test_move_nodes(self, aio_grpc_server: CoreAioGrpcServer):
+        # given
+        client = CoreGrpcClient(AIO_ADDRESS)
+        session = aio_grpc_server.coreemu.create_session()
+        node = session.add_node(CoreNode)
+        streamer = MoveNodesStreamer(session.id)
+        streamer.send_position(node.id, 10.0, 20.0)
+        streamer.stop()
+
+        # then
+        with client.context_connect():
+            client.move_nodes(streamer)
+
+        # then
+        assert node.position.x == 10.0
+        assert node.position.y == 20.0
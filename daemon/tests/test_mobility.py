@@ -1,10 +1,61 @@
+import random
+import time
+from pathlib import Path
+
 import pytest
 
-from core.location.mobility import WayPoint
+from core.emulator.data import IpPrefixes, NodeOptions
+from core.emulator.session import Session
+from core.location.clock import MobilityClock, ScaledClock, StepClock, create_clock
+from core.location.geo import GeoLocation
+from core.location.mobility import (
+    BasicRangeModel,
+    Ns2ScriptedMobility,
+    RangeEngine,
+    WayPoint,
+    WayPointMobility,
+    np,
+)
+from core.location.trace import (
+    BinaryTraceReader,
+    Ns2TraceReader,
+    TraceReader,
+    convert_ns2,
+)
+from core.nodes.base import CoreNode
+from core.nodes.interface import CoreInterface
+from core.nodes.network import WlanNode
 
 POSITION = (0.0, 0.0, 0.0)
 
 
+@pytest.fixture
+def clock_session(session: Session):
+    clock = session.options.get_config("mobility_clock")
+    scale = session.options.get_config("mobility_scale")
+    yield session
+    thread = session.event_loop.thread
+    session.event_loop.stop()
+    if thread is not None:
+        thread.join(1)
+    session.options.set_config("mobility_clock", clock)
+    session.options.set_config("mobility_scale", scale)
+
+
+def create_ns2_script(path: Path, nodes: int, count: int) -> Path:
+    lines = []
+    for node in range(nodes):
+        lines.append(f"$node_({node}) set X_ {node * 10.0}")
+        lines.append(f"$node_({node}) set Y_ 5.0")
+        lines.append(f"$node_({node}) set Z_ 0.00")
+    for index in range(count):
+        node = index % nodes
+        line_time = float(index)
+        lines.append(f'$ns_ at {line_time} "$node_({node}) setdest 50.0 60.0 5.0"')
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
 class TestMobility:
     @pytest.mark.parametrize(
         "wp1, wp2, expected",
@@ -17,3 +68,362 @@ class TestMobility:
     )
     def test_waypoint_lessthan(self, wp1, wp2, expected):
         assert (wp1 < wp2) == expected
+
+    @pytest.mark.parametrize("vectorized", [True, False])
+    def test_basic_range_update(
+        self, session: Session, ip_prefixes: IpPrefixes, vectorized: bool
+    ):
+        # given
+        wlan_node = session.add_node(WlanNode)
+        session.mobility.set_model(wlan_node, BasicRangeModel, {"range": "100"})
+        ifaces = []
+        for x in (0, 50, 500):
+            options = NodeOptions(model="mdr")
+            options.set_position(x, 0)
+            node = session.add_node(CoreNode, options=options)
+            iface_data = ip_prefixes.create_iface(node)
+            session.add_link(node.id, wlan_node.id, iface1_data=iface_data)
+            ifaces.append(node.get_iface(iface_data.id))
+        iface1, iface2, iface3 = ifaces
+        model = wlan_node.model
+        if not vectorized:
+            model.engine = None
+        assert wlan_node.is_linked(min(iface1, iface2), max(iface1, iface2))
+
+        # when
+        iface2.node.setposition(450, 0)
+        model.update([iface2])
+
+        # then
+        assert not wlan_node.is_linked(min(iface1, iface2), max(iface1, iface2))
+        assert wlan_node.is_linked(min(iface2, iface3), max(iface2, iface3))
+        assert model.iface_links == {iface2: {iface3}, iface3: {iface2}}
+
+    @pytest.mark.parametrize("vectorized", [True, False])
+    def test_basic_range_unlinks_external_link(
+        self, session: Session, ip_prefixes: IpPrefixes, vectorized: bool
+    ):
+        # given
+        wlan_node = session.add_node(WlanNode)
+        session.mobility.set_model(wlan_node, BasicRangeModel, {"range": "10"})
+        ifaces = []
+        for x in (0, 50):
+            options = NodeOptions(model="mdr")
+            options.set_position(x, 0)
+            node = session.add_node(CoreNode, options=options)
+            iface_data = ip_prefixes.create_iface(node)
+            session.add_link(node.id, wlan_node.id, iface1_data=iface_data)
+            ifaces.append(node.get_iface(iface_data.id))
+        iface1, iface2 = ifaces
+        model = wlan_node.model
+        if not vectorized:
+            model.engine = None
+        wlan_node.link(iface2, iface1)
+        assert wlan_node.is_linked(min(iface1, iface2), max(iface1, iface2))
+
+        # when
+        iface2.node.position.set(500, 0)
+        model.update([iface2])
+
+        # then
+        assert not wlan_node.is_linked(min(iface1, iface2), max(iface1, iface2))
+        assert model.iface_links == {}
+
+    def test_basic_range_unlinks_link_before_model(
+        self, session: Session, ip_prefixes: IpPrefixes
+    ):
+        # given
+        wlan_node = session.add_node(WlanNode)
+        ifaces = []
+        for _ in range(2):
+            node = session.add_node(CoreNode, options=NodeOptions(model="mdr"))
+            iface_data = ip_prefixes.create_iface(node)
+            session.add_link(node.id, wlan_node.id, iface1_data=iface_data)
+            ifaces.append(node.get_iface(iface_data.id))
+        iface1, iface2 = ifaces
+        wlan_node.link(iface1, iface2)
+        session.mobility.set_model(wlan_node, BasicRangeModel, {"range": "10"})
+        model = wlan_node.model
+        iface1.node.setposition(0, 0)
+
+        # when
+        iface2.node.setposition(500, 0)
+
+        # then
+        assert not wlan_node.is_linked(min(iface1, iface2), max(iface1, iface2))
+        assert model.iface_links == {}
+
+    @pytest.mark.skipif(np is None, reason="numpy not installed")
+    def test_range_engine_matches_calcdistance(self):
+        # given
+        engine = RangeEngine()
+        positions = {}
+        random.seed(1)
+        for index in range(40):
+            iface = object.__new__(CoreInterface)
+            x, y = random.uniform(0, 300), random.uniform(0, 300)
+            z = random.choice([None, random.uniform(0, 50)])
+            positions[iface] = (x, y, z)
+        first = next(iter(positions))
+        positions[first] = (0.0, 0.0, None)
+        ifaces = list(positions)
+        positions[ifaces[1]] = (60.0, 80.0, None)
+        positions[ifaces[2]] = (None, None, None)
+        for iface, (x, y, z) in positions.items():
+            engine.set_position(iface, x, y, z)
+        moved = ifaces[:5]
+        moved.remove(ifaces[2])
+
+        # when
+        valid, in_range = engine.calc(moved, 100)
+
+        # then
+        for row, iface in enumerate(moved):
+            for column, iface2 in enumerate(ifaces):
+                x, y, z = positions[iface2]
+                if iface2 is iface or x is None:
+                    assert not valid[row, column]
+                    continue
+                d = BasicRangeModel.calcdistance(positions[iface], (x, y, z))
+                assert in_range[row, column] == (d <= 100)
+        assert in_range[0, 1]
+
+    @pytest.mark.skipif(np is None, reason="numpy not installed")
+    def test_movenodes_matches_movenode(self, session: Session):
+        # given
+        points = [
+            ((10.0, 10.0, None), (100.0, 50.0, None), 20.0),
+            ((10.0, 10.0, 5.0), (12.0, 10.0, 5.0), 20.0),
+            ((1.0, 50.0, None), (-20.0, 60.0, None), 30.0),
+            ((30.0, 30.0, None), (30.0, 30.0, None), 10.0),
+            ((30.0, 30.0, None), (60.0, 90.0, 10.0), 0.0),
+        ]
+        models = []
+        for _ in range(2):
+            model = object.__new__(WayPointMobility)
+            model.session = session
+            model.points = {}
+            model.endtime = 0
+            model.timezero = 0.0
+            model.lasttime = 3.0
+            nodes = []
+            for start, end, speed in points:
+                options = NodeOptions()
+                options.set_position(*start[:2])
+                node = session.add_node(CoreNode, options=options)
+                node.position.set(*start)
+                model.points[node.id] = WayPoint(0.0, node.id, end, speed)
+                nodes.append(node)
+            models.append((model, nodes))
+        (scalar, scalar_nodes), (vector, vector_nodes) = models
+
+        # when
+        scalar_moved = [x for x in scalar_nodes if scalar.movenode(x, 0.5)]
+        vector_moved = vector.movenodes(vector_nodes, 0.5)
+
+        # then
+        assert [scalar_nodes.index(x) for x in scalar_moved] == [
+            vector_nodes.index(x) for x in vector_moved
+        ]
+        for node1, node2 in zip(scalar_nodes, vector_nodes):
+            assert node1.position.get() == pytest.approx(node2.position.get())
+        assert len(scalar.points) == len(vector.points) == 3
+        assert scalar.endtime == vector.endtime == 3.0
+
+    def test_ns2_trace_reader(self, tmp_path: Path):
+        # given
+        path = create_ns2_script(tmp_path / "test.scen", 3, 100)
+
+        # when
+        reader = Ns2TraceReader(path, chunk_size=256)
+
+        # then
+        assert len(reader.chunks) > 1
+        assert reader.end_time == 99.0
+        assert reader.initial == {
+            0: (0.0, 5.0, 0.0),
+            1: (10.0, 5.0, 0.0),
+            2: (20.0, 5.0, 0.0),
+        }
+        rows = reader.read(10.0, 20.0)
+        assert [x[0] for x in rows] == [float(x) for x in range(10, 20)]
+        assert rows[0] == (10.0, 1, 50.0, 60.0, None, 5.0)
+        assert len(reader.read(0.0, 100.0)) == 100
+        reader.close()
+
+    def test_incomplete_trace_reader(self, tmp_path: Path):
+        # given
+        class PartialReader(TraceReader):
+            def close(self) -> None:
+                pass
+
+        # when
+        with pytest.raises(TypeError):
+            PartialReader(tmp_path / "test.scen")
+
+    def test_ns2_script_streaming(self, session: Session, tmp_path: Path, monkeypatch):
+        # given
+        path = create_ns2_script(tmp_path / "test.scen", 3, 100)
+        monkeypatch.setattr(Ns2ScriptedMobility, "stream_size", 0)
+        wlan_node = session.add_node(WlanNode)
+        config = {
+            "file": str(path),
+            "refresh_ms": "50",
+            "loop": "1",
+            "autostart": "",
+            "map": "0:5",
+            "script_start": "",
+            "script_pause": "",
+            "script_stop": "",
+        }
+
+        # when
+        session.mobility.set_model(wlan_node, Ns2ScriptedMobility, config)
+        model = wlan_node.mobility
+
+        # then
+        assert model.reader is not None
+        assert set(model.initial) == {5, 1, 2}
+        assert model.endtime == 99.0
+        assert len(model.queue) == 10
+        model.updatepoints(15.0)
+        assert len(model.points) == 3
+        assert max(x.time for x in model.queue) == 29.0
+        assert model.loopwaypoints()
+        assert min(x.time for x in model.queue) == 0.0
+
+    def test_binary_trace(self, tmp_path: Path, monkeypatch):
+        # given
+        monkeypatch.setattr("core.location.trace.BINARY_INDEX_STEP", 7)
+        path = create_ns2_script(tmp_path / "test.scen", 3, 100)
+        trace_path = tmp_path / "test.trace"
+
+        # when
+        count = convert_ns2(path, trace_path)
+        reader = BinaryTraceReader(trace_path)
+
+        # then
+        ns2_reader = Ns2TraceReader(path)
+        assert count == 100
+        assert reader.initial == ns2_reader.initial
+        assert reader.end_time == 99.0
+        assert reader.find(-1.0) == 0
+        assert reader.find(10.5) == 11
+        assert reader.find(100.0) == 100
+        assert reader.read(10.0, 20.0) == ns2_reader.read(10.0, 20.0)
+        reader.close()
+        ns2_reader.close()
+
+    def test_ns2_script_binary_trace(self, session: Session, tmp_path: Path):
+        # given
+        path = create_ns2_script(tmp_path / "test.scen", 3, 30)
+        trace_path = tmp_path / "test.trace"
+        convert_ns2(path, trace_path)
+        wlan_node = session.add_node(WlanNode)
+        config = {
+            "file": str(trace_path),
+            "refresh_ms": "50",
+            "loop": "1",
+            "autostart": "",
+            "map": "0:5",
+            "script_start": "",
+            "script_pause": "",
+            "script_stop": "",
+        }
+
+        # when
+        session.mobility.set_model(wlan_node, Ns2ScriptedMobility, config)
+        model = wlan_node.mobility
+
+        # then
+        assert isinstance(model.reader, BinaryTraceReader)
+        assert model.initial[5].coords == (0.0, 5.0, 0.0)
+        assert model.endtime == 29.0
+        assert sorted(x.node_id for x in model.queue if x.time < 3.0) == [1, 2, 5]
+
+    @pytest.mark.parametrize("loop", ["0", "1"])
+    def test_step_clock_timeline(
+        self, clock_session: Session, ip_prefixes: IpPrefixes, tmp_path: Path, loop
+    ):
+        # given
+        session = clock_session
+        session.options.set_config("mobility_clock", "step")
+        wlan_node = session.add_node(WlanNode)
+        session.mobility.set_model(wlan_node, BasicRangeModel, {"range": "100"})
+        nodes = []
+        for _ in range(2):
+            node = session.add_node(CoreNode, options=NodeOptions(model="mdr"))
+            iface_data = ip_prefixes.create_iface(node)
+            session.add_link(node.id, wlan_node.id, iface1_data=iface_data)
+            nodes.append(node)
+        node1, node2 = nodes
+        path = tmp_path / "test.scen"
+        path.write_text(
+            "$node_(0) set X_ 0.0\n$node_(0) set Y_ 0.0\n$node_(0) set Z_ 0.0\n"
+            "$node_(1) set X_ 50.0\n$node_(1) set Y_ 0.0\n$node_(1) set Z_ 0.0\n"
+            '$ns_ at 1.0 "$node_(1) setdest 500.0 0.0 100.0"\n'
+        )
+        config = {
+            "file": str(path),
+            "refresh_ms": "50",
+            "loop": loop,
+            "autostart": "",
+            "map": f"0:{node1.id},1:{node2.id}",
+            "script_start": "",
+            "script_pause": "",
+            "script_stop": "",
+        }
+        session.mobility.set_model(wlan_node, Ns2ScriptedMobility, config)
+        mobility = wlan_node.mobility
+        session.event_loop.run()
+
+        # when
+        mobility.start()
+        timeout = time.monotonic() + 5
+        while mobility.state != mobility.STATE_STOPPED:
+            assert time.monotonic() < timeout
+            time.sleep(0.01)
+
+        # then
+        timeline = wlan_node.model.get_timeline()
+        assert [x.linked for x in timeline] == [True, False]
+        assert timeline[0].time == 0.0
+        assert 1.4 < timeline[1].time < 1.7
+        assert mobility.clock.now() >= 5.0
+
+    @pytest.mark.parametrize(
+        "name,expected",
+        [("realtime", MobilityClock), ("scaled", ScaledClock), ("step", StepClock)],
+    )
+    def test_create_clock(self, clock_session: Session, name, expected):
+        # given
+        session = clock_session
+        session.options.set_config("mobility_clock", name)
+        session.options.set_config("mobility_scale", "10")
+
+        # when
+        clock = create_clock(session.options)
+
+        # then
+        assert type(clock) is expected
+        if name == "scaled":
+            assert clock.delay(10.0) == 1.0
+        elif name == "step":
+            assert clock.delay(10.0) == 0.0
+            assert clock.now() == 10.0
+
+    def test_geo_many_matches_scalar(self):
+        # given
+        location = GeoLocation()
+        location.setrefgeo(47.57917, -122.13232, 2.0)
+        location.refscale = 150.0
+        positions = [(100.0, 200.0, None), (0.0, 0.0, 5.0), (1000.5, 20.25, 3.0)]
+
+        # when
+        geos = location.getgeo_many(positions)
+        xyzs = location.getxyz_many(geos)
+
+        # then
+        assert geos == [location.getgeo(*x) for x in positions]
+        assert xyzs == [location.getxyz(*x) for x in geos]
+        assert location.getgeo_many([]) == []
@@ -0,0 +1,159 @@
+import struct
+
+import mock
+import pytest
+
+from core.errors import CoreCommandError
+from core.nodes import netlink
+from core.nodes.netclient import NetlinkNetClient
+
+
+class FakeNetlinkSocket:
+    """
+    Netlink socket acknowledging requests with the provided error code, link
+    lookups are answered with a link and always succeed.
+    """
+
+    def __init__(self, code: int = 0) -> None:
+        self.code: int = code
+        self.sent = []
+        self.replies = []
+
+    def bind(self, address) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def send(self, data: bytes) -> None:
+        self.sent.append(data)
+        _, msg_type, _, seq, _ = netlink.NLMSG_HEADER.unpack_from(data)
+        code = self.code
+        reply = b""
+        if msg_type == netlink.RTM_GETLINK:
+            body = netlink.IFINFOMSG.pack(0, 0, 5, 0, 0)
+            length = netlink.NLMSG_HEADER.size + len(body)
+            header = netlink.NLMSG_HEADER.pack(length, netlink.RTM_NEWLINK, 0, seq, 0)
+            reply += header + body
+            code = 0
+        body = netlink.NLMSG_ERROR_CODE.pack(-code) + b"\0" * 16
+        length = netlink.NLMSG_HEADER.size + len(body)
+        header = netlink.NLMSG_HEADER.pack(length, netlink.NLMSG_ERROR, 0, seq, 0)
+        self.replies.append(reply + header + body)
+
+    def recv(self, size: int) -> bytes:
+        return self.replies.pop(0)
+
+
+class TestNetlink:
+    def test_pack_attr_alignment(self):
+        # given
+        name = "eth0"
+
+        # when
+        data = netlink.pack_str(netlink.IFLA_IFNAME, name)
+
+        # then
+        length, attr_type = netlink.RTA_HEADER.unpack_from(data)
+        assert attr_type == netlink.IFLA_IFNAME
+        assert length == netlink.RTA_HEADER.size + len(name) + 1
+        assert len(data) % 4 == 0
+
+    def test_parse_attrs(self):
+        # given
+        data = netlink.pack_str(netlink.IFLA_IFNAME, "veth1.0.1")
+        data += netlink.pack_u32(netlink.IFLA_MTU, 1500)
+        data += netlink.pack_attr(netlink.IFLA_ADDRESS, bytes(range(6)))
+
+        # when
+        attrs = netlink.parse_attrs(data)
+
+        # then
+        assert attrs[netlink.IFLA_IFNAME] == b"veth1.0.1\0"
+        assert struct.unpack("=I", attrs[netlink.IFLA_MTU])[0] == 1500
+        assert attrs[netlink.IFLA_ADDRESS] == bytes(range(6))
+
+    def test_parse_messages(self):
+        # given
+        payload = netlink.NLMSG_ERROR_CODE.pack(-19) + b"\0" * 16
+        length = netlink.NLMSG_HEADER.size + len(payload)
+        header = netlink.NLMSG_HEADER.pack(length, netlink.NLMSG_ERROR, 0, 5, 0)
+
+        # when
+        messages = netlink.parse_messages(header + payload + header + payload)
+
+        # then
+        assert len(messages) == 2
+        msg_type, seq, body = messages[0]
+        assert msg_type == netlink.NLMSG_ERROR
+        assert seq == 5
+        assert netlink.NLMSG_ERROR_CODE.unpack_from(body)[0] == -19
+
+
+class TestNetlinkNetClient:
+    def test_host_socket(self):
+        # given
+        client = NetlinkNetClient(mock.MagicMock())
+        host = FakeNetlinkSocket()
+
+        # when
+        with mock.patch.object(netlink, "host_socket", return_value=host):
+            sock = client._sock("ip link show lo")
+
+        # then
+        assert sock is host
+
+    def test_namespace_socket(self):
+        # given
+        pids = [10, 10, 20]
+        client = NetlinkNetClient(mock.MagicMock(), lambda: pids.pop(0))
+
+        # when
+        with mock.patch(
+            "core.nodes.netlink._setns_socket", side_effect=FakeNetlinkSocket
+        ) as setns_socket:
+            sock1 = client._sock("ip link show lo")
+            sock2 = client._sock("ip link show lo")
+            sock3 = client._sock("ip link show lo")
+
+        # then
+        assert sock1 is sock2
+        assert sock3 is not sock1
+        assert [x[0][0] for x in setns_socket.call_args_list] == [10, 20]
+        assert sock3.pid == 20
+
+    def test_missing_namespace(self):
+        # given
+        client = NetlinkNetClient(mock.MagicMock(), lambda: None)
+
+        # when
+        with mock.patch.object(
+            netlink, "host_socket"
+        ) as host_socket, mock.patch.object(
+            netlink, "_setns_socket"
+        ) as setns_socket, pytest.raises(
+            CoreCommandError
+        ) as e:
+            client.device_up("eth0")
+
+        # then
+        assert e.value.cmd == "ip link show eth0"
+        host_socket.assert_not_called()
+        setns_socket.assert_not_called()
+
+    def test_request_error(self):
+        # given
+        client = NetlinkNetClient(mock.MagicMock(), lambda: 10)
+        fake = FakeNetlinkSocket(19)
+
+        # when
+        with mock.patch.object(
+            netlink, "_setns_socket", return_value=fake
+        ), pytest.raises(CoreCommandError) as e:
+            client.device_up("eth0")
+
+        # then
+        assert e.value.returncode == 19
+        assert e.value.cmd == "ip link set eth0 up"
+        assert e.value.stderr == "No such device"
+        assert len(fake.sent) == 2
@@ -0,0 +1,126 @@
+import time
+
+import mock
+import pytest
+
+from core.emulator.data import InterfaceData
+from core.emulator.session import Session
+from core.errors import CoreCommandError
+from core.executables import NFTABLES
+from core.nodes.base import CoreNode
+from core.nodes.network import NftablesQueue, SwitchNode, WlanNode
+
+
+class NftRecorder:
+    def __init__(self, fail=None):
+        self.fail = fail
+        self.calls = []
+
+    def __call__(self, args, stdin=None):
+        self.calls.append((args, stdin))
+        if self.fail and self.fail(stdin):
+            raise CoreCommandError(1, args, "", "Error: Could not process rule")
+        return ""
+
+
+@pytest.fixture
+def local_session(session: Session):
+    with mock.patch.dict(session.distributed.servers, clear=True):
+        yield session
+
+
+class TestNftables:
+    def test_commit_payload(self, local_session: Session):
+        # given
+        net1 = local_session.add_node(SwitchNode)
+        net2 = local_session.add_node(SwitchNode)
+        nft_queue = NftablesQueue()
+        recorder = NftRecorder()
+
+        # when
+        with mock.patch("core.utils.cmd", side_effect=recorder):
+            nft_queue.commit([net1, net2])
+
+        # then
+        assert len(recorder.calls) == 1
+        args, data = recorder.calls[0]
+        assert args == f"{NFTABLES} -f -"
+        lines = data.splitlines()
+        assert lines[0] == f"add table bridge {net1.brname}"
+        assert f"add table bridge {net2.brname}" in lines
+        assert data.endswith("\n")
+        stats = nft_queue.get_stats()
+        assert stats.commits == 1
+        assert stats.networks == 2
+        assert stats.rules == len(lines)
+        assert stats.last_networks == 2
+        assert stats.last_rules == len(lines)
+        assert stats.errors == 0
+
+    def test_updates_coalesced(self, local_session: Session):
+        # given
+        net1 = local_session.add_node(SwitchNode)
+        net2 = local_session.add_node(SwitchNode)
+        nft_queue = NftablesQueue()
+        recorder = NftRecorder()
+
+        # when
+        with mock.patch("core.utils.cmd", side_effect=recorder):
+            nft_queue.last_commit = time.monotonic()
+            nft_queue.start()
+            nft_queue.update(net1)
+            nft_queue.update(net2)
+            nft_queue.update(net1)
+            deadline = time.monotonic() + 5
+            while not nft_queue.get_stats().commits and time.monotonic() < deadline:
+                time.sleep(0.01)
+            nft_queue.stop()
+
+        # then
+        assert len(recorder.calls) == 1
+        stats = nft_queue.get_stats()
+        assert stats.commits == 1
+        assert stats.last_networks == 2
+
+    @mock.patch("core.nodes.network.nft_queue")
+    def test_failed_commit_restores_state(self, _, local_session: Session):
+        # given
+        local_session.options.set_config("nftables_vmap", "1")
+        wlan = local_session.add_node(WlanNode)
+        node1 = local_session.add_node(CoreNode)
+        node2 = local_session.add_node(CoreNode)
+        local_session.options.set_config("nftables_vmap", "0")
+        iface1, _ = local_session.add_link(node1.id, wlan.id, InterfaceData())
+        iface2, _ = local_session.add_link(node2.id, wlan.id, InterfaceData())
+        nft_queue = NftablesQueue()
+        wlan.link(iface1, iface2)
+        recorder = NftRecorder(fail=lambda _: True)
+
+        # when
+        with mock.patch("core.utils.cmd", side_effect=recorder):
+            nft_queue.commit([wlan])
+
+        # then
+        assert nft_queue.get_stats().errors == 1
+        assert not wlan.has_nftables_chain
+        assert not wlan.nftables_elements
+        assert wlan.nftables_resync
+
+    def test_failed_network_retried_separately(self, local_session: Session):
+        # given
+        net1 = local_session.add_node(SwitchNode)
+        net2 = local_session.add_node(SwitchNode)
+        nft_queue = NftablesQueue()
+        recorder = NftRecorder(fail=lambda data: net2.brname in data)
+
+        # when
+        with mock.patch("core.utils.cmd", side_effect=recorder):
+            nft_queue.commit([net1, net2])
+
+        # then
+        assert len(recorder.calls) == 3
+        assert nft_queue.get_stats().errors == 1
+        assert net1.has_nftables_chain
+        assert not net1.nftables_resync
+        assert not net2.has_nftables_chain
+        assert net2.nftables_resync
@@ -1,10 +1,11 @@
 import pytest
+from mock import patch
 
 from core.emulator.data import InterfaceData, NodeOptions
 from core.emulator.session import Session
 from core.errors import CoreError
 from core.nodes.base import CoreNode
-from core.nodes.network import HubNode, SwitchNode, WlanNode
+from core.nodes.network import HubNode, NftablesQueue, SwitchNode, WlanNode
 
 MODELS = ["router", "host", "PC", "mdr"]
 NET_TYPES = [SwitchNode, HubNode, WlanNode]
@@ -141,3 +142,37 @@ class TestNodes:
         # then
         assert node
         assert node.up
+
+    @patch("core.nodes.network.nft_queue")
+    def test_wlan_nftables_vmap(self, _, session: Session):
+        # given
+        session.options.set_config("nftables_vmap", "1")
+        wlan = session.add_node(WlanNode)
+        node1 = session.add_node(CoreNode)
+        node2 = session.add_node(CoreNode)
+        iface1, _ = session.add_link(node1.id, wlan.id, InterfaceData())
+        iface2, _ = session.add_link(node2.id, wlan.id, InterfaceData())
+        session.options.set_config("nftables_vmap", "0")
+        nft_queue = NftablesQueue()
+        nft_queue.build_cmds(wlan)
+        nft_queue.cmds.clear()
+        name1, name2 = sorted([iface1.localname, iface2.localname])
+
+        # when
+        wlan.link(iface1, iface2)
+        nft_queue.build_cmds(wlan)
+        link_cmds = list(nft_queue.cmds)
+        nft_queue.cmds.clear()
+        wlan.unlink(iface1, iface2)
+        nft_queue.build_cmds(wlan)
+        unlink_cmds = list(nft_queue.cmds)
+
+        # then
+        assert link_cmds == [
+            f"add element bridge {wlan.brname} links "
+            f"{{ {name1} . {name2} : accept, {name2} . {name1} : accept }}"
+        ]
+        assert unlink_cmds == [
+            f"delete element bridge {wlan.brname} links "
+            f"{{ {name1} . {name2}, {name2} . {name1} }}"
+        ]
@@ -0,0 +1,92 @@
+import threading
+
+import pytest
+
+from core.emulator.taskgraph import TaskGraph
+from core.errors import CoreError
+
+
+class TestTaskGraph:
+    def test_run_order(self):
+        # given
+        graph = TaskGraph(workers=4)
+        order = []
+        lock = threading.Lock()
+
+        def task(name: str) -> str:
+            with lock:
+                order.append(name)
+            return name
+
+        graph.add("node", task, "node")
+        graph.add("link", task, "link", deps=["node"])
+        graph.add("boot", task, "boot", deps=["link", "iface"])
+        graph.add("iface", task, "iface", deps=["node"])
+
+        # when
+        exceptions = graph.run()
+
+        # then
+        assert not exceptions
+        assert order[0] == "node"
+        assert order[-1] == "boot"
+        assert graph.results["link"] == "link"
+
+    def test_run_failure_skips_dependents(self):
+        # given
+        graph = TaskGraph()
+        error = ValueError("failed")
+
+        def fail() -> None:
+            raise error
+
+        graph.add(("node", 1), fail)
+        graph.add(("boot", 1), lambda: 1, deps=[("node", 1)])
+        graph.add(("node", 2), lambda: 2)
+        graph.add(("boot", 2), lambda: 2, deps=[("node", 2)])
+
+        # when
+        exceptions = graph.run()
+
+        # then
+        assert exceptions == [error]
+        assert graph.errors == {("node", 1): error}
+        assert graph.skipped == {("boot", 1)}
+        assert graph.results[("boot", 2)] == 2
+
+    def test_run_slow_node_does_not_block(self):
+        # given
+        graph = TaskGraph(workers=2)
+        fast_booted = threading.Event()
+
+        def slow_node() -> bool:
+            return fast_booted.wait(5)
+
+        graph.add("slow", slow_node)
+        graph.add("fast", lambda: None)
+        graph.add("fast_boot", fast_booted.set, deps=["fast"])
+
+        # when
+        graph.run()
+
+        # then
+        assert graph.results["slow"] is True
+
+    def test_check_cycle(self):
+        # given
+        graph = TaskGraph()
+        graph.add("one", lambda: None, deps=["two"])
+        graph.add("two", lambda: None, deps=["one"])
+
+        # when
+        with pytest.raises(CoreError):
+            graph.run()
+
+    def test_check_unknown_dependency(self):
+        # given
+        graph = TaskGraph()
+        graph.add("one", lambda: None, deps=["two"])
+
+        # when
+        with pytest.raises(CoreError):
+            graph.run()
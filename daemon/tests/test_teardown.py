@@ -0,0 +1,149 @@
+from pathlib import Path
+
+import mock
+import pytest
+
+from core.emulator import teardown
+from core.emulator.data import IpPrefixes
+from core.emulator.session import Session
+from core.nodes.base import CoreNode
+from core.nodes.network import SwitchNode
+
+
+class TestTeardown:
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("veth1.0.3e8", True),
+            ("veth1.0.3e8p", True),
+            ("veth1.2.3e8", True),
+            ("tap1.0.3e8", True),
+            ("gt.1.3e8", True),
+            ("b.1.3e8", True),
+            ("ctrl0.3e8", True),
+            ("b.1.3e9", False),
+            ("veth1.0.13e8", False),
+            ("eth0", False),
+        ],
+    )
+    def test_device_regex(self, name: str, expected: bool):
+        # given
+        regex = teardown.device_regex("3e8")
+
+        # when
+        result = regex.match(name) is not None
+
+        # then
+        assert result == expected
+
+    def test_find_devices(self, tmp_path: Path):
+        # given
+        for name in ["lo", "eth0", "b.1.3e8", "b.1.5", "veth2.0.3e8"]:
+            tmp_path.joinpath(name).mkdir()
+
+        # when
+        with mock.patch.object(teardown, "SYS_NET", tmp_path):
+            session_names = teardown.find_devices("3e8")
+            all_names = teardown.find_devices()
+
+        # then
+        assert session_names == ["b.1.3e8", "veth2.0.3e8"]
+        assert all_names == ["b.1.3e8", "b.1.5", "veth2.0.3e8"]
+
+    def test_remove_paths(self, tmp_path: Path):
+        # given
+        directory = tmp_path / "n1.conf"
+        directory.mkdir()
+        directory.joinpath("file").write_text("")
+        socket = tmp_path / "n1"
+        socket.write_text("")
+
+        # when
+        teardown.remove_paths([directory, socket, tmp_path / "missing"])
+
+        # then
+        assert not directory.exists()
+        assert not socket.exists()
+
+    def test_shutdown_nodes(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        switch = session.add_node(SwitchNode)
+        node = session.add_node(CoreNode)
+        iface_data = ip_prefixes.create_iface(node)
+        session.add_link(node.id, switch.id, iface1_data=iface_data)
+        session.instantiate()
+        iface = node.get_iface(iface_data.id)
+        names = [switch.brname, iface.localname]
+
+        # when
+        with mock.patch.object(
+            teardown, "find_devices", return_value=names
+        ), mock.patch.object(
+            teardown, "delete_devices"
+        ) as delete_devices, mock.patch.object(
+            teardown, "kill_processes"
+        ) as kill_processes, mock.patch.dict(
+            session.distributed.servers, clear=True
+        ):
+            session.delete_nodes()
+
+        # then
+        delete_devices.assert_called_once_with(names)
+        assert list(kill_processes.call_args[0][0]) == [node.pid]
+        assert not node.up
+        assert not switch.up
+        assert not iface.up
+        assert not node.ifaces
+
+    def test_shutdown_nodes_owned_devices(
+        self, session: Session, ip_prefixes: IpPrefixes
+    ):
+        # given
+        switch = session.add_node(SwitchNode)
+        node = session.add_node(CoreNode)
+        iface_data = ip_prefixes.create_iface(node)
+        session.add_link(node.id, switch.id, iface1_data=iface_data)
+        session.instantiate()
+        iface = node.get_iface(iface_data.id)
+        short_id = session.short_session_id()
+        names = [switch.brname, f"b.99.{short_id}", iface.localname]
+
+        # when
+        with mock.patch.object(
+            teardown, "find_devices", return_value=names
+        ), mock.patch.object(
+            teardown, "delete_devices"
+        ) as delete_devices, mock.patch.dict(
+            session.distributed.servers, clear=True
+        ):
+            session.delete_nodes()
+
+        # then
+        delete_devices.assert_called_once_with([switch.brname, iface.localname])
+
+    def test_shutdown_nodes_separately(self, session: Session, ip_prefixes):
+        # given
+        switch = session.add_node(SwitchNode)
+        node = session.add_node(CoreNode)
+        iface_data = ip_prefixes.create_iface(node)
+        session.add_link(node.id, switch.id, iface1_data=iface_data)
+        session.instantiate()
+        iface = node.get_iface(iface_data.id)
+        names = [switch.brname, iface.localname]
+
+        # when
+        with mock.patch.object(
+            teardown, "is_bulk", side_effect=lambda _, x: x is node
+        ), mock.patch.object(
+            teardown, "find_devices", return_value=names
+        ), mock.patch.object(
+            teardown, "delete_devices"
+        ) as delete_devices, mock.patch.object(
+            switch, "shutdown"
+        ) as switch_shutdown:
+            session.delete_nodes()
+
+        # then
+        delete_devices.assert_called_once_with([iface.localname])
+        switch_shutdown.assert_called_once()
+        assert not node.up
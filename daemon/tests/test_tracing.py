@@ -0,0 +1,82 @@
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from core.emulator.data import IpPrefixes
+from core.emulator.session import Session
+from core.emulator.tracing import Tracer
+from core.nodes.base import CoreNode
+from core.nodes.network import SwitchNode
+
+
+class TestTracing:
+    def test_span_disabled(self):
+        # given
+        tracer = Tracer(lambda: False)
+
+        # when
+        with tracer.span("add_node", "session", node_id=1):
+            pass
+
+        # then
+        assert not tracer.spans
+
+    def test_span_error(self):
+        # given
+        tracer = Tracer(lambda: True)
+
+        # when
+        with pytest.raises(ValueError):
+            with tracer.span("cmd", "node", node_id=1):
+                raise ValueError("failed")
+
+        # then
+        assert len(tracer.spans) == 1
+        span = tracer.spans[0]
+        assert span.args == dict(node_id=1, error="failed")
+        assert span.thread_id == threading.get_ident()
+
+    def test_export(self, tmp_path: Path):
+        # given
+        tracer = Tracer(lambda: True)
+        with tracer.span("boot_node", "node", node_id=1):
+            with tracer.span("cmd", "node", node_id=1, cmd="true"):
+                pass
+        path = tmp_path / "trace.json"
+
+        # when
+        tracer.export(path, 1, "session 1")
+
+        # then
+        data = json.loads(path.read_text())
+        spans = [x for x in data["traceEvents"] if x["ph"] == "X"]
+        assert [x["name"] for x in spans] == ["cmd", "boot_node"]
+        cmd, boot = spans
+        assert cmd["args"]["cmd"] == "true"
+        assert boot["ts"] <= cmd["ts"]
+        assert cmd["ts"] + cmd["dur"] <= boot["ts"] + boot["dur"]
+        names = {x["name"] for x in data["traceEvents"] if x["ph"] == "M"}
+        assert names == {"process_name", "thread_name"}
+
+    def test_session_trace(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        session.options.set_config("trace", "1")
+        try:
+            switch = session.add_node(SwitchNode)
+            node = session.add_node(CoreNode)
+            iface_data = ip_prefixes.create_iface(node)
+            session.add_link(node.id, switch.id, iface1_data=iface_data)
+
+            # when
+            session.instantiate()
+        finally:
+            session.options.set_config("trace", "0")
+
+        # then
+        spans = session.tracer.spans
+        names = {x.name for x in spans}
+        assert {"add_node", "add_link", "boot_node", "config_service_start"} <= names
+        boot = next(x for x in spans if x.name == "boot_node")
+        assert boot.args["node_id"] == node.id
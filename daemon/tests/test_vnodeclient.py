@@ -0,0 +1,211 @@
+import array
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+import mock
+import pytest
+
+from core.emulator.session import Session
+from core.errors import CoreCommandError
+from core.nodes import vnodeclient
+from core.nodes.base import CoreNode
+from core.nodes.vnodeclient import VnodeClientPool
+
+
+class FakeVnoded:
+    """
+    Control channel server running fake commands: "echo" writes its arguments
+    to stdout, "fail" exits with status 1 and "drop" closes the connection.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path: Path = path
+        self.server: socket.socket = socket.socket(
+            socket.AF_UNIX, socket.SOCK_SEQPACKET
+        )
+        self.server.bind(str(path))
+        self.server.listen(8)
+        self.connections: int = 0
+        self.running: threading.Event = threading.Event()
+        self.release: threading.Event = threading.Event()
+        self.release.set()
+        threading.Thread(target=self.accept, daemon=True).start()
+
+    def accept(self) -> None:
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self.handle, args=(conn,), daemon=True).start()
+
+    def handle(self, conn: socket.socket) -> None:
+        with conn:
+            while True:
+                fds = array.array("i")
+                data, ancdata, _, _ = conn.recvmsg(
+                    vnodeclient.MSG_SIZE_MAX, socket.CMSG_LEN(3 * fds.itemsize)
+                )
+                if not data:
+                    return
+                for _, _, fd_data in ancdata:
+                    fds.frombytes(fd_data)
+                cmdid, args = self.parse(data)
+                in_fd, out_fd, err_fd = fds
+                if args[0] == "drop":
+                    for fd in fds:
+                        os.close(fd)
+                    return
+                self.running.set()
+                self.release.wait()
+                status = 0
+                if args[0] == "echo":
+                    os.write(out_fd, " ".join(args[1:]).encode())
+                elif args[0] == "fail":
+                    os.write(err_fd, b"error")
+                    status = 1 << 8
+                for fd in fds:
+                    os.close(fd)
+                self.reply(conn, vnodeclient.MSG_CMDREQACK, cmdid, 100)
+                self.reply(conn, vnodeclient.MSG_CMDSTATUS, cmdid, status)
+
+    def parse(self, data: bytes):
+        offset = vnodeclient.HEADER.size
+        cmdid = None
+        args = []
+        while offset < len(data):
+            tlv_type, length = vnodeclient.TLV.unpack_from(data, offset)
+            offset += vnodeclient.TLV.size
+            value = data[offset : offset + length]
+            offset += length
+            if tlv_type == vnodeclient.TLV_CMDID:
+                cmdid = vnodeclient.INT32.unpack(value)[0]
+            elif tlv_type == vnodeclient.TLV_CMDARG:
+                args.append(value[:-1].decode())
+        return cmdid, args
+
+    def reply(self, conn: socket.socket, msg_type: int, cmdid: int, value: int):
+        value_type = (
+            vnodeclient.TLV_CMDPID
+            if msg_type == vnodeclient.MSG_CMDREQACK
+            else vnodeclient.TLV_CMDSTATUS
+        )
+        data = vnodeclient._pack_tlv(
+            vnodeclient.TLV_CMDID, vnodeclient.INT32.pack(cmdid)
+        ) + vnodeclient._pack_tlv(value_type, vnodeclient.INT32.pack(value))
+        conn.send(vnodeclient.HEADER.pack(msg_type, len(data)) + data)
+
+    def close(self) -> None:
+        self.server.close()
+
+
+@pytest.fixture
+def vnoded(tmp_path: Path):
+    server = FakeVnoded(tmp_path / "n1")
+    yield server
+    server.release.set()
+    server.close()
+
+
+class TestVnodeClientPool:
+    def test_cmd(self, vnoded: FakeVnoded):
+        # given
+        pool = VnodeClientPool(vnoded.path)
+
+        # when
+        output1 = pool.cmd("echo hello world")
+        output2 = pool.cmd("echo again")
+
+        # then
+        assert output1 == "hello world"
+        assert output2 == "again"
+        assert vnoded.connections == 1
+        assert pool.count == 1
+
+    def test_cmd_error(self, vnoded: FakeVnoded):
+        # given
+        pool = VnodeClientPool(vnoded.path)
+
+        # when
+        with pytest.raises(CoreCommandError) as e:
+            pool.cmd("fail")
+
+        # then
+        assert e.value.returncode == 1
+        assert e.value.stderr == "error"
+        assert len(pool.idle) == 1
+
+    def test_concurrent_checkout(self, vnoded: FakeVnoded):
+        # given
+        pool = VnodeClientPool(vnoded.path, size=2)
+        vnoded.release.clear()
+        outputs: List[str] = []
+
+        def run(value: str) -> None:
+            outputs.append(pool.cmd(f"echo {value}"))
+
+        threads = [threading.Thread(target=run, args=(x,)) for x in "abc"]
+
+        # when
+        for thread in threads:
+            thread.start()
+        assert vnoded.running.wait(5)
+        deadline = time.monotonic() + 5
+        while vnoded.connections < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        vnoded.release.set()
+        for thread in threads:
+            thread.join(5)
+
+        # then
+        assert sorted(outputs) == ["a", "b", "c"]
+        assert vnoded.connections == 2
+        assert pool.count == 2
+
+    def test_reconnect(self, vnoded: FakeVnoded):
+        # given
+        pool = VnodeClientPool(vnoded.path)
+        pool.cmd("echo first")
+
+        # when
+        with pytest.raises(OSError):
+            pool.cmd("drop")
+        output = pool.cmd("echo second")
+
+        # then
+        assert output == "second"
+        assert vnoded.connections == 2
+        assert pool.count == 1
+
+    def test_close(self, vnoded: FakeVnoded):
+        # given
+        pool = VnodeClientPool(vnoded.path)
+        pool.cmd("echo first")
+
+        # when
+        pool.close()
+
+        # then
+        assert pool.count == 0
+        assert not pool.idle
+        with pytest.raises(ValueError):
+            pool.cmd("echo closed")
+
+    def test_node_cmd_fallback(self, session: Session, tmp_path: Path):
+        # given
+        node = session.add_node(CoreNode)
+        node.client_pool = VnodeClientPool(tmp_path / "missing")
+
+        # when
+        with mock.patch("core.utils.cmd", return_value="output") as cmd:
+            output = node.cmd("echo fallback")
+
+        # then
+        assert output == "output"
+        assert node.client_pool is None
+        assert "echo fallback" in cmd.call_args[0][0]
@@ -0,0 +1,133 @@
+import shlex
+import shutil
+from pathlib import Path
+from typing import Dict
+
+import mock
+
+from core import utils
+from core.emulator.session import Session
+from core.executables import VNODED
+from core.nodes.base import CoreNode
+from core.nodes.warmpool import WarmPool
+
+
+def create_pool(path: Path, size: int = 1) -> WarmPool:
+    pool = WarmPool(size, path / "pool")
+    pool.directory.mkdir()
+    pool.fill()
+    for namespace in pool.ready:
+        namespace.ctrlchnlname.touch()
+    return pool
+
+
+def get_vnoded_env() -> Dict[str, str]:
+    for args, kwargs in utils.cmd.call_args_list:
+        if args[0].startswith(VNODED):
+            return kwargs["env"] if "env" in kwargs else args[1]
+    raise AssertionError("vnoded was not run")
+
+
+class TestWarmPool:
+    def test_fill(self, patcher, tmp_path: Path):
+        # given
+        pool = WarmPool(2, tmp_path)
+
+        # when
+        pool.fill()
+
+        # then
+        assert len(pool.ready) == 2
+        namespace = pool.ready[0]
+        assert namespace.directory.is_dir()
+        assert [x for _, x in namespace.mounts] == [Path("/var/run"), Path("/var/log")]
+        for host_path, _ in namespace.mounts:
+            assert host_path.is_dir()
+
+    def test_claim(self, patcher, tmp_path: Path):
+        # given
+        pool = create_pool(tmp_path)
+        ctrlchnlname = tmp_path / "n1"
+        directory = tmp_path / "n1.conf"
+
+        # when
+        namespace = pool.claim(ctrlchnlname, directory)
+        missing = pool.claim(tmp_path / "n2", tmp_path / "n2.conf")
+
+        # then
+        assert namespace.ctrlchnlname == ctrlchnlname
+        assert namespace.directory == directory
+        assert ctrlchnlname.exists()
+        for host_path, _ in namespace.mounts:
+            assert host_path.parent == directory
+            assert host_path.is_dir()
+        assert missing is None
+        stats = pool.stats()
+        assert stats["ready"] == 0
+        assert stats["claimed"] == 1
+        assert stats["missed"] == 1
+
+    def test_runtime_node_startup(self, session: Session, tmp_path: Path):
+        # given
+        pool = create_pool(tmp_path)
+        session.directory.mkdir(exist_ok=True)
+        session.instantiate()
+
+        # when
+        with mock.patch.object(session, "node_pool", pool):
+            node = session.add_node(CoreNode)
+
+        # then
+        assert node.up
+        assert node.directory == session.directory / f"{node.name}.conf"
+        assert node.ctrlchnlname.exists()
+        assert pool.stats()["claimed"] == 1
+        shutil.rmtree(session.directory)
+
+    def test_node_startup_without_runtime(self, session: Session, tmp_path: Path):
+        # given
+        pool = create_pool(tmp_path)
+        node = session.add_node(CoreNode)
+
+        # when
+        with mock.patch.object(session, "node_pool", pool):
+            session.instantiate()
+
+        # then
+        assert node.up
+        assert pool.stats()["ready"] == 1
+
+    def test_pooled_node_environment(self, session: Session):
+        # given
+        session.directory.mkdir(exist_ok=True)
+        session.instantiate()
+        utils.cmd.reset_mock()
+        session.add_node(CoreNode)
+        env = get_vnoded_env()
+        session.options.set_config("nodepool", "1")
+        try:
+            with mock.patch.object(WarmPool, "start"):
+                session.start_node_pool()
+            pool = session.node_pool
+            pool.directory.mkdir(parents=True)
+            utils.cmd.reset_mock()
+            pool.fill()
+            pool_env = get_vnoded_env()
+            pool.ready[0].ctrlchnlname.touch()
+            node2 = session.add_node(CoreNode)
+
+            # when
+            utils.cmd.reset_mock()
+            node2.cmd("echo")
+        finally:
+            session.stop_node_pool()
+            session.options.set_config("nodepool", "0")
+            shutil.rmtree(session.directory)
+
+        # then
+        assert node2.cmd_env
+        args = shlex.split(utils.cmd.call_args[0][0])
+        args = args[args.index("env") + 1 : args.index("echo")]
+        node2_env = dict(pool_env, **dict(x.split("=", 1) for x in args))
+        assert node2_env["SESSION_DIR"] == str(session.directory)
+        assert node2_env == dict(env, **node2.get_environment())
@@ -181,7 +181,7 @@ def install_system(c: Context, os_info: OsInfo, hide: bool) -> None:
 
 def install_grpcio(c: Context, hide: bool) -> None:
     c.run(
-        "python3 -m pip install --user grpcio==1.27.2 grpcio-tools==1.27.2",
+        "python3 -m pip install --user grpcio==1.48.2 grpcio-tools==1.48.2",
         hide=hide,
     )
 